@@ -0,0 +1,151 @@
+"""
+Construction time and memory of the slotted model classes.
+
+Compares ``TimelineEvent``, ``TimelineSegment``, ``StreamInfo`` and
+``Camera`` with equivalent dict-backed dataclasses (the previous layout)
+at 100k instances.
+
+Usage:
+    python -m benchmarks.bench_models [count]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.models.camera import Camera, CameraState, RecordingMode, StreamInfo
+from src.models.timeline import TimelineEvent, TimelineEventType, TimelineSegment
+
+
+@dataclass
+class DictTimelineEvent:
+    """TimelineEvent as it was before slots."""
+    timestamp: datetime
+    event_type: TimelineEventType
+    duration_seconds: Optional[int] = None
+    metadata: Dict[str, Any] = None
+
+    def __post_init__(self):
+        if self.metadata is None:
+            self.metadata = {}
+
+
+@dataclass
+class DictTimelineSegment:
+    """TimelineSegment as it was before slots."""
+    start_time: datetime
+    end_time: datetime
+    recording_id: str
+    camera_id: str
+    has_motion: bool = False
+    motion_events: List[Any] = None
+    recording_ids: List[str] = None
+    recording_spans: List[Tuple[str, datetime, datetime]] = None
+
+    def __post_init__(self):
+        if self.motion_events is None:
+            self.motion_events = []
+        if self.recording_ids is None:
+            self.recording_ids = [self.recording_id]
+        if self.recording_spans is None:
+            self.recording_spans = [(self.recording_id, self.start_time, self.end_time)]
+
+
+@dataclass
+class DictStreamInfo:
+    """StreamInfo as it was before slots."""
+    channel: int
+    width: int
+    height: int
+    fps: int
+    bitrate: int
+    codec: str
+    url: str
+
+
+@dataclass
+class DictCamera:
+    """Camera as it was before slots."""
+    camera_id: str
+    name: str
+    mac_address: str
+    model: str
+    firmware_version: str
+    ip_address: str
+    port: int
+    state: CameraState
+    is_connected: bool
+    last_seen: Optional[str] = None
+    recording_mode: RecordingMode = RecordingMode.MOTION
+    is_recording: bool = False
+    streams: List[Any] = field(default_factory=list)
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.streams is None:
+            self.streams = []
+        if self.properties is None:
+            self.properties = {}
+
+
+def _measure(factory, count: int, repeat: int = 5):
+    """Build ``count`` objects and return (seconds, bytes allocated).
+
+    The time is the best of ``repeat`` runs with the garbage collector
+    off, so single runs disturbed by collections do not skew it. Time
+    and memory are measured in separate passes because tracing
+    allocations slows construction down considerably.
+    """
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        started = time.perf_counter()
+        objects = [factory(i) for i in range(count)]
+        elapsed = min(elapsed, time.perf_counter() - started)
+        gc.enable()
+        del objects
+
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(i) for i in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return elapsed, allocated
+
+
+def main(count: int = 100_000):
+    base = datetime(2024, 1, 1)
+    times = [base + timedelta(seconds=i) for i in range(count)]
+    cases = [
+        ("TimelineEvent",
+         lambda cls: (lambda i: cls(times[i], TimelineEventType.MOTION, 5)),
+         TimelineEvent, DictTimelineEvent),
+        ("TimelineSegment",
+         lambda cls: (lambda i: cls(times[i], times[i], "rec", "cam")),
+         TimelineSegment, DictTimelineSegment),
+        ("StreamInfo",
+         lambda cls: (lambda i: cls(i % 3, 1920, 1080, 30, 4000000, "h264", "rtsp://nvr/cam")),
+         StreamInfo, DictStreamInfo),
+        ("Camera",
+         lambda cls: (lambda i: cls("cam", "Front", "00:00:00:00:00:00", "UVC G3", "4.0",
+                                    "10.0.0.2", 554, CameraState.ONLINE, True)),
+         Camera, DictCamera),
+    ]
+    print(f"{count} instances each")
+    for name, make, slotted, dict_backed in cases:
+        dict_time, dict_bytes = _measure(make(dict_backed), count)
+        slot_time, slot_bytes = _measure(make(slotted), count)
+        print(f"{name:16} dict: {dict_time * 1000:7.1f} ms {dict_bytes / 2 ** 20:6.1f} MiB   "
+              f"slots: {slot_time * 1000:7.1f} ms {slot_bytes / 2 ** 20:6.1f} MiB   "
+              f"(time {slot_time / dict_time - 1:+.0%}, "
+              f"memory {slot_bytes / dict_bytes - 1:+.0%})")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
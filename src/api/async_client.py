@@ -0,0 +1,298 @@
+"""
+Asynchronous UniFi Video API client.
+
+This module provides an asyncio-native counterpart of ``UniFiVideoClient``
+so the GUI loop and the stream manager can fan out many API requests
+without dedicating a thread to each call.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import aiohttp
+
+from .auth import SESSION_COOKIE
+from .client import (UniFiVideoAPIError, unwrap_response, parse_stream_url,
+                     recording_query_params)
+from ..models.camera import Camera
+from ..models.recording import Recording
+from ..utils.logger import get_logger
+
+logger = get_logger("api.async_client")
+
+
+class AsyncUniFiVideoClient:
+    """Asyncio API client for UniFi Video server communication."""
+
+    API_PREFIX = "/api/2.0"
+
+    def __init__(self, server_url: str, max_connections: int = 4,
+                 timeout: float = 15.0, verify_ssl: bool = True):
+        """Initialize the async API client.
+
+        The underlying ``aiohttp`` session is created lazily so the client can
+        be constructed outside of a running event loop.
+
+        Args:
+            server_url: The base URL of the UniFi Video server
+            max_connections: Maximum number of pooled connections to the server
+            timeout: Timeout in seconds for API requests
+            verify_ssl: Whether to verify the server TLS certificate
+        """
+        self.server_url = server_url.rstrip('/')
+        self.session_id: Optional[str] = None
+        self.max_connections = max(1, max_connections)
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def from_config(cls, config) -> 'AsyncUniFiVideoClient':
+        """Create a client from application configuration.
+
+        Args:
+            config: Loaded ConfigManager instance
+
+        Returns:
+            Configured async API client
+        """
+        server = config.get_server_config()
+        network = config.get_network_settings()
+        return cls(
+            server['url'],
+            max_connections=network['max_concurrent_streams'],
+            timeout=network['api_timeout'],
+            verify_ssl=server['verify_ssl'],
+        )
+
+    async def __aenter__(self):
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the client when leaving the context."""
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
+
+        Returns:
+            aiohttp client session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                ssl=None if self.verify_ssl else False,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                # NVRs are usually addressed by IP, which the default jar rejects
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                headers={'Accept': 'application/json'},
+            )
+        return self._session
+
+    # Authentication
+
+    async def login(self, username: str, password: str) -> bool:
+        """Authenticate with the UniFi Video server.
+
+        Args:
+            username: User login name
+            password: User password
+
+        Returns:
+            True if authentication successful, False otherwise
+        """
+        session = self._get_session()
+        try:
+            async with session.post(f"{self.server_url}{self.API_PREFIX}/login",
+                                    json={"email": username, "password": password}) as response:
+                cookie = response.cookies.get(SESSION_COOKIE)
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Login request to {self.server_url} failed: {e}")
+            return False
+
+        session.cookie_jar.clear()
+        if status != 200 or cookie is None:
+            logger.warning(f"Login rejected by {self.server_url} (HTTP {status})")
+            self.session_id = None
+            return False
+
+        self.session_id = cookie.value
+        session.cookie_jar.update_cookies({SESSION_COOKIE: self.session_id})
+        logger.info(f"Logged in to {self.server_url}")
+        return True
+
+    async def logout(self) -> bool:
+        """Log out from the UniFi Video server.
+
+        Returns:
+            True if logout successful, False otherwise
+        """
+        if self.session_id is None:
+            return True
+
+        success = True
+        try:
+            await self._request('GET', "/logout")
+        except UniFiVideoAPIError as e:
+            logger.warning(f"Logout request failed: {e}")
+            success = False
+
+        self.session_id = None
+        self._get_session().cookie_jar.clear()
+        return success
+
+    # Transport
+
+    async def _request(self, method: str, path: str, **kwargs) -> bytes:
+        """Send a request and read the full response body.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path relative to the API prefix
+            **kwargs: Extra arguments passed to ``aiohttp.ClientSession.request``
+
+        Returns:
+            Response body
+
+        Raises:
+            UniFiVideoAPIError: On connection errors or HTTP error status
+        """
+        url = f"{self.server_url}{self.API_PREFIX}{path}"
+        try:
+            async with self._get_session().request(method, url, **kwargs) as response:
+                if response.status >= 400:
+                    raise UniFiVideoAPIError(f"{method} {path} returned HTTP {response.status}",
+                                             status_code=response.status)
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise UniFiVideoAPIError(f"{method} {path} failed: {e}") from e
+
+    async def _get_data(self, path: str, **kwargs) -> List[Dict[str, Any]]:
+        """GET a JSON endpoint and return its ``data`` list.
+
+        Args:
+            path: Endpoint path relative to the API prefix
+            **kwargs: Extra request arguments
+
+        Returns:
+            List of data items
+        """
+        body = await self._request('GET', path, **kwargs)
+        return unwrap_response(json.loads(body))
+
+    # Endpoints
+
+    async def get_server_info(self, server_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get server information.
+
+        Args:
+            server_id: Optional server ID to filter by
+
+        Returns:
+            Server information or None if not available
+        """
+        path = f"/server/{server_id}" if server_id else "/server"
+        data = await self._get_data(path)
+        return data[0] if data else None
+
+    async def get_cameras(self) -> List[Camera]:
+        """Get all cameras known to the server.
+
+        Returns:
+            List of cameras
+        """
+        return [Camera.from_api_response(item) for item in await self._get_data("/camera")]
+
+    async def get_camera(self, camera_id: str) -> Optional[Camera]:
+        """Get a single camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            Camera or None if not found
+        """
+        data = await self._get_data(f"/camera/{camera_id}")
+        return Camera.from_api_response(data[0]) if data else None
+
+    async def get_stream_url(self, camera_id: str, channel: int = 0) -> Optional[str]:
+        """Get the stream URL for a camera channel.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            channel: Stream channel number
+
+        Returns:
+            Stream URL or None if not available
+        """
+        return parse_stream_url(await self._get_data(f"/stream/{camera_id}/{channel}/url"))
+
+    async def get_stream_urls(self, camera_ids: Iterable[str],
+                              channel: int = 0) -> Dict[str, Optional[str]]:
+        """Resolve stream URLs for several cameras concurrently.
+
+        Concurrency is bounded by the connector limit, not by the number of
+        cameras.
+
+        Args:
+            camera_ids: Camera identifiers
+            channel: Stream channel number
+
+        Returns:
+            Mapping of camera ID to stream URL (None where resolution failed)
+        """
+        camera_ids = list(dict.fromkeys(camera_ids))
+        results = await asyncio.gather(
+            *(self.get_stream_url(camera_id, channel) for camera_id in camera_ids),
+            return_exceptions=True,
+        )
+        urls: Dict[str, Optional[str]] = {}
+        for camera_id, result in zip(camera_ids, results):
+            if isinstance(result, UniFiVideoAPIError):
+                logger.warning(f"Request for {camera_id} failed: {result}")
+                result = None
+            elif isinstance(result, BaseException):
+                raise result
+            urls[camera_id] = result
+        return urls
+
+    async def get_recordings(self, camera_ids: Iterable[str], start_time: datetime,
+                             end_time: datetime) -> List[Recording]:
+        """Get recordings for cameras within a time range.
+
+        Args:
+            camera_ids: Cameras to query
+            start_time: Start of the time range
+            end_time: End of the time range
+
+        Returns:
+            List of recordings ordered by start time
+        """
+        params = recording_query_params(camera_ids, start_time, end_time)
+        return [Recording.from_api_response(item)
+                for item in await self._get_data("/recording", params=params)]
+
+    async def get_snapshot(self, camera_id: str) -> bytes:
+        """Get the latest JPEG snapshot for a camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            JPEG image data
+        """
+        return await self._request('GET', f"/snapshot/camera/{camera_id}",
+                                   headers={'Accept': 'image/jpeg'})
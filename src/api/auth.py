@@ -5,20 +5,64 @@ This module manages authentication with the UniFi Video server,
 including login, session management, and cookie handling.
 """
 
-from typing import Optional, Dict
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+import requests
+
+from ..utils.logger import get_logger
+
+logger = get_logger("api.auth")
+
+# Session cookie issued by /api/2.0/login and required by every other endpoint
+SESSION_COOKIE = "JSESSIONID_AV"
 
 
 class AuthManager:
     """Manages authentication state and session cookies for API requests."""
 
-    def __init__(self):
-        """Initialize the authentication manager."""
+    # Seconds to wait before retrying a failed background refresh
+    REFRESH_RETRY_DELAY = 30.0
+
+    def __init__(self, session: Optional[requests.Session] = None,
+                 session_file: Optional[str] = None,
+                 session_lifetime: int = 3600,
+                 refresh_margin: int = 300):
+        """Initialize the authentication manager.
+
+        Args:
+            session: HTTP session to authenticate. Sharing the API client's
+                session lets the session cookie ride on its pooled connections.
+            session_file: Optional path where the session cookie is cached
+                between application runs
+            session_lifetime: Seconds a session is assumed to stay valid
+            refresh_margin: Seconds before expiry at which the session is renewed
+        """
+        self.session = session or requests.Session()
+        self.server_url: Optional[str] = None
         self.session_id: Optional[str] = None
         self.cookies: Dict[str, str] = {}
+        self.expires_at: Optional[float] = None
+
+        self.session_file = Path(session_file) if session_file else None
+        self.session_lifetime = session_lifetime
+        self.refresh_margin = min(refresh_margin, session_lifetime // 2)
+
+        self._credentials: Optional[Tuple[str, str]] = None
+        self._lock = threading.RLock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
 
     def login(self, username: str, password: str, server_url: str) -> bool:
         """Authenticate with the UniFi Video server.
 
+        A still-valid session cached by a previous run is reused without
+        contacting the server.
+
         Args:
             username: User login name
             password: User password
@@ -27,10 +71,32 @@ class AuthManager:
         Returns:
             True if authentication successful, False otherwise
         """
-        # TODO: Implement login API call
-        # TODO: Extract and store session cookies (JSESSIONID_AV)
-        # TODO: Handle authentication errors
-        pass
+        with self._lock:
+            self.server_url = server_url.rstrip('/')
+            self._credentials = (username, password)
+
+            if self._restore_session(username):
+                logger.info(f"Reusing cached session for {self.server_url}")
+                return True
+            return self._login_remote()
+
+    def reauthenticate(self, stale_session_id: Optional[str] = None) -> bool:
+        """Log in again with the credentials of the last login.
+
+        Args:
+            stale_session_id: Session that was rejected by the server. If the
+                session has already been replaced since, no new login is made.
+
+        Returns:
+            True if a valid session is available afterwards, False otherwise
+        """
+        with self._lock:
+            if (stale_session_id is not None and self.session_id is not None
+                    and self.session_id != stale_session_id):
+                return True
+            if self._credentials is None or self.server_url is None:
+                return False
+            return self._login_remote()
 
     def logout(self) -> bool:
         """Log out from the UniFi Video server.
@@ -38,9 +104,22 @@ class AuthManager:
         Returns:
             True if logout successful, False otherwise
         """
-        # TODO: Implement logout API call
-        # TODO: Clear session cookies
-        pass
+        self.stop_auto_refresh()
+        if not self.is_authenticated():
+            self._clear_session()
+            return True
+
+        success = True
+        try:
+            response = self.session.get(f"{self.server_url}/api/2.0/logout")
+            success = response.status_code < 400
+        except requests.RequestException as e:
+            logger.warning(f"Logout request failed: {e}")
+            success = False
+
+        self._clear_session()
+        self._credentials = None
+        return success
 
     def is_authenticated(self) -> bool:
         """Check if currently authenticated.
@@ -48,5 +127,144 @@ class AuthManager:
         Returns:
             True if authenticated, False otherwise
         """
-        # TODO: Implement authentication check
-        return self.session_id is not None
\ No newline at end of file
+        if self.session_id is None:
+            return False
+        return self.expires_at is None or self.expires_at > time.time()
+
+    def start_auto_refresh(self):
+        """Start renewing the session in the background before it expires."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop_refresh.clear()
+        self._refresh_thread = threading.Thread(target=self._refresh_loop,
+                                                name="auth-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def stop_auto_refresh(self):
+        """Stop the background session refresh."""
+        self._stop_refresh.set()
+        thread = self._refresh_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._refresh_thread = None
+
+    def _refresh_loop(self):
+        """Re-authenticate shortly before each session expiry."""
+        while not self._stop_refresh.is_set():
+            expires_at = self.expires_at or time.time() + self.session_lifetime
+            delay = max(0.0, expires_at - self.refresh_margin - time.time())
+            if self._stop_refresh.wait(delay):
+                break
+            logger.debug("Refreshing session before expiry")
+            if not self.reauthenticate():
+                logger.warning("Background session refresh failed")
+                self._stop_refresh.wait(self.REFRESH_RETRY_DELAY)
+
+    def _login_remote(self) -> bool:
+        """POST the stored credentials to the login endpoint.
+
+        Returns:
+            True if authentication successful, False otherwise
+        """
+        username, password = self._credentials
+        try:
+            response = self.session.post(
+                f"{self.server_url}/api/2.0/login",
+                json={"email": username, "password": password},
+            )
+        except requests.RequestException as e:
+            logger.error(f"Login request to {self.server_url} failed: {e}")
+            return False
+
+        session_id = response.cookies.get(SESSION_COOKIE)
+        if response.status_code != 200 or not session_id:
+            logger.warning(f"Login rejected by {self.server_url} (HTTP {response.status_code})")
+            self._clear_session()
+            return False
+
+        self._set_session(session_id, time.time() + self.session_lifetime)
+        self._save_session(username)
+        logger.info(f"Logged in to {self.server_url}")
+        return True
+
+    def _set_session(self, session_id: str, expires_at: Optional[float]):
+        """Store the session cookie on the shared HTTP session.
+
+        Args:
+            session_id: Value of the ``JSESSIONID_AV`` cookie
+            expires_at: Epoch time at which the session is considered expired
+        """
+        self.session_id = session_id
+        self.expires_at = expires_at
+        self.cookies = {SESSION_COOKIE: session_id}
+        # Replace the host-scoped Secure cookie from the login response so a
+        # single cookie is sent on every pooled connection
+        self.session.cookies.clear()
+        self.session.cookies.set(SESSION_COOKIE, session_id)
+
+    def _clear_session(self):
+        """Forget the current session cookie, including the cached copy."""
+        self.session_id = None
+        self.expires_at = None
+        self.cookies = {}
+        self.session.cookies.clear()
+        if self.session_file is not None:
+            try:
+                self.session_file.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove session cache {self.session_file}: {e}")
+
+    def _restore_session(self, username: str) -> bool:
+        """Load a cached session for this server and user if still valid.
+
+        Args:
+            username: User the session must belong to
+
+        Returns:
+            True if a cached session was restored, False otherwise
+        """
+        if self.session_file is None or not self.session_file.exists():
+            return False
+        try:
+            with open(self.session_file) as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session cache {self.session_file}: {e}")
+            return False
+
+        if (cached.get('server_url') != self.server_url
+                or cached.get('username') != username
+                or not cached.get('session_id')
+                or cached.get('expires_at', 0) <= time.time()):
+            return False
+
+        self._set_session(cached['session_id'], cached['expires_at'])
+        return True
+
+    def _save_session(self, username: str):
+        """Write the current session to the cache file, readable by the owner only.
+
+        The password is never written to disk.
+
+        Args:
+            username: User the session belongs to
+        """
+        if self.session_file is None:
+            return
+        cached = {
+            'server_url': self.server_url,
+            'username': username,
+            'session_id': self.session_id,
+            'expires_at': self.expires_at,
+        }
+        try:
+            self.session_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = self.session_file.with_name(self.session_file.name + '.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, self.session_file)
+        except OSError as e:
+            logger.warning(f"Could not write session cache {self.session_file}: {e}")
@@ -0,0 +1,208 @@
+"""
+Response cache for read-only UniFi Video endpoints.
+
+The GUI, the stream manager and the health monitor tend to ask for the
+same camera, stream URL or snapshot within milliseconds of each other.
+This module keeps recent response bodies for a per-endpoint time to
+live, evicts the least recently used ones past an entry and byte budget,
+revalidates expired entries with ``If-None-Match``/``If-Modified-Since``
+and lets concurrent callers asking for the same resource share a single
+request.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger("api.cache")
+
+# Endpoint kinds with their default time to live in seconds
+DEFAULT_TTLS: Dict[str, float] = {
+    'server': 300.0,
+    'camera': 10.0,
+    'stream': 60.0,
+    'snapshot': 0.5,
+}
+
+
+@dataclass
+class CachedResponse:
+    """Body and validators of a cached response."""
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires: float = 0.0
+
+    @property
+    def size(self) -> int:
+        """Bytes held by the body."""
+        return len(self.body)
+
+    def validators(self) -> Dict[str, str]:
+        """Get the headers that make a request conditional on this response.
+
+        Returns:
+            ``If-None-Match``/``If-Modified-Since`` headers, empty if the
+            server sent no validators
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """Counters of a response cache."""
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    shared: int = 0
+    evictions: int = 0
+    by_endpoint: Dict[str, int] = field(default_factory=dict)
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of response bodies with single-flight loading."""
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 512,
+                 max_bytes: int = 32 * 1024 * 1024,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the cache.
+
+        Args:
+            ttls: Seconds a response stays fresh per endpoint kind, merged
+                over ``DEFAULT_TTLS``
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum combined size of the cached bodies
+            clock: Monotonic time source
+        """
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.stats = CacheStats()
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> 'ResponseCache':
+        """Create a response cache from application configuration.
+
+        Args:
+            config: Loaded ConfigManager instance
+
+        Returns:
+            Configured response cache
+        """
+        network = config.get_network_settings()
+        return cls(ttls=network['response_cache_ttls'],
+                   max_entries=network['response_cache_entries'],
+                   max_bytes=network['response_cache_mb'] * 1024 * 1024)
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes held by the cached bodies."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, endpoint: str,
+            load: Callable[[Optional[CachedResponse]], CachedResponse]) -> CachedResponse:
+        """Get a fresh response, loading it if needed.
+
+        ``load`` receives the expired entry, if any, so it can make the
+        request conditional; returning that same entry (e.g. on HTTP 304)
+        renews it. Callers asking for a key that is already being loaded
+        wait for that load instead of starting their own.
+
+        Args:
+            key: Cache key, e.g. the request path
+            endpoint: Endpoint kind selecting the time to live
+            load: Function performing the request
+
+        Returns:
+            Cached response
+
+        Raises:
+            Exception: Whatever ``load`` raised, for every caller sharing the load
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > self.clock():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+                self.stats.misses += 1
+                self.stats.by_endpoint[endpoint] = self.stats.by_endpoint.get(endpoint, 0) + 1
+            else:
+                self.stats.shared += 1
+        if not owner:
+            return future.result()
+
+        try:
+            response = load(entry)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            if response is entry:
+                self.stats.revalidated += 1
+            response.expires = self.clock() + self.ttls.get(endpoint, 0.0)
+            self._store(key, response)
+            del self._in_flight[key]
+        future.set_result(response)
+        return response
+
+    def invalidate(self, prefix: str = ""):
+        """Drop cached responses, e.g. after changing a camera.
+
+        Args:
+            prefix: Only drop keys starting with this, all if empty
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._bytes -= self._entries.pop(key).size
+
+    def clear(self):
+        """Drop all cached responses."""
+        self.invalidate()
+
+    def _store(self, key: str, response: CachedResponse):
+        """Insert a response and evict the least recently used ones over budget.
+
+        Must be called with the lock held.
+
+        Args:
+            key: Cache key
+            response: Response to keep
+        """
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        if response.size > self.max_bytes:
+            logger.debug(f"Response for {key} exceeds the cache size, not cached")
+            return
+        self._entries[key] = response
+        self._bytes += response.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.stats.evictions += 1
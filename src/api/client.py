@@ -5,21 +5,662 @@ This module provides the main API client for communicating with UniFi Video serv
 handling authentication, camera discovery, and stream management.
 """
 
+import json
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .auth import AuthManager
+from .cache import CachedResponse, ResponseCache
+from .json_stream import ITEM, iter_envelope
+from ..models.camera import Camera
+from ..models.recording import Recording
+from ..models.recording_set import RecordingSet
+from ..utils.logger import get_logger
+
+logger = get_logger("api.client")
+
+
+# Responses up to this size are parsed in one go, larger ones item by item
+STREAM_THRESHOLD = 1 << 20
+STREAM_CHUNK_SIZE = 1 << 16
+
+
+class UniFiVideoAPIError(Exception):
+    """Raised when a UniFi Video API request fails."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        """Initialize the error.
+
+        Args:
+            message: Error description
+            status_code: HTTP status code of the failed response, if any
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def unwrap_response(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract the ``data`` list from a UniFi Video response envelope.
+
+    Args:
+        payload: Decoded JSON response body
+
+    Returns:
+        List of data items
+
+    Raises:
+        UniFiVideoAPIError: If the envelope reports an error
+    """
+    meta = payload.get('meta') or {}
+    if meta.get('rc') == 'error' or payload.get('rc') == 'error':
+        message = meta.get('msg') or payload.get('message') or 'Unknown API error'
+        raise UniFiVideoAPIError(message)
+    return payload.get('data') or []
+
+
+def parse_stream_url(data: List[Dict[str, Any]]) -> Optional[str]:
+    """Extract a playable stream URL from a ``/stream/.../url`` response.
+
+    Args:
+        data: Data items of the stream URL response
+
+    Returns:
+        Stream URL or None if the response carries none
+    """
+    if not data:
+        return None
+    item = data[0]
+    url = item.get('url') or item.get('rtspPath')
+    if url:
+        return url
+    if item.get('rtmpPath') and item.get('streamName'):
+        return f"{item['rtmpPath'].rstrip('/')}/{item['streamName']}"
+    return None
+
+
+def recording_query_params(camera_ids: Iterable[str], start_time: datetime,
+                           end_time: datetime) -> List[Tuple[str, Any]]:
+    """Build query parameters for a ``/recording`` listing.
+
+    Args:
+        camera_ids: Cameras to include
+        start_time: Start of the time range
+        end_time: End of the time range
+
+    Returns:
+        List of query parameter pairs
+    """
+    params: List[Tuple[str, Any]] = [('cameras[]', camera_id) for camera_id in camera_ids]
+    params += [
+        ('startTime', round(start_time.timestamp() * 1000)),
+        ('endTime', round(end_time.timestamp() * 1000)),
+        ('sortBy', 'startTime'),
+        ('sort', 'asc'),
+    ]
+    return params
+
+
+def recording_slices(camera_ids: Iterable[str], start_time: datetime, end_time: datetime,
+                     priority: Optional[datetime] = None,
+                     first_slice: timedelta = timedelta(hours=1),
+                     slice_duration: timedelta = timedelta(hours=12)
+                     ) -> List[Tuple[str, datetime, datetime]]:
+    """Split a recording query into per-camera time slices, most urgent first.
+
+    The slice starting at ``priority`` is short so it returns quickly; the
+    rest of the range follows in longer slices, nearest to ``priority`` first.
+
+    Args:
+        camera_ids: Cameras to include
+        start_time: Start of the time range
+        end_time: End of the time range
+        priority: Time the user looks at first, defaults to ``start_time``
+        first_slice: Length of the slice at ``priority``
+        slice_duration: Length of the other slices
+
+    Returns:
+        List of (camera_id, start, end) slices
+    """
+    camera_ids = list(dict.fromkeys(camera_ids))
+    if end_time <= start_time:
+        return [(camera_id, start_time, end_time) for camera_id in camera_ids]
+    priority = min(max(priority or start_time, start_time), end_time)
+    spans = [(priority, min(priority + first_slice, end_time))]
+    later, earlier = spans[0][1], priority
+    while later < end_time or earlier > start_time:
+        if later < end_time:
+            spans.append((later, min(later + slice_duration, end_time)))
+            later = spans[-1][1]
+        if earlier > start_time:
+            spans.append((max(earlier - slice_duration, start_time), earlier))
+            earlier = spans[-1][0]
+    return [(camera_id, span_start, span_end)
+            for span_start, span_end in spans if span_end > span_start
+            for camera_id in camera_ids]
+
 
 class UniFiVideoClient:
     """Main API client for UniFi Video server communication."""
 
-    def __init__(self, server_url: str):
+    API_PREFIX = "/api/2.0"
+
+    def __init__(self, server_url: str, max_connections: int = 4,
+                 timeout: float = 15.0, verify_ssl: bool = True,
+                 session_file: Optional[str] = None, session_lifetime: int = 3600,
+                 cache: Optional[ResponseCache] = None):
         """Initialize the API client.
 
+        Every request goes through one ``requests.Session`` whose connection
+        pool is capped at ``max_connections`` keep-alive connections, so the
+        TLS handshake is paid once per connection rather than once per call.
+
         Args:
             server_url: The base URL of the UniFi Video server
+            max_connections: Maximum number of pooled connections to the server
+            timeout: Timeout in seconds for API requests
+            verify_ssl: Whether to verify the server TLS certificate
+            session_file: Optional path for caching the session between runs
+            session_lifetime: Seconds a session is assumed to stay valid
+            cache: Response cache for server info, camera details, stream
+                URLs and snapshots; nothing is cached if omitted
+        """
+        self.server_url = server_url.rstrip('/')
+        self.max_connections = max(1, max_connections)
+        self.timeout = timeout
+        self.cache = cache
+
+        self.session = requests.Session()
+        self.session.verify = verify_ssl
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+        })
+        # pool_block keeps concurrent callers waiting for a free connection
+        # instead of opening throwaway ones past the cap
+        adapter = HTTPAdapter(pool_connections=1,
+                              pool_maxsize=self.max_connections,
+                              pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.auth = AuthManager(self.session, session_file=session_file,
+                                session_lifetime=session_lifetime)
+
+    @classmethod
+    def from_config(cls, config) -> 'UniFiVideoClient':
+        """Create a client from application configuration.
+
+        Args:
+            config: Loaded ConfigManager instance
+
+        Returns:
+            Configured API client
         """
-        self.server_url = server_url
-        self.session_id = None
+        server = config.get_server_config()
+        network = config.get_network_settings()
+        return cls(
+            server['url'],
+            max_connections=network['max_concurrent_streams'],
+            timeout=network['api_timeout'],
+            verify_ssl=server['verify_ssl'],
+            session_file=server['session_file'] or None,
+            session_lifetime=server['session_lifetime'],
+            cache=ResponseCache.from_config(config),
+        )
+
+    @property
+    def session_id(self) -> Optional[str]:
+        """Current ``JSESSIONID_AV`` session cookie, if logged in."""
+        return self.auth.session_id
+
+    def __enter__(self):
+        """Enter the client context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the client when leaving the context."""
+        self.close()
+
+    def close(self):
+        """Stop the session refresh and close all pooled connections."""
+        self.auth.stop_auto_refresh()
+        self.session.close()
+
+    # Authentication
+
+    def login(self, username: str, password: str) -> bool:
+        """Log in and keep the session cookie for subsequent requests.
+
+        Args:
+            username: User login name
+            password: User password
+
+        Returns:
+            True if authentication successful, False otherwise
+        """
+        success = self.auth.login(username, password, self.server_url)
+        if success:
+            self.auth.start_auto_refresh()
+        return success
+
+    def logout(self) -> bool:
+        """Log out from the server.
+
+        Returns:
+            True if logout successful, False otherwise
+        """
+        return self.auth.logout()
+
+    # Transport
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request over the pooled session.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path relative to the API prefix
+            **kwargs: Extra arguments passed to ``requests.Session.request``
+
+        Returns:
+            HTTP response
+
+        Raises:
+            UniFiVideoAPIError: On connection errors or HTTP error status
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        url = f"{self.server_url}{self.API_PREFIX}{path}"
+        session_id = self.auth.session_id
+        try:
+            response = self.session.request(method, url, **kwargs)
+            # An expired session is renewed and the request replayed once
+            if response.status_code == 401 and self.auth.reauthenticate(session_id):
+                logger.info(f"Session rejected on {method} {path}, replaying after re-login")
+                response.close()
+                response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            raise UniFiVideoAPIError(f"{method} {path} failed: {e}") from e
+
+        if response.status_code >= 400:
+            response.close()
+            raise UniFiVideoAPIError(f"{method} {path} returned HTTP {response.status_code}",
+                                     status_code=response.status_code)
+        return response
+
+    def _get_data(self, path: str, **kwargs) -> List[Dict[str, Any]]:
+        """GET a JSON endpoint and return its ``data`` list.
+
+        Args:
+            path: Endpoint path relative to the API prefix
+            **kwargs: Extra request arguments
+
+        Returns:
+            List of data items
+        """
+        response = self._request('GET', path, **kwargs)
+        return unwrap_response(response.json())
+
+    def _get_cached(self, endpoint: str, path: str, **kwargs) -> bytes:
+        """GET an endpoint through the response cache.
+
+        Expired entries are revalidated with a conditional request when the
+        server sent an ETag or Last-Modified header, and concurrent calls
+        for the same path share one request.
+
+        Args:
+            endpoint: Endpoint kind selecting the time to live
+            path: Endpoint path relative to the API prefix
+            **kwargs: Extra request arguments
+
+        Returns:
+            Response body
+        """
+        def load(stale: Optional[CachedResponse]) -> CachedResponse:
+            headers = dict(kwargs.get('headers') or {})
+            if stale is not None:
+                headers.update(stale.validators())
+            response = self._request('GET', path, **dict(kwargs, headers=headers))
+            if response.status_code == 304 and stale is not None:
+                return stale
+            return CachedResponse(response.content, response.headers.get('ETag'),
+                                  response.headers.get('Last-Modified'))
+
+        if self.cache is None:
+            return self._request('GET', path, **kwargs).content
+        return self.cache.get(path, endpoint, load).body
+
+    def _get_cached_data(self, endpoint: str, path: str) -> List[Dict[str, Any]]:
+        """GET a JSON endpoint through the response cache and return its ``data`` list.
+
+        Args:
+            endpoint: Endpoint kind selecting the time to live
+            path: Endpoint path relative to the API prefix
+
+        Returns:
+            List of data items, decoded afresh for every caller
+        """
+        if self.cache is None:
+            return self._get_data(path)
+        return unwrap_response(json.loads(self._get_cached(endpoint, path)))
+
+    def _iter_data(self, path: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """GET a JSON endpoint and yield its ``data`` items as they are decoded.
+
+        Large listings are parsed incrementally from the socket, so the
+        full body and the full parsed document are never held at once.
+        Responses that declare a length up to ``STREAM_THRESHOLD`` are
+        parsed in one go, which is faster for small payloads.
 
-    # TODO: Implement authentication methods
-    # TODO: Implement camera discovery
-    # TODO: Implement stream URL retrieval
-    # TODO: Implement server info retrieval
-    pass
\ No newline at end of file
+        Args:
+            path: Endpoint path relative to the API prefix
+            **kwargs: Extra request arguments
+
+        Yields:
+            Data items
+
+        Raises:
+            UniFiVideoAPIError: If the request fails, the envelope reports an
+                error or the body is malformed
+        """
+        response = self._request('GET', path, stream=True, **kwargs)
+        with response:
+            length = response.headers.get('Content-Length')
+            if length is not None and int(length) <= STREAM_THRESHOLD:
+                yield from unwrap_response(response.json())
+                return
+
+            envelope: Dict[str, Any] = {}
+            try:
+                for name, value in iter_envelope(response.iter_content(STREAM_CHUNK_SIZE)):
+                    if name == ITEM:
+                        yield value
+                        continue
+                    envelope[name] = value
+                    if name == 'meta':
+                        unwrap_response(envelope)
+            except ValueError as e:
+                raise UniFiVideoAPIError(f"Malformed response from {path}: {e}") from e
+            unwrap_response(envelope)
+
+    def _map_concurrent(self, func: Callable[[Any], Any],
+                        items: Iterable[Any]) -> Dict[Any, Any]:
+        """Run ``func`` for every item using at most one worker per pooled connection.
+
+        Args:
+            func: Function called with a single item
+            items: Items to process
+
+        Returns:
+            Mapping of item to result, or to None if the call failed
+        """
+        items = list(dict.fromkeys(items))
+        if not items:
+            return {}
+
+        results: Dict[Any, Any] = {}
+        workers = min(self.max_connections, len(items))
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="unifi-api") as executor:
+            futures = {item: executor.submit(func, item) for item in items}
+            for item, future in futures.items():
+                try:
+                    results[item] = future.result()
+                except UniFiVideoAPIError as e:
+                    logger.warning(f"Request for {item} failed: {e}")
+                    results[item] = None
+        return results
+
+    # Endpoints
+
+    def get_server_info(self, server_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get server information.
+
+        Args:
+            server_id: Optional server ID to filter by
+
+        Returns:
+            Server information or None if not available
+        """
+        path = f"/server/{server_id}" if server_id else "/server"
+        data = self._get_cached_data('server', path)
+        return data[0] if data else None
+
+    def get_cameras(self) -> List[Camera]:
+        """Get all cameras known to the server.
+
+        Returns:
+            List of cameras
+        """
+        return [Camera.from_api_response(item) for item in self.get_camera_data()]
+
+    def get_camera_data(self) -> List[Dict[str, Any]]:
+        """Get the raw camera listing, e.g. for ``CameraRegistry.sync``.
+
+        Returns:
+            Camera items as returned by the API
+        """
+        return list(self._iter_data("/camera"))
+
+    def get_camera(self, camera_id: str) -> Optional[Camera]:
+        """Get a single camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            Camera or None if not found
+        """
+        data = self._get_cached_data('camera', f"/camera/{camera_id}")
+        return Camera.from_api_response(data[0]) if data else None
+
+    def get_stream_url(self, camera_id: str, channel: int = 0) -> Optional[str]:
+        """Get the stream URL for a camera channel.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            channel: Stream channel number
+
+        Returns:
+            Stream URL or None if not available
+        """
+        return parse_stream_url(self._get_cached_data('stream',
+                                                      f"/stream/{camera_id}/{channel}/url"))
+
+    def get_stream_urls(self, camera_ids: Iterable[str],
+                        channel: int = 0) -> Dict[str, Optional[str]]:
+        """Resolve stream URLs for several cameras concurrently.
+
+        Args:
+            camera_ids: Camera identifiers
+            channel: Stream channel number
+
+        Returns:
+            Mapping of camera ID to stream URL (None where resolution failed)
+        """
+        return self._map_concurrent(lambda camera_id: self.get_stream_url(camera_id, channel),
+                                    camera_ids)
+
+    def get_snapshot(self, camera_id: str) -> bytes:
+        """Get the latest JPEG snapshot for a camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            JPEG image data
+        """
+        return self._get_cached('snapshot', f"/snapshot/camera/{camera_id}",
+                                headers={'Accept': 'image/jpeg'})
+
+    def get_recordings(self, camera_ids: Iterable[str], start_time: datetime,
+                       end_time: datetime) -> List[Recording]:
+        """Get recordings for cameras within a time range.
+
+        Args:
+            camera_ids: Cameras to query
+            start_time: Start of the time range
+            end_time: End of the time range
+
+        Returns:
+            List of recordings ordered by start time
+        """
+        params = recording_query_params(camera_ids, start_time, end_time)
+        return [Recording.from_api_response(item)
+                for item in self._iter_data("/recording", params=params)]
+
+    def get_recording_set(self, camera_ids: Iterable[str], start_time: datetime,
+                          end_time: datetime) -> RecordingSet:
+        """Get recordings for cameras within a time range as a compact column store.
+
+        Preferable to ``get_recordings`` for long ranges: rows are only
+        turned into ``Recording`` objects when accessed.
+
+        Args:
+            camera_ids: Cameras to query
+            start_time: Start of the time range
+            end_time: End of the time range
+
+        Returns:
+            Recording set ordered by start time
+        """
+        params = recording_query_params(camera_ids, start_time, end_time)
+        return RecordingSet.from_api_response(self._iter_data("/recording", params=params))
+
+    def get_recording_data(self, camera_ids: Iterable[str], start_time: datetime,
+                           end_time: datetime) -> List[Dict[str, Any]]:
+        """Get the raw recording items of cameras within a time range.
+
+        Args:
+            camera_ids: Cameras to query
+            start_time: Start of the time range
+            end_time: End of the time range
+
+        Returns:
+            Recording data items ordered by start time
+        """
+        params = recording_query_params(camera_ids, start_time, end_time)
+        return list(self._iter_data("/recording", params=params))
+
+    def iter_recording_pages(self, camera_ids: Iterable[str], start_time: datetime,
+                             end_time: datetime, priority: Optional[datetime] = None,
+                             first_slice: timedelta = timedelta(hours=1),
+                             slice_duration: timedelta = timedelta(hours=12),
+                             page_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        """Query a long recording range in parallel slices, yielding pages as they arrive.
+
+        The range is split with ``recording_slices`` and the slices are
+        fetched concurrently, at most one per pooled connection. Each slice
+        is paged by start time. Pages are yielded in arrival order, so the
+        slice at ``priority`` usually comes first and can be shown while the
+        rest loads, e.g. by feeding ``MultiTimeline.add_recording_data``.
+        A recording returned by two slices is yielded once. Closing the
+        iterator early stops the outstanding slices.
+
+        Args:
+            camera_ids: Cameras to query
+            start_time: Start of the time range
+            end_time: End of the time range
+            priority: Time to load first, defaults to ``start_time``
+            first_slice: Length of the slice at ``priority``
+            slice_duration: Length of the other slices
+            page_size: Recordings requested per page
+
+        Yields:
+            Pages of recording data items, each ordered by start time
+        """
+        slices = recording_slices(camera_ids, start_time, end_time, priority,
+                                  first_slice, slice_duration)
+        if not slices:
+            return
+        pages: "queue.Queue[Tuple[Optional[List[Dict[str, Any]]], Optional[Future]]]" = queue.Queue()
+        stop = threading.Event()
+
+        def fetch_slice(camera_id: str, slice_start: datetime, slice_end: datetime):
+            cursor = slice_start
+            limit = page_size
+            while not stop.is_set():
+                params = recording_query_params([camera_id], cursor, slice_end)
+                page = self._get_data("/recording", params=params + [('limit', limit)])
+                if page:
+                    pages.put((page, None))
+                if len(page) < limit:
+                    return
+                # Continue from the newest start time of this page, inclusive,
+                # so recordings past the page that share it are not skipped;
+                # the ones seen already are dropped by their _id below
+                latest = max(item['startTime'] for item in page)
+                if latest <= round(cursor.timestamp() * 1000):
+                    # The whole page starts at the cursor, widen it to get past
+                    limit *= 2
+                    continue
+                limit = page_size
+                cursor = datetime.fromtimestamp(latest / 1000)
+
+        seen = set()
+        executor = ThreadPoolExecutor(max_workers=min(self.max_connections, len(slices)),
+                                      thread_name_prefix="unifi-recordings")
+        try:
+            for recording_slice in slices:
+                future = executor.submit(fetch_slice, *recording_slice)
+                future.add_done_callback(lambda done: pages.put((None, done)))
+            remaining = len(slices)
+            while remaining:
+                page, done = pages.get()
+                if done is not None:
+                    remaining -= 1
+                    if not done.cancelled() and done.exception() is not None:
+                        logger.warning(f"Recording slice failed: {done.exception()}")
+                    continue
+                new = [item for item in page if item['_id'] not in seen]
+                seen.update(item['_id'] for item in new)
+                if new:
+                    yield new
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def open_recording(self, recording_id: str, offset: int = 0) -> requests.Response:
+        """Open a streamed download of a recording's MP4 file.
+
+        Args:
+            recording_id: Unique identifier for the recording
+            offset: Byte offset to resume from, sent as an HTTP Range header
+
+        Returns:
+            Streaming response (206 if the range was honoured); the caller
+            must close it
+        """
+        headers = {'Accept': 'video/mp4'}
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+        return self._request('GET', f"/recording/{recording_id}/download",
+                             headers=headers, stream=True)
+
+    def download_recording(self, recording_id: str, destination: Union[str, Path],
+                           chunk_size: int = 256 * 1024) -> int:
+        """Download the MP4 file of a recording.
+
+        The file is streamed to disk in chunks rather than held in memory.
+        See ``DownloadManager`` for resumable, parallel downloads.
+
+        Args:
+            recording_id: Unique identifier for the recording
+            destination: File path to write to
+            chunk_size: Bytes read from the socket per write
+
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with self.open_recording(recording_id) as response:
+            with open(destination, 'wb') as output:
+                for chunk in response.iter_content(chunk_size):
+                    output.write(chunk)
+                    written += len(chunk)
+        return written
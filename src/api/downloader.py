@@ -0,0 +1,349 @@
+"""
+Resumable, parallel recording downloads.
+
+This module streams recording MP4 files to disk in chunks, resumes
+interrupted transfers with HTTP Range requests, runs several downloads
+in parallel under a shared bandwidth cap and reports progress per file
+and in aggregate.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Union
+
+import requests
+
+from .client import UniFiVideoAPIError
+from ..models.recording import Recording
+from ..utils.helpers import retry_operation
+from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
+
+logger = get_logger("api.downloader")
+
+_PARTIAL_SUFFIX = ".part"
+
+
+class DownloadState(Enum):
+    """States of a recording download."""
+    QUEUED = "queued"
+    DOWNLOADING = "downloading"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class DownloadProgress:
+    """Progress of a single recording download."""
+    recording_id: str
+    destination: Path
+    total_bytes: Optional[int] = None
+    bytes_done: int = 0
+    state: DownloadState = DownloadState.QUEUED
+    resumed: int = 0
+    error: Optional[str] = None
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Completed fraction (0-1), or None if the size is unknown."""
+        if not self.total_bytes:
+            return None
+        return min(1.0, self.bytes_done / self.total_bytes)
+
+
+@dataclass
+class AggregateProgress:
+    """Combined progress of all downloads of a manager."""
+    files_total: int = 0
+    files_completed: int = 0
+    files_failed: int = 0
+    bytes_done: int = 0
+    bytes_total: int = 0
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Completed fraction (0-1) of the known total size."""
+        if not self.bytes_total:
+            return None
+        return min(1.0, self.bytes_done / self.bytes_total)
+
+
+class DownloadSizeError(Exception):
+    """Raised when a downloaded file does not match the expected size."""
+
+
+class DownloadManager:
+    """Downloads recordings in parallel within a bandwidth cap."""
+
+    def __init__(self, client, max_parallel: int = 3, bandwidth_limit: float = 0,
+                 chunk_size: int = 256 * 1024, max_retries: int = 3, retry_delay: float = 1.0,
+                 on_progress: Optional[Callable[[DownloadProgress, AggregateProgress], None]] = None):
+        """Initialize the download manager.
+
+        Args:
+            client: UniFiVideoClient used to open recording streams
+            max_parallel: Downloads running at the same time
+            bandwidth_limit: Combined cap for all downloads in bytes per second,
+                0 for unlimited
+            chunk_size: Bytes read from the socket per write
+            max_retries: Resume attempts after an interrupted transfer
+            retry_delay: Delay before the first resume attempt in seconds
+            on_progress: Called from worker threads with the file and aggregate
+                progress after every chunk
+        """
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.on_progress = on_progress
+        self.bandwidth = TokenBucket(bandwidth_limit, capacity=max(bandwidth_limit, chunk_size))
+
+        self._downloads: Dict[str, DownloadProgress] = {}
+        self._lock = threading.Lock()
+        # Replaced on every cancel_all, so later submits are not cancelled
+        self._cancel_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=max_parallel,
+                                            thread_name_prefix="download")
+
+    @classmethod
+    def from_config(cls, config, client, **kwargs) -> 'DownloadManager':
+        """Create a download manager from application configuration.
+
+        Args:
+            config: Loaded ConfigManager instance
+            client: API client used for downloads
+            **kwargs: Extra arguments passed to the constructor
+
+        Returns:
+            Configured download manager
+        """
+        network = config.get_network_settings()
+        return cls(client, max_parallel=network['max_parallel_downloads'],
+                   bandwidth_limit=network['download_bandwidth_limit'] * 1024,
+                   max_retries=network['stream_retry_attempts'], **kwargs)
+
+    def set_bandwidth_limit(self, bandwidth_limit: float):
+        """Change the combined bandwidth cap.
+
+        Args:
+            bandwidth_limit: Bytes per second, 0 for unlimited
+        """
+        self.bandwidth.set_rate(bandwidth_limit, capacity=max(bandwidth_limit, self.chunk_size))
+
+    def submit(self, recording: Recording, destination: Union[str, Path]) -> Future:
+        """Queue a recording for download.
+
+        Args:
+            recording: Recording to download
+            destination: Final file path; data is written to ``<destination>.part``
+                until the download is complete and verified
+
+        Returns:
+            Future resolving to the final DownloadProgress
+        """
+        progress = DownloadProgress(recording.recording_id, Path(destination),
+                                    total_bytes=recording.file_size_bytes or None)
+        with self._lock:
+            self._downloads[recording.recording_id] = progress
+            cancel_event = self._cancel_event
+        return self._executor.submit(self._run, progress, cancel_event)
+
+    def submit_many(self, recordings: Iterable[Recording],
+                    directory: Union[str, Path]) -> Dict[str, Future]:
+        """Queue several recordings, e.g. an incident across cameras.
+
+        Args:
+            recordings: Recordings to download
+            directory: Directory the files are written to
+
+        Returns:
+            Mapping of recording ID to future
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        return {recording.recording_id: self.submit(recording,
+                                                    directory / self.file_name(recording))
+                for recording in recordings}
+
+    @staticmethod
+    def file_name(recording: Recording) -> str:
+        """Build a descriptive file name for a recording.
+
+        Args:
+            recording: Recording to name
+
+        Returns:
+            File name such as ``camera001_20240101-120000_rec001.mp4``
+        """
+        return (f"{recording.camera_id}_{recording.start_time:%Y%m%d-%H%M%S}_"
+                f"{recording.recording_id}.mp4")
+
+    def get_progress(self, recording_id: str) -> Optional[DownloadProgress]:
+        """Get a copy of the progress of a download.
+
+        Args:
+            recording_id: Unique identifier for the recording
+
+        Returns:
+            Download progress or None if the recording was never submitted
+        """
+        with self._lock:
+            progress = self._downloads.get(recording_id)
+            return replace(progress) if progress is not None else None
+
+    def get_aggregate_progress(self) -> AggregateProgress:
+        """Get the combined progress of all submitted downloads.
+
+        Returns:
+            Aggregate progress
+        """
+        with self._lock:
+            return self._aggregate()
+
+    def cancel_all(self):
+        """Cancel queued downloads and stop running ones after their current chunk.
+
+        Partial files are kept, so downloading them again later resumes where
+        they stopped. Recordings submitted afterwards download normally.
+        """
+        with self._lock:
+            cancel_event, self._cancel_event = self._cancel_event, threading.Event()
+        cancel_event.set()
+
+    def close(self):
+        """Cancel all downloads and wait for the workers to finish."""
+        self.cancel_all()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _aggregate(self) -> AggregateProgress:
+        """Sum up all downloads. Must be called with the lock held."""
+        aggregate = AggregateProgress(files_total=len(self._downloads))
+        for progress in self._downloads.values():
+            aggregate.bytes_done += progress.bytes_done
+            aggregate.bytes_total += progress.total_bytes or progress.bytes_done
+            if progress.state == DownloadState.COMPLETED:
+                aggregate.files_completed += 1
+            elif progress.state in (DownloadState.FAILED, DownloadState.CANCELLED):
+                aggregate.files_failed += 1
+        return aggregate
+
+    def _update(self, progress: DownloadProgress, **changes):
+        """Apply changes to a download and report progress.
+
+        Args:
+            progress: Download progress to update
+            **changes: Field values to set
+        """
+        with self._lock:
+            for name, value in changes.items():
+                setattr(progress, name, value)
+            snapshot, aggregate = replace(progress), self._aggregate()
+        if self.on_progress is not None:
+            try:
+                self.on_progress(snapshot, aggregate)
+            except Exception as e:
+                logger.error(f"Download progress callback failed: {e}")
+
+    def _run(self, progress: DownloadProgress,
+             cancel_event: threading.Event) -> DownloadProgress:
+        """Download one recording, resuming after interruptions.
+
+        Args:
+            progress: Download progress to fill in
+            cancel_event: Cancel event of the batch the download was submitted in
+
+        Returns:
+            Final download progress
+        """
+        if cancel_event.is_set():
+            self._update(progress, state=DownloadState.CANCELLED)
+            return replace(progress)
+
+        progress.destination.parent.mkdir(parents=True, exist_ok=True)
+        self._update(progress, state=DownloadState.DOWNLOADING)
+        try:
+            retry_operation(lambda: self._transfer(progress, cancel_event),
+                            max_retries=self.max_retries, delay=self.retry_delay,
+                            stop_event=cancel_event)
+        except Exception as e:
+            state = (DownloadState.CANCELLED if cancel_event.is_set()
+                     else DownloadState.FAILED)
+            logger.error(f"Download of recording {progress.recording_id} {state.value}: {e}")
+            self._update(progress, state=state, error=str(e))
+            return replace(progress)
+
+        self._update(progress, state=DownloadState.COMPLETED, error=None)
+        logger.info(f"Downloaded recording {progress.recording_id} to {progress.destination}")
+        return replace(progress)
+
+    def _transfer(self, progress: DownloadProgress, cancel_event: threading.Event):
+        """Stream a recording into its partial file, resuming from its current size.
+
+        Args:
+            progress: Download progress
+            cancel_event: Event that stops the transfer after the current chunk
+
+        Raises:
+            DownloadSizeError: If the finished file does not have the expected size
+            UniFiVideoAPIError: On HTTP errors or interrupted transfers
+        """
+        partial = progress.destination.with_name(progress.destination.name + _PARTIAL_SUFFIX)
+        offset = partial.stat().st_size if partial.exists() else 0
+        if offset:
+            self._update(progress, resumed=progress.resumed + 1)
+
+        try:
+            response = self.client.open_recording(progress.recording_id, offset)
+        except UniFiVideoAPIError as e:
+            # 416: the partial file already holds the whole recording
+            if e.status_code != 416 or not offset:
+                raise
+            response = None
+
+        if response is not None:
+            with response:
+                if offset and response.status_code != 206:
+                    logger.debug(f"Server ignored range for {progress.recording_id}, restarting")
+                    offset = 0
+                self._update(progress, bytes_done=offset)
+                self._write_body(progress, response, partial, offset, cancel_event)
+
+        size = partial.stat().st_size
+        if progress.total_bytes is not None and size != progress.total_bytes:
+            if size > progress.total_bytes:
+                partial.unlink()
+            raise DownloadSizeError(f"recording {progress.recording_id} has {size} bytes, "
+                                    f"expected {progress.total_bytes}")
+        os.replace(partial, progress.destination)
+        self._update(progress, bytes_done=size)
+
+    def _write_body(self, progress: DownloadProgress, response, partial: Path, offset: int,
+                    cancel_event: threading.Event):
+        """Write a streamed response body to the partial file.
+
+        Args:
+            progress: Download progress
+            response: Streaming HTTP response
+            partial: Partial file path
+            offset: Bytes already on disk; 0 truncates the file
+            cancel_event: Event that stops the transfer after the current chunk
+        """
+        done = offset
+        with open(partial, 'ab' if offset else 'wb') as output:
+            try:
+                for chunk in response.iter_content(self.chunk_size):
+                    if (cancel_event.is_set()
+                            or not self.bandwidth.acquire(len(chunk), cancel_event)):
+                        raise UniFiVideoAPIError("download cancelled")
+                    output.write(chunk)
+                    done += len(chunk)
+                    self._update(progress, bytes_done=done)
+            except requests.RequestException as e:
+                # A dropped connection surfaces while iterating the body
+                raise UniFiVideoAPIError(f"transfer of {progress.recording_id} "
+                                         f"interrupted: {e}") from e
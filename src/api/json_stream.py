@@ -0,0 +1,151 @@
+"""
+Incremental parsing of UniFi Video response envelopes.
+
+Camera and recording listings arrive as one ``{"data": [...], "meta": {...}}``
+document that can be many megabytes large. This module decodes such a
+document from a stream of byte chunks and hands out the items of its
+array one by one, so neither the full text nor the full parsed tree has
+to be held in memory. Only the standard library JSON decoder is used.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Tuple
+
+# Item yielded for every element of the streamed array
+ITEM = "item"
+
+_WHITESPACE = " \t\n\r"
+
+# Buffered text is compacted once this much of it has been consumed
+_COMPACT_AT = 1 << 16
+
+
+class _Reader:
+    """Text buffer filled from byte chunks on demand."""
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer.
+
+        Returns:
+            False if the stream is exhausted
+        """
+        if self.eof:
+            return False
+        if self.pos >= _COMPACT_AT:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.text += text
+                return True
+        self.text += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it.
+
+        Returns:
+            Next character, empty at the end of the stream
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, characters: str) -> str:
+        """Consume the next character, which must be one of ``characters``.
+
+        Returns:
+            Consumed character
+
+        Raises:
+            ValueError: If the document does not continue as expected
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            found = repr(character) if character else "end of data"
+            raise ValueError(f"Expected one of {characters!r} at offset {self.pos}, "
+                             f"found {found}")
+        self.pos += 1
+        return character
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        """Decode the JSON value at the current position.
+
+        A value is only accepted once the character following it is
+        buffered, so a number split across chunks is not cut short.
+
+        Returns:
+            Decoded value
+
+        Raises:
+            ValueError: If the value is malformed
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            if end < len(self.text) or self.eof or not self.fill():
+                self.pos = end
+                return value
+
+
+def iter_envelope(chunks: Iterable[bytes], key: str = "data",
+                  encoding: str = "utf-8") -> Iterator[Tuple[str, Any]]:
+    """Decode a JSON object from byte chunks, streaming one array field.
+
+    Args:
+        chunks: Raw response body, e.g. ``response.iter_content(65536)``
+        key: Top-level field whose array elements are yielded one by one
+        encoding: Text encoding of the body
+
+    Yields:
+        (``ITEM``, element) for every element of ``key``, and
+        (name, value) for every other top-level field, in document order
+
+    Raises:
+        ValueError: If the body is not a JSON object or is malformed
+    """
+    reader = _Reader(chunks, encoding)
+    decoder = json.JSONDecoder()
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        if reader.peek() != '"':
+            reader.expect('"')
+        name = reader.value(decoder)
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.pos += 1
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield ITEM, reader.value(decoder)
+                    if reader.expect(",]") == "]":
+                        break
+        else:
+            yield name, reader.value(decoder)
+        if reader.expect(",}") == "}":
+            break
+    if reader.peek():
+        raise ValueError(f"Extra data after the JSON object at offset {reader.pos}")
@@ -5,19 +5,109 @@ This module implements the grid layout for displaying multiple camera
 live streams in a organized, resizable grid format.
 """
 
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Tuple
+
+import FreeSimpleGUI as sg
+
+from ..models.camera import Camera
+from ..models.camera_registry import CameraEvent, CameraEventKind
+from ..video.compositor import MosaicCompositor
+from ..video.snapshot_poller import SnapshotPoller
+from ..video.stream_manager import SuspendMode
+from ..utils.logger import get_logger
+
+logger = get_logger("gui.camera_grid")
+
+# Window event carrying a decoded snapshot as (camera_id, image_data)
+SNAPSHOT_EVENT = "-SNAPSHOT-"
+# Window event carrying a CameraEvent from the camera registry
+CAMERA_EVENT = "-CAMERA-"
+# Image element showing the composited mosaic
+MOSAIC_KEY = "-MOSAIC-"
+
+# Camera fields whose change requires reopening a tile's stream
+_STREAM_FIELDS = {'streams', 'ip_address', 'port'}
+
+# Worker group adapting stream channels to the decode load
+QUALITY_GROUP = "quality"
+
+
+class GridMode(Enum):
+    """Rendering modes of the camera grid."""
+    VIDEO = "video"
+    SNAPSHOT = "snapshot"
+    MOSAIC = "mosaic"
+
+
+@dataclass
+class CameraTile:
+    """A camera assigned to a grid cell."""
+    camera_id: str
+    stream_url: str
+    key: str
+    visible: bool = True
+    camera: Optional[Camera] = None
+    suspended: bool = False
+
 
 class CameraGrid:
     """Grid widget for displaying multiple camera streams."""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, stream_manager=None, client=None,
+                 mode: GridMode = GridMode.VIDEO, tile_size: Tuple[int, int] = (320, 180),
+                 snapshot_interval: float = 1.0, snapshot_rate_limit: float = 4.0,
+                 worker=None, suspend_mode: SuspendMode = SuspendMode.PAUSE,
+                 mosaic_fps: float = 15.0):
         """Initialize the camera grid.
 
         Args:
             parent: Parent widget or window
+            stream_manager: StreamManager used for video tiles
+            client: API client used to fetch snapshots in snapshot mode
+            mode: Initial rendering mode
+            tile_size: Size of a single tile in pixels
+            snapshot_interval: Refresh interval per snapshot tile in seconds
+            snapshot_rate_limit: Maximum snapshot requests per second for the whole grid
+            worker: BackgroundWorker running stream manager calls off the GUI
+                thread; without one they run inline
+            suspend_mode: How video tiles nobody can see are suspended
+            mosaic_fps: Frame rate cap of the composited image in mosaic mode
         """
         self.parent = parent
-        self.camera_widgets = []
+        self.camera_widgets: List[CameraTile] = []
         self.grid_layout = None
+        self.rows = 0
+        self.columns = 0
+
+        self.mode = mode
+        self.stream_manager = stream_manager
+        self.client = client
+        self.tile_size = tile_size
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_rate_limit = snapshot_rate_limit
+        self.snapshot_poller: Optional[SnapshotPoller] = None
+        self.minimized = False
+        self.zoomed_camera: Optional[str] = None
+        self.worker = worker
+        self.suspend_mode = suspend_mode
+        self.mosaic_fps = mosaic_fps
+        self.compositor: Optional[MosaicCompositor] = None
+        self._next_quality_update = 0.0
+
+    @staticmethod
+    def _tile_key(index: int) -> str:
+        """Get the element key of a grid cell.
+
+        Args:
+            index: Cell index in row-major order
+
+        Returns:
+            Element key
+        """
+        return f"-TILE-{index}-"
 
     def setup_grid(self, rows: int, columns: int):
         """Setup the grid layout with specified dimensions.
@@ -25,23 +115,61 @@ class CameraGrid:
         Args:
             rows: Number of rows in the grid
             columns: Number of columns in the grid
+
+        Returns:
+            Layout rows to embed in the window
         """
-        # TODO: Create grid layout
-        # TODO: Initialize camera widget placeholders
-        # TODO: Setup grid sizing and spacing
-        pass
+        self.rows = rows
+        self.columns = columns
+        if self.mode == GridMode.MOSAIC:
+            width, height = self.tile_size
+            if self.compositor is not None:
+                self._run_serial("mosaic", self.compositor.set_layout, rows, columns,
+                                 self.tile_size)
+            self.grid_layout = [[sg.Image(key=MOSAIC_KEY, size=(columns * width, rows * height),
+                                          background_color='black', pad=(2, 2))]]
+            return self.grid_layout
+        self.grid_layout = [
+            [sg.Image(key=self._tile_key(row * columns + column), size=self.tile_size,
+                      background_color='black', pad=(2, 2))
+             for column in range(columns)]
+            for row in range(rows)
+        ]
+        return self.grid_layout
+
+    def get_tile(self, camera_id: str) -> Optional[CameraTile]:
+        """Get the tile showing a camera.
 
-    def add_camera_stream(self, camera_id: str, stream_url: str):
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            Camera tile or None if the camera is not in the grid
+        """
+        for tile in self.camera_widgets:
+            if tile.camera_id == camera_id:
+                return tile
+        return None
+
+    def add_camera_stream(self, camera_id: str, stream_url: str,
+                          camera: Optional[Camera] = None):
         """Add a camera stream to the grid.
 
         Args:
             camera_id: Unique identifier for the camera
             stream_url: URL of the camera stream
+            camera: Camera model, lets the stream manager pick a channel for the tile size
         """
-        # TODO: Create camera widget
-        # TODO: Initialize video player for stream
-        # TODO: Add to grid layout
-        pass
+        if self.get_tile(camera_id) is not None:
+            return
+        index = len(self.camera_widgets)
+        if index >= self.rows * self.columns:
+            logger.warning(f"No free grid cell for camera {camera_id}")
+            return
+
+        tile = CameraTile(camera_id, stream_url, self._tile_key(index), camera=camera)
+        self.camera_widgets.append(tile)
+        self._start_tile(tile)
 
     def remove_camera_stream(self, camera_id: str):
         """Remove a camera stream from the grid.
@@ -49,18 +177,400 @@ class CameraGrid:
         Args:
             camera_id: Unique identifier for the camera to remove
         """
-        # TODO: Find and remove camera widget
-        # TODO: Cleanup video player resources
-        # TODO: Update grid layout
-        pass
+        tile = self.get_tile(camera_id)
+        if tile is None:
+            return
+        self._stop_tile(tile)
+        self.camera_widgets.remove(tile)
+        self._clear_cell(tile.key)
+        # Shift the remaining cameras so the grid stays packed; running
+        # players are moved to their new cell rather than restarted
+        for index, other in enumerate(self.camera_widgets):
+            new_key = self._tile_key(index)
+            if other.key != new_key:
+                self._clear_cell(other.key)
+                other.key = new_key
+                if self.mode == GridMode.VIDEO and self.stream_manager is not None:
+                    self._call_stream_manager(other.camera_id, 'set_stream_widget',
+                                              other.camera_id, self._tile_widget(other))
 
     def update_grid_layout(self, rows: int, columns: int):
         """Update the grid layout dimensions.
 
+        The window has to be rebuilt from the new ``grid_layout``; tiles
+        resume rendering once it is passed to ``attach``.
+
         Args:
             rows: New number of rows
             columns: New number of columns
         """
-        # TODO: Reorganize existing camera widgets
-        # TODO: Update grid layout
-        pass
\ No newline at end of file
+        for tile in self.camera_widgets:
+            self._stop_tile(tile)
+        self.setup_grid(rows, columns)
+
+        capacity = rows * columns
+        for tile in self.camera_widgets[capacity:]:
+            logger.info(f"Camera {tile.camera_id} no longer fits in a {rows}x{columns} grid")
+        self.camera_widgets = self.camera_widgets[:capacity]
+        for index, tile in enumerate(self.camera_widgets):
+            tile.key = self._tile_key(index)
+
+    def attach(self, window):
+        """Attach the grid to its finalized window and start rendering.
+
+        Called after the window built from ``grid_layout`` has been created.
+
+        Args:
+            window: Finalized FreeSimpleGUI window
+        """
+        self.parent = window
+        for tile in self.camera_widgets:
+            self._start_tile(tile)
+
+    def set_mode(self, mode: GridMode):
+        """Switch between live video tiles, refreshed snapshots and the mosaic.
+
+        Switching to or from the mosaic changes the layout: the window has
+        to be rebuilt from the new ``grid_layout`` and passed to ``attach``.
+
+        Args:
+            mode: New rendering mode
+        """
+        if mode == self.mode:
+            return
+        for tile in self.camera_widgets:
+            self._stop_tile(tile)
+        relayout = GridMode.MOSAIC in (mode, self.mode)
+        self.mode = mode
+        if relayout:
+            self.setup_grid(self.rows, self.columns)
+            return
+        for tile in self.camera_widgets:
+            self._start_tile(tile)
+        if mode != GridMode.SNAPSHOT and self.snapshot_poller is not None:
+            self.snapshot_poller.stop()
+
+    def set_zoomed_camera(self, camera_id: Optional[str]):
+        """Show one camera in the single-camera zoom view, or return to the grid.
+
+        The zoomed camera is switched to its full-resolution channel and the
+        previously zoomed one back to the channel matching its tile.
+
+        Args:
+            camera_id: Camera to zoom into, or None to leave the zoom view
+        """
+        previous = self.zoomed_camera
+        self.zoomed_camera = camera_id
+        if self.stream_manager is not None and self.mode == GridMode.VIDEO:
+            if previous is not None and previous != camera_id:
+                self._call_stream_manager(previous, 'set_tile_size', previous, self.tile_size)
+            if camera_id is not None:
+                self._call_stream_manager(camera_id, 'set_tile_size', camera_id, None)
+        # The zoom view covers every other tile
+        for tile in self.camera_widgets:
+            self._update_suspension(tile)
+
+    def set_tile_visible(self, camera_id: str, visible: bool):
+        """Mark a tile as visible or hidden (e.g. scrolled out of view).
+
+        Args:
+            camera_id: Unique identifier for the camera
+            visible: Whether the tile can be seen
+        """
+        tile = self.get_tile(camera_id)
+        if tile is None or tile.visible == visible:
+            return
+        tile.visible = visible
+        self._update_suspension(tile)
+
+    def set_minimized(self, minimized: bool):
+        """Pause or resume rendering when the window is minimized.
+
+        Args:
+            minimized: Whether the window is minimized
+        """
+        if minimized == self.minimized:
+            return
+        self.minimized = minimized
+        if self.snapshot_poller is not None:
+            self.snapshot_poller.set_paused(minimized)
+        for tile in self.camera_widgets:
+            self._update_suspension(tile)
+
+    def refresh_visibility(self):
+        """Update tile visibility and minimized state from the window."""
+        if self.parent is None or getattr(self.parent, 'TKroot', None) is None:
+            return
+        self.set_minimized(self.parent.TKroot.state() == 'iconic')
+        for tile in self.camera_widgets:
+            widget = self._tile_widget(tile)
+            if widget is not None:
+                self.set_tile_visible(tile.camera_id, bool(widget.winfo_viewable()))
+
+    def update_mosaic(self):
+        """Blit the composited mosaic if a new image is due.
+
+        Meant to be called from the GUI loop on every read timeout.
+        """
+        if (self.mode != GridMode.MOSAIC or self.compositor is None or self.minimized
+                or self.parent is None):
+            return
+        data = self.compositor.render()
+        if data is not None:
+            self.parent[MOSAIC_KEY].update(data=data)
+
+    def update_quality(self):
+        """Let the stream manager adapt channels to the decode load if it is due.
+
+        Meant to be called from the GUI loop on every read timeout; the
+        update runs on the worker at most once per quality change cooldown.
+        """
+        if self.mode != GridMode.VIDEO or self.stream_manager is None:
+            return
+        now = time.monotonic()
+        if now < self._next_quality_update:
+            return
+        self._next_quality_update = now + self.stream_manager.quality.change_cooldown
+        self._run_serial(QUALITY_GROUP, self.stream_manager.update_quality)
+
+    def handle_event(self, event, values) -> bool:
+        """Handle grid events from the window read loop.
+
+        Args:
+            event: Window event
+            values: Window values
+
+        Returns:
+            True if the event was handled by the grid, False otherwise
+        """
+        if event == CAMERA_EVENT:
+            self.apply_camera_event(values[event])
+            return True
+        if event != SNAPSHOT_EVENT:
+            return False
+        camera_id, image_data = values[event]
+        tile = self.get_tile(camera_id)
+        if tile is not None and self.mode == GridMode.SNAPSHOT and self.parent is not None:
+            self.parent[tile.key].update(data=image_data)
+        return True
+
+    def post_camera_event(self, event: CameraEvent):
+        """Hand a camera registry event from a worker thread to the GUI loop.
+
+        Suitable as a ``CameraRegistry`` listener.
+
+        Args:
+            event: Camera list change
+        """
+        if self.parent is not None:
+            self.parent.write_event_value(CAMERA_EVENT, event)
+
+    def apply_camera_event(self, event: CameraEvent):
+        """Update only the tile affected by a camera list change.
+
+        Args:
+            event: Camera list change
+        """
+        tile = self.get_tile(event.camera_id)
+        if tile is None:
+            return
+        if event.kind == CameraEventKind.REMOVED:
+            self.remove_camera_stream(event.camera_id)
+            return
+        if event.kind != CameraEventKind.CHANGED:
+            return
+
+        if event.camera is not None:
+            tile.camera = event.camera
+        camera = tile.camera
+        if camera is not None and event.changed_fields & {'state', 'is_connected'}:
+            if not camera.is_online:
+                logger.info(f"Camera {event.camera_id} went offline")
+                self._stop_tile(tile)
+                self._clear_cell(tile.key)
+            else:
+                logger.info(f"Camera {event.camera_id} is back online")
+                self._start_tile(tile)
+        elif event.changed_fields & _STREAM_FIELDS:
+            logger.debug(f"Streams of camera {event.camera_id} changed, reopening tile")
+            self._stop_tile(tile)
+            self._start_tile(tile)
+
+    def cleanup(self):
+        """Stop all tiles, the snapshot poller and the mosaic compositor."""
+        for tile in self.camera_widgets:
+            self._stop_tile(tile)
+        if self.snapshot_poller is not None:
+            self.snapshot_poller.stop()
+        if self.compositor is not None:
+            self._run_serial("mosaic", self.compositor.cleanup)
+
+    def is_tile_shown(self, tile: CameraTile) -> bool:
+        """Check if a tile can currently be seen.
+
+        Args:
+            tile: Camera tile
+
+        Returns:
+            False if the tile is scrolled away, covered by the zoom view or
+            the window is minimized
+        """
+        if self.minimized or not tile.visible:
+            return False
+        return self.zoomed_camera is None or self.zoomed_camera == tile.camera_id
+
+    def _update_suspension(self, tile: CameraTile):
+        """Suspend or resume a tile's rendering to match whether it can be seen.
+
+        Args:
+            tile: Camera tile
+        """
+        if self.mode == GridMode.MOSAIC:
+            # Mosaic cells share one image; update_mosaic stops blitting while minimized
+            return
+        shown = self.is_tile_shown(tile)
+        if self.mode == GridMode.SNAPSHOT:
+            if self.snapshot_poller is not None:
+                self.snapshot_poller.set_visible(tile.camera_id, shown)
+            return
+        if self.stream_manager is None or tile.suspended != shown:
+            return
+        tile.suspended = not shown
+        if shown:
+            self._call_stream_manager(tile.camera_id, 'resume_stream', tile.camera_id)
+        else:
+            self._call_stream_manager(tile.camera_id, 'suspend_stream', tile.camera_id,
+                                      self.suspend_mode)
+
+    def _tile_widget(self, tile: CameraTile):
+        """Get the native widget of a tile.
+
+        Args:
+            tile: Camera tile
+
+        Returns:
+            Tk widget or None if the window is not created yet
+        """
+        if self.parent is None:
+            return None
+        element = self.parent.find_element(tile.key, silent_on_error=True)
+        return getattr(element, 'Widget', None)
+
+    def _clear_cell(self, key: str):
+        """Blank a grid cell.
+
+        Args:
+            key: Element key of the cell
+        """
+        if self.parent is not None:
+            element = self.parent.find_element(key, silent_on_error=True)
+            if element is not None and getattr(element, 'Widget', None) is not None:
+                element.update(data=None)
+
+    def _get_snapshot_poller(self) -> SnapshotPoller:
+        """Get the shared snapshot poller, starting it on first use.
+
+        Returns:
+            Running snapshot poller
+        """
+        if self.snapshot_poller is None:
+            self.snapshot_poller = SnapshotPoller(
+                self.client.get_snapshot, self._post_snapshot,
+                rate_limit=self.snapshot_rate_limit, interval=self.snapshot_interval,
+            )
+            self.snapshot_poller.set_paused(self.minimized)
+        self.snapshot_poller.start()
+        return self.snapshot_poller
+
+    def _get_compositor(self) -> MosaicCompositor:
+        """Get the mosaic compositor, creating it on first use.
+
+        Returns:
+            Mosaic compositor for the current layout
+        """
+        if self.compositor is None:
+            self.compositor = MosaicCompositor(self.rows, self.columns, self.tile_size,
+                                               max_fps=self.mosaic_fps)
+        return self.compositor
+
+    def _post_snapshot(self, camera_id: str, image_data: bytes):
+        """Hand a decoded snapshot from a worker thread to the GUI loop.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            image_data: Decoded image data
+        """
+        if self.parent is not None:
+            self.parent.write_event_value(SNAPSHOT_EVENT, (camera_id, image_data))
+
+    def _start_tile(self, tile: CameraTile):
+        """Start rendering a tile in the current mode.
+
+        Args:
+            tile: Camera tile
+        """
+        if self.mode == GridMode.SNAPSHOT:
+            if self.client is not None:
+                self._get_snapshot_poller().add_camera(tile.camera_id, self.tile_size,
+                                                       self.is_tile_shown(tile))
+        elif self.mode == GridMode.MOSAIC:
+            self._run_serial("mosaic", self._get_compositor().add_camera, tile.camera_id,
+                             tile.stream_url, camera=tile.camera)
+        elif self.stream_manager is not None and self.parent is not None:
+            # The widget handle is looked up here: Tk may only be used on the GUI thread
+            self._call_stream_manager(tile.camera_id, 'add_stream', tile.camera_id,
+                                      tile.stream_url, self._tile_widget(tile),
+                                      camera=tile.camera, tile_size=self.tile_size)
+            tile.suspended = False
+            self._update_suspension(tile)
+
+    def _stop_tile(self, tile: CameraTile):
+        """Stop rendering a tile in the current mode.
+
+        Args:
+            tile: Camera tile
+        """
+        if self.mode == GridMode.SNAPSHOT:
+            if self.snapshot_poller is not None:
+                self.snapshot_poller.remove_camera(tile.camera_id)
+        elif self.mode == GridMode.MOSAIC:
+            if self.compositor is not None:
+                self._run_serial("mosaic", self.compositor.remove_camera, tile.camera_id)
+        elif self.stream_manager is not None:
+            self._call_stream_manager(tile.camera_id, 'remove_stream', tile.camera_id,
+                                      cancel_pending=True)
+        tile.suspended = False
+
+    def _call_stream_manager(self, camera_id: str, method: str, *args,
+                             cancel_pending: bool = False, **kwargs):
+        """Call the stream manager, on the worker if the grid has one.
+
+        Calls for one camera run in order, so a stop never overtakes the
+        start it undoes.
+
+        Args:
+            camera_id: Camera the call is about
+            method: StreamManager method name
+            *args: Positional arguments for the method
+            cancel_pending: Skip this camera's calls that have not started yet
+            **kwargs: Keyword arguments for the method
+        """
+        self._run_serial(f"tile:{camera_id}", getattr(self.stream_manager, method), *args,
+                         cancel_pending=cancel_pending, **kwargs)
+
+    def _run_serial(self, group: str, func, *args, cancel_pending: bool = False, **kwargs):
+        """Run a call on the worker in submission order within its group.
+
+        Args:
+            group: Worker group
+            func: Function to call
+            *args: Positional arguments for the function
+            cancel_pending: Skip the group's calls that have not started yet
+            **kwargs: Keyword arguments for the function
+        """
+        if self.worker is None:
+            func(*args, **kwargs)
+            return
+        if cancel_pending:
+            self.worker.cancel(group)
+        self.worker.submit(func, *args, group=group, serial=True, **kwargs)
@@ -5,33 +5,267 @@ This module defines the main GUI window that serves as the primary
 interface for the camera live view application.
 """
 
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import FreeSimpleGUI as sg
+
+from .camera_grid import CameraGrid, GridMode
+from .worker import BackgroundWorker
+from ..models.camera import Camera
+from ..models.camera_registry import CameraEvent, CameraRegistry
+from ..video.stream_manager import SuspendMode
+from ..utils.logger import get_logger
+
+logger = get_logger("gui.main_window")
+
+CAMERA_LIST_KEY = "-CAMERAS-"
+STATUS_KEY = "-STATUS-"
+REFRESH_KEY = "-REFRESH-"
+
+# Cancellation group of camera list refreshes
+CAMERA_LIST_GROUP = "camera-list"
+
+# Read loop timeout; periodic work is checked this often
+UI_TICK_MS = 100
+
+# Seconds closing the window waits for queued stream stops
+CLOSE_TIMEOUT = 5.0
+
 
 class MainWindow:
     """Main application window class."""
 
-    def __init__(self):
-        """Initialize the main window."""
-        # TODO: Initialize window layout
-        # TODO: Create menu bar
-        # TODO: Create toolbar
-        # TODO: Setup camera grid container
-        # TODO: Setup status bar
-        pass
+    def __init__(self, client=None, stream_manager=None, registry: Optional[CameraRegistry] = None,
+                 worker: Optional[BackgroundWorker] = None, title: str = "GeekTime Camera",
+                 size=(1280, 720), grid_rows: int = 2, grid_columns: int = 2,
+                 grid_mode: GridMode = GridMode.VIDEO, snapshot_interval: float = 1.0,
+                 refresh_interval: float = 30.0,
+                 suspend_mode: SuspendMode = SuspendMode.PAUSE, mosaic_fps: float = 15.0):
+        """Initialize the main window.
+
+        Blocking work (API calls, opening and closing streams) goes through
+        ``worker``; the read loop only updates widgets.
+
+        Args:
+            client: API client
+            stream_manager: StreamManager for live video tiles
+            registry: Camera registry kept in sync with the server
+            worker: Background worker, created if not given
+            title: Window title
+            size: Window size in pixels
+            grid_rows: Rows of the camera grid
+            grid_columns: Columns of the camera grid
+            grid_mode: Live video or snapshot tiles
+            snapshot_interval: Refresh interval of snapshot tiles in seconds
+            refresh_interval: Seconds between camera list refreshes
+            suspend_mode: How video tiles nobody can see are suspended
+            mosaic_fps: Frame rate cap of the composited image in mosaic mode
+        """
+        self.client = client
+        self.title = title
+        self.size = size
+        self.grid_rows = grid_rows
+        self.grid_columns = grid_columns
+        self.refresh_interval = refresh_interval
+
+        self.worker = worker or BackgroundWorker()
+        self.registry = registry or CameraRegistry()
+        self.camera_grid = CameraGrid(stream_manager=stream_manager, client=client,
+                                      mode=grid_mode, snapshot_interval=snapshot_interval,
+                                      worker=self.worker, suspend_mode=suspend_mode,
+                                      mosaic_fps=mosaic_fps)
+        self.registry.add_listener(self.camera_grid.post_camera_event)
+
+        self.window = None
+        self.layout = None
+        self.selected: Set[str] = set()
+        # GUI thread copy of the registry, replaced after every refresh
+        self._cameras: Dict[str, Camera] = {}
+        self._camera_order: List[str] = []
+        self._next_refresh = 0.0
+
+    @classmethod
+    def from_config(cls, config, client=None, stream_manager=None) -> 'MainWindow':
+        """Create the main window from application configuration.
+
+        Args:
+            config: Loaded ConfigManager instance
+            client: API client
+            stream_manager: StreamManager for live video tiles
+
+        Returns:
+            Configured main window
+        """
+        ui = config.get_ui_settings()
+        video = config.get_video_settings()
+        network = config.get_network_settings()
+        return cls(client=client, stream_manager=stream_manager,
+                   worker=BackgroundWorker(max_workers=network['max_concurrent_streams']),
+                   size=(ui['window_width'], ui['window_height']),
+                   grid_rows=ui['grid_rows'], grid_columns=ui['grid_columns'],
+                   grid_mode=GridMode(ui['grid_mode']),
+                   snapshot_interval=ui['snapshot_interval'],
+                   refresh_interval=network['camera_refresh_interval'],
+                   suspend_mode=SuspendMode(video['hidden_stream_mode']),
+                   mosaic_fps=ui['mosaic_fps'])
 
     def setup_ui(self):
-        """Setup the user interface components."""
-        # TODO: Create and layout GUI components
-        # TODO: Connect signal handlers
-        # TODO: Setup window properties
-        pass
+        """Setup the user interface components.
+
+        Returns:
+            Window layout
+        """
+        camera_column = [
+            [sg.Text("Cameras")],
+            [sg.Listbox([], key=CAMERA_LIST_KEY, size=(24, 20), enable_events=True,
+                        select_mode=sg.LISTBOX_SELECT_MODE_MULTIPLE)],
+            [sg.Button("Refresh", key=REFRESH_KEY)],
+        ]
+        grid = self.camera_grid.setup_grid(self.grid_rows, self.grid_columns)
+        self.layout = [
+            [sg.Column(camera_column, vertical_alignment='top'), sg.Column(grid)],
+            [sg.Text("", key=STATUS_KEY, size=(80, 1))],
+        ]
+        return self.layout
 
     def show(self):
-        """Display the main window."""
-        # TODO: Show window and bring to front
-        pass
+        """Display the main window and run its event loop until it is closed."""
+        if self.layout is None:
+            self.setup_ui()
+        self.window = sg.Window(self.title, self.layout, size=self.size, resizable=True,
+                                finalize=True)
+        self.worker.attach(self.window)
+        self.camera_grid.attach(self.window)
+        self.refresh_cameras()
+
+        try:
+            while True:
+                event, values = self.window.read(timeout=UI_TICK_MS)
+                if event in (sg.WIN_CLOSED, 'Exit'):
+                    break
+                self.handle_event(event, values)
+        finally:
+            self.close()
+
+    def handle_event(self, event, values):
+        """Dispatch one event of the read loop.
+
+        Args:
+            event: Window event
+            values: Window values
+        """
+        if self.worker.handle_event(event, values):
+            return
+        if self.camera_grid.handle_event(event, values):
+            return
+        if event == CAMERA_LIST_KEY:
+            labels = set(values[CAMERA_LIST_KEY])
+            self.set_selection(camera_id for camera_id in self._camera_order
+                               if self._label(camera_id) in labels)
+        elif event == REFRESH_KEY:
+            self.refresh_cameras()
+        elif event == sg.TIMEOUT_EVENT:
+            self.camera_grid.refresh_visibility()
+            self.camera_grid.update_mosaic()
+            self.camera_grid.update_quality()
+            if time.monotonic() >= self._next_refresh:
+                self.refresh_cameras()
+
+    def refresh_cameras(self):
+        """Fetch the camera list in the background.
+
+        Grid tiles are updated through the registry events; the camera
+        list widget once the refresh completes.
+        """
+        if self.client is None:
+            return
+        self._next_refresh = time.monotonic() + self.refresh_interval
+        self.worker.cancel(CAMERA_LIST_GROUP)
+        self.worker.submit(self._fetch_cameras, group=CAMERA_LIST_GROUP,
+                           on_result=self._on_cameras_refreshed,
+                           on_error=lambda e: self.set_status(f"Camera refresh failed: {e}"))
+
+    def set_selection(self, camera_ids: Iterable[str]):
+        """Show exactly the given cameras in the grid.
+
+        Deselecting a camera cancels its stream work that has not started
+        yet, so clicking through cameras quickly only opens the streams of
+        the final selection.
+
+        Args:
+            camera_ids: Cameras to show
+        """
+        selected = [camera_id for camera_id in camera_ids if camera_id in self._cameras]
+        for camera_id in self.selected - set(selected):
+            self.camera_grid.remove_camera_stream(camera_id)
+        for camera_id in selected:
+            if camera_id in self.selected:
+                continue
+            camera = self._cameras.get(camera_id)
+            stream = camera.primary_stream if camera is not None else None
+            self.camera_grid.add_camera_stream(camera_id, stream.url if stream else "",
+                                               camera=camera)
+        self.selected = set(selected)
+        self.set_status(f"Showing {len(self.selected)} of {len(self._cameras)} cameras")
+
+    def set_status(self, text: str):
+        """Show a message in the status bar.
+
+        Args:
+            text: Status message
+        """
+        if self.window is not None:
+            self.window[STATUS_KEY].update(text)
 
     def close(self):
         """Close the main window."""
-        # TODO: Cleanup resources
-        # TODO: Save window state
-        pass
\ No newline at end of file
+        # The grid stops its streams through the worker, so it goes first
+        # and the worker runs the queued stops before shutting down
+        self.camera_grid.cleanup()
+        self.worker.shutdown(drain=True, timeout=CLOSE_TIMEOUT)
+        if self.window is not None:
+            self.window.close()
+            self.window = None
+
+    def _fetch_cameras(self) -> Tuple[List[CameraEvent], Dict[str, Camera]]:
+        """Refresh the registry; runs on the worker.
+
+        Returns:
+            Changes applied by the registry and a snapshot of the cameras
+            for the GUI thread
+        """
+        events = self.registry.refresh(self.client)
+        return events, self.registry.snapshot()
+
+    def _on_cameras_refreshed(self, result: Tuple[List[CameraEvent], Dict[str, Camera]]):
+        """Update the camera list widget after a refresh.
+
+        Args:
+            result: Changes applied by the registry and a snapshot of the cameras
+        """
+        events, self._cameras = result
+        self._camera_order = sorted(self._cameras,
+                                    key=lambda camera_id: self._cameras[camera_id].name)
+        removed = self.selected - set(self._camera_order)
+        self.selected -= removed
+        if self.window is not None:
+            self.window[CAMERA_LIST_KEY].update(
+                values=[self._label(camera_id) for camera_id in self._camera_order])
+            self.window[CAMERA_LIST_KEY].set_value(
+                [self._label(camera_id) for camera_id in self._camera_order
+                 if camera_id in self.selected])
+        if events:
+            self.set_status(f"{len(self._camera_order)} cameras, {len(events)} changed")
+
+    def _label(self, camera_id: str) -> str:
+        """Get the camera list label of a camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            Label shown in the camera list
+        """
+        camera = self._cameras.get(camera_id)
+        return f"{camera.name} ({camera_id})" if camera is not None else camera_id
@@ -0,0 +1,300 @@
+"""
+Background work for the GUI.
+
+This module runs network calls, player control and other blocking work
+on a thread pool and hands the results back to the FreeSimpleGUI read
+loop through ``window.write_event_value``, so the window keeps
+responding while cameras connect or reconnect. Work is submitted in
+groups; cancelling a group (e.g. when the camera selection changes)
+skips its queued tasks and drops the results of the running ones.
+"""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger("gui.worker")
+
+# Window event telling the read loop that results are waiting
+WORKER_EVENT = "-WORKER-"
+
+
+@dataclass
+class _Task:
+    """A unit of background work."""
+    func: Callable
+    args: tuple
+    kwargs: Dict[str, Any]
+    group: Optional[str]
+    generation: int
+    future: Future
+    on_result: Optional[Callable[[Any], None]] = None
+    on_error: Optional[Callable[[Exception], None]] = None
+
+
+class BackgroundWorker:
+    """Thread pool whose results are delivered on the GUI thread."""
+
+    def __init__(self, window=None, max_workers: int = 8):
+        """Initialize the worker.
+
+        Args:
+            window: Finalized FreeSimpleGUI window, can be attached later
+            max_workers: Tasks running at the same time
+        """
+        self.window = window
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="gui-worker")
+        self._results: "queue.Queue[tuple]" = queue.Queue()
+        self._generations: Dict[str, int] = {}
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._serial: Dict[str, Deque[_Task]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def attach(self, window):
+        """Deliver results through a window.
+
+        Args:
+            window: Finalized FreeSimpleGUI window
+        """
+        self.window = window
+        if not self._results.empty():
+            self._notify()
+
+    def submit(self, func: Callable, *args, group: Optional[str] = None,
+               serial: bool = False, on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               pass_cancel_event: bool = False, **kwargs) -> Future:
+        """Run a function on the thread pool.
+
+        ``on_result`` and ``on_error`` are called on the GUI thread from
+        ``handle_event``/``process_results``, and only if the group was not
+        cancelled in the meantime.
+
+        Args:
+            func: Function to run
+            *args: Positional arguments for the function
+            group: Cancellation group, e.g. ``"selection"``
+            serial: Run tasks of the same group one after another in
+                submission order, e.g. start and stop of one stream
+            on_result: Called with the return value
+            on_error: Called with the exception raised by the function
+            pass_cancel_event: Pass the group's ``threading.Event`` as the
+                ``cancel_event`` keyword argument, so long tasks can stop early
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Future of the function's return value
+
+        Raises:
+            RuntimeError: If the worker has been shut down
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("worker has been shut down")
+            generation = self._generations.get(group, 0) if group is not None else 0
+            if pass_cancel_event:
+                if group is None:
+                    raise ValueError("pass_cancel_event requires a group")
+                kwargs['cancel_event'] = self._cancel_event(group)
+            task = _Task(func, args, kwargs, group, generation, future, on_result, on_error)
+
+            if serial and group is not None:
+                pending = self._serial.setdefault(group, deque())
+                pending.append(task)
+                if len(pending) > 1:
+                    # A runner for this group is active and will pick it up
+                    return future
+                self._executor.submit(self._drain, group)
+                return future
+
+        self._executor.submit(self._run, task)
+        return future
+
+    def cancel(self, group: str):
+        """Cancel the queued and running work of a group.
+
+        Queued tasks are skipped and running tasks have their results
+        dropped; tasks submitted afterwards run normally.
+
+        Args:
+            group: Cancellation group
+        """
+        with self._lock:
+            self._generations[group] = self._generations.get(group, 0) + 1
+            event = self._cancel_events.pop(group, None)
+        if event is not None:
+            event.set()
+        logger.debug(f"Cancelled background work of group {group}")
+
+    def is_cancelled(self, group: Optional[str], generation: int) -> bool:
+        """Check if work submitted in a generation of a group was cancelled.
+
+        Args:
+            group: Cancellation group
+            generation: Generation the work was submitted in
+
+        Returns:
+            True if the group has been cancelled since
+        """
+        if group is None:
+            return False
+        with self._lock:
+            return self._generations.get(group, 0) != generation
+
+    def handle_event(self, event, values) -> bool:
+        """Handle worker events from the window read loop.
+
+        Args:
+            event: Window event
+            values: Window values
+
+        Returns:
+            True if the event was handled by the worker, False otherwise
+        """
+        if event != WORKER_EVENT:
+            return False
+        self.process_results()
+        return True
+
+    def process_results(self) -> int:
+        """Deliver finished results to their callbacks on the calling thread.
+
+        Returns:
+            Number of callbacks run
+        """
+        delivered = 0
+        while True:
+            try:
+                task, result, error = self._results.get_nowait()
+            except queue.Empty:
+                return delivered
+            # The selection may have changed while the result sat in the queue
+            if self.is_cancelled(task.group, task.generation):
+                continue
+            callback = task.on_error if error is not None else task.on_result
+            if callback is None:
+                continue
+            try:
+                callback(error if error is not None else result)
+                delivered += 1
+            except Exception as e:
+                logger.error(f"Background task callback failed: {e}")
+
+    def shutdown(self, wait: bool = True, drain: bool = False,
+                 timeout: Optional[float] = None):
+        """Cancel all queued work and stop the thread pool.
+
+        Args:
+            wait: Wait for running tasks to finish
+            drain: First run the serial tasks already queued, e.g. the
+                stream stops queued while the window closes
+            timeout: Seconds to wait for the serial tasks when draining,
+                unlimited if None; whatever is left after it is cancelled
+        """
+        with self._lock:
+            self._closed = True
+            draining = [task.future for pending in self._serial.values()
+                        for task in pending] if drain else []
+        if draining:
+            _, not_done = wait_futures(draining, timeout=timeout)
+            if not_done:
+                logger.warning(f"{len(not_done)} queued tasks did not finish before shutdown")
+        with self._lock:
+            events = list(self._cancel_events.values())
+            self._cancel_events.clear()
+            for group in list(self._generations):
+                self._generations[group] += 1
+        for event in events:
+            event.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _cancel_event(self, group: str) -> threading.Event:
+        """Get the cancel event of a group's current generation.
+
+        Must be called with the lock held.
+
+        Args:
+            group: Cancellation group
+
+        Returns:
+            Event set when the group is cancelled
+        """
+        event = self._cancel_events.get(group)
+        if event is None:
+            event = self._cancel_events[group] = threading.Event()
+        return event
+
+    def _drain(self, group: str):
+        """Run the serial tasks of a group until none are left.
+
+        Args:
+            group: Cancellation group
+        """
+        while True:
+            with self._lock:
+                pending = self._serial[group]
+                task = pending[0]
+            self._run(task)
+            with self._lock:
+                pending.popleft()
+                if not pending:
+                    del self._serial[group]
+                    return
+
+    def _run(self, task: _Task):
+        """Run a task and queue its result for the GUI thread.
+
+        Args:
+            task: Task to run
+        """
+        if self.is_cancelled(task.group, task.generation):
+            task.future.cancel()
+            return
+        if not task.future.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = task.func(*task.args, **task.kwargs)
+        except Exception as e:
+            if not self.is_cancelled(task.group, task.generation):
+                logger.error(f"Background task {getattr(task.func, '__name__', task.func)} "
+                             f"failed: {e}")
+            task.future.set_exception(e)
+            self._deliver(task, None, e)
+            return
+        task.future.set_result(result)
+        self._deliver(task, result, None)
+
+    def _deliver(self, task: _Task, result: Any, error: Optional[Exception]):
+        """Queue a task outcome for its callbacks.
+
+        Args:
+            task: Finished task
+            result: Return value
+            error: Raised exception, if any
+        """
+        if task.on_result is None and task.on_error is None:
+            return
+        if self.is_cancelled(task.group, task.generation):
+            return
+        self._results.put((task, result, error))
+        self._notify()
+
+    def _notify(self):
+        """Wake the window read loop up to process results."""
+        window = self.window
+        if window is None:
+            return
+        try:
+            window.write_event_value(WORKER_EVENT, None)
+        except Exception as e:
+            # The window may be closing while the last tasks finish
+            logger.debug(f"Could not notify window of background results: {e}")
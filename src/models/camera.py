@@ -5,7 +5,7 @@ This module defines the camera data model with properties for camera
 information, streaming capabilities, and current state.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
@@ -19,6 +19,21 @@ class CameraState(Enum):
     ERROR = "error"
 
 
+# UniFi Video reports the camera connection as an upper-case state string
+_API_STATES = {
+    'CONNECTED': CameraState.ONLINE,
+    'DISCONNECTED': CameraState.OFFLINE,
+    'CONNECTING': CameraState.OFFLINE,
+    'UPDATING': CameraState.OFFLINE,
+}
+
+# Keys mapped onto Camera fields; everything else is kept in ``properties``
+_CONSUMED_API_KEYS = {
+    '_id', 'name', 'mac', 'model', 'firmwareVersion', 'ip', 'host', 'port',
+    'state', 'lastSeen', 'recordingIndicator', 'channels',
+}
+
+
 class RecordingMode(Enum):
     """Camera recording modes."""
     NEVER = "never"
@@ -27,7 +42,7 @@ class RecordingMode(Enum):
     SCHEDULED = "scheduled"
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamInfo:
     """Information about a camera stream."""
     channel: int
@@ -38,8 +53,33 @@ class StreamInfo:
     codec: str
     url: str
 
+    @property
+    def pixel_count(self) -> int:
+        """Number of pixels per frame."""
+        return self.width * self.height
+
+    def quality_key(self) -> tuple:
+        """Sort key ordering streams by resolution, then bitrate."""
+        return (self.pixel_count, self.bitrate, self.fps)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stream info to dictionary representation.
 
-@dataclass
+        Returns:
+            Dictionary representation of the stream
+        """
+        return {
+            'channel': self.channel,
+            'width': self.width,
+            'height': self.height,
+            'fps': self.fps,
+            'bitrate': self.bitrate,
+            'codec': self.codec,
+            'url': self.url,
+        }
+
+
+@dataclass(slots=True)
 class Camera:
     """Camera data model."""
 
@@ -64,13 +104,13 @@ class Camera:
     is_recording: bool = False
 
     # Stream information
-    streams: List[StreamInfo] = None
+    streams: List[StreamInfo] = field(default_factory=list)
 
     # Additional properties
-    properties: Dict[str, Any] = None
+    properties: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
-        """Initialize default values after dataclass creation."""
+        """Replace explicitly passed None values with empty containers."""
         if self.streams is None:
             self.streams = []
         if self.properties is None:
@@ -94,8 +134,7 @@ class Camera:
         """
         if not self.streams:
             return None
-        # TODO: Return highest quality stream (highest resolution/bitrate)
-        return self.streams[0] if self.streams else None
+        return max(self.streams, key=StreamInfo.quality_key)
 
     @property
     def secondary_stream(self) -> Optional[StreamInfo]:
@@ -106,8 +145,16 @@ class Camera:
         """
         if len(self.streams) < 2:
             return None
-        # TODO: Return lower quality stream for bandwidth saving
-        return self.streams[1] if len(self.streams) > 1 else None
+        return min(self.streams, key=StreamInfo.quality_key)
+
+    @property
+    def streams_by_quality(self) -> List[StreamInfo]:
+        """Get all streams ordered from lowest to highest quality.
+
+        Returns:
+            List of stream info
+        """
+        return sorted(self.streams, key=StreamInfo.quality_key)
 
     def get_stream_by_channel(self, channel: int) -> Optional[StreamInfo]:
         """Get stream information by channel number.
@@ -150,8 +197,22 @@ class Camera:
         Returns:
             Dictionary representation of camera
         """
-        # TODO: Convert camera object to dictionary
-        pass
+        return {
+            'camera_id': self.camera_id,
+            'name': self.name,
+            'mac_address': self.mac_address,
+            'model': self.model,
+            'firmware_version': self.firmware_version,
+            'ip_address': self.ip_address,
+            'port': self.port,
+            'state': self.state.value,
+            'is_connected': self.is_connected,
+            'last_seen': self.last_seen,
+            'recording_mode': self.recording_mode.value,
+            'is_recording': self.is_recording,
+            'streams': [stream.to_dict() for stream in self.streams],
+            'properties': dict(self.properties),
+        }
 
     @classmethod
     def from_api_response(cls, api_data: Dict[str, Any]) -> 'Camera':
@@ -163,6 +224,47 @@ class Camera:
         Returns:
             Camera instance
         """
-        # TODO: Parse API response and create camera instance
-        # TODO: Handle missing or optional fields
-        pass
\ No newline at end of file
+        api_state = str(api_data.get('state', '')).upper()
+        is_connected = api_state == 'CONNECTED'
+
+        recording_settings = api_data.get('recordingSettings') or {}
+        if recording_settings.get('fullTimeRecordEnabled'):
+            recording_mode = RecordingMode.ALWAYS
+        elif recording_settings.get('motionRecordEnabled'):
+            recording_mode = RecordingMode.MOTION
+        else:
+            recording_mode = RecordingMode.NEVER
+
+        streams = []
+        for channel in api_data.get('channels') or []:
+            rtsp_uris = channel.get('rtspUris') or []
+            streams.append(StreamInfo(
+                channel=int(channel.get('id', len(streams))),
+                width=int(channel.get('width', 0)),
+                height=int(channel.get('height', 0)),
+                fps=int(channel.get('fps', 0)),
+                bitrate=int(channel.get('bitrate', 0)),
+                codec=channel.get('codec', ''),
+                url=channel.get('url') or (rtsp_uris[0] if rtsp_uris else ''),
+            ))
+
+        last_seen = api_data.get('lastSeen')
+        properties = {key: value for key, value in api_data.items()
+                      if key not in _CONSUMED_API_KEYS}
+
+        return cls(
+            camera_id=api_data['_id'],
+            name=api_data.get('name', ''),
+            mac_address=api_data.get('mac', ''),
+            model=api_data.get('model', ''),
+            firmware_version=api_data.get('firmwareVersion', ''),
+            ip_address=api_data.get('ip') or api_data.get('host', ''),
+            port=int(api_data.get('port') or 0),
+            state=_API_STATES.get(api_state, CameraState.ERROR),
+            is_connected=is_connected,
+            last_seen=str(last_seen) if last_seen is not None else None,
+            recording_mode=recording_mode,
+            is_recording=bool(api_data.get('recordingIndicator', False)),
+            streams=streams,
+            properties=properties,
+        )
@@ -0,0 +1,180 @@
+"""
+Incrementally synchronized camera list.
+
+This module keeps the cameras known to the application in sync with the
+server's camera listing. Each refresh is diffed against the current
+state by camera ID, only changed fields are applied to the existing
+``Camera`` objects, and listeners are told exactly which cameras were
+added, removed or changed.
+"""
+
+import copy
+import threading
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .camera import Camera
+from ..utils.logger import get_logger
+
+logger = get_logger("models.camera_registry")
+
+# Fields that change on every poll without affecting how a camera is shown;
+# they are kept current but do not produce change events on their own
+_QUIET_FIELDS = {'last_seen', 'properties'}
+
+
+class CameraEventKind(Enum):
+    """Kinds of camera list changes."""
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+@dataclass
+class CameraEvent:
+    """A change to the camera list."""
+    kind: CameraEventKind
+    camera_id: str
+    camera: Optional[Camera] = None
+    changed_fields: Set[str] = field(default_factory=set)
+
+
+class CameraRegistry:
+    """Cameras known to the application, updated in place from API listings."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.cameras: Dict[str, Camera] = {}
+        self._raw: Dict[str, Dict[str, Any]] = {}
+        self._listeners: List[Callable[[CameraEvent], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[CameraEvent], None]):
+        """Subscribe to camera list changes.
+
+        Listeners are called on the thread running ``sync``.
+
+        Args:
+            listener: Function called with every CameraEvent
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[CameraEvent], None]):
+        """Unsubscribe from camera list changes.
+
+        Args:
+            listener: Previously added listener
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def get(self, camera_id: str) -> Optional[Camera]:
+        """Get a camera by ID.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            Camera or None if unknown
+        """
+        return self.cameras.get(camera_id)
+
+    def snapshot(self) -> Dict[str, Camera]:
+        """Get copies of the known cameras, e.g. to hand them to the GUI thread.
+
+        Syncs replace field values rather than mutating them, so shallow
+        copies taken under the lock are not affected by later syncs.
+
+        Returns:
+            Mapping of camera ID to a copy of the camera
+        """
+        with self._lock:
+            return {camera_id: copy.copy(camera) for camera_id, camera in self.cameras.items()}
+
+    def refresh(self, client) -> List[CameraEvent]:
+        """Fetch the camera listing and apply it.
+
+        Args:
+            client: UniFiVideoClient to poll
+
+        Returns:
+            Events describing the changes
+        """
+        return self.sync(client.get_camera_data())
+
+    def sync(self, api_items: List[Dict[str, Any]]) -> List[CameraEvent]:
+        """Apply a camera listing from the API.
+
+        Items identical to the previous listing are skipped without being
+        parsed. Changed cameras are updated in place, so references held
+        elsewhere (grid tiles, stream manager) stay valid.
+
+        Args:
+            api_items: Camera items from ``/api/2.0/camera``
+
+        Returns:
+            Events describing the changes
+        """
+        events: List[CameraEvent] = []
+        with self._lock:
+            seen = set()
+            for item in api_items:
+                camera_id = item['_id']
+                seen.add(camera_id)
+                if self._raw.get(camera_id) == item:
+                    continue
+                self._raw[camera_id] = item
+                new = Camera.from_api_response(item)
+                current = self.cameras.get(camera_id)
+                if current is None:
+                    self.cameras[camera_id] = new
+                    events.append(CameraEvent(CameraEventKind.ADDED, camera_id, new))
+                    continue
+                changed = self._apply(current, new)
+                if changed:
+                    events.append(CameraEvent(CameraEventKind.CHANGED, camera_id, current,
+                                              changed))
+
+            for camera_id in [c for c in self.cameras if c not in seen]:
+                camera = self.cameras.pop(camera_id)
+                self._raw.pop(camera_id, None)
+                events.append(CameraEvent(CameraEventKind.REMOVED, camera_id, camera))
+
+        for event in events:
+            logger.debug(f"Camera {event.camera_id} {event.kind.value} "
+                         f"{sorted(event.changed_fields) or ''}")
+            for listener in list(self._listeners):
+                try:
+                    listener(event)
+                except Exception as e:
+                    logger.error(f"Camera listener failed on {event.kind.value} event: {e}")
+        return events
+
+    @staticmethod
+    def _apply(current: Camera, new: Camera) -> Set[str]:
+        """Copy changed fields from a freshly parsed camera onto the current one.
+
+        Connection and state changes go through ``update_connection_status``
+        and ``update_state`` so any logic attached to them runs.
+
+        Args:
+            current: Camera kept in the registry
+            new: Camera parsed from the latest listing
+
+        Returns:
+            Names of the changed fields that affect the camera's display
+        """
+        changed = set()
+        for camera_field in fields(Camera):
+            name = camera_field.name
+            if getattr(current, name) != getattr(new, name):
+                changed.add(name)
+
+        if 'is_connected' in changed:
+            current.update_connection_status(new.is_connected)
+        if 'state' in changed or current.state != new.state:
+            current.update_state(new.state)
+        for name in changed - {'is_connected', 'state'}:
+            setattr(current, name, getattr(new, name))
+        return changed - _QUIET_FIELDS
@@ -0,0 +1,348 @@
+"""
+Persistent local index of camera, recording and event metadata.
+
+This module mirrors the NVR's camera and recording listings, and the
+timeline events derived from them, into a SQLite database indexed by
+camera and time. Entering playback for a date range then reads the
+local index, and only recordings newer than the latest known one are
+fetched from ``/api/2.0/recording``.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .camera import Camera
+from .recording import Recording, RecordingType, api_camera_id, api_recording_type
+from .recording_set import RecordingSet
+from .timeline import TimelineEvent, TimelineEventType
+from ..utils.logger import get_logger
+
+logger = get_logger("models.metadata_store")
+
+# Bumped when the schema changes; an older database is rebuilt from the NVR
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cameras (
+    camera_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recordings (
+    recording_id TEXT PRIMARY KEY,
+    camera_id TEXT NOT NULL,
+    start_time INTEGER NOT NULL,
+    end_time INTEGER,
+    in_progress INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recordings_camera_start ON recordings (camera_id, start_time);
+CREATE TABLE IF NOT EXISTS events (
+    camera_id TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    duration INTEGER,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (camera_id, timestamp, event_type)
+);
+"""
+
+
+def _to_ms(timestamp: datetime) -> int:
+    """Convert a naive local datetime to epoch milliseconds."""
+    return int(timestamp.timestamp() * 1000)
+
+
+def _from_ms(milliseconds: int) -> datetime:
+    """Convert epoch milliseconds to a naive local datetime."""
+    return datetime.fromtimestamp(milliseconds / 1000)
+
+
+def motion_event(api_data: Dict[str, Any]) -> Optional[TimelineEvent]:
+    """Derive the timeline event of a motion recording.
+
+    Args:
+        api_data: Recording data from UniFi Video API
+
+    Returns:
+        Motion event at the start of the recording, or None for other recordings
+    """
+    if api_recording_type(api_data) != RecordingType.MOTION:
+        return None
+    duration = None
+    if api_data.get('endTime'):
+        duration = int((api_data['endTime'] - api_data['startTime']) / 1000)
+    return TimelineEvent(_from_ms(api_data['startTime']), TimelineEventType.MOTION, duration,
+                         {'recording_id': api_data['_id'],
+                          'motion_score': api_data.get('motionScore')})
+
+
+class MetadataStore:
+    """SQLite mirror of the NVR metadata, keyed by camera and time."""
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """Open or create the store.
+
+        Args:
+            path: Database file, ``:memory:`` for a throwaway store
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                logger.info(f"Metadata store schema {version} is outdated, rebuilding")
+                self._connection.executescript(
+                    "DROP TABLE IF EXISTS cameras; DROP TABLE IF EXISTS recordings; "
+                    "DROP TABLE IF EXISTS events;")
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    @classmethod
+    def from_config(cls, config) -> 'MetadataStore':
+        """Open the store at the path configured in the application settings.
+
+        Args:
+            config: Loaded ConfigManager instance
+
+        Returns:
+            Metadata store
+        """
+        return cls(config.get_metadata_store_path())
+
+    def put_cameras(self, items: Iterable[Dict[str, Any]]):
+        """Replace the stored camera listing.
+
+        Args:
+            items: Camera items as returned by the API
+        """
+        rows = [(item['_id'], json.dumps(item)) for item in items]
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cameras")
+            self._connection.executemany("INSERT INTO cameras VALUES (?, ?)", rows)
+
+    def get_camera_data(self) -> List[Dict[str, Any]]:
+        """Get the stored camera listing, e.g. for ``CameraRegistry.sync``.
+
+        Returns:
+            Camera items as returned by the API
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT data FROM cameras").fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def get_cameras(self) -> List[Camera]:
+        """Get the stored cameras.
+
+        Returns:
+            List of cameras
+        """
+        return [Camera.from_api_response(item) for item in self.get_camera_data()]
+
+    def put_recordings(self, items: Iterable[Dict[str, Any]]) -> int:
+        """Insert or update recordings and the motion events derived from them.
+
+        Args:
+            items: Recording items as returned by the API
+
+        Returns:
+            Number of recordings written
+        """
+        recordings, events = [], []
+        for item in items:
+            camera_id = api_camera_id(item)
+            recordings.append((item['_id'], camera_id, item['startTime'], item.get('endTime'),
+                               int(bool(item.get('inProgress'))), json.dumps(item)))
+            event = motion_event(item)
+            if event is not None:
+                events.append(self._event_row(camera_id, event))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?, ?, ?)", recordings)
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)", events)
+        return len(recordings)
+
+    def get_recording_data(self, camera_ids: Iterable[str], start_time: datetime,
+                           end_time: datetime) -> List[Dict[str, Any]]:
+        """Get the stored recordings overlapping a time range.
+
+        Args:
+            camera_ids: Cameras to include
+            start_time: Start of the time range
+            end_time: End of the time range
+
+        Returns:
+            Recording items as returned by the API, ordered by start time
+        """
+        camera_ids = list(camera_ids)
+        if not camera_ids:
+            return []
+        placeholders = ", ".join("?" * len(camera_ids))
+        # Recordings are bounded in length, so one that overlaps the range
+        # starts at most a day before it; this keeps the index range tight
+        query = (f"SELECT data FROM recordings WHERE camera_id IN ({placeholders}) "
+                 f"AND start_time BETWEEN ? AND ? "
+                 f"AND (end_time IS NULL OR end_time >= ?) ORDER BY start_time")
+        params = camera_ids + [_to_ms(start_time - timedelta(days=1)), _to_ms(end_time),
+                               _to_ms(start_time)]
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def get_recordings(self, camera_ids: Iterable[str], start_time: datetime,
+                       end_time: datetime) -> List[Recording]:
+        """Get stored recordings within a time range.
+
+        Args:
+            camera_ids: Cameras to include
+            start_time: Start of the time range
+            end_time: End of the time range
+
+        Returns:
+            List of recordings ordered by start time
+        """
+        return [Recording.from_api_response(item)
+                for item in self.get_recording_data(camera_ids, start_time, end_time)]
+
+    def get_recording_set(self, camera_ids: Iterable[str], start_time: datetime,
+                          end_time: datetime) -> RecordingSet:
+        """Get stored recordings within a time range as a compact column store.
+
+        Args:
+            camera_ids: Cameras to include
+            start_time: Start of the time range
+            end_time: End of the time range
+
+        Returns:
+            Recording set ordered by start time
+        """
+        return RecordingSet.from_api_response(
+            self.get_recording_data(camera_ids, start_time, end_time))
+
+    def put_events(self, camera_id: str, events: Iterable[TimelineEvent]):
+        """Insert or update timeline events, e.g. bookmarks.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            events: Timeline events
+        """
+        rows = [self._event_row(camera_id, event) for event in events]
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)",
+                                         rows)
+
+    def get_events(self, camera_id: str, start_time: datetime,
+                   end_time: datetime) -> List[TimelineEvent]:
+        """Get the stored events of a camera within a time range.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            start_time: Start of the time range
+            end_time: End of the time range
+
+        Returns:
+            Timeline events ordered by time
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT timestamp, event_type, duration, metadata FROM events "
+                "WHERE camera_id = ? AND timestamp BETWEEN ? AND ? ORDER BY timestamp",
+                (camera_id, _to_ms(start_time), _to_ms(end_time))).fetchall()
+        return [TimelineEvent(_from_ms(timestamp), TimelineEventType(event_type), duration,
+                              json.loads(metadata))
+                for timestamp, event_type, duration, metadata in rows]
+
+    def sync_point(self, camera_id: str) -> Optional[datetime]:
+        """Get the time from which a camera's recordings must be fetched again.
+
+        That is the start of its oldest recording still in progress, or
+        else of its newest recording, which may have grown since.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            Sync point, or None if nothing is stored for the camera
+        """
+        with self._lock:
+            in_progress, latest = self._connection.execute(
+                "SELECT MIN(CASE WHEN in_progress THEN start_time END), MAX(start_time) "
+                "FROM recordings WHERE camera_id = ?", (camera_id,)).fetchone()
+        point = in_progress if in_progress is not None else latest
+        return _from_ms(point) if point is not None else None
+
+    def sync_recordings(self, client, camera_ids: Iterable[str], retention_start: datetime,
+                        end_time: Optional[datetime] = None) -> int:
+        """Fetch the recordings the store is missing from the NVR.
+
+        Cameras already in the store are fetched from their oldest sync
+        point, the rest from the start of retention. Recordings that ended
+        before the start of retention are removed.
+
+        Args:
+            client: API client providing ``get_recording_data``
+            camera_ids: Cameras to sync
+            retention_start: Oldest time recordings are kept for
+            end_time: End of the sync range, defaults to now
+
+        Returns:
+            Number of recordings fetched
+        """
+        end_time = end_time or datetime.now()
+        synced: Dict[str, datetime] = {}
+        unsynced: List[str] = []
+        for camera_id in camera_ids:
+            point = self.sync_point(camera_id)
+            if point is None or point < retention_start:
+                unsynced.append(camera_id)
+            else:
+                synced[camera_id] = point
+
+        fetched = 0
+        for group, start_time in ((unsynced, retention_start),
+                                  (list(synced), min(synced.values(), default=None))):
+            if group:
+                fetched += self.put_recordings(
+                    client.get_recording_data(group, start_time, end_time))
+        self.purge(retention_start)
+        logger.debug(f"Synced {fetched} recordings for {len(synced) + len(unsynced)} cameras")
+        return fetched
+
+    def purge(self, before: datetime):
+        """Remove recordings and events older than a time.
+
+        Args:
+            before: Recordings that ended and events that happened before this are removed
+        """
+        cutoff = _to_ms(before)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM recordings WHERE end_time IS NOT NULL AND end_time < ?", (cutoff,))
+            self._connection.execute("DELETE FROM events WHERE timestamp < ?", (cutoff,))
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _event_row(camera_id: str, event: TimelineEvent) -> tuple:
+        """Convert a timeline event into an ``events`` row.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            event: Timeline event
+
+        Returns:
+            Row tuple
+        """
+        return (camera_id, _to_ms(event.timestamp), event.event_type.value,
+                event.duration_seconds, json.dumps(event.metadata))
@@ -0,0 +1,183 @@
+"""
+Bucketed motion density for timeline rendering.
+
+This module keeps per-minute, per-hour and per-day counts and peak
+motion scores of a camera's motion events, updated as events are added,
+so the density bar of any zoom level is read from a few hundred buckets
+instead of the raw events.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Naive reference point; buckets align to naive minute, hour and day boundaries
+_EPOCH = datetime(1970, 1, 1)
+
+
+class MotionResolution(Enum):
+    """Bucket sizes of the motion heatmap, in seconds."""
+    MINUTE = 60
+    HOUR = 3600
+    DAY = 86400
+
+
+@dataclass
+class MotionDensity:
+    """Motion buckets covering a time range, oldest first."""
+    start_time: datetime
+    resolution: MotionResolution
+    counts: np.ndarray
+    max_scores: np.ndarray
+
+    @property
+    def end_time(self) -> datetime:
+        """End of the last bucket."""
+        return self.start_time + timedelta(seconds=self.resolution.value * len(self.counts))
+
+    def bucket_times(self) -> List[datetime]:
+        """Get the start time of every bucket.
+
+        Returns:
+            Bucket start times
+        """
+        step = timedelta(seconds=self.resolution.value)
+        return [self.start_time + step * index for index in range(len(self.counts))]
+
+
+class MotionHeatmap:
+    """Motion event counts and peak scores at minute, hour and day resolution."""
+
+    def __init__(self):
+        # Bucket number -> [event count, max motion score]
+        self._buckets: Dict[MotionResolution, Dict[int, List[float]]] = {
+            resolution: {} for resolution in MotionResolution
+        }
+        self.total = 0
+
+    def add(self, timestamp: datetime, score: Optional[float] = None):
+        """Count one motion event.
+
+        Args:
+            timestamp: Time of the event
+            score: Motion score of the event, if known
+        """
+        score = float(score) if score is not None else 0.0
+        seconds = (timestamp - _EPOCH).total_seconds()
+        for resolution, buckets in self._buckets.items():
+            key = int(seconds // resolution.value)
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [1, score]
+            else:
+                bucket[0] += 1
+                if score > bucket[1]:
+                    bucket[1] = score
+        self.total += 1
+
+    def resolution_for(self, start_time: datetime, end_time: datetime,
+                       max_buckets: int = 2000) -> MotionResolution:
+        """Choose the finest resolution that fits a range into a bucket budget.
+
+        Args:
+            start_time: Start of the range
+            end_time: End of the range
+            max_buckets: Maximum number of buckets, e.g. the bar width in pixels
+
+        Returns:
+            Motion resolution
+        """
+        span = max(0.0, (end_time - start_time).total_seconds())
+        for resolution in MotionResolution:
+            if span / resolution.value <= max_buckets:
+                return resolution
+        return MotionResolution.DAY
+
+    def density(self, start_time: datetime, end_time: datetime,
+                resolution: Optional[MotionResolution] = None) -> MotionDensity:
+        """Read the buckets covering a time range.
+
+        Args:
+            start_time: Start of the range
+            end_time: End of the range
+            resolution: Bucket size, chosen with ``resolution_for`` if omitted
+
+        Returns:
+            Motion density with one entry per bucket
+        """
+        resolution = resolution or self.resolution_for(start_time, end_time)
+        first, last = self._key_range(start_time, end_time, resolution)
+        count = max(0, last - first + 1)
+        counts = np.zeros(count, dtype=np.int32)
+        max_scores = np.zeros(count, dtype=np.float32)
+        buckets = self._buckets[resolution]
+        if len(buckets) < count:
+            items = ((key, bucket) for key, bucket in buckets.items() if first <= key <= last)
+        else:
+            items = ((key, buckets[key]) for key in range(first, last + 1) if key in buckets)
+        for key, (events, score) in items:
+            counts[key - first] = events
+            max_scores[key - first] = score
+        return MotionDensity(_EPOCH + timedelta(seconds=first * resolution.value), resolution,
+                             counts, max_scores)
+
+    def summary(self, start_time: Optional[datetime] = None,
+                end_time: Optional[datetime] = None) -> Tuple[int, float]:
+        """Count the motion events of a range from the coarsest buckets it aligns with.
+
+        Whole days are read from day buckets and the rest from hour and
+        minute buckets, so ranges are counted at minute precision.
+
+        Args:
+            start_time: Start of the range, all events if omitted
+            end_time: End of the range, all events if omitted
+
+        Returns:
+            (event count, peak motion score)
+        """
+        minutes = self._buckets[MotionResolution.MINUTE]
+        if start_time is None or end_time is None:
+            scores = [bucket[1] for bucket in minutes.values()]
+            return self.total, max(scores, default=0.0)
+
+        first, last = self._key_range(start_time, end_time, MotionResolution.MINUTE)
+        events, peak = 0, 0.0
+        key = first
+        while key <= last:
+            for resolution in (MotionResolution.DAY, MotionResolution.HOUR,
+                               MotionResolution.MINUTE):
+                per_bucket = resolution.value // MotionResolution.MINUTE.value
+                if key % per_bucket == 0 and key + per_bucket - 1 <= last:
+                    bucket = self._buckets[resolution].get(key // per_bucket)
+                    if bucket is not None:
+                        events += bucket[0]
+                        peak = max(peak, bucket[1])
+                    key += per_bucket
+                    break
+        return events, peak
+
+    def clear(self):
+        """Remove all buckets."""
+        for buckets in self._buckets.values():
+            buckets.clear()
+        self.total = 0
+
+    @staticmethod
+    def _key_range(start_time: datetime, end_time: datetime,
+                   resolution: MotionResolution) -> Tuple[int, int]:
+        """Get the first and last bucket numbers touching a range.
+
+        Args:
+            start_time: Start of the range
+            end_time: End of the range
+            resolution: Bucket size
+
+        Returns:
+            (first, last) bucket numbers, inclusive
+        """
+        first = int((start_time - _EPOCH).total_seconds() // resolution.value)
+        last = int((end_time - _EPOCH).total_seconds() // resolution.value)
+        return first, last
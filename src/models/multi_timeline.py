@@ -0,0 +1,153 @@
+"""
+Combined timeline over several cameras for synchronized playback.
+
+This module groups the per-camera timelines selected for playback and
+precomputes when any of them has footage, so playback can jump over
+periods where no camera recorded anything in a single step.
+"""
+
+from bisect import bisect_right
+from datetime import datetime
+from heapq import merge
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .timeline import Timeline, TimelineSegment
+
+
+class MultiTimeline:
+    """Timelines of all cameras taking part in synchronized playback."""
+
+    def __init__(self, timelines: Optional[Iterable[Timeline]] = None):
+        """Initialize the multi-camera timeline.
+
+        Args:
+            timelines: Per-camera timelines to include
+        """
+        self.timelines: Dict[str, Timeline] = {}
+        self._coverage: List[Tuple[datetime, datetime]] = []
+        self._coverage_starts: List[datetime] = []
+        self._coverage_key: Optional[Tuple] = None
+        for timeline in timelines or []:
+            self.add_timeline(timeline)
+
+    def add_timeline(self, timeline: Timeline):
+        """Add or replace the timeline of a camera.
+
+        Args:
+            timeline: Camera timeline
+        """
+        self.timelines[timeline.camera_id] = timeline
+
+    def remove_timeline(self, camera_id: str):
+        """Remove the timeline of a camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+        """
+        self.timelines.pop(camera_id, None)
+
+    def add_recording_data(self, items: Iterable[Dict[str, Any]]) -> int:
+        """Add a page of recording API items to the timelines of their cameras.
+
+        Timelines are created for cameras that have none yet. Pages may
+        arrive in any order, e.g. from ``UniFiVideoClient.iter_recording_pages``.
+
+        Args:
+            items: Recording data items
+
+        Returns:
+            Number of segments added
+        """
+        now = datetime.now()
+        by_camera: Dict[str, List[TimelineSegment]] = {}
+        for item in items:
+            segment = TimelineSegment.from_api_response(item, now)
+            by_camera.setdefault(segment.camera_id, []).append(segment)
+        for camera_id, segments in by_camera.items():
+            timeline = self.timelines.get(camera_id)
+            if timeline is None:
+                timeline = Timeline(camera_id)
+                self.add_timeline(timeline)
+            timeline.add_segments(segments)
+        return sum(len(segments) for segments in by_camera.values())
+
+    @property
+    def coverage(self) -> List[Tuple[datetime, datetime]]:
+        """Sorted, disjoint (start, end) spans during which any camera has footage."""
+        key = tuple((camera_id, id(timeline), timeline.revision)
+                    for camera_id, timeline in self.timelines.items())
+        if key != self._coverage_key:
+            self._rebuild_coverage()
+            self._coverage_key = key
+        return self._coverage
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Earliest recorded instant across all cameras."""
+        coverage = self.coverage
+        return coverage[0][0] if coverage else None
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Latest recorded instant across all cameras."""
+        coverage = self.coverage
+        return coverage[-1][1] if coverage else None
+
+    def has_footage_at(self, timestamp: datetime) -> bool:
+        """Check if any camera has footage at a timestamp.
+
+        Args:
+            timestamp: Timestamp to query
+
+        Returns:
+            True if at least one camera recorded at that time
+        """
+        coverage = self.coverage
+        index = bisect_right(self._coverage_starts, timestamp) - 1
+        return index >= 0 and timestamp <= coverage[index][1]
+
+    def next_covered_time(self, timestamp: datetime) -> Optional[datetime]:
+        """Get the first instant at or after a timestamp where any camera has footage.
+
+        Args:
+            timestamp: Timestamp to start from
+
+        Returns:
+            The timestamp itself if it is covered, the start of the next
+            covered span otherwise, or None if nothing is recorded later
+        """
+        if self.has_footage_at(timestamp):
+            return timestamp
+        index = bisect_right(self._coverage_starts, timestamp)
+        return self._coverage[index][0] if index < len(self._coverage) else None
+
+    def get_segments_at(self, timestamp: datetime) -> Dict[str, TimelineSegment]:
+        """Get the segment each camera is showing at a timestamp.
+
+        Args:
+            timestamp: Timestamp to query
+
+        Returns:
+            Mapping of camera ID to segment, for cameras with footage only
+        """
+        segments = {}
+        for camera_id, timeline in self.timelines.items():
+            segment = timeline.get_segment_at_time(timestamp)
+            if segment is not None:
+                segments[camera_id] = segment
+        return segments
+
+    def _rebuild_coverage(self):
+        """Merge the segments of all timelines into disjoint covered spans."""
+        spans = merge(*[[(s.start_time, s.end_time) for s in timeline.segments]
+                        for timeline in self.timelines.values()])
+        coverage: List[Tuple[datetime, datetime]] = []
+        for start, end in spans:
+            # Touching spans merge too: playback runs straight through them
+            if coverage and start <= coverage[-1][1]:
+                if end > coverage[-1][1]:
+                    coverage[-1] = (coverage[-1][0], end)
+            else:
+                coverage.append((start, end))
+        self._coverage = coverage
+        self._coverage_starts = [start for start, _ in coverage]
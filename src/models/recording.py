@@ -28,6 +28,51 @@ class RecordingStatus(Enum):
     DELETED = "deleted"
 
 
+# Mapping of API ``type``/``eventType`` values to recording types
+_API_TYPES = {
+    'motion': RecordingType.MOTION,
+    'continuous': RecordingType.CONTINUOUS,
+    'fullTime': RecordingType.CONTINUOUS,
+    'manual': RecordingType.MANUAL,
+    'scheduled': RecordingType.SCHEDULED,
+}
+
+_API_EVENT_TYPES = {
+    'motionRecording': RecordingType.MOTION,
+    'fullTimeRecording': RecordingType.CONTINUOUS,
+}
+
+
+def api_camera_id(api_data: Dict[str, Any]) -> str:
+    """Get the camera a recording API item belongs to.
+
+    Args:
+        api_data: Recording data from UniFi Video API
+
+    Returns:
+        Camera ID, empty if the item names none
+    """
+    camera_id = api_data.get('cameraId')
+    if camera_id is None and api_data.get('cameras'):
+        camera_id = api_data['cameras'][0]
+    return camera_id or ''
+
+
+def api_recording_type(api_data: Dict[str, Any]) -> RecordingType:
+    """Get the recording type of a recording API item.
+
+    Args:
+        api_data: Recording data from UniFi Video API
+
+    Returns:
+        Recording type, motion if the item does not say
+    """
+    recording_type = _API_TYPES.get(api_data.get('type'))
+    if recording_type is None:
+        recording_type = _API_EVENT_TYPES.get(api_data.get('eventType'), RecordingType.MOTION)
+    return recording_type
+
+
 @dataclass
 class Recording:
     """Recording data model."""
@@ -127,13 +172,13 @@ class Recording:
         if not self.file_size_bytes:
             return "Unknown"
 
-        # TODO: Format file size in human readable format
-        # Simple implementation - could be moved to helpers
+        # Work on a copy: file_size_bytes is used to verify downloads
+        size = float(self.file_size_bytes)
         for unit in ['B', 'KB', 'MB', 'GB']:
-            if self.file_size_bytes < 1024.0:
-                return f"{self.file_size_bytes:.1f} {unit}"
-            self.file_size_bytes /= 1024.0
-        return f"{self.file_size_bytes:.1f} TB"
+            if size < 1024.0:
+                return f"{size:.1f} {unit}"
+            size /= 1024.0
+        return f"{size:.1f} TB"
 
     def has_motion_events(self) -> bool:
         """Check if recording has motion events.
@@ -152,8 +197,7 @@ class Recording:
         Returns:
             Complete download URL for the recording
         """
-        # TODO: Construct download URL based on API specification
-        return f"{base_url}/api/2.0/recording/{self.recording_id}/download"
+        return f"{base_url.rstrip('/')}/api/2.0/recording/{self.recording_id}/download"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert recording to dictionary representation.
@@ -175,7 +219,34 @@ class Recording:
         Returns:
             Recording instance
         """
-        # TODO: Parse API response and create recording instance
-        # TODO: Handle datetime parsing
-        # TODO: Handle missing or optional fields
-        pass
\ No newline at end of file
+        meta = api_data.get('meta') or {}
+        rec = api_data.get('rec') or {}
+
+        camera_id = api_camera_id(api_data)
+        start_time = datetime.fromtimestamp(api_data['startTime'] / 1000)
+        end_time = None
+        if api_data.get('endTime'):
+            end_time = datetime.fromtimestamp(api_data['endTime'] / 1000)
+
+        recording_type = api_recording_type(api_data)
+        status = RecordingStatus.RECORDING if api_data.get('inProgress') else RecordingStatus.AVAILABLE
+
+        metadata = {
+            'locked': bool(api_data.get('locked', False)),
+            'event_type': api_data.get('eventType'),
+        }
+        if rec.get('filename'):
+            metadata['filename'] = rec['filename']
+
+        return cls(
+            recording_id=api_data['_id'],
+            camera_id=camera_id,
+            camera_name=meta.get('cameraName') or api_data.get('cameraName', ''),
+            start_time=start_time,
+            end_time=end_time,
+            recording_type=recording_type,
+            status=status,
+            file_size_bytes=rec.get('filesize'),
+            motion_score=api_data.get('motionScore'),
+            metadata=metadata,
+        )
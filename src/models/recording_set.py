@@ -0,0 +1,356 @@
+"""
+Compact, array-backed collection of recordings.
+
+This module stores large recording listings as parallel numpy arrays
+instead of one ``Recording`` object per row, and filters them with
+vectorized operations. ``Recording`` objects are only built for the rows
+that are actually accessed.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .recording import (Recording, RecordingStatus, RecordingType,
+                        api_camera_id, api_recording_type)
+
+_TYPES: List[RecordingType] = list(RecordingType)
+_STATUSES: List[RecordingStatus] = list(RecordingStatus)
+_TYPE_CODES = {recording_type: code for code, recording_type in enumerate(_TYPES)}
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
+# Sentinels for missing values in integer columns
+_NO_END = -1
+_NO_SIZE = -1
+
+
+def _to_ms(timestamp: datetime) -> int:
+    """Convert a naive local datetime to epoch milliseconds."""
+    return int(timestamp.timestamp() * 1000)
+
+
+def _from_ms(milliseconds: int) -> datetime:
+    """Convert epoch milliseconds to a naive local datetime."""
+    return datetime.fromtimestamp(milliseconds / 1000)
+
+
+class _Interner:
+    """Maps repeated strings (camera IDs, event types) to small integer codes."""
+
+    def __init__(self, values: Sequence[str] = ()):
+        self.values: List[str] = list(values)
+        self._codes: Dict[str, int] = {value: code for code, value in enumerate(self.values)}
+
+    def code(self, value: str) -> int:
+        if value not in self._codes:
+            self._codes[value] = len(self.values)
+            self.values.append(value)
+        return self._codes[value]
+
+
+class RecordingSet:
+    """Columnar store of recordings with lazy row materialization.
+
+    Columns hold epoch-millisecond start/end times, an index into the
+    camera table, type and status codes, file sizes and motion scores.
+    Recording IDs are kept as a fixed-width byte array. Metadata beyond
+    the ``locked`` flag and the API event type is not retained.
+    """
+
+    def __init__(self, recording_ids: np.ndarray, camera_index: np.ndarray,
+                 start_ms: np.ndarray, end_ms: np.ndarray, type_codes: np.ndarray,
+                 status_codes: np.ndarray, sizes: np.ndarray, motion_scores: np.ndarray,
+                 locked: np.ndarray, event_type_codes: np.ndarray,
+                 cameras: Sequence[str], camera_names: Sequence[str],
+                 event_types: Sequence[str]):
+        """Initialize the set from prepared columns.
+
+        Use ``from_api_response``, ``from_recordings`` or ``empty`` instead
+        of calling this directly.
+        """
+        self.recording_ids = recording_ids
+        self.camera_index = camera_index
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.type_codes = type_codes
+        self.status_codes = status_codes
+        self.sizes = sizes
+        self.motion_scores = motion_scores
+        self.locked = locked
+        self.event_type_codes = event_type_codes
+        self.cameras = list(cameras)
+        self.camera_names = list(camera_names)
+        self.event_types = list(event_types)
+
+    @classmethod
+    def empty(cls) -> 'RecordingSet':
+        """Create an empty recording set.
+
+        Returns:
+            Recording set without rows
+        """
+        return cls._from_rows([], _Interner(), [], _Interner())
+
+    @classmethod
+    def from_api_response(cls, items: Iterable[Dict[str, Any]]) -> 'RecordingSet':
+        """Build a recording set straight from API recording items.
+
+        No ``Recording`` objects are created on the way.
+
+        Args:
+            items: Recording data from UniFi Video API
+
+        Returns:
+            Recording set
+        """
+        cameras, events = _Interner(), _Interner([''])
+        camera_names: List[str] = []
+        rows = []
+        for item in items:
+            camera_id = api_camera_id(item)
+            camera = cameras.code(camera_id)
+            if camera == len(camera_names):
+                meta = item.get('meta') or {}
+                camera_names.append(meta.get('cameraName') or item.get('cameraName', ''))
+            rec = item.get('rec') or {}
+            status = RecordingStatus.RECORDING if item.get('inProgress') else RecordingStatus.AVAILABLE
+            score = item.get('motionScore')
+            rows.append((
+                item['_id'], camera, item['startTime'], item.get('endTime') or _NO_END,
+                _TYPE_CODES[api_recording_type(item)], _STATUS_CODES[status],
+                rec.get('filesize') or _NO_SIZE, np.nan if score is None else score,
+                bool(item.get('locked', False)), events.code(item.get('eventType') or ''),
+            ))
+        return cls._from_rows(rows, cameras, camera_names, events)
+
+    @classmethod
+    def from_recordings(cls, recordings: Iterable[Recording]) -> 'RecordingSet':
+        """Build a recording set from recording objects.
+
+        Args:
+            recordings: Recordings to store
+
+        Returns:
+            Recording set
+        """
+        cameras, events = _Interner(), _Interner([''])
+        camera_names: List[str] = []
+        rows = []
+        for recording in recordings:
+            camera = cameras.code(recording.camera_id)
+            if camera == len(camera_names):
+                camera_names.append(recording.camera_name)
+            rows.append((
+                recording.recording_id, camera, _to_ms(recording.start_time),
+                _to_ms(recording.end_time) if recording.end_time else _NO_END,
+                _TYPE_CODES[recording.recording_type], _STATUS_CODES[recording.status],
+                recording.file_size_bytes or _NO_SIZE,
+                np.nan if recording.motion_score is None else recording.motion_score,
+                bool(recording.metadata.get('locked', False)),
+                events.code(recording.metadata.get('event_type') or ''),
+            ))
+        return cls._from_rows(rows, cameras, camera_names, events)
+
+    @classmethod
+    def _from_rows(cls, rows: List[tuple], cameras: _Interner, camera_names: List[str],
+                   events: _Interner) -> 'RecordingSet':
+        """Transpose parsed rows into columns."""
+        columns = list(zip(*rows)) if rows else [()] * 10
+        return cls(
+            recording_ids=np.array(columns[0], dtype=np.bytes_) if rows else np.array([], 'S1'),
+            camera_index=np.array(columns[1], dtype=np.int16),
+            start_ms=np.array(columns[2], dtype=np.int64),
+            end_ms=np.array(columns[3], dtype=np.int64),
+            type_codes=np.array(columns[4], dtype=np.int8),
+            status_codes=np.array(columns[5], dtype=np.int8),
+            sizes=np.array(columns[6], dtype=np.int64),
+            motion_scores=np.array(columns[7], dtype=np.float32),
+            locked=np.array(columns[8], dtype=bool),
+            event_type_codes=np.array(columns[9], dtype=np.int8),
+            cameras=cameras.values, camera_names=camera_names, event_types=events.values,
+        )
+
+    @classmethod
+    def concat(cls, sets: Iterable['RecordingSet']) -> 'RecordingSet':
+        """Combine several recording sets, e.g. pages of one query.
+
+        Args:
+            sets: Recording sets to combine
+
+        Returns:
+            Recording set with the rows of all inputs in order
+        """
+        sets = [s for s in sets if len(s)]
+        if not sets:
+            return cls.empty()
+        cameras, events = _Interner(), _Interner([''])
+        camera_names: List[str] = []
+        camera_columns, event_columns = [], []
+        for part in sets:
+            camera_map = np.array([cameras.code(c) for c in part.cameras], dtype=np.int16)
+            for camera_id, name in zip(part.cameras, part.camera_names):
+                if cameras.code(camera_id) == len(camera_names):
+                    camera_names.append(name)
+            event_map = np.array([events.code(e) for e in part.event_types], dtype=np.int8)
+            camera_columns.append(camera_map[part.camera_index])
+            event_columns.append(event_map[part.event_type_codes])
+
+        width = max(part.recording_ids.dtype.itemsize for part in sets)
+        return cls(
+            recording_ids=np.concatenate([p.recording_ids.astype(f'S{width}') for p in sets]),
+            camera_index=np.concatenate(camera_columns),
+            start_ms=np.concatenate([p.start_ms for p in sets]),
+            end_ms=np.concatenate([p.end_ms for p in sets]),
+            type_codes=np.concatenate([p.type_codes for p in sets]),
+            status_codes=np.concatenate([p.status_codes for p in sets]),
+            sizes=np.concatenate([p.sizes for p in sets]),
+            motion_scores=np.concatenate([p.motion_scores for p in sets]),
+            locked=np.concatenate([p.locked for p in sets]),
+            event_type_codes=np.concatenate(event_columns),
+            cameras=cameras.values, camera_names=camera_names, event_types=events.values,
+        )
+
+    def __len__(self) -> int:
+        return len(self.start_ms)
+
+    def __iter__(self) -> Iterator[Recording]:
+        for index in range(len(self)):
+            yield self._materialize(index)
+
+    def __getitem__(self, key: Union[int, slice, np.ndarray]) -> Union[Recording, 'RecordingSet']:
+        """Get one recording, or a subset for slices, index arrays and boolean masks."""
+        if isinstance(key, (int, np.integer)):
+            index = int(key)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("recording index out of range")
+            return self._materialize(index)
+        return self._take(key)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays in bytes."""
+        return sum(column.nbytes for column in self._columns())
+
+    def get_ids(self) -> List[str]:
+        """Get the IDs of all recordings.
+
+        Returns:
+            Recording IDs in row order
+        """
+        return [recording_id.decode() for recording_id in self.recording_ids]
+
+    def index_of(self, recording_id: str) -> Optional[int]:
+        """Find the row of a recording.
+
+        Args:
+            recording_id: Unique identifier for the recording
+
+        Returns:
+            Row index or None if the recording is not in the set
+        """
+        matches = np.flatnonzero(self.recording_ids == recording_id.encode())
+        return int(matches[0]) if len(matches) else None
+
+    def for_cameras(self, camera_ids: Iterable[str]) -> 'RecordingSet':
+        """Keep the recordings of some cameras.
+
+        Args:
+            camera_ids: Cameras to keep
+
+        Returns:
+            Filtered recording set
+        """
+        wanted = set(camera_ids)
+        codes = [code for code, camera_id in enumerate(self.cameras) if camera_id in wanted]
+        return self._take(np.isin(self.camera_index, codes))
+
+    def in_range(self, start_time: datetime, end_time: datetime) -> 'RecordingSet':
+        """Keep the recordings overlapping a time range.
+
+        Recordings still in progress extend to the end of the range.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range
+
+        Returns:
+            Filtered recording set
+        """
+        start, end = _to_ms(start_time), _to_ms(end_time)
+        ends = np.where(self.end_ms == _NO_END, np.iinfo(np.int64).max, self.end_ms)
+        return self._take((self.start_ms <= end) & (ends >= start))
+
+    def of_type(self, *recording_types: RecordingType) -> 'RecordingSet':
+        """Keep recordings of some types.
+
+        Args:
+            *recording_types: Types to keep
+
+        Returns:
+            Filtered recording set
+        """
+        codes = [_TYPE_CODES[recording_type] for recording_type in recording_types]
+        return self._take(np.isin(self.type_codes, codes))
+
+    def with_status(self, *statuses: RecordingStatus) -> 'RecordingSet':
+        """Keep recordings with some statuses.
+
+        Args:
+            *statuses: Statuses to keep
+
+        Returns:
+            Filtered recording set
+        """
+        codes = [_STATUS_CODES[status] for status in statuses]
+        return self._take(np.isin(self.status_codes, codes))
+
+    def sorted_by_start(self) -> 'RecordingSet':
+        """Order the recordings by start time.
+
+        Returns:
+            Sorted recording set
+        """
+        return self._take(np.argsort(self.start_ms, kind='stable'))
+
+    def total_size(self) -> int:
+        """Sum the known file sizes.
+
+        Returns:
+            Total size in bytes of the recordings with a known size
+        """
+        return int(self.sizes[self.sizes != _NO_SIZE].sum())
+
+    def _columns(self) -> List[np.ndarray]:
+        """Get all per-row arrays."""
+        return [self.recording_ids, self.camera_index, self.start_ms, self.end_ms,
+                self.type_codes, self.status_codes, self.sizes, self.motion_scores,
+                self.locked, self.event_type_codes]
+
+    def _take(self, selection) -> 'RecordingSet':
+        """Build a subset sharing the lookup tables of this set."""
+        columns = [column[selection] for column in self._columns()]
+        return RecordingSet(*columns, cameras=self.cameras, camera_names=self.camera_names,
+                            event_types=self.event_types)
+
+    def _materialize(self, index: int) -> Recording:
+        """Build the Recording object of a row."""
+        camera = int(self.camera_index[index])
+        end_ms = int(self.end_ms[index])
+        size = int(self.sizes[index])
+        score = float(self.motion_scores[index])
+        event_type = self.event_types[int(self.event_type_codes[index])]
+        return Recording(
+            recording_id=self.recording_ids[index].decode(),
+            camera_id=self.cameras[camera],
+            camera_name=self.camera_names[camera],
+            start_time=_from_ms(int(self.start_ms[index])),
+            end_time=_from_ms(end_ms) if end_ms != _NO_END else None,
+            recording_type=_TYPES[int(self.type_codes[index])],
+            status=_STATUSES[int(self.status_codes[index])],
+            file_size_bytes=size if size != _NO_SIZE else None,
+            motion_score=None if np.isnan(score) else score,
+            metadata={'locked': bool(self.locked[index]), 'event_type': event_type or None},
+        )
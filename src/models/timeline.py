@@ -5,11 +5,15 @@ This module defines the timeline model for managing recording playback,
 seeking, and timeline visualization with motion events.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Tuple
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
+from .motion_heatmap import MotionDensity, MotionHeatmap, MotionResolution
+from .recording import RecordingType, api_camera_id, api_recording_type
+
 
 class PlaybackState(Enum):
     """Playback states for timeline."""
@@ -29,21 +33,36 @@ class TimelineEventType(Enum):
     ALERT = "alert"
 
 
-@dataclass
+# Events and segments are created in bulk on every range query, so they
+# are slotted: no per-instance __dict__, which saves memory
+@dataclass(slots=True)
 class TimelineEvent:
     """Event marker on the timeline."""
     timestamp: datetime
     event_type: TimelineEventType
     duration_seconds: Optional[int] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
-        """Initialize default values."""
+        """Replace an explicitly passed None metadata with an empty dict."""
         if self.metadata is None:
             self.metadata = {}
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert event to dictionary representation.
+
+        Returns:
+            Dictionary representation of the event
+        """
+        return {
+            'timestamp': self.timestamp.isoformat(),
+            'event_type': self.event_type.value,
+            'duration_seconds': self.duration_seconds,
+            'metadata': dict(self.metadata),
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class TimelineSegment:
     """Continuous recording segment on timeline."""
     start_time: datetime
@@ -51,12 +70,19 @@ class TimelineSegment:
     recording_id: str
     camera_id: str
     has_motion: bool = False
-    motion_events: List[TimelineEvent] = None
+    motion_events: List[TimelineEvent] = field(default_factory=list)
+    recording_ids: List[str] = None
+    # (recording_id, start_time, end_time) of every coalesced recording
+    recording_spans: List[Tuple[str, datetime, datetime]] = None
 
     def __post_init__(self):
         """Initialize default values."""
         if self.motion_events is None:
             self.motion_events = []
+        if self.recording_ids is None:
+            self.recording_ids = [self.recording_id]
+        if self.recording_spans is None:
+            self.recording_spans = [(self.recording_id, self.start_time, self.end_time)]
 
     @property
     def duration_seconds(self) -> int:
@@ -75,6 +101,143 @@ class TimelineSegment:
         """
         return self.start_time <= timestamp <= self.end_time
 
+    def recording_at(self, timestamp: datetime,
+                     preferred: Optional[str] = None) -> Tuple[str, datetime]:
+        """Get the coalesced recording that covers a timestamp.
+
+        Where recordings overlap, the preferred one is kept while it still
+        covers the timestamp, otherwise the earliest one is chosen.
+
+        Args:
+            timestamp: Timestamp within the segment
+            preferred: Recording to keep if it covers the timestamp, e.g.
+                the one a player already has loaded
+
+        Returns:
+            (recording ID, start time of that recording); offsets into its
+            media are relative to that start time
+        """
+        covering = [(start_time, recording_id)
+                    for recording_id, start_time, end_time in self.recording_spans
+                    if start_time <= timestamp <= end_time]
+        for start_time, recording_id in covering:
+            if recording_id == preferred:
+                return recording_id, start_time
+        if covering:
+            start_time, recording_id = min(covering)
+            return recording_id, start_time
+        return self.recording_id, self.start_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert segment to dictionary representation.
+
+        Returns:
+            Dictionary representation of the segment
+        """
+        return {
+            'start_time': self.start_time.isoformat(),
+            'end_time': self.end_time.isoformat(),
+            'recording_id': self.recording_id,
+            'camera_id': self.camera_id,
+            'has_motion': self.has_motion,
+            'motion_events': [event.to_dict() for event in self.motion_events],
+            'recording_ids': list(self.recording_ids),
+            'recording_spans': [(recording_id, start_time.isoformat(), end_time.isoformat())
+                                for recording_id, start_time, end_time in self.recording_spans],
+        }
+
+    def overlaps(self, other: 'TimelineSegment') -> bool:
+        """Check if two segments share some time span.
+
+        Args:
+            other: Segment to compare with
+
+        Returns:
+            True if the segments overlap, False if they are disjoint or only touch
+        """
+        return self.start_time < other.end_time and other.start_time < self.end_time
+
+    @classmethod
+    def from_api_response(cls, api_data: Dict[str, Any],
+                          now: Optional[datetime] = None) -> 'TimelineSegment':
+        """Create the segment of a recording API item.
+
+        Args:
+            api_data: Recording data from UniFi Video API
+            now: End of recordings still in progress, defaults to the current time
+
+        Returns:
+            Timeline segment
+        """
+        start_time = datetime.fromtimestamp(api_data['startTime'] / 1000)
+        if api_data.get('endTime'):
+            end_time = datetime.fromtimestamp(api_data['endTime'] / 1000)
+        else:
+            end_time = max(start_time, now or datetime.now())
+        return cls(start_time, end_time, api_data['_id'], api_camera_id(api_data),
+                   has_motion=api_recording_type(api_data) == RecordingType.MOTION)
+
+    def merge(self, other: 'TimelineSegment'):
+        """Extend this segment to also cover an overlapping segment.
+
+        The earlier segment's ``recording_id`` stays the primary one; the
+        ids of all coalesced recordings are kept in ``recording_ids`` and
+        their own time spans in ``recording_spans``.
+
+        Args:
+            other: Overlapping segment to absorb
+        """
+        if other.start_time < self.start_time:
+            self.recording_id = other.recording_id
+        self.start_time = min(self.start_time, other.start_time)
+        self.end_time = max(self.end_time, other.end_time)
+        self.has_motion = self.has_motion or other.has_motion
+        self.recording_ids = self.recording_ids + [
+            recording_id for recording_id in other.recording_ids
+            if recording_id not in self.recording_ids
+        ]
+        known = {span[0] for span in self.recording_spans}
+        self.recording_spans = self.recording_spans + [
+            span for span in other.recording_spans if span[0] not in known
+        ]
+        if other.motion_events:
+            self.motion_events = sorted(self.motion_events + other.motion_events,
+                                        key=lambda e: e.timestamp)
+
+
+class _EventIndex:
+    """Events kept sorted by timestamp with a parallel key list for bisection."""
+
+    def __init__(self):
+        self.events: List[TimelineEvent] = []
+        self.times: List[datetime] = []
+
+    def insert(self, event: TimelineEvent):
+        """Insert an event after any events with the same timestamp."""
+        index = bisect_right(self.times, event.timestamp)
+        self.times.insert(index, event.timestamp)
+        self.events.insert(index, event)
+
+    def in_range(self, start_time: datetime, end_time: datetime) -> List[TimelineEvent]:
+        """Get the events with ``start_time <= timestamp <= end_time``."""
+        return self.events[bisect_left(self.times, start_time):
+                           bisect_right(self.times, end_time)]
+
+    def after(self, timestamp: Optional[datetime]) -> int:
+        """Get the index of the first event strictly after a timestamp."""
+        return 0 if timestamp is None else bisect_right(self.times, timestamp)
+
+    def before(self, timestamp: Optional[datetime]) -> int:
+        """Get the index of the last event strictly before a timestamp, or -1."""
+        if timestamp is None:
+            return len(self.events) - 1
+        return bisect_left(self.times, timestamp) - 1
+
+    def clear(self):
+        """Remove all events."""
+        self.events.clear()
+        self.times.clear()
+
 
 class Timeline:
     """Timeline model for recording playback management."""
@@ -86,8 +249,18 @@ class Timeline:
             camera_id: Unique identifier for the camera
         """
         self.camera_id = camera_id
+
+        # Segments are kept sorted and non-overlapping, with their start
+        # times mirrored in a parallel list so lookups can bisect
         self.segments: List[TimelineSegment] = []
-        self.events: List[TimelineEvent] = []
+        self._segment_starts: List[datetime] = []
+        # Bumped whenever segments change, lets derived indexes detect staleness
+        self.revision = 0
+        self._event_index = _EventIndex()
+        self._events_by_type: Dict[TimelineEventType, _EventIndex] = {}
+        self.events: List[TimelineEvent] = self._event_index.events
+        # Motion density per minute, hour and day for the timeline bar
+        self.motion_heatmap = MotionHeatmap()
 
         # Playback state
         self.current_position: Optional[datetime] = None
@@ -98,17 +271,58 @@ class Timeline:
         self.view_start: Optional[datetime] = None
         self.view_end: Optional[datetime] = None
         self.zoom_level = 1.0
+        self.density_resolution = MotionResolution.DAY
 
     def add_segment(self, segment: TimelineSegment):
         """Add a recording segment to the timeline.
 
+        The segment is inserted in chronological order and coalesced with
+        any segments it overlaps, so the timeline never holds two segments
+        covering the same instant.
+
         Args:
             segment: Timeline segment to add
         """
-        # TODO: Insert segment in chronological order
-        # TODO: Merge overlapping segments if needed
-        self.segments.append(segment)
-        self.segments.sort(key=lambda s: s.start_time)
+        index = bisect_right(self._segment_starts, segment.start_time)
+        # Absorb the preceding segment if it reaches into the new one
+        if index > 0 and self.segments[index - 1].overlaps(segment):
+            index -= 1
+            merged = self.segments[index]
+            merged.merge(segment)
+        else:
+            merged = segment
+            self.segments.insert(index, merged)
+            self._segment_starts.insert(index, merged.start_time)
+
+        # Absorb following segments that start before the merged one ends
+        following = index + 1
+        while following < len(self.segments) and self.segments[following].overlaps(merged):
+            merged.merge(self.segments[following])
+            following += 1
+        del self.segments[index + 1:following]
+        del self._segment_starts[index + 1:following]
+        self._segment_starts[index] = merged.start_time
+        self.revision += 1
+
+    def add_segments(self, segments: Iterable[TimelineSegment]):
+        """Add many recording segments at once.
+
+        Equivalent to calling ``add_segment`` for each of them, but sorts and
+        coalesces in one pass, which is much faster for large batches.
+
+        Args:
+            segments: Timeline segments to add
+        """
+        combined = sorted(list(self.segments) + list(segments), key=lambda s: s.start_time)
+        coalesced: List[TimelineSegment] = []
+        for segment in combined:
+            if coalesced and coalesced[-1].overlaps(segment):
+                coalesced[-1].merge(segment)
+            else:
+                coalesced.append(segment)
+        self.segments[:] = coalesced
+        self._segment_starts[:] = [segment.start_time for segment in coalesced]
+        self.revision += 1
 
     def add_event(self, event: TimelineEvent):
         """Add an event marker to the timeline.
@@ -116,9 +330,10 @@ class Timeline:
         Args:
             event: Timeline event to add
         """
-        # TODO: Insert event in chronological order
-        self.events.append(event)
-        self.events.sort(key=lambda e: e.timestamp)
+        self._event_index.insert(event)
+        self._events_by_type.setdefault(event.event_type, _EventIndex()).insert(event)
+        if event.event_type == TimelineEventType.MOTION:
+            self.motion_heatmap.add(event.timestamp, event.metadata.get('motion_score'))
 
     def get_segment_at_time(self, timestamp: datetime) -> Optional[TimelineSegment]:
         """Get the recording segment at a specific timestamp.
@@ -129,12 +344,40 @@ class Timeline:
         Returns:
             Timeline segment containing the timestamp or None
         """
-        # TODO: Find segment containing the timestamp
-        for segment in self.segments:
-            if segment.contains_timestamp(timestamp):
-                return segment
+        index = bisect_right(self._segment_starts, timestamp) - 1
+        if index >= 0 and timestamp <= self.segments[index].end_time:
+            return self.segments[index]
         return None
 
+    def get_next_segment(self, timestamp: datetime) -> Optional[TimelineSegment]:
+        """Get the first segment starting after a timestamp.
+
+        Args:
+            timestamp: Timestamp to query
+
+        Returns:
+            Next timeline segment or None if there is none
+        """
+        index = bisect_right(self._segment_starts, timestamp)
+        return self.segments[index] if index < len(self.segments) else None
+
+    def get_segments_in_range(self, start_time: datetime,
+                              end_time: datetime) -> List[TimelineSegment]:
+        """Get segments overlapping a time range.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range
+
+        Returns:
+            Timeline segments intersecting the range, in chronological order
+        """
+        first = max(0, bisect_right(self._segment_starts, start_time) - 1)
+        if first < len(self.segments) and self.segments[first].end_time < start_time:
+            first += 1
+        last = bisect_right(self._segment_starts, end_time)
+        return self.segments[first:last]
+
     def get_events_in_range(self, start_time: datetime,
                            end_time: datetime) -> List[TimelineEvent]:
         """Get events within a time range.
@@ -146,9 +389,7 @@ class Timeline:
         Returns:
             List of events within the time range
         """
-        # TODO: Filter events by time range
-        return [event for event in self.events
-                if start_time <= event.timestamp <= end_time]
+        return self._event_index.in_range(start_time, end_time)
 
     def seek_to_time(self, timestamp: datetime) -> bool:
         """Seek playback to a specific timestamp.
@@ -171,30 +412,53 @@ class Timeline:
     def seek_to_next_event(self, event_type: Optional[TimelineEventType] = None) -> bool:
         """Seek to the next event on the timeline.
 
+        Events outside of recorded footage are skipped.
+
         Args:
             event_type: Optional event type filter
 
         Returns:
             True if next event found and seeked, False otherwise
         """
-        # TODO: Find next event after current position
-        # TODO: Filter by event type if specified
-        # TODO: Seek to event timestamp
-        pass
+        index = self._events_for(event_type)
+        if index is None:
+            return False
+        for position in range(index.after(self.current_position), len(index.events)):
+            if self.seek_to_time(index.times[position]):
+                return True
+        return False
 
     def seek_to_previous_event(self, event_type: Optional[TimelineEventType] = None) -> bool:
         """Seek to the previous event on the timeline.
 
+        Events outside of recorded footage are skipped.
+
         Args:
             event_type: Optional event type filter
 
         Returns:
             True if previous event found and seeked, False otherwise
         """
-        # TODO: Find previous event before current position
-        # TODO: Filter by event type if specified
-        # TODO: Seek to event timestamp
-        pass
+        index = self._events_for(event_type)
+        if index is None:
+            return False
+        for position in range(index.before(self.current_position), -1, -1):
+            if self.seek_to_time(index.times[position]):
+                return True
+        return False
+
+    def _events_for(self, event_type: Optional[TimelineEventType]) -> Optional[_EventIndex]:
+        """Get the event index for an optional type filter.
+
+        Args:
+            event_type: Event type, or None for all events
+
+        Returns:
+            Matching event index or None if there are no such events
+        """
+        if event_type is None:
+            return self._event_index
+        return self._events_by_type.get(event_type)
 
     def set_playback_state(self, state: PlaybackState):
         """Set the current playback state.
@@ -231,13 +495,43 @@ class Timeline:
     def zoom_to_range(self, start_time: datetime, end_time: datetime):
         """Zoom timeline view to a specific time range.
 
+        The zoom level is how many times the range fits into the span of
+        all segments, never below 1. The motion density bar switches to the
+        finest heatmap resolution that fits the range.
+
         Args:
             start_time: Start of zoom range
             end_time: End of zoom range
         """
-        # TODO: Set view range to specified times
-        # TODO: Update zoom level
         self.set_view_range(start_time, end_time)
+        span = (end_time - start_time).total_seconds()
+        if self.segments and span > 0:
+            full = (self.segments[-1].end_time - self.segments[0].start_time).total_seconds()
+            self.zoom_level = max(1.0, full / span)
+        else:
+            self.zoom_level = 1.0
+        self.density_resolution = self.motion_heatmap.resolution_for(start_time, end_time)
+
+    def get_motion_density(self, start_time: Optional[datetime] = None,
+                           end_time: Optional[datetime] = None) -> Optional[MotionDensity]:
+        """Get the motion density bar of a range from the precomputed heatmap.
+
+        Args:
+            start_time: Start of the range, defaults to the view range
+            end_time: End of the range, defaults to the view range
+
+        Returns:
+            Motion density, or None if no range is given or set
+        """
+        start_time = start_time or self.view_start
+        end_time = end_time or self.view_end
+        if start_time is None or end_time is None:
+            return None
+        if start_time == self.view_start and end_time == self.view_end:
+            resolution = self.density_resolution
+        else:
+            resolution = self.motion_heatmap.resolution_for(start_time, end_time)
+        return self.motion_heatmap.density(start_time, end_time, resolution)
 
     def get_timeline_summary(self) -> Dict[str, Any]:
         """Get summary information about the timeline.
@@ -245,16 +539,33 @@ class Timeline:
         Returns:
             Dictionary containing timeline summary
         """
-        # TODO: Calculate total duration
-        # TODO: Count segments and events
-        # TODO: Return summary statistics
-        pass
+        motion_events, peak_motion = self.motion_heatmap.summary()
+        summary = {
+            'camera_id': self.camera_id,
+            'segment_count': len(self.segments),
+            'total_duration_seconds': sum(segment.duration_seconds for segment in self.segments),
+            'start_time': self.segments[0].start_time.isoformat() if self.segments else None,
+            'end_time': self.segments[-1].end_time.isoformat() if self.segments else None,
+            'event_count': len(self.events),
+            'events_by_type': {event_type.value: len(index.events)
+                               for event_type, index in self._events_by_type.items()},
+            'motion_event_count': motion_events,
+            'peak_motion_score': peak_motion,
+            'zoom_level': self.zoom_level,
+        }
+        if self.view_start is not None and self.view_end is not None:
+            view_motion, view_peak = self.motion_heatmap.summary(self.view_start, self.view_end)
+            summary['view_motion_event_count'] = view_motion
+            summary['view_peak_motion_score'] = view_peak
+        return summary
 
     def clear(self):
         """Clear all timeline data."""
-        # TODO: Clear segments and events
-        # TODO: Reset playback state
         self.segments.clear()
-        self.events.clear()
+        self._segment_starts.clear()
+        self.revision += 1
+        self._event_index.clear()
+        self._events_by_type.clear()
+        self.motion_heatmap.clear()
         self.current_position = None
         self.playback_state = PlaybackState.STOPPED
\ No newline at end of file
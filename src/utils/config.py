@@ -95,14 +95,21 @@ class ConfigManager:
             self.config.add_section(section)
         self.config.set(section, key, str(value))
 
-    def get_server_config(self) -> Dict[str, str]:
+    def get_server_config(self) -> Dict[str, Any]:
         """Get server connection configuration.
 
         Returns:
             Dictionary containing server configuration
         """
-        # TODO: Return server connection settings
-        pass
+        return {
+            'url': self.get('server', 'url', fallback=''),
+            'username': self.get('server', 'username', fallback=''),
+            'password': self.get('server', 'password', fallback=''),
+            'connection_timeout': self.config.getint('server', 'connection_timeout', fallback=30),
+            'verify_ssl': self.config.getboolean('server', 'verify_ssl', fallback=True),
+            'session_file': self.get('server', 'session_file', fallback=''),
+            'session_lifetime': self.config.getint('server', 'session_lifetime', fallback=3600),
+        }
 
     def set_server_config(self, server_url: str, username: str = None,
                          remember_credentials: bool = False):
@@ -123,8 +130,59 @@ class ConfigManager:
         Returns:
             Dictionary containing video settings
         """
-        # TODO: Return video quality and playback settings
-        pass
+        return {
+            'default_quality': self.get('video', 'default_quality', fallback='high'),
+            'auto_quality': self.config.getboolean('video', 'auto_quality', fallback=True),
+            'buffer_size': self.config.getint('video', 'buffer_size', fallback=5000),
+            'hardware_acceleration': self.config.getboolean('video', 'hardware_acceleration',
+                                                            fallback=True),
+            'video_cache': self.config.getint('video', 'video_cache', fallback=1000),
+            'hidden_stream_mode': self.get('video', 'hidden_stream_mode', fallback='pause'),
+        }
+
+    def get_advanced_settings(self) -> Dict[str, Any]:
+        """Get advanced settings.
+
+        Returns:
+            Dictionary containing advanced settings
+        """
+        return {
+            'vlc_options': self.get('advanced', 'vlc_options', fallback=''),
+            'debug_mode': self.config.getboolean('advanced', 'debug_mode', fallback=False),
+            'performance_monitoring': self.config.getboolean('advanced', 'performance_monitoring',
+                                                             fallback=False),
+            'auto_reconnect': self.config.getboolean('advanced', 'auto_reconnect', fallback=True),
+            'reconnect_interval': self.config.getint('advanced', 'reconnect_interval', fallback=30),
+        }
+
+    def get_network_settings(self) -> Dict[str, Any]:
+        """Get network and performance settings.
+
+        Returns:
+            Dictionary containing network settings
+        """
+        return {
+            'max_concurrent_streams': self.config.getint('network', 'max_concurrent_streams', fallback=4),
+            'stream_retry_attempts': self.config.getint('network', 'stream_retry_attempts', fallback=3),
+            'stream_timeout': self.config.getint('network', 'stream_timeout', fallback=10),
+            'api_timeout': self.config.getint('network', 'api_timeout', fallback=15),
+            'snapshot_rate_limit': self.config.getfloat('network', 'snapshot_rate_limit', fallback=4.0),
+            'max_parallel_downloads': self.config.getint('network', 'max_parallel_downloads',
+                                                         fallback=3),
+            'download_bandwidth_limit': self.config.getint('network', 'download_bandwidth_limit',
+                                                           fallback=0),
+            'camera_refresh_interval': self.config.getfloat('network', 'camera_refresh_interval',
+                                                            fallback=30.0),
+            'response_cache_ttls': {
+                'server': self.config.getfloat('network', 'cache_ttl_server', fallback=300.0),
+                'camera': self.config.getfloat('network', 'cache_ttl_camera', fallback=10.0),
+                'stream': self.config.getfloat('network', 'cache_ttl_stream', fallback=60.0),
+                'snapshot': self.config.getfloat('network', 'cache_ttl_snapshot', fallback=0.5),
+            },
+            'response_cache_entries': self.config.getint('network', 'response_cache_entries',
+                                                         fallback=512),
+            'response_cache_mb': self.config.getint('network', 'response_cache_mb', fallback=32),
+        }
 
     def get_ui_settings(self) -> Dict[str, Any]:
         """Get UI layout and appearance settings.
@@ -132,5 +190,44 @@ class ConfigManager:
         Returns:
             Dictionary containing UI settings
         """
-        # TODO: Return UI configuration
-        pass
\ No newline at end of file
+        return {
+            'window_width': self.config.getint('ui', 'window_width', fallback=1280),
+            'window_height': self.config.getint('ui', 'window_height', fallback=720),
+            'window_maximized': self.config.getboolean('ui', 'window_maximized', fallback=False),
+            'grid_rows': self.config.getint('ui', 'grid_rows', fallback=2),
+            'grid_columns': self.config.getint('ui', 'grid_columns', fallback=2),
+            'grid_mode': self.get('ui', 'grid_mode', fallback='video'),
+            'snapshot_interval': self.config.getfloat('ui', 'snapshot_interval', fallback=1.0),
+            'mosaic_fps': self.config.getfloat('ui', 'mosaic_fps', fallback=15.0),
+            'show_toolbar': self.config.getboolean('ui', 'show_toolbar', fallback=True),
+            'show_statusbar': self.config.getboolean('ui', 'show_statusbar', fallback=True),
+            'theme': self.get('ui', 'theme', fallback='default'),
+        }
+
+    def get_recording_settings(self) -> Dict[str, Any]:
+        """Get recording storage and playback cache settings.
+
+        Returns:
+            Dictionary containing recording settings
+        """
+        return {
+            'auto_save_snapshots': self.config.getboolean('recording', 'auto_save_snapshots',
+                                                          fallback=False),
+            'snapshot_directory': self.get('recording', 'snapshot_directory', fallback='snapshots'),
+            'recording_directory': self.get('recording', 'recording_directory',
+                                            fallback='recordings'),
+            'max_recording_age_days': self.config.getint('recording', 'max_recording_age_days',
+                                                         fallback=30),
+            'cache_size_mb': self.config.getint('recording', 'cache_size_mb', fallback=4096),
+            'prefetch_segments': self.config.getint('recording', 'prefetch_segments', fallback=2),
+            'thumbnail_directory': self.get('recording', 'thumbnail_directory',
+                                            fallback='thumbnails'),
+        }
+
+    def get_metadata_store_path(self) -> Path:
+        """Get the database file of the local metadata index.
+
+        Returns:
+            Path of the SQLite database
+        """
+        return Path(self.get('recording', 'metadata_database', fallback='cache/metadata.db'))
@@ -5,10 +5,18 @@ This module provides common utility functions used throughout the application
 for data processing, validation, and general helper operations.
 """
 
+import functools
+import random
 import re
+import threading
+import time
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
+from .logger import get_logger
+
+logger = get_logger("utils.helpers")
+
 
 def validate_url(url: str) -> bool:
     """Validate if a string is a valid URL.
@@ -98,13 +106,20 @@ def deep_merge_dict(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, A
     pass
 
 
-def retry_operation(func, max_retries: int = 3, delay: float = 1.0):
+def retry_operation(func, max_retries: int = 3, delay: float = 1.0,
+                    backoff: float = 2.0, max_delay: Optional[float] = None,
+                    jitter: float = 0.1, stop_event: Optional[threading.Event] = None):
     """Retry an operation with exponential backoff.
 
     Args:
         func: Function to retry
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries
+        backoff: Multiplier applied to the delay after each failure
+        max_delay: Upper bound for the delay between retries
+        jitter: Random spread applied to each delay as a fraction of it, so
+            many callers failing together do not retry in lockstep
+        stop_event: Optional event that aborts the remaining retries when set
 
     Returns:
         Function result if successful
@@ -112,9 +127,24 @@ def retry_operation(func, max_retries: int = 3, delay: float = 1.0):
     Raises:
         Last exception if all retries fail
     """
-    # TODO: Implement retry logic with exponential backoff
-    # TODO: Log retry attempts
-    pass
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= max_retries or (stop_event is not None and stop_event.is_set()):
+                raise
+            wait = delay * (backoff ** attempt)
+            if max_delay is not None:
+                wait = min(wait, max_delay)
+            wait *= 1 + random.uniform(-jitter, jitter)
+            attempt += 1
+            logger.debug(f"Attempt {attempt}/{max_retries} failed ({e}), retrying in {wait:.1f}s")
+            if stop_event is not None:
+                if stop_event.wait(wait):
+                    raise
+            else:
+                time.sleep(wait)
 
 
 def calculate_grid_dimensions(item_count: int, aspect_ratio: float = 16/9) -> tuple:
@@ -135,26 +165,117 @@ def calculate_grid_dimensions(item_count: int, aspect_ratio: float = 16/9) -> tu
 def debounce(wait_time: float):
     """Decorator to debounce function calls.
 
+    Each call restarts the wait; the function runs once, with the arguments
+    of the last call, after ``wait_time`` seconds without calls. It runs on
+    a timer thread. The decorated function gains ``cancel()`` and
+    ``flush()`` to drop or immediately run the pending call.
+
+    The pending call is shared by all callers of the decorated function;
+    decorate a bound method (``debounce(0.2)(self.save)``) for per-object state.
+
     Args:
         wait_time: Time to wait before allowing next call
 
     Returns:
         Decorated function
     """
-    # TODO: Implement debounce decorator
-    # TODO: Prevent rapid successive calls
-    pass
+    def decorator(func):
+        lock = threading.Lock()
+        state = {'timer': None, 'args': None}
+
+        def run():
+            with lock:
+                pending, state['args'] = state['args'], None
+                state['timer'] = None
+            if pending is not None:
+                func(*pending[0], **pending[1])
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with lock:
+                if state['timer'] is not None:
+                    state['timer'].cancel()
+                state['args'] = (args, kwargs)
+                state['timer'] = threading.Timer(wait_time, run)
+                state['timer'].daemon = True
+                state['timer'].start()
+
+        def cancel():
+            with lock:
+                if state['timer'] is not None:
+                    state['timer'].cancel()
+                state['timer'] = state['args'] = None
+
+        def flush():
+            with lock:
+                if state['timer'] is not None:
+                    state['timer'].cancel()
+            run()
+
+        wrapper.cancel = cancel
+        wrapper.flush = flush
+        return wrapper
+    return decorator
 
 
 def throttle(rate_limit: float):
     """Decorator to throttle function calls.
 
+    The first call runs immediately. Calls made within ``1 / rate_limit``
+    seconds of the last run are coalesced: only the last of them runs, on a
+    timer thread, once the interval has passed. The decorated function
+    gains ``cancel()`` and ``flush()`` like with ``debounce``.
+
     Args:
         rate_limit: Maximum calls per second
 
     Returns:
         Decorated function
     """
-    # TODO: Implement throttle decorator
-    # TODO: Limit function call rate
-    pass
\ No newline at end of file
+    interval = 1.0 / rate_limit
+
+    def decorator(func):
+        lock = threading.Lock()
+        state = {'timer': None, 'args': None, 'last': None}
+
+        def run_pending():
+            with lock:
+                pending, state['args'] = state['args'], None
+                state['timer'] = None
+                if pending is not None:
+                    state['last'] = time.monotonic()
+            if pending is not None:
+                func(*pending[0], **pending[1])
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with lock:
+                now = time.monotonic()
+                state['args'] = (args, kwargs)
+                if state['timer'] is not None:
+                    return
+                remaining = (interval - (now - state['last'])
+                             if state['last'] is not None else 0.0)
+                if remaining > 0:
+                    state['timer'] = threading.Timer(remaining, run_pending)
+                    state['timer'].daemon = True
+                    state['timer'].start()
+                    return
+            run_pending()
+
+        def cancel():
+            with lock:
+                if state['timer'] is not None:
+                    state['timer'].cancel()
+                state['timer'] = state['args'] = None
+
+        def flush():
+            with lock:
+                if state['timer'] is not None:
+                    state['timer'].cancel()
+            run_pending()
+
+        wrapper.cancel = cancel
+        wrapper.flush = flush
+        return wrapper
+    return decorator
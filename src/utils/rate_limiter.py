@@ -0,0 +1,88 @@
+"""
+Token bucket rate limiting for network operations.
+
+This module provides a thread-safe token bucket used to keep request
+rates and transfer bandwidth within configured budgets.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: Maximum burst size, defaults to one second worth of tokens
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None):
+        """Change the refill rate.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size, defaults to one second worth of tokens
+        """
+        with self._lock:
+            self._refill()
+            self.rate = rate
+            self.capacity = capacity if capacity is not None else max(rate, 1.0)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def _refill(self):
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens if available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until they will be available
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill()
+            # Requests larger than the bucket are let through once it is full
+            needed = min(tokens, self.capacity)
+            if self._tokens >= needed:
+                self._tokens -= tokens
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, stop_event: Optional[threading.Event] = None) -> bool:
+        """Block until tokens are available and take them.
+
+        Args:
+            tokens: Number of tokens to take
+            stop_event: Optional event that aborts the wait when set
+
+        Returns:
+            True if the tokens were taken, False if the wait was aborted
+        """
+        if stop_event is not None and stop_event.is_set():
+            return False
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return True
+            if stop_event is not None:
+                if stop_event.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
@@ -0,0 +1,250 @@
+"""
+Single-surface mosaic rendering for large camera walls.
+
+This module decodes every selected stream into the raw frame buffers of
+its player, at the resolution of its tile, copies the frames into one
+shared NumPy canvas and hands the GUI a single image to blit at
+a capped frame rate, instead of embedding one native video window per
+tile.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .frame_buffer import FrameRing
+from .player import VideoPlayer, PlayerPool
+from .quality import QualityController
+from ..models.camera import Camera
+from ..utils.logger import get_logger
+
+logger = get_logger("video.compositor")
+
+
+@dataclass
+class _MosaicTile:
+    """A stream decoded into one cell of the mosaic."""
+    camera_id: str
+    url: str
+    index: int
+    player: VideoPlayer
+    frames: int = 0
+
+
+class MosaicCompositor:
+    """Composites many decoded streams into one image."""
+
+    def __init__(self, rows: int, columns: int, tile_size: Tuple[int, int] = (320, 180),
+                 max_fps: float = 15.0, pool: Optional[PlayerPool] = None,
+                 player_factory: Optional[Callable[[], VideoPlayer]] = None,
+                 quality: Optional[QualityController] = None):
+        """Initialize the compositor.
+
+        Args:
+            rows: Rows of the mosaic
+            columns: Columns of the mosaic
+            tile_size: (width, height) of one cell in pixels
+            max_fps: Maximum rate at which composited images are produced
+            pool: Player pool the decoders are checked out of
+            player_factory: Function creating a player, defaults to a
+                windowless ``VideoPlayer`` on ``pool``
+            quality: Picks the lowest channel that covers a cell
+        """
+        self.max_fps = max_fps
+        self.player_factory = player_factory or (lambda: VideoPlayer(None, pool))
+        self.quality = quality or QualityController()
+
+        self.tiles: Dict[str, _MosaicTile] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_render = 0.0
+        self.set_layout(rows, columns, tile_size)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(width, height) of the composited image."""
+        return self.columns * self.tile_size[0], self.rows * self.tile_size[1]
+
+    def set_layout(self, rows: int, columns: int, tile_size: Tuple[int, int]):
+        """Change the mosaic dimensions, restarting the decoders at the new tile size.
+
+        Args:
+            rows: Rows of the mosaic
+            columns: Columns of the mosaic
+            tile_size: (width, height) of one cell in pixels
+        """
+        running = sorted(self.tiles.values(), key=lambda tile: tile.index)
+        for tile in running:
+            self._stop(tile)
+        self.tiles.clear()
+
+        self.rows, self.columns = rows, columns
+        self.tile_size = (tile_size[0] & ~1, tile_size[1] & ~1)
+        width, height = self.size
+        with self._lock:
+            self.canvas = np.zeros((height, width, 3), dtype=np.uint8)
+            self._header = f"P6 {width} {height} 255\n".encode('ascii')
+            self._dirty = True
+
+        for tile in running[:rows * columns]:
+            self.add_camera(tile.camera_id, tile.url)
+
+    def add_camera(self, camera_id: str, stream_url: Optional[str] = None,
+                   camera: Optional[Camera] = None) -> bool:
+        """Start decoding a camera into the next free cell.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            stream_url: URL of the stream, used if the camera has no channels
+            camera: Camera model, used to pick a channel for the cell size
+
+        Returns:
+            True if the camera was added, False otherwise
+        """
+        if camera_id in self.tiles:
+            return True
+        index = self._free_index()
+        if index is None:
+            logger.warning(f"No free mosaic cell for camera {camera_id}")
+            return False
+        if camera is not None and camera.streams:
+            level = self.quality.preferred_level(camera, self.tile_size)
+            stream_url = camera.streams_by_quality[level].url or stream_url
+        if not stream_url:
+            logger.warning(f"No stream URL available for camera {camera_id}")
+            return False
+
+        tile = _MosaicTile(camera_id, stream_url, index, self.player_factory())
+        try:
+            self._start(tile)
+        except Exception as e:
+            logger.error(f"Failed to start mosaic decoder for camera {camera_id}: {e}")
+            tile.player.cleanup()
+            return False
+        self.tiles[camera_id] = tile
+        return True
+
+    def remove_camera(self, camera_id: str):
+        """Stop decoding a camera and blank its cell.
+
+        Args:
+            camera_id: Unique identifier for the camera
+        """
+        tile = self.tiles.pop(camera_id, None)
+        if tile is None:
+            return
+        self._stop(tile)
+        x, y = self._origin(tile.index)
+        width, height = self.tile_size
+        with self._lock:
+            self.canvas[y:y + height, x:x + width] = 0
+            self._dirty = True
+
+    def get_camera_at(self, x: int, y: int) -> Optional[str]:
+        """Find the camera shown at a point of the composited image, e.g. for clicks.
+
+        Args:
+            x: Horizontal position in pixels
+            y: Vertical position in pixels
+
+        Returns:
+            Camera ID or None if the cell is empty
+        """
+        column, row = x // self.tile_size[0], y // self.tile_size[1]
+        if not (0 <= column < self.columns and 0 <= row < self.rows):
+            return None
+        index = row * self.columns + column
+        return next((tile.camera_id for tile in self.tiles.values() if tile.index == index),
+                    None)
+
+    def render(self, now: Optional[float] = None) -> Optional[bytes]:
+        """Produce the composited image if it changed and the frame budget allows.
+
+        Meant to be called from the GUI loop; the result can be passed to
+        ``sg.Image.update(data=...)``.
+
+        Args:
+            now: Current monotonic time, defaults to ``time.monotonic()``
+
+        Returns:
+            PPM image data, or None if there is nothing new to show yet
+        """
+        now = time.monotonic() if now is None else now
+        if self.max_fps and now - self._last_render < 1.0 / self.max_fps:
+            return None
+        with self._lock:
+            if not self._dirty:
+                return None
+            data = self._header + self.canvas.tobytes()
+            self._dirty = False
+        self._last_render = now
+        return data
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of frames decoded per camera.
+
+        Returns:
+            Mapping of camera ID to decoded frame count
+        """
+        return {camera_id: tile.frames for camera_id, tile in self.tiles.items()}
+
+    def cleanup(self):
+        """Stop all decoders."""
+        for camera_id in list(self.tiles):
+            self.remove_camera(camera_id)
+
+    def _free_index(self) -> Optional[int]:
+        """Get the first cell without a camera.
+
+        Returns:
+            Cell index or None if the mosaic is full
+        """
+        used = {tile.index for tile in self.tiles.values()}
+        return next((index for index in range(self.rows * self.columns) if index not in used),
+                    None)
+
+    def _origin(self, index: int) -> Tuple[int, int]:
+        """Get the top left corner of a cell.
+
+        Args:
+            index: Cell index in row-major order
+
+        Returns:
+            (x, y) in pixels
+        """
+        row, column = divmod(index, self.columns)
+        return column * self.tile_size[0], row * self.tile_size[1]
+
+    def _start(self, tile: _MosaicTile):
+        """Decode a tile into its player's frame ring and start playback.
+
+        Args:
+            tile: Mosaic tile
+        """
+        x, y = self._origin(tile.index)
+        width, height = self.tile_size
+
+        def on_frame(ring: FrameRing):
+            # Runs on the decoder thread; the GUI thread reads the canvas in render()
+            with ring.read() as frame:
+                if frame is None:
+                    return
+                with self._lock:
+                    # The canvas is RGB so it can be shown as a PPM image
+                    self.canvas[y:y + height, x:x + width] = frame.data[:, :, :3]
+                    self._dirty = True
+            tile.frames += 1
+
+        tile.player.enable_frame_access(width, height, on_frame=on_frame)
+        tile.player.play_stream(tile.url)
+
+    def _stop(self, tile: _MosaicTile):
+        """Stop a tile's decoder, returning its player to the pool.
+
+        Args:
+            tile: Mosaic tile
+        """
+        tile.player.cleanup()
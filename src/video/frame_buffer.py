@@ -0,0 +1,185 @@
+"""
+Preallocated frame buffers for raw video access.
+
+This module provides the ring of reusable NumPy frame buffers a player
+decodes into when raw frame access is enabled. The decoder writes into
+a free buffer while readers (the mosaic compositor, thumbnails, motion
+analysis) look at the most recent complete frame without copying it,
+and no memory is allocated per frame.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Set
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FrameView:
+    """A complete decoded frame, valid while its ``FrameRing.read`` block is open."""
+    data: np.ndarray
+    sequence: int
+    timestamp: float
+
+
+class FrameRing:
+    """Ring of reusable frame buffers shared by one decoder and its readers.
+
+    The newest complete frame and every buffer pinned by a reader are
+    never written to. If the decoder finds no free buffer, the frame goes
+    to a spare buffer and is dropped.
+    """
+
+    def __init__(self, width: int, height: int, count: int = 3, channels: int = 4):
+        """Initialize the ring.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+            count: Number of buffers; at least two more than concurrent readers
+            channels: Bytes per pixel (4 for RGBA)
+        """
+        if count < 2:
+            raise ValueError("a frame ring needs at least two buffers")
+        self.width = width
+        self.height = height
+        self.channels = channels
+        # The last buffer is the spare that absorbs frames with nowhere to go
+        self._buffers: List[np.ndarray] = [np.zeros((height, width, channels), dtype=np.uint8)
+                                           for _ in range(count + 1)]
+        self._addresses = [buffer.ctypes.data for buffer in self._buffers]
+        self._spare = count
+        self._writing: Set[int] = set()
+        # Written but not committed yet; reused only if nothing else is free,
+        # since the decoder may drop a frame between writing and display
+        self._ready: Set[int] = set()
+        self._pins = [0] * count
+        self._latest: Optional[int] = None
+        self._timestamp = 0.0
+        self._next = 0
+        self.sequence = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Number of buffers in the ring."""
+        return self._spare
+
+    @property
+    def pitch(self) -> int:
+        """Bytes per buffer row."""
+        return self.width * self.channels
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the buffers."""
+        return sum(buffer.nbytes for buffer in self._buffers)
+
+    def address(self, slot: int) -> int:
+        """Get the memory address of a buffer, for the decoder to write to.
+
+        Args:
+            slot: Buffer returned by ``begin_write``
+
+        Returns:
+            Address of the first pixel
+        """
+        return self._addresses[slot]
+
+    def begin_write(self) -> int:
+        """Reserve a buffer for the next decoded frame.
+
+        Returns:
+            Buffer slot
+        """
+        with self._lock:
+            fallback = None
+            for step in range(self.count):
+                slot = (self._next + step) % self.count
+                if slot == self._latest or slot in self._writing or self._pins[slot]:
+                    continue
+                if slot not in self._ready:
+                    break
+                if fallback is None:
+                    fallback = slot
+            else:
+                slot = fallback
+            if slot is None:
+                return self._spare
+            self._ready.discard(slot)
+            self._writing.add(slot)
+            self._next = (slot + 1) % self.count
+            return slot
+
+    def end_write(self, slot: int):
+        """Mark a buffer as fully written by the decoder.
+
+        Args:
+            slot: Buffer returned by ``begin_write``
+        """
+        with self._lock:
+            if slot in self._writing:
+                self._writing.discard(slot)
+                self._ready.add(slot)
+
+    def commit(self, slot: int, timestamp: Optional[float] = None):
+        """Publish a written buffer as the newest frame.
+
+        Args:
+            slot: Buffer returned by ``begin_write``
+            timestamp: Frame time, defaults to ``time.monotonic()``
+        """
+        with self._lock:
+            self._writing.discard(slot)
+            self._ready.discard(slot)
+            if slot == self._spare:
+                self.dropped += 1
+                return
+            self._latest = slot
+            self._timestamp = time.monotonic() if timestamp is None else timestamp
+            self.sequence += 1
+
+    @contextmanager
+    def read(self) -> Iterator[Optional[FrameView]]:
+        """Look at the newest frame without copying it.
+
+        The buffer cannot be overwritten until the block ends; keep the
+        block short and copy what must outlive it.
+
+        Yields:
+            Read-only frame view, or None if no frame has been decoded yet
+        """
+        with self._lock:
+            slot = self._latest
+            if slot is None:
+                view = None
+            else:
+                self._pins[slot] += 1
+                data = self._buffers[slot].view()
+                data.flags.writeable = False
+                view = FrameView(data, self.sequence, self._timestamp)
+        try:
+            yield view
+        finally:
+            if slot is not None:
+                with self._lock:
+                    self._pins[slot] -= 1
+
+    def copy_latest(self, out: np.ndarray) -> Optional[int]:
+        """Copy the newest frame into a caller-owned array.
+
+        Args:
+            out: Array of shape (height, width, channels) to fill
+
+        Returns:
+            Sequence number of the copied frame, or None if there is none yet
+        """
+        with self.read() as frame:
+            if frame is None:
+                return None
+            np.copyto(out, frame.data)
+            return frame.sequence
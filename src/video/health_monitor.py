@@ -0,0 +1,350 @@
+"""
+Stream health monitoring and automatic reconnection.
+
+This module watches every active stream through libVLC events and decoder
+frame counters, detects errors and stalls, and reconnects failed streams
+with bounded, jittered exponential backoff.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, replace
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+import vlc
+
+from .player import VideoPlayer
+from ..utils.helpers import retry_operation
+from ..utils.logger import get_logger
+
+logger = get_logger("video.health_monitor")
+
+
+class StreamHealth(Enum):
+    """Health states of a monitored stream."""
+    STARTING = "starting"
+    PLAYING = "playing"
+    BUFFERING = "buffering"
+    STALLED = "stalled"
+    RECONNECTING = "reconnecting"
+    FAILED = "failed"
+
+
+@dataclass
+class StreamStatus:
+    """Point-in-time health snapshot of a stream."""
+    camera_id: str
+    state: StreamHealth = StreamHealth.STARTING
+    bitrate_kbps: float = 0.0
+    decoded_frames: int = 0
+    dropped_frames: int = 0
+    reconnect_count: int = 0
+    last_frame_age: Optional[float] = None
+    buffering_percent: float = 0.0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert status to dictionary representation.
+
+        Returns:
+            Dictionary representation of the status
+        """
+        data = asdict(self)
+        data['state'] = self.state.value
+        return data
+
+
+class _WatchedStream:
+    """Monitor bookkeeping for a single stream."""
+
+    def __init__(self, camera_id: str, player: VideoPlayer, now: float):
+        self.player = player
+        self.status = StreamStatus(camera_id)
+        self.started_at = now
+        self.last_frame_time: Optional[float] = None
+        self.failure: Optional[str] = None
+        self.reconnecting = False
+        self.next_attempt_at = 0.0
+        # Set once the stream is no longer watched, aborting its reconnect
+        self.cancelled = threading.Event()
+
+
+class StreamHealthMonitor:
+    """Detects failed or stalled streams and reconnects them."""
+
+    def __init__(self, restart_stream: Callable[[str, VideoPlayer], bool],
+                 stall_timeout: float = 10.0,
+                 max_retries: int = 3, retry_delay: float = 1.0,
+                 reconnect_interval: float = 30.0, auto_reconnect: bool = True,
+                 check_interval: float = 1.0, max_parallel_reconnects: int = 4):
+        """Initialize the health monitor.
+
+        Args:
+            restart_stream: Function restarting playback of a camera on the given
+                player, returns success; it must refuse if that player no
+                longer shows the camera
+            stall_timeout: Seconds without a decoded frame before a stream counts as stalled
+            max_retries: Reconnect attempts per failure before giving up for a while
+            retry_delay: Delay before the first retry, doubled on every further one
+            reconnect_interval: Upper bound for the backoff delay, and the wait
+                before a stream that exhausted its retries is tried again
+            auto_reconnect: Whether failed streams are reconnected automatically
+            check_interval: Seconds between health checks
+            max_parallel_reconnects: Reconnects running at the same time, so a
+                network blip across many cameras does not become a reconnect storm
+        """
+        self.restart_stream = restart_stream
+        self.stall_timeout = stall_timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.reconnect_interval = reconnect_interval
+        self.auto_reconnect = auto_reconnect
+        self.check_interval = check_interval
+
+        self._streams: Dict[str, _WatchedStream] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self.max_parallel_reconnects = max_parallel_reconnects
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self):
+        """Start the background health check thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_parallel_reconnects,
+                                                thread_name_prefix="reconnect")
+        self._thread = threading.Thread(target=self._run, name="stream-health", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop health checks and pending reconnects."""
+        self._stop_event.set()
+        self._wake.set()
+        with self._lock:
+            for watched in self._streams.values():
+                watched.cancelled.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def watch(self, camera_id: str, player: VideoPlayer):
+        """Start monitoring a stream that was just started.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            player: Player showing the stream
+        """
+        now = time.monotonic()
+        with self._lock:
+            watched = self._streams.get(camera_id)
+            if watched is not None and watched.player is player and not watched.cancelled.is_set():
+                watched.started_at = now
+                watched.last_frame_time = None
+                watched.failure = None
+                watched.status.state = StreamHealth.STARTING
+                return
+            self._streams[camera_id] = _WatchedStream(camera_id, player, now)
+        if watched is not None:
+            watched.cancelled.set()
+            watched.player.detach_events()
+
+        events = vlc.EventType
+        player.attach_event(events.MediaPlayerPlaying,
+                            lambda event: self._on_playing(camera_id))
+        player.attach_event(events.MediaPlayerBuffering,
+                            lambda event: self._on_buffering(camera_id, event.u.new_cache))
+        player.attach_event(events.MediaPlayerEncounteredError,
+                            lambda event: self._on_failure(camera_id, "playback error"))
+        player.attach_event(events.MediaPlayerEndReached,
+                            lambda event: self._on_failure(camera_id, "stream ended"))
+        self.start()
+
+    def unwatch(self, camera_id: str):
+        """Stop monitoring a stream, e.g. because it was stopped on purpose.
+
+        A reconnect of the stream in flight makes no further attempts.
+
+        Args:
+            camera_id: Unique identifier for the camera
+        """
+        with self._lock:
+            watched = self._streams.pop(camera_id, None)
+        if watched is not None:
+            watched.cancelled.set()
+            watched.player.detach_events()
+
+    def get_status(self, camera_id: str) -> Optional[StreamStatus]:
+        """Get a copy of the health status of a stream.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            Stream status or None if the stream is not monitored
+        """
+        with self._lock:
+            watched = self._streams.get(camera_id)
+            return replace(watched.status) if watched is not None else None
+
+    def snapshot(self) -> Dict[str, StreamStatus]:
+        """Get a copy of the health status of every monitored stream.
+
+        Returns:
+            Mapping of camera ID to stream status
+        """
+        with self._lock:
+            return {camera_id: replace(watched.status)
+                    for camera_id, watched in self._streams.items()}
+
+    def check(self, now: Optional[float] = None):
+        """Run one health check over all monitored streams.
+
+        Args:
+            now: Current monotonic time, defaults to ``time.monotonic()``
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            watched_streams = list(self._streams.values())
+
+        for watched in watched_streams:
+            if watched.reconnecting:
+                continue
+            self._update_counters(watched, watched.player.get_stats(), now)
+
+            with self._lock:
+                status = watched.status
+                reference = watched.last_frame_time or watched.started_at
+                if watched.failure is None and now - reference > self.stall_timeout:
+                    watched.failure = f"no frames for {now - reference:.0f}s"
+                    status.state = StreamHealth.STALLED
+                if (watched.failure is None or not self.auto_reconnect
+                        or now < watched.next_attempt_at):
+                    continue
+                watched.reconnecting = True
+                status.state = StreamHealth.RECONNECTING
+                status.last_error = watched.failure
+
+            logger.warning(f"Stream {status.camera_id} unhealthy ({watched.failure}), reconnecting")
+            if self._executor is None:
+                self.start()
+            self._executor.submit(self._reconnect, watched)
+
+    def _update_counters(self, watched: _WatchedStream, stats: Dict[str, float], now: float):
+        """Update frame counters and bitrate from player statistics.
+
+        Args:
+            watched: Monitored stream
+            stats: Statistics from ``VideoPlayer.get_stats``
+            now: Current monotonic time
+        """
+        if not stats:
+            return
+        with self._lock:
+            status = watched.status
+            decoded = int(stats.get('decoded_frames', 0))
+            if decoded != status.decoded_frames and decoded > 0:
+                watched.last_frame_time = now
+            status.decoded_frames = decoded
+            status.dropped_frames = int(stats.get('lost_frames', 0))
+            # libVLC reports input bitrate in kB per millisecond
+            status.bitrate_kbps = float(stats.get('input_bitrate', 0.0)) * 8000
+            if watched.last_frame_time is not None:
+                status.last_frame_age = now - watched.last_frame_time
+
+    def _reconnect(self, watched: _WatchedStream):
+        """Restart a stream until it produces frames again, backing off between attempts.
+
+        Args:
+            watched: Monitored stream
+        """
+        camera_id = watched.status.camera_id
+
+        def attempt():
+            if watched.cancelled.is_set():
+                raise RuntimeError("stream no longer watched")
+            if not self.restart_stream(camera_id, watched.player):
+                raise RuntimeError("restart failed")
+            # The restart opens new media, so its frame counters start from zero
+            deadline = time.monotonic() + self.stall_timeout
+            while time.monotonic() < deadline:
+                if int(watched.player.get_stats().get('decoded_frames', 0)) > 0:
+                    return
+                if watched.cancelled.wait(0.2):
+                    break
+            raise RuntimeError("no frames after restart")
+
+        try:
+            retry_operation(attempt, max_retries=self.max_retries, delay=self.retry_delay,
+                            max_delay=self.reconnect_interval, jitter=0.3,
+                            stop_event=watched.cancelled)
+        except Exception as e:
+            if watched.cancelled.is_set():
+                logger.debug(f"Reconnect of stream {camera_id} abandoned: {e}")
+                return
+            with self._lock:
+                watched.status.state = StreamHealth.FAILED
+                watched.status.last_error = str(e)
+                watched.next_attempt_at = time.monotonic() + self.reconnect_interval
+                watched.reconnecting = False
+            logger.error(f"Stream {camera_id} could not be reconnected: {e}")
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            watched.status.state = StreamHealth.PLAYING
+            watched.status.reconnect_count += 1
+            watched.status.last_error = None
+            watched.started_at = now
+            watched.last_frame_time = now
+            watched.failure = None
+            watched.reconnecting = False
+        logger.info(f"Stream {camera_id} reconnected")
+
+    def _on_playing(self, camera_id: str):
+        """Handle the VLC playing event."""
+        with self._lock:
+            watched = self._streams.get(camera_id)
+            if watched is not None and not watched.reconnecting:
+                watched.status.state = StreamHealth.PLAYING
+
+    def _on_buffering(self, camera_id: str, percent: float):
+        """Handle the VLC buffering event."""
+        with self._lock:
+            watched = self._streams.get(camera_id)
+            if watched is None or watched.reconnecting:
+                return
+            watched.status.buffering_percent = percent
+            if percent < 100:
+                watched.status.state = StreamHealth.BUFFERING
+            elif watched.status.state == StreamHealth.BUFFERING:
+                watched.status.state = StreamHealth.PLAYING
+
+    def _on_failure(self, camera_id: str, reason: str):
+        """Handle VLC error and end-of-stream events."""
+        with self._lock:
+            watched = self._streams.get(camera_id)
+            if watched is None or watched.reconnecting:
+                return
+            watched.failure = reason
+        self._wake.set()
+
+    def _run(self):
+        """Health check loop."""
+        while not self._stop_event.is_set():
+            self._wake.wait(self.check_interval)
+            self._wake.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Stream health check failed: {e}")
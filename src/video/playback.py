@@ -0,0 +1,264 @@
+"""
+Synchronized multi-camera recording playback.
+
+This module drives one video player per selected camera from a single
+master clock, so every camera shows the same moment of the recordings
+while the playback slider moves.
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from .player import VideoPlayer, PlayerPool
+from .thumbnail_index import ThumbnailIndex
+from ..models.multi_timeline import MultiTimeline
+from ..models.timeline import PlaybackState
+from ..utils.logger import get_logger
+
+logger = get_logger("video.playback")
+
+
+class PlaybackCoordinator:
+    """Keeps the players of all selected cameras on one master clock."""
+
+    def __init__(self, multi_timeline: MultiTimeline,
+                 media_resolver: Callable[[str, str], Optional[str]],
+                 pool: Optional[PlayerPool] = None, drift_threshold: float = 1.0,
+                 player_factory: Optional[Callable[[object], VideoPlayer]] = None,
+                 prefetch: Optional[Callable[[MultiTimeline, datetime], None]] = None,
+                 thumbnails: Optional[ThumbnailIndex] = None):
+        """Initialize the playback coordinator.
+
+        Args:
+            multi_timeline: Timelines of the cameras taking part in playback
+            media_resolver: Function returning a playable URL or path for
+                (camera_id, recording_id)
+            pool: Player pool the players are checked out of
+            drift_threshold: Seconds a player may be ahead of or behind the
+                master clock before it is seeked back in line
+            player_factory: Function creating a player for a widget, defaults
+                to ``VideoPlayer`` on ``pool``
+            prefetch: Function called with the timelines and the new position
+                whenever the clock moves, e.g. ``RecordingCache.prefetch_all``
+            thumbnails: Preview thumbnails shown while the slider is dragged
+        """
+        self.multi_timeline = multi_timeline
+        self.media_resolver = media_resolver
+        self.drift_threshold = drift_threshold
+        self.player_factory = player_factory or (lambda widget: VideoPlayer(widget, pool))
+        self.prefetch = prefetch
+        self.thumbnails = thumbnails
+
+        self.players: Dict[str, VideoPlayer] = {}
+        self.position: Optional[datetime] = None
+        self.state = PlaybackState.STOPPED
+        self.speed = 1.0
+        self.drift_corrections = 0
+
+        self._loaded: Dict[str, Optional[str]] = {}
+        self._last_tick: Optional[float] = None
+
+    def add_camera(self, camera_id: str, widget=None):
+        """Create the player of a camera taking part in playback.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            widget: GUI widget to display the recording
+        """
+        if camera_id in self.players:
+            self.players[camera_id].set_widget(widget)
+            return
+        self.players[camera_id] = self.player_factory(widget)
+        self._loaded[camera_id] = None
+        if self.position is not None:
+            self._sync_player(camera_id, force_seek=True)
+
+    def remove_camera(self, camera_id: str):
+        """Release the player of a camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+        """
+        player = self.players.pop(camera_id, None)
+        self._loaded.pop(camera_id, None)
+        if player is not None:
+            player.cleanup()
+
+    def play(self):
+        """Start or resume playback from the current position."""
+        if self.position is None:
+            self.position = self.multi_timeline.start_time
+        if self.position is None:
+            logger.info("Nothing to play: no camera has recordings")
+            return
+        position = self.multi_timeline.next_covered_time(self.position)
+        if position is None:
+            logger.info("Reached the end of the recordings")
+            return
+        self.state = PlaybackState.PLAYING
+        self._last_tick = time.monotonic()
+        self._move_to(position, force_seek=position != self.position)
+
+    def pause(self):
+        """Pause playback on all players."""
+        if self.state != PlaybackState.PLAYING:
+            return
+        self.state = PlaybackState.PAUSED
+        for player in self.players.values():
+            player.pause()
+
+    def stop(self):
+        """Stop playback and unload all recordings."""
+        self.state = PlaybackState.STOPPED
+        for camera_id, player in self.players.items():
+            player.stop()
+            self._loaded[camera_id] = None
+
+    def seek(self, timestamp: datetime):
+        """Move every camera to a timestamp.
+
+        Slider drags should go through a ``SeekPipeline``, which coalesces
+        them into a bounded number of calls to this method.
+
+        Args:
+            timestamp: Target timestamp
+        """
+        self._last_tick = time.monotonic()
+        self._move_to(timestamp, force_seek=True)
+
+    def preview(self, timestamp: datetime) -> Dict[str, Optional[bytes]]:
+        """Get a preview of every camera at a timestamp without seeking.
+
+        Meant for slider drags: show the previews while dragging and
+        ``seek`` once the slider is released.
+
+        Args:
+            timestamp: Timestamp under the slider
+
+        Returns:
+            Mapping of camera ID to JPEG thumbnail, None where there is none
+        """
+        previews: Dict[str, Optional[bytes]] = {}
+        for camera_id in self.players:
+            timeline = self.multi_timeline.timelines.get(camera_id)
+            if self.thumbnails is None or timeline is None:
+                previews[camera_id] = None
+                continue
+            previews[camera_id] = self.thumbnails.get(camera_id, timestamp,
+                                                      self.thumbnails.sample_interval(timeline))
+        return previews
+
+    def set_speed(self, speed: float):
+        """Set the playback speed of the master clock and all players.
+
+        Args:
+            speed: Speed multiplier (1.0 = normal)
+        """
+        self.speed = speed
+        for player in self.players.values():
+            player.set_rate(speed)
+
+    def tick(self, now: Optional[float] = None) -> Optional[datetime]:
+        """Advance the master clock and keep the players in line with it.
+
+        Meant to be called periodically from the GUI loop, e.g. ten times
+        a second. When no camera has footage at the new position, playback
+        jumps straight to the next moment any camera recorded.
+
+        Args:
+            now: Current monotonic time, defaults to ``time.monotonic()``
+
+        Returns:
+            Master clock position after the tick
+        """
+        now = time.monotonic() if now is None else now
+        if self.state != PlaybackState.PLAYING or self.position is None:
+            self._last_tick = now
+            return self.position
+
+        elapsed = now - (self._last_tick if self._last_tick is not None else now)
+        self._last_tick = now
+        position = self.position + timedelta(seconds=elapsed * self.speed)
+
+        next_position = self.multi_timeline.next_covered_time(position)
+        if next_position is None:
+            logger.info("Reached the end of the recordings")
+            self.position = self.multi_timeline.end_time
+            self.pause()
+            return self.position
+        self._move_to(next_position, force_seek=next_position != position)
+        return self.position
+
+    def cleanup(self):
+        """Release all players."""
+        for camera_id in list(self.players):
+            self.remove_camera(camera_id)
+        self.state = PlaybackState.STOPPED
+
+    def _move_to(self, position: datetime, force_seek: bool = False):
+        """Set the master clock and sync every player to it.
+
+        Args:
+            position: New master clock position
+            force_seek: Seek players even if they are within the drift threshold
+        """
+        self.position = position
+        for timeline in self.multi_timeline.timelines.values():
+            timeline.seek_to_time(position)
+        if self.prefetch is not None:
+            self.prefetch(self.multi_timeline, position)
+        for camera_id in self.players:
+            self._sync_player(camera_id, force_seek)
+
+    def _sync_player(self, camera_id: str, force_seek: bool = False):
+        """Bring one player in line with the master clock.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            force_seek: Seek even if the player is within the drift threshold
+        """
+        player = self.players[camera_id]
+        timeline = self.multi_timeline.timelines.get(camera_id)
+        segment = timeline.get_segment_at_time(self.position) if timeline else None
+        playing = self.state == PlaybackState.PLAYING
+
+        if segment is None:
+            # No footage for this camera right now: hold the last frame
+            if player.is_playing():
+                player.pause()
+            return
+
+        # Overlapping recordings are coalesced into one segment; play the
+        # one covering the position, offset from that recording's own start
+        recording_id, recording_start = segment.recording_at(self.position,
+                                                              self._loaded.get(camera_id))
+        offset_ms = int((self.position - recording_start).total_seconds() * 1000)
+        if self._loaded.get(camera_id) != recording_id:
+            url = self.media_resolver(camera_id, recording_id)
+            if not url:
+                logger.warning(f"No media for recording {recording_id} of camera {camera_id}")
+                player.pause()
+                return
+            # libVLC drops seeks sent before the input has started, so the
+            # offset is passed as a media option instead of set_time
+            player.play_stream(url, options=[f":start-time={offset_ms / 1000:.3f}"])
+            player.set_rate(self.speed)
+            self._loaded[camera_id] = recording_id
+            if not playing:
+                player.pause()
+            return
+
+        if force_seek:
+            player.set_time(offset_ms)
+        elif playing:
+            player_ms = player.get_time()
+            if player_ms is not None and abs(player_ms - offset_ms) > self.drift_threshold * 1000:
+                logger.debug(f"Camera {camera_id} drifted {player_ms - offset_ms} ms, resyncing")
+                player.set_time(offset_ms)
+                self.drift_corrections += 1
+
+        if playing and not player.is_playing():
+            player.resume()
+        elif not playing and player.is_playing():
+            player.pause()
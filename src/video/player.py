@@ -5,58 +5,270 @@ This module provides a wrapper around VLC media player for handling
 video stream playback with proper resource management and error handling.
 """
 
+import sys
+import threading
+
 import vlc
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List
+
+from .frame_buffer import FrameRing
+from ..utils.logger import get_logger
+
+logger = get_logger("video.player")
+
+# Raw frames are decoded as RGBA
+FRAME_CHROMA = "RGBA"
+
+# Resolved once so the ctypes prototypes outlive any patching of ``vlc``
+_VideoLockCb = vlc.CallbackDecorators.VideoLockCb
+_VideoUnlockCb = vlc.CallbackDecorators.VideoUnlockCb
+_VideoDisplayCb = vlc.CallbackDecorators.VideoDisplayCb
+
+
+class VLCInstanceManager:
+    """Owns the single libVLC instance shared by every player in the process."""
+
+    _instance: Optional[vlc.Instance] = None
+    _options: str = ""
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, options: str = "") -> vlc.Instance:
+        """Get the shared libVLC instance, creating it on first use.
+
+        Args:
+            options: Command line options used if the instance is created now
+
+        Returns:
+            Shared VLC instance
+
+        Raises:
+            RuntimeError: If libVLC cannot be initialized
+        """
+        with cls._lock:
+            if cls._instance is None:
+                instance = vlc.Instance(options)
+                if instance is None:
+                    raise RuntimeError("Failed to create VLC instance")
+                cls._instance = instance
+                cls._options = options
+            elif options and options != cls._options:
+                logger.warning(f"VLC instance already created with options '{cls._options}', "
+                               f"ignoring '{options}'")
+            return cls._instance
+
+    @classmethod
+    def release(cls):
+        """Release the shared instance. Players must not be used afterwards."""
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.release()
+                cls._instance = None
+                cls._options = ""
+
+
+def _attach_window(media_player: vlc.MediaPlayer, handle: int):
+    """Point a media player's video output at a native window.
+
+    Args:
+        media_player: VLC media player
+        handle: Native window handle, 0 to detach
+    """
+    if sys.platform.startswith('win'):
+        media_player.set_hwnd(handle)
+    elif sys.platform == 'darwin':
+        media_player.set_nsobject(handle)
+    else:
+        media_player.set_xwindow(handle)
+
+
+class PlayerPool:
+    """Pool of reusable VLC media players on the shared instance.
+
+    Checking a player back in stops it and detaches it from its window
+    instead of destroying it, so switching layouts or camera selections
+    does not pay for libVLC player setup again.
+    """
+
+    _default: Optional['PlayerPool'] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, vlc_options: str = "", max_idle: int = 16):
+        """Initialize the player pool.
+
+        Args:
+            vlc_options: Command line options for the shared VLC instance
+            max_idle: Maximum number of idle players kept for reuse
+        """
+        self.vlc_options = vlc_options
+        self.max_idle = max_idle
+        self._idle: List[vlc.MediaPlayer] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls, vlc_options: str = "") -> 'PlayerPool':
+        """Get the process-wide player pool.
+
+        Args:
+            vlc_options: Command line options used if the pool is created now
+
+        Returns:
+            Shared player pool
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls(vlc_options)
+            return cls._default
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle players available for reuse."""
+        return len(self._idle)
+
+    def acquire(self) -> vlc.MediaPlayer:
+        """Check out a media player.
+
+        Returns:
+            Muted media player with no media and no window attached
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        media_player = VLCInstanceManager.get_instance(self.vlc_options).media_player_new()
+        media_player.audio_set_mute(True)
+        return media_player
+
+    def release(self, media_player: vlc.MediaPlayer):
+        """Check a media player back in.
+
+        Args:
+            media_player: Player previously returned by ``acquire``
+        """
+        media_player.stop()
+        media_player.set_media(None)
+        _attach_window(media_player, 0)
+        media_player.audio_set_mute(True)
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(media_player)
+                return
+        media_player.release()
+
+    def clear(self):
+        """Release all idle players."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for media_player in idle:
+            media_player.release()
 
 
 class VideoPlayer:
     """VLC media player wrapper for video streams."""
 
-    def __init__(self, widget=None):
+    def __init__(self, widget=None, pool: Optional[PlayerPool] = None):
         """Initialize the video player.
 
         Args:
             widget: GUI widget to embed the video player
+            pool: Player pool to check the VLC player out of, defaults to
+                the process-wide pool
         """
         self.widget = widget
+        self.pool = pool
         self.vlc_instance: Optional[vlc.Instance] = None
         self.media_player: Optional[vlc.MediaPlayer] = None
         self.current_media: Optional[vlc.Media] = None
+        self.current_url: Optional[str] = None
+        self._attached_events: List[vlc.EventType] = []
+        self.frame_ring: Optional[FrameRing] = None
+        self._frame_callbacks: tuple = ()
 
     def initialize(self):
         """Initialize VLC instance and media player."""
-        # TODO: Create VLC instance with appropriate options
-        # TODO: Create media player
-        # TODO: Setup event handlers
-        # TODO: Configure video output for widget
-        pass
+        if self.media_player is not None:
+            return
+        if self.pool is None:
+            self.pool = PlayerPool.default()
+        self.vlc_instance = VLCInstanceManager.get_instance(self.pool.vlc_options)
+        self.media_player = self.pool.acquire()
+        if self.widget is not None:
+            self.set_widget(self.widget)
+
+    def set_widget(self, widget):
+        """Render video into a GUI widget.
 
-    def play_stream(self, stream_url: str):
+        Args:
+            widget: Tk widget (or anything exposing ``winfo_id``)
+        """
+        self.widget = widget
+        if self.media_player is None or widget is None:
+            return
+        _attach_window(self.media_player, widget.winfo_id())
+
+    def play_stream(self, stream_url: str, options: Optional[List[str]] = None):
         """Start playing a video stream.
 
         Args:
             stream_url: URL of the video stream to play
+            options: Media options, e.g. ``[":start-time=12.5"]``
         """
-        # TODO: Create media from stream URL
-        # TODO: Set media to player
-        # TODO: Start playback
-        pass
+        self.initialize()
+        media = self.vlc_instance.media_new(stream_url, *(options or []))
+        self.media_player.set_media(media)
+        if self.current_media is not None:
+            self.current_media.release()
+        self.current_media = media
+        self.current_url = stream_url
+        if self.media_player.play() == -1:
+            logger.error(f"VLC failed to start playback of {stream_url}")
 
     def stop(self):
         """Stop video playback."""
-        # TODO: Stop media player
-        # TODO: Release media resources
-        pass
+        if self.media_player is not None:
+            self.media_player.stop()
+        if self.current_media is not None:
+            self.current_media.release()
+            self.current_media = None
+        self.current_url = None
 
     def pause(self):
         """Pause video playback."""
-        # TODO: Pause media player
-        pass
+        if self.media_player is not None:
+            self.media_player.set_pause(1)
 
     def resume(self):
         """Resume video playback."""
-        # TODO: Resume media player
-        pass
+        if self.media_player is not None:
+            self.media_player.set_pause(0)
+
+    def get_time(self) -> Optional[int]:
+        """Get the playback position within the current media.
+
+        Returns:
+            Position in milliseconds, or None if nothing is loaded
+        """
+        if self.media_player is None or self.current_media is None:
+            return None
+        position = self.media_player.get_time()
+        return position if position >= 0 else None
+
+    def set_time(self, position_ms: int):
+        """Seek within the current media.
+
+        Args:
+            position_ms: Target position in milliseconds
+        """
+        if self.media_player is not None:
+            self.media_player.set_time(max(0, int(position_ms)))
+
+    def set_rate(self, rate: float):
+        """Set the playback speed.
+
+        Args:
+            rate: Speed multiplier (1.0 = normal)
+        """
+        if self.media_player is not None:
+            self.media_player.set_rate(rate)
 
     def set_volume(self, volume: int):
         """Set playback volume.
@@ -64,8 +276,91 @@ class VideoPlayer:
         Args:
             volume: Volume level (0-100)
         """
-        # TODO: Set media player volume
-        pass
+        if self.media_player is not None:
+            self.media_player.audio_set_volume(max(0, min(100, int(volume))))
+
+    def set_mute(self, muted: bool):
+        """Mute or unmute the audio track.
+
+        Args:
+            muted: True to mute
+        """
+        if self.media_player is not None:
+            self.media_player.audio_set_mute(muted)
+
+    def attach_event(self, event_type: vlc.EventType, callback: Callable):
+        """Subscribe to a libVLC media player event.
+
+        Callbacks run on a libVLC thread and must not block.
+
+        Args:
+            event_type: VLC event type, e.g. ``vlc.EventType.MediaPlayerEncounteredError``
+            callback: Function called with the VLC event
+        """
+        self.initialize()
+        self.media_player.event_manager().event_attach(event_type, callback)
+        self._attached_events.append(event_type)
+
+    def detach_events(self):
+        """Remove all event subscriptions made through ``attach_event``."""
+        if self.media_player is not None:
+            event_manager = self.media_player.event_manager()
+            for event_type in self._attached_events:
+                event_manager.event_detach(event_type)
+        self._attached_events = []
+
+    def enable_frame_access(self, width: int, height: int, buffers: int = 3,
+                            on_frame: Optional[Callable[[FrameRing], None]] = None) -> FrameRing:
+        """Decode into preallocated memory instead of a window.
+
+        libVLC scales frames to the given size and writes them as RGBA into
+        a ring of reused buffers; consumers read them through the returned
+        ring. Takes effect on the next ``play_stream``.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+            buffers: Buffers in the ring
+            on_frame: Called on the decoder thread after every new frame;
+                must not block
+
+        Returns:
+            Frame ring the decoder writes to
+        """
+        self.initialize()
+        ring = FrameRing(width, height, buffers)
+
+        # Picture IDs are slot + 1: libVLC passes a NULL picture on as None
+        @_VideoLockCb
+        def lock(opaque, planes):
+            slot = ring.begin_write()
+            planes[0] = ring.address(slot)
+            return slot + 1
+
+        @_VideoUnlockCb
+        def unlock(opaque, picture, planes):
+            ring.end_write(picture - 1)
+
+        @_VideoDisplayCb
+        def display(opaque, picture):
+            ring.commit(picture - 1)
+            if on_frame is not None:
+                on_frame(ring)
+
+        # ctypes callbacks must stay referenced while libVLC may call them
+        self._frame_callbacks = (lock, unlock, display)
+        self.media_player.video_set_callbacks(lock, unlock, display, None)
+        self.media_player.video_set_format(FRAME_CHROMA, width, height, ring.pitch)
+        self.frame_ring = ring
+        return ring
+
+    def disable_frame_access(self):
+        """Return to rendering into the widget on the next ``play_stream``."""
+        if self.media_player is not None and self._frame_callbacks:
+            # A NULL lock callback puts the player back on its normal video output
+            self.media_player.video_set_callbacks(None, None, None, None)
+        self._frame_callbacks = ()
+        self.frame_ring = None
 
     def is_playing(self) -> bool:
         """Check if video is currently playing.
@@ -73,12 +368,37 @@ class VideoPlayer:
         Returns:
             True if playing, False otherwise
         """
-        # TODO: Return media player state
-        return False
+        return bool(self.media_player is not None and self.media_player.is_playing())
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get decoder statistics of the current media.
+
+        Returns:
+            Dictionary with frame counters and bitrates (empty if nothing is playing)
+        """
+        if self.current_media is None:
+            return {}
+        stats = vlc.MediaStats()
+        if not self.current_media.get_stats(stats):
+            return {}
+        return {
+            'decoded_frames': stats.decoded_video,
+            'displayed_frames': stats.displayed_pictures,
+            'lost_frames': stats.lost_pictures,
+            'input_bitrate': stats.input_bitrate,
+            'demux_bitrate': stats.demux_bitrate,
+        }
 
     def cleanup(self):
-        """Cleanup player resources."""
-        # TODO: Stop playback
-        # TODO: Release media player
-        # TODO: Release VLC instance
-        pass
\ No newline at end of file
+        """Cleanup player resources.
+
+        The VLC player goes back to the pool; the shared instance stays alive.
+        """
+        self.stop()
+        # Pooled players must not carry callbacks over to their next user
+        self.detach_events()
+        self.disable_frame_access()
+        if self.media_player is not None:
+            self.pool.release(self.media_player)
+            self.media_player = None
+        self.vlc_instance = None
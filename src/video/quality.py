@@ -0,0 +1,176 @@
+"""
+Adaptive stream quality selection for camera streams.
+
+This module chooses the stream channel for each grid tile from its
+on-screen size and adapts the choice to the decode load of the client,
+dropping to lower-bitrate channels under pressure and restoring them
+once there is headroom again.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from ..models.camera import Camera
+
+
+@dataclass
+class StreamQualityState:
+    """Quality bookkeeping for a single stream.
+
+    Levels index ``Camera.streams_by_quality``: 0 is the lowest-bitrate
+    channel, higher levels are better channels.
+    """
+    camera_id: str
+    level: int
+    preferred_level: int
+    tile_size: Optional[Tuple[int, int]] = None
+    decoded_frames: int = 0
+    lost_frames: int = 0
+    drop_ratio: float = 0.0
+
+
+class QualityController:
+    """Chooses stream levels per tile and adapts them to client load."""
+
+    def __init__(self, auto_quality: bool = True, default_quality: str = "high",
+                 high_load: float = 0.85, low_load: float = 0.5,
+                 max_drop_ratio: float = 0.05, change_cooldown: float = 5.0,
+                 upgrade_delay: float = 30.0):
+        """Initialize the quality controller.
+
+        Args:
+            auto_quality: Whether levels follow tile size and load
+            default_quality: ``high`` or ``low``, used when auto quality is off
+            high_load: CPU load (0-1) above which streams are downgraded
+            low_load: CPU load (0-1) below which streams may be upgraded
+            max_drop_ratio: Fraction of lost frames above which streams are downgraded
+            change_cooldown: Minimum seconds between two automatic changes
+            upgrade_delay: Seconds of sustained headroom required before upgrading
+        """
+        self.auto_quality = auto_quality
+        self.default_quality = default_quality
+        self.high_load = high_load
+        self.low_load = low_load
+        self.max_drop_ratio = max_drop_ratio
+        self.change_cooldown = change_cooldown
+        self.upgrade_delay = upgrade_delay
+
+        self._cpu_count = os.cpu_count() or 1
+        self._last_cpu_sample = (time.monotonic(), time.process_time())
+        self._last_change = float('-inf')
+        self._headroom_since: Optional[float] = None
+
+    def preferred_level(self, camera: Camera, tile_size: Optional[Tuple[int, int]]) -> int:
+        """Choose the stream level a tile should use when there is no load pressure.
+
+        The lowest channel that still covers the tile is chosen, so small
+        grid tiles get the low-bitrate channel and the zoom view gets the
+        full-resolution one.
+
+        Args:
+            camera: Camera being displayed
+            tile_size: (width, height) of the tile, or None for full size
+
+        Returns:
+            Stream level
+        """
+        streams = camera.streams_by_quality
+        highest = max(0, len(streams) - 1)
+        if not self.auto_quality:
+            return highest if self.default_quality == "high" else 0
+        if tile_size is None:
+            return highest
+
+        tile_width, tile_height = tile_size
+        for level, stream in enumerate(streams):
+            if stream.width >= tile_width and stream.height >= tile_height:
+                return level
+        return highest
+
+    def measure_cpu_load(self) -> float:
+        """Measure the CPU load of this process since the previous call.
+
+        Decoding runs on libVLC threads inside the process, so process CPU
+        time is a portable proxy for decode load.
+
+        Returns:
+            CPU load as a fraction of all cores (0-1)
+        """
+        now, cpu = time.monotonic(), time.process_time()
+        last_now, last_cpu = self._last_cpu_sample
+        self._last_cpu_sample = (now, cpu)
+        elapsed = now - last_now
+        if elapsed <= 0:
+            return 0.0
+        return min(1.0, (cpu - last_cpu) / elapsed / self._cpu_count)
+
+    @staticmethod
+    def update_frame_stats(state: StreamQualityState, stats: Dict[str, float]):
+        """Update the dropped-frame ratio of a stream from player statistics.
+
+        Args:
+            state: Stream quality state
+            stats: Statistics from ``VideoPlayer.get_stats``
+        """
+        decoded = int(stats.get('decoded_frames', 0))
+        lost = int(stats.get('lost_frames', 0))
+        # Counters restart when the media changes
+        if decoded < state.decoded_frames or lost < state.lost_frames:
+            state.decoded_frames = state.lost_frames = 0
+        decoded_delta = decoded - state.decoded_frames
+        lost_delta = lost - state.lost_frames
+        state.decoded_frames, state.lost_frames = decoded, lost
+        state.drop_ratio = lost_delta / decoded_delta if decoded_delta > 0 else 0.0
+
+    def evaluate(self, states: Dict[str, StreamQualityState], cpu_load: float,
+                 now: Optional[float] = None) -> Dict[str, int]:
+        """Decide which streams should change level.
+
+        At most one stream changes per call, so the effect of a change can
+        be observed before the next one.
+
+        Args:
+            states: Quality state of every managed stream
+            cpu_load: Current CPU load (0-1)
+            now: Current monotonic time, defaults to ``time.monotonic()``
+
+        Returns:
+            Mapping of camera ID to its new level
+        """
+        if not self.auto_quality or not states:
+            return {}
+        now = time.monotonic() if now is None else now
+
+        overloaded = (cpu_load > self.high_load
+                      or any(s.drop_ratio > self.max_drop_ratio for s in states.values()))
+        if overloaded:
+            self._headroom_since = None
+            if now - self._last_change < self.change_cooldown:
+                return {}
+            candidates = [s for s in states.values() if s.level > 0]
+            if not candidates:
+                return {}
+            # Relieve the worst-dropping stream first, then the most expensive one
+            target = max(candidates, key=lambda s: (s.drop_ratio > self.max_drop_ratio,
+                                                     s.level, s.drop_ratio))
+            self._last_change = now
+            return {target.camera_id: target.level - 1}
+
+        if cpu_load >= self.low_load:
+            self._headroom_since = None
+            return {}
+
+        if self._headroom_since is None:
+            self._headroom_since = now
+        if (now - self._headroom_since < self.upgrade_delay
+                or now - self._last_change < self.change_cooldown):
+            return {}
+        candidates = [s for s in states.values() if s.level < s.preferred_level]
+        if not candidates:
+            return {}
+        target = min(candidates, key=lambda s: s.level)
+        self._last_change = now
+        self._headroom_since = now
+        return {target.camera_id: target.level + 1}
@@ -0,0 +1,324 @@
+"""
+Local disk cache for recording playback.
+
+This module keeps downloaded recording files in a size-bounded,
+least-recently-used directory, fetches recordings ahead of the playhead
+and hands players local file paths, so scrubbing back and forth over the
+same period does not download the same MP4 files again.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Union
+
+from ..models.multi_timeline import MultiTimeline
+from ..models.timeline import Timeline
+from ..utils.logger import get_logger
+
+logger = get_logger("video.recording_cache")
+
+_SUFFIX = ".mp4"
+_PARTIAL_SUFFIX = ".part"
+_SAFE_ID = re.compile(r'[^A-Za-z0-9_-]')
+
+
+class RecordingCache:
+    """Size-bounded LRU directory of downloaded recordings."""
+
+    def __init__(self, download: Callable[[str, Path], object],
+                 directory: Union[str, Path] = "recordings",
+                 max_bytes: int = 4 * 1024 ** 3, max_age_days: Optional[int] = 30,
+                 prefetch_segments: int = 2, max_workers: int = 2):
+        """Initialize the recording cache.
+
+        Args:
+            download: Function downloading a recording to a path, e.g.
+                ``UniFiVideoClient.download_recording``
+            directory: Cache directory
+            max_bytes: Total size the cached files may occupy
+            max_age_days: Cached files older than this are deleted, None keeps them
+            prefetch_segments: Segments fetched ahead of the playhead per camera
+            max_workers: Downloads running at the same time
+        """
+        self.download = download
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.prefetch_segments = prefetch_segments
+
+        # recording_id -> file size, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._pending: Set[str] = set()
+        self._protected: Set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="recording-cache")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @classmethod
+    def from_config(cls, config, client) -> 'RecordingCache':
+        """Create a recording cache from application configuration.
+
+        Args:
+            config: Loaded ConfigManager instance
+            client: API client used for downloads
+
+        Returns:
+            Configured recording cache
+        """
+        settings = config.get_recording_settings()
+        return cls(client.download_recording,
+                   directory=settings['recording_directory'],
+                   max_bytes=settings['cache_size_mb'] * 1024 * 1024,
+                   max_age_days=settings['max_recording_age_days'] or None,
+                   prefetch_segments=settings['prefetch_segments'])
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently occupied by cached recordings."""
+        return self._total_bytes
+
+    def path_for(self, recording_id: str) -> Path:
+        """Get the cache file path of a recording.
+
+        Args:
+            recording_id: Unique identifier for the recording
+
+        Returns:
+            File path, whether or not the recording is cached
+        """
+        return self.directory / f"{_SAFE_ID.sub('_', recording_id)}{_SUFFIX}"
+
+    def contains(self, recording_id: str) -> bool:
+        """Check if a recording is cached.
+
+        Args:
+            recording_id: Unique identifier for the recording
+
+        Returns:
+            True if the recording file is available locally
+        """
+        with self._lock:
+            return recording_id in self._entries
+
+    def get_path(self, recording_id: str) -> Optional[str]:
+        """Get the local file of a cached recording and mark it recently used.
+
+        Args:
+            recording_id: Unique identifier for the recording
+
+        Returns:
+            File path or None if the recording is not cached
+        """
+        with self._lock:
+            if recording_id not in self._entries:
+                return None
+            self._entries.move_to_end(recording_id)
+        path = self.path_for(recording_id)
+        try:
+            # Access time carries the LRU order over to the next session
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        except OSError:
+            self._drop(recording_id)
+            return None
+        return str(path)
+
+    def resolve(self, camera_id: str, recording_id: str) -> Optional[str]:
+        """Resolve a recording to a playable local file.
+
+        Suitable as the ``media_resolver`` of ``PlaybackCoordinator``. A
+        recording that is not cached yet is queued for download and None is
+        returned; the coordinator asks again on its next tick.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            recording_id: Unique identifier for the recording
+
+        Returns:
+            Local file path or None while the recording is being fetched
+        """
+        path = self.get_path(recording_id)
+        if path is None:
+            self.fetch(recording_id)
+        return path
+
+    def fetch(self, recording_id: str):
+        """Queue a recording for download unless it is cached or queued already.
+
+        Args:
+            recording_id: Unique identifier for the recording
+        """
+        with self._lock:
+            if recording_id in self._entries or recording_id in self._pending:
+                return
+            self._pending.add(recording_id)
+        self._executor.submit(self._download, recording_id)
+
+    def prefetch(self, timeline: Timeline, position: datetime):
+        """Fetch the recordings a camera will play next.
+
+        Args:
+            timeline: Camera timeline
+            position: Current playhead position
+        """
+        for recording_id in self._window(timeline, position):
+            self.fetch(recording_id)
+
+    def prefetch_all(self, multi_timeline: MultiTimeline, position: datetime):
+        """Fetch the upcoming recordings of every camera taking part in playback.
+
+        Suitable as the ``prefetch`` hook of ``PlaybackCoordinator``. The
+        recordings around the playhead are protected from eviction.
+
+        Args:
+            multi_timeline: Timelines of the cameras taking part in playback
+            position: Current playhead position
+        """
+        windows = [self._window(timeline, position)
+                   for timeline in multi_timeline.timelines.values()]
+        with self._lock:
+            self._protected = {recording_id for window in windows for recording_id in window}
+        # Interleave cameras so the current segment of each comes before lookahead
+        longest = max((len(window) for window in windows), default=0)
+        for index in range(longest):
+            for window in windows:
+                if index < len(window):
+                    self.fetch(window[index])
+
+    def purge_expired(self):
+        """Delete cached recordings older than ``max_age_days``."""
+        if self.max_age_days is None:
+            return
+        cutoff = time.time() - self.max_age_days * 86400
+        with self._lock:
+            recording_ids = list(self._entries)
+        for recording_id in recording_ids:
+            try:
+                expired = self.path_for(recording_id).stat().st_mtime < cutoff
+            except OSError:
+                expired = True
+            if expired:
+                self._remove(recording_id)
+
+    def clear(self):
+        """Delete all cached recordings."""
+        with self._lock:
+            recording_ids = list(self._entries)
+        for recording_id in recording_ids:
+            self._remove(recording_id)
+
+    def close(self):
+        """Cancel queued downloads and wait for running ones."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _window(self, timeline: Timeline, position: datetime) -> List[str]:
+        """Get the recordings in the prefetch window of a camera.
+
+        Args:
+            timeline: Camera timeline
+            position: Current playhead position
+
+        Returns:
+            Recording IDs, the one at the playhead first
+        """
+        segments = []
+        current = timeline.get_segment_at_time(position)
+        if current is not None:
+            segments.append(current)
+        following = timeline.get_next_segment(position)
+        while following is not None and len(segments) < self.prefetch_segments + 1:
+            segments.append(following)
+            following = timeline.get_next_segment(following.start_time)
+
+        window = []
+        for segment in segments:
+            for recording_id in segment.recording_ids:
+                if recording_id not in window:
+                    window.append(recording_id)
+        return window
+
+    def _download(self, recording_id: str):
+        """Download a recording into the cache.
+
+        Args:
+            recording_id: Unique identifier for the recording
+        """
+        path = self.path_for(recording_id)
+        partial = path.with_name(path.name + _PARTIAL_SUFFIX)
+        try:
+            self.download(recording_id, partial)
+            os.replace(partial, path)
+            size = path.stat().st_size
+        except Exception as e:
+            logger.error(f"Failed to download recording {recording_id}: {e}")
+            partial.unlink(missing_ok=True)
+            with self._lock:
+                self._pending.discard(recording_id)
+            return
+
+        with self._lock:
+            self._pending.discard(recording_id)
+            self._entries[recording_id] = size
+            self._total_bytes += size
+        logger.debug(f"Cached recording {recording_id} ({size} bytes)")
+        self._evict()
+
+    def _evict(self):
+        """Delete least recently used recordings until the cache fits its budget."""
+        self.purge_expired()
+        while True:
+            with self._lock:
+                if self._total_bytes <= self.max_bytes:
+                    return
+                victim = next((recording_id for recording_id in self._entries
+                               if recording_id not in self._protected), None)
+            if victim is None:
+                logger.warning("Recording cache over budget but every file is in use")
+                return
+            self._remove(victim)
+
+    def _remove(self, recording_id: str):
+        """Delete a cached recording.
+
+        Args:
+            recording_id: Unique identifier for the recording
+        """
+        try:
+            self.path_for(recording_id).unlink(missing_ok=True)
+        except OSError as e:
+            # Windows refuses to delete files a player still has open
+            logger.debug(f"Could not delete cached recording {recording_id}: {e}")
+        self._drop(recording_id)
+
+    def _drop(self, recording_id: str):
+        """Forget a cached recording without touching the file.
+
+        Args:
+            recording_id: Unique identifier for the recording
+        """
+        with self._lock:
+            size = self._entries.pop(recording_id, None)
+            if size is not None:
+                self._total_bytes -= size
+
+    def _load_index(self):
+        """Index recordings cached by earlier sessions, oldest access first."""
+        files: Dict[str, os.stat_result] = {}
+        for path in self.directory.iterdir():
+            if path.name.endswith(_PARTIAL_SUFFIX):
+                path.unlink(missing_ok=True)
+            elif path.suffix == _SUFFIX:
+                files[path.stem] = path.stat()
+        for recording_id, stat in sorted(files.items(), key=lambda item: item[1].st_atime):
+            self._entries[recording_id] = stat.st_size
+            self._total_bytes += stat.st_size
+        self._evict()
@@ -0,0 +1,208 @@
+"""
+Coalesced seeking for the playback slider.
+
+Dragging the slider produces far more position events than the players
+can follow; seeking every player on each of them keeps libVLC busy with
+seeks that are obsolete before they show a frame. The pipeline collapses
+the events into the latest target, sends at most one seek at a time and
+a bounded number per second to the ``PlaybackCoordinator``, and times
+how long each seek takes to show its first frame.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Deque, Dict, Optional
+
+from .playback import PlaybackCoordinator
+from ..utils.helpers import debounce, throttle
+from ..utils.logger import get_logger
+
+logger = get_logger("video.seek_pipeline")
+
+
+@dataclass
+class _InFlightSeek:
+    """A seek sent to the players that has not shown its first frame everywhere."""
+    target: datetime
+    started: float
+    # Displayed frame count per camera when the seek was sent
+    baseline: Dict[str, int] = field(default_factory=dict)
+    first_frames: Dict[str, float] = field(default_factory=dict)
+
+
+class SeekPipeline:
+    """Turns a stream of slider positions into a bounded number of seeks.
+
+    ``request`` may be called on every slider event. The GUI loop must call
+    ``tick`` instead of ``PlaybackCoordinator.tick``: seeks also run on
+    timer threads and the pipeline serializes them with the clock.
+    """
+
+    def __init__(self, coordinator: PlaybackCoordinator, max_seeks_per_second: float = 4.0,
+                 settle_time: float = 0.15, seek_timeout: float = 1.0,
+                 on_first_frame: Optional[Callable[[datetime, float], None]] = None):
+        """Initialize the seek pipeline.
+
+        Args:
+            coordinator: Playback coordinator whose players are seeked
+            max_seeks_per_second: Upper bound of seeks sent while dragging
+            settle_time: Seconds without slider events after which the last
+                target is sent even if a seek is still in flight
+            seek_timeout: Seconds after which a seek that has not shown a
+                frame no longer holds back the next one
+            on_first_frame: Called with the target and the latency in
+                seconds once every player shows a frame of a seek
+        """
+        self.coordinator = coordinator
+        self.seek_timeout = seek_timeout
+        self.on_first_frame = on_first_frame
+
+        self.requests = 0
+        self.seeks = 0
+        self.superseded = 0
+        self.latencies: Deque[float] = deque(maxlen=100)
+
+        self._target: Optional[datetime] = None
+        self._in_flight: Optional[_InFlightSeek] = None
+        self._lock = threading.RLock()
+        self._dispatch_throttled = throttle(max_seeks_per_second)(self._dispatch)
+        self._dispatch_settled = debounce(settle_time)(lambda: self._dispatch(force=True))
+
+    def request(self, timestamp: datetime) -> Dict[str, Optional[bytes]]:
+        """Ask for the players to show a timestamp, e.g. on a slider event.
+
+        Args:
+            timestamp: Position under the slider
+
+        Returns:
+            Preview thumbnail per camera to show until the seek lands
+        """
+        with self._lock:
+            self._target = timestamp
+            self.requests += 1
+            previews = self.coordinator.preview(timestamp)
+        self._dispatch_throttled()
+        self._dispatch_settled()
+        return previews
+
+    def commit(self, timestamp: Optional[datetime] = None):
+        """Seek right away, e.g. when the slider is released.
+
+        Args:
+            timestamp: Final position, defaults to the last requested one
+        """
+        self._dispatch_throttled.cancel()
+        self._dispatch_settled.cancel()
+        with self._lock:
+            if timestamp is not None:
+                self._target = timestamp
+            self._dispatch(force=True)
+
+    def tick(self, now: Optional[float] = None) -> Optional[datetime]:
+        """Advance playback and time the seek in flight.
+
+        Args:
+            now: Current monotonic time, defaults to ``time.monotonic()``
+
+        Returns:
+            Master clock position after the tick
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._check_first_frames(now)
+            if self._in_flight is None and self._target is not None:
+                self._dispatch()
+            return self.coordinator.tick(now)
+
+    def cancel(self):
+        """Drop the pending target and stop waiting for the seek in flight."""
+        self._dispatch_throttled.cancel()
+        self._dispatch_settled.cancel()
+        with self._lock:
+            self._target = None
+            self._in_flight = None
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get seek counters and first frame latencies.
+
+        Returns:
+            Dictionary with request, seek and superseded counts and latencies in ms
+        """
+        with self._lock:
+            latencies = list(self.latencies)
+            return {
+                'requests': self.requests,
+                'seeks': self.seeks,
+                'superseded': self.superseded,
+                'last_latency_ms': latencies[-1] * 1000 if latencies else 0.0,
+                'average_latency_ms': (sum(latencies) / len(latencies) * 1000
+                                       if latencies else 0.0),
+            }
+
+    def _dispatch(self, force: bool = False):
+        """Send the latest target to the players.
+
+        Args:
+            force: Send even if the seek in flight has not shown a frame yet
+        """
+        with self._lock:
+            if self._target is None:
+                return
+            now = time.monotonic()
+            if self._in_flight is not None:
+                waited = now - self._in_flight.started
+                if not force and waited < self.seek_timeout:
+                    # Picked up by tick() once the seek in flight lands
+                    return
+                self.superseded += 1
+                logger.debug(f"Seek to {self._in_flight.target} superseded after "
+                             f"{waited * 1000:.0f} ms")
+
+            target, self._target = self._target, None
+            self._in_flight = _InFlightSeek(target, now, self._displayed_frames())
+            self.seeks += 1
+            self.coordinator.seek(target)
+
+    def _check_first_frames(self, now: float):
+        """Record which players show a frame of the seek in flight.
+
+        Args:
+            now: Current monotonic time
+        """
+        seek = self._in_flight
+        if seek is None:
+            return
+        for camera_id, count in self._displayed_frames().items():
+            if camera_id in seek.first_frames:
+                continue
+            if count > seek.baseline.get(camera_id, count):
+                seek.first_frames[camera_id] = now - seek.started
+        waiting = [camera_id for camera_id in seek.baseline
+                   if camera_id not in seek.first_frames]
+        if waiting and now - seek.started < self.seek_timeout:
+            return
+
+        self._in_flight = None
+        if waiting:
+            logger.debug(f"No frame after seek to {seek.target} from cameras {waiting}")
+            return
+        latency = max(seek.first_frames.values(), default=now - seek.started)
+        self.latencies.append(latency)
+        if self.on_first_frame is not None:
+            self.on_first_frame(seek.target, latency)
+
+    def _displayed_frames(self) -> Dict[str, int]:
+        """Get the displayed frame count of every player with media loaded.
+
+        Returns:
+            Mapping of camera ID to displayed frames
+        """
+        counts = {}
+        for camera_id, player in self.coordinator.players.items():
+            stats = player.get_stats()
+            if stats:
+                counts[camera_id] = stats['displayed_frames']
+        return counts
@@ -0,0 +1,232 @@
+"""
+Shared JPEG snapshot poller for the low-bandwidth camera grid.
+
+This module polls ``/api/2.0/snapshot/camera/(CameraId)`` for every visible
+grid tile from a single scheduler thread, keeping the total request rate
+within a budget and decoding images off the GUI thread.
+"""
+
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from PIL import Image
+
+from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
+
+logger = get_logger("video.snapshot_poller")
+
+
+def decode_snapshot(jpeg_data: bytes, size: Tuple[int, int]) -> bytes:
+    """Decode a JPEG snapshot and scale it to fit a tile.
+
+    The result is encoded as PPM, which Tk loads without a compression pass.
+
+    Args:
+        jpeg_data: JPEG image data
+        size: Maximum (width, height) of the tile
+
+    Returns:
+        PPM image data ready for an image element
+    """
+    image = Image.open(io.BytesIO(jpeg_data))
+    # Let the JPEG decoder downscale by a power of two before resampling
+    image.draft('RGB', size)
+    image = image.convert('RGB')
+    image.thumbnail(size, Image.BILINEAR)
+    output = io.BytesIO()
+    image.save(output, format='PPM')
+    return output.getvalue()
+
+
+@dataclass
+class _SnapshotTarget:
+    """Polling state of a single camera tile."""
+    camera_id: str
+    size: Tuple[int, int]
+    visible: bool = True
+    next_due: float = 0.0
+    in_flight: bool = False
+
+
+class SnapshotPoller:
+    """Polls camera snapshots for visible tiles within a shared rate budget."""
+
+    def __init__(self, fetch_snapshot: Callable[[str], bytes],
+                 on_frame: Callable[[str, bytes], None],
+                 rate_limit: float = 4.0, interval: float = 1.0,
+                 max_workers: int = 2):
+        """Initialize the snapshot poller.
+
+        Args:
+            fetch_snapshot: Function returning JPEG data for a camera ID
+            on_frame: Callback receiving (camera_id, image_data) from a worker thread
+            rate_limit: Maximum snapshot requests per second across all cameras
+            interval: Desired refresh interval per camera in seconds
+            max_workers: Number of fetch/decode worker threads
+        """
+        self.fetch_snapshot = fetch_snapshot
+        self.on_frame = on_frame
+        self.interval = interval
+        self.max_workers = max(1, max_workers)
+
+        self._bucket = TokenBucket(rate_limit)
+        self._targets: Dict[str, _SnapshotTarget] = {}
+        self._condition = threading.Condition()
+        self._paused = False
+        self._stop_event = threading.Event()
+        self._scheduler: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the scheduler thread is running."""
+        return self._scheduler is not None and self._scheduler.is_alive()
+
+    def add_camera(self, camera_id: str, size: Tuple[int, int], visible: bool = True):
+        """Start polling a camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            size: Tile (width, height) the snapshot is scaled to
+            visible: Whether the tile is currently visible
+        """
+        with self._condition:
+            self._targets[camera_id] = _SnapshotTarget(camera_id, size, visible)
+            self._condition.notify()
+
+    def remove_camera(self, camera_id: str):
+        """Stop polling a camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+        """
+        with self._condition:
+            self._targets.pop(camera_id, None)
+
+    def set_visible(self, camera_id: str, visible: bool):
+        """Mark a tile as visible or hidden. Hidden tiles are not polled.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            visible: Whether the tile is visible
+        """
+        with self._condition:
+            target = self._targets.get(camera_id)
+            if target is not None and target.visible != visible:
+                target.visible = visible
+                if visible:
+                    target.next_due = 0.0
+                self._condition.notify()
+
+    def set_tile_size(self, camera_id: str, size: Tuple[int, int]):
+        """Change the size snapshots of a camera are scaled to.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            size: Tile (width, height)
+        """
+        with self._condition:
+            target = self._targets.get(camera_id)
+            if target is not None:
+                target.size = size
+
+    def set_paused(self, paused: bool):
+        """Pause or resume polling of all cameras, e.g. while minimized.
+
+        Args:
+            paused: True to stop issuing requests
+        """
+        with self._condition:
+            self._paused = paused
+            self._condition.notify()
+
+    def set_rate_limit(self, rate_limit: float):
+        """Change the total request budget.
+
+        Args:
+            rate_limit: Maximum snapshot requests per second across all cameras
+        """
+        self._bucket.set_rate(rate_limit)
+
+    def start(self):
+        """Start the scheduler and worker threads."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="snapshot")
+        self._scheduler = threading.Thread(target=self._run, name="snapshot-scheduler",
+                                           daemon=True)
+        self._scheduler.start()
+
+    def stop(self):
+        """Stop polling and wait for the scheduler to exit."""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._scheduler is not None:
+            self._scheduler.join(timeout=2.0)
+            self._scheduler = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _next_target(self) -> Tuple[Optional[_SnapshotTarget], float]:
+        """Pick the most overdue pollable target. Caller must hold the lock.
+
+        Returns:
+            Tuple of (target or None, seconds until it is due)
+        """
+        if self._paused:
+            return None, self.interval
+        candidates = [t for t in self._targets.values() if t.visible and not t.in_flight]
+        if not candidates:
+            return None, self.interval
+        target = min(candidates, key=lambda t: t.next_due)
+        return target, target.next_due - time.monotonic()
+
+    def _run(self):
+        """Scheduler loop issuing one snapshot request at a time."""
+        while not self._stop_event.is_set():
+            with self._condition:
+                target, delay = self._next_target()
+                if target is None or delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+            if not self._bucket.acquire(stop_event=self._stop_event):
+                break
+
+            with self._condition:
+                # The tile may have been hidden or removed while waiting for a token
+                if (self._paused or not target.visible
+                        or self._targets.get(target.camera_id) is not target):
+                    continue
+                target.in_flight = True
+                target.next_due = time.monotonic() + self.interval
+                size = target.size
+
+            self._executor.submit(self._poll, target, size)
+
+    def _poll(self, target: _SnapshotTarget, size: Tuple[int, int]):
+        """Fetch, decode and deliver one snapshot on a worker thread.
+
+        Args:
+            target: Target being polled
+            size: Size to scale the snapshot to
+        """
+        try:
+            image_data = decode_snapshot(self.fetch_snapshot(target.camera_id), size)
+            if target.visible and not self._stop_event.is_set():
+                self.on_frame(target.camera_id, image_data)
+        except Exception as e:
+            logger.debug(f"Snapshot for {target.camera_id} failed: {e}")
+        finally:
+            with self._condition:
+                target.in_flight = False
+                self._condition.notify()
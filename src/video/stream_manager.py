@@ -5,35 +5,148 @@ This module manages multiple video streams, coordinating playback,
 resource allocation, and stream health monitoring.
 """
 
-from typing import Dict, List, Optional
-from .player import VideoPlayer
+import threading
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .health_monitor import StreamHealthMonitor
+from .player import VideoPlayer, PlayerPool
+from .quality import QualityController, StreamQualityState
+from ..models.camera import Camera
+from ..utils.logger import get_logger
+
+logger = get_logger("video.stream_manager")
+
+
+class SuspendMode(Enum):
+    """How streams nobody can see are suspended."""
+    PAUSE = "pause"      # keep the connection, stop decoding
+    RELEASE = "release"  # close the connection and the decoder
+    WARM = "warm"        # keep playing the lowest-bitrate channel
 
 
 class StreamManager:
     """Manages multiple video streams and their players."""
 
-    def __init__(self):
-        """Initialize the stream manager."""
+    def __init__(self, url_resolver: Optional[Callable[[str, int], Optional[str]]] = None,
+                 auto_quality: bool = True, default_quality: str = "high",
+                 vlc_options: str = "", auto_reconnect: bool = True,
+                 reconnect_interval: float = 30.0, retry_attempts: int = 3,
+                 stall_timeout: float = 10.0):
+        """Initialize the stream manager.
+
+        Args:
+            url_resolver: Function returning the stream URL for (camera_id, channel),
+                used for channels whose URL is not part of the camera data
+            auto_quality: Whether to pick and adapt channels automatically
+            default_quality: ``high`` or ``low``, used when auto quality is off
+            vlc_options: Command line options for the shared VLC instance
+            auto_reconnect: Whether failed or stalled streams are reconnected
+            reconnect_interval: Maximum delay between reconnect attempts in seconds
+            retry_attempts: Reconnect attempts per failure
+            stall_timeout: Seconds without a decoded frame before a stream counts as stalled
+        """
         self.streams: Dict[str, VideoPlayer] = {}
         self.stream_urls: Dict[str, str] = {}
         self.active_streams: List[str] = []
 
-    def add_stream(self, camera_id: str, stream_url: str, widget=None) -> bool:
+        self.url_resolver = url_resolver
+        self.player_pool = PlayerPool.default(vlc_options)
+        self.cameras: Dict[str, Camera] = {}
+        self.quality = QualityController(auto_quality, default_quality)
+        self.quality_states: Dict[str, StreamQualityState] = {}
+        self.suspended: Dict[str, SuspendMode] = {}
+        # Guards the stream state above: calls arrive from GUI worker threads,
+        # the GUI thread and health monitor reconnects, and a reconnect must
+        # never restart a player that is being removed
+        self._lock = threading.RLock()
+        # Stream URLs are resolved without the lock, since the resolver may
+        # ask the NVR. An add is dropped if the camera was removed or added
+        # again meanwhile, a channel switch if its revision is outdated
+        self._adding: Dict[str, object] = {}
+        self._revisions: Dict[str, int] = {}
+        self.health_monitor = StreamHealthMonitor(
+            self._restart_stream, stall_timeout=stall_timeout, max_retries=retry_attempts,
+            reconnect_interval=reconnect_interval, auto_reconnect=auto_reconnect,
+        )
+
+    @classmethod
+    def from_config(cls, config, url_resolver=None) -> 'StreamManager':
+        """Create a stream manager from application configuration.
+
+        Args:
+            config: Loaded ConfigManager instance
+            url_resolver: Function returning the stream URL for (camera_id, channel)
+
+        Returns:
+            Configured stream manager
+        """
+        video = config.get_video_settings()
+        network = config.get_network_settings()
+        advanced = config.get_advanced_settings()
+        return cls(url_resolver=url_resolver,
+                   auto_quality=video['auto_quality'],
+                   default_quality=video['default_quality'],
+                   vlc_options=advanced['vlc_options'],
+                   auto_reconnect=advanced['auto_reconnect'],
+                   reconnect_interval=advanced['reconnect_interval'],
+                   retry_attempts=network['stream_retry_attempts'],
+                   stall_timeout=network['stream_timeout'])
+
+    def add_stream(self, camera_id: str, stream_url: Optional[str] = None, widget=None,
+                   camera: Optional[Camera] = None,
+                   tile_size: Optional[Tuple[int, int]] = None) -> bool:
         """Add a new video stream.
 
+        When the camera model is given, the channel is chosen from the tile
+        size and ``stream_url`` is only used as a fallback.
+
         Args:
             camera_id: Unique identifier for the camera
             stream_url: URL of the video stream
             widget: GUI widget to display the stream
+            camera: Camera model with the available channels
+            tile_size: (width, height) of the tile showing the stream
 
         Returns:
             True if stream added successfully, False otherwise
         """
-        # TODO: Create video player for stream
-        # TODO: Initialize player with widget
-        # TODO: Store stream information
-        # TODO: Start stream playback
-        pass
+        with self._lock:
+            token = self._adding[camera_id] = object()
+        level = None
+        if camera is not None and camera.streams:
+            level = self.quality.preferred_level(camera, tile_size)
+            stream_url = self._resolve_url(camera, level) or stream_url
+
+        with self._lock:
+            if self._adding.get(camera_id) is not token:
+                logger.debug(f"Stream of camera {camera_id} changed while resolving its URL")
+                return False
+            del self._adding[camera_id]
+            if camera_id in self.streams:
+                self.remove_stream(camera_id)
+
+            if level is not None:
+                self.cameras[camera_id] = camera
+                self.quality_states[camera_id] = StreamQualityState(camera_id, level, level,
+                                                                    tile_size)
+
+            if not stream_url:
+                logger.warning(f"No stream URL available for camera {camera_id}")
+                self._forget(camera_id)
+                return False
+
+            player = VideoPlayer(widget, self.player_pool)
+            try:
+                player.initialize()
+            except Exception as e:
+                logger.error(f"Failed to initialize player for camera {camera_id}: {e}")
+                self._forget(camera_id)
+                return False
+
+            self.streams[camera_id] = player
+            self.stream_urls[camera_id] = stream_url
+            return self.start_stream(camera_id)
 
     def remove_stream(self, camera_id: str):
         """Remove a video stream.
@@ -41,10 +154,30 @@ class StreamManager:
         Args:
             camera_id: Unique identifier for the camera
         """
-        # TODO: Stop stream playback
-        # TODO: Cleanup player resources
-        # TODO: Remove from active streams
-        pass
+        with self._lock:
+            self._adding.pop(camera_id, None)
+            self._touch(camera_id)
+            self.health_monitor.unwatch(camera_id)
+            self.suspended.pop(camera_id, None)
+            player = self.streams.pop(camera_id, None)
+            if player is not None:
+                player.cleanup()
+            if camera_id in self.active_streams:
+                self.active_streams.remove(camera_id)
+            self.stream_urls.pop(camera_id, None)
+            self._forget(camera_id)
+
+    def set_stream_widget(self, camera_id: str, widget):
+        """Move a running stream to another widget without restarting it.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            widget: GUI widget to display the stream
+        """
+        with self._lock:
+            player = self.streams.get(camera_id)
+            if player is not None:
+                player.set_widget(widget)
 
     def start_stream(self, camera_id: str) -> bool:
         """Start playback for a specific stream.
@@ -55,9 +188,19 @@ class StreamManager:
         Returns:
             True if stream started successfully, False otherwise
         """
-        # TODO: Start stream playback
-        # TODO: Add to active streams list
-        pass
+        with self._lock:
+            player = self.streams.get(camera_id)
+            if player is None:
+                return False
+            try:
+                player.play_stream(self.stream_urls[camera_id])
+            except Exception as e:
+                logger.error(f"Failed to start stream for camera {camera_id}: {e}")
+                return False
+            if camera_id not in self.active_streams:
+                self.active_streams.append(camera_id)
+            self.health_monitor.watch(camera_id, player)
+            return True
 
     def stop_stream(self, camera_id: str):
         """Stop playback for a specific stream.
@@ -65,15 +208,82 @@ class StreamManager:
         Args:
             camera_id: Unique identifier for the camera
         """
-        # TODO: Stop stream playback
-        # TODO: Remove from active streams list
-        pass
+        with self._lock:
+            # Streams stopped on purpose must not be reconnected
+            self.health_monitor.unwatch(camera_id)
+            self.suspended.pop(camera_id, None)
+            player = self.streams.get(camera_id)
+            if player is not None:
+                player.stop()
+            if camera_id in self.active_streams:
+                self.active_streams.remove(camera_id)
+
+    def suspend_stream(self, camera_id: str, mode: SuspendMode = SuspendMode.PAUSE):
+        """Stop spending decode time on a stream nobody can see.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            mode: How to suspend the stream
+        """
+        switches = []
+        with self._lock:
+            player = self.streams.get(camera_id)
+            if player is None or camera_id in self.suspended:
+                return
+            self._touch(camera_id)
+            state = self.quality_states.get(camera_id)
+            if mode == SuspendMode.WARM and state is None:
+                # Without channel information there is nothing cheaper to switch to
+                mode = SuspendMode.PAUSE
+
+            if mode == SuspendMode.RELEASE:
+                self.stop_stream(camera_id)
+            elif mode == SuspendMode.PAUSE:
+                # A paused stream decodes no frames and would look stalled
+                self.health_monitor.unwatch(camera_id)
+                player.pause()
+            elif state.level != 0:
+                switches.append(self._plan_switch(camera_id, 0))
+            self.suspended[camera_id] = mode
+            logger.debug(f"Suspended stream of camera {camera_id} ({mode.value})")
+        self._switch_levels(switches)
+
+    def resume_stream(self, camera_id: str) -> bool:
+        """Resume a suspended stream.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            True if the stream is playing again, False otherwise
+        """
+        switches = []
+        with self._lock:
+            mode = self.suspended.pop(camera_id, None)
+            player = self.streams.get(camera_id)
+            if mode is None or player is None:
+                return player is not None
+            self._touch(camera_id)
+            logger.debug(f"Resuming stream of camera {camera_id} ({mode.value})")
+
+            if mode == SuspendMode.RELEASE:
+                return self.start_stream(camera_id)
+            if mode == SuspendMode.PAUSE:
+                player.resume()
+                if camera_id in self.active_streams:
+                    self.health_monitor.watch(camera_id, player)
+                return True
+            state = self.quality_states[camera_id]
+            if state.level != state.preferred_level:
+                switches.append(self._plan_switch(camera_id, state.preferred_level))
+        self._switch_levels(switches)
+        return True
 
     def stop_all_streams(self):
         """Stop all active streams."""
-        # TODO: Stop all stream playback
-        # TODO: Clear active streams list
-        pass
+        with self._lock:
+            for camera_id in list(self.active_streams):
+                self.stop_stream(camera_id)
 
     def set_stream_volume(self, camera_id: str, volume: int):
         """Set volume for a specific stream.
@@ -82,8 +292,10 @@ class StreamManager:
             camera_id: Unique identifier for the camera
             volume: Volume level (0-100)
         """
-        # TODO: Set volume for specified stream
-        pass
+        with self._lock:
+            player = self.streams.get(camera_id)
+            if player is not None:
+                player.set_volume(volume)
 
     def set_master_volume(self, volume: int):
         """Set master volume for all streams.
@@ -91,8 +303,54 @@ class StreamManager:
         Args:
             volume: Master volume level (0-100)
         """
-        # TODO: Set volume for all active streams
-        pass
+        with self._lock:
+            for player in self.streams.values():
+                player.set_volume(volume)
+
+    def set_tile_size(self, camera_id: str, tile_size: Optional[Tuple[int, int]]):
+        """Update the on-screen size of a stream and switch channel if needed.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            tile_size: New (width, height) of the tile, or None for full size
+        """
+        switches = []
+        with self._lock:
+            state = self.quality_states.get(camera_id)
+            if state is None:
+                return
+            state.tile_size = tile_size
+            state.preferred_level = self.quality.preferred_level(self.cameras[camera_id],
+                                                                 tile_size)
+            # Suspended streams pick the preferred level up when they resume
+            if state.level != state.preferred_level and camera_id not in self.suspended:
+                switches.append(self._plan_switch(camera_id, state.preferred_level))
+        self._switch_levels(switches)
+
+    def update_quality(self):
+        """Adapt stream channels to the current decode load.
+
+        Meant to be called periodically, e.g. every few seconds from the GUI loop.
+        """
+        switches = []
+        with self._lock:
+            if not self.quality.auto_quality or not self.quality_states:
+                self.quality.measure_cpu_load()
+                return
+            # Suspended streams are held at their suspend level
+            states = {camera_id: state for camera_id, state in self.quality_states.items()
+                      if camera_id not in self.suspended}
+            for camera_id, state in states.items():
+                player = self.streams.get(camera_id)
+                if player is not None:
+                    self.quality.update_frame_stats(state, player.get_stats())
+
+            cpu_load = self.quality.measure_cpu_load()
+            for camera_id, level in self.quality.evaluate(states, cpu_load).items():
+                logger.info(f"Switching camera {camera_id} to quality level {level} "
+                            f"(cpu load {cpu_load:.0%})")
+                switches.append(self._plan_switch(camera_id, level))
+        self._switch_levels(switches)
 
     def get_stream_status(self, camera_id: str) -> dict:
         """Get status information for a stream.
@@ -103,12 +361,146 @@ class StreamManager:
         Returns:
             Dictionary containing stream status information
         """
-        # TODO: Return stream status information
-        pass
+        with self._lock:
+            player = self.streams.get(camera_id)
+            if player is None:
+                return {}
+            state = self.quality_states.get(camera_id)
+            health = self.health_monitor.get_status(camera_id)
+            suspended = self.suspended.get(camera_id)
+            return {
+                'camera_id': camera_id,
+                'url': self.stream_urls.get(camera_id),
+                'active': camera_id in self.active_streams,
+                'suspended': suspended.value if suspended else None,
+                'playing': player.is_playing(),
+                'quality_level': state.level if state else None,
+                'drop_ratio': state.drop_ratio if state else 0.0,
+                'stats': player.get_stats(),
+                'health': health.to_dict() if health else None,
+            }
+
+    def get_health_snapshot(self) -> Dict[str, dict]:
+        """Get the health status of every active stream.
+
+        Returns:
+            Mapping of camera ID to status dictionary (state, bitrate,
+            dropped frames, reconnect count, last-frame age)
+        """
+        return {camera_id: status.to_dict()
+                for camera_id, status in self.health_monitor.snapshot().items()}
 
     def cleanup(self):
         """Cleanup all stream resources."""
-        # TODO: Stop all streams
-        # TODO: Cleanup all players
-        # TODO: Clear stream data
-        pass
\ No newline at end of file
+        with self._lock:
+            self.stop_all_streams()
+            for camera_id in list(self.streams):
+                self.remove_stream(camera_id)
+            self.stream_urls.clear()
+            self.active_streams.clear()
+        self.health_monitor.stop()
+
+    def _restart_stream(self, camera_id: str, player: VideoPlayer) -> bool:
+        """Reopen the current URL of a stream, used by the health monitor.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            player: Player the health monitor watched; nothing is restarted
+                if the camera has since been removed or given another player
+
+        Returns:
+            True if playback was restarted, False otherwise
+        """
+        with self._lock:
+            url = self.stream_urls.get(camera_id)
+            if (self.streams.get(camera_id) is not player or not url
+                    or camera_id not in self.active_streams
+                    or self.suspended.get(camera_id, SuspendMode.WARM) != SuspendMode.WARM):
+                return False
+            player.play_stream(url)
+            return True
+
+    def _resolve_url(self, camera: Camera, level: int) -> Optional[str]:
+        """Get the URL of a camera stream at a quality level.
+
+        Called without the lock held, since the resolver may ask the NVR.
+
+        Args:
+            camera: Camera model with the available channels
+            level: Index into ``Camera.streams_by_quality``
+
+        Returns:
+            Stream URL or None if it cannot be resolved
+        """
+        stream = camera.streams_by_quality[level]
+        if stream.url:
+            return stream.url
+        if self.url_resolver is not None:
+            try:
+                return self.url_resolver(camera.camera_id, stream.channel)
+            except Exception as e:
+                logger.warning(f"Could not resolve channel {stream.channel} "
+                               f"of camera {camera.camera_id}: {e}")
+        return None
+
+    def _touch(self, camera_id: str) -> int:
+        """Start a new revision of a camera's stream. Must be called with the lock held.
+
+        Args:
+            camera_id: Unique identifier for the camera
+
+        Returns:
+            The new revision
+        """
+        self._revisions[camera_id] = self._revisions.get(camera_id, 0) + 1
+        return self._revisions[camera_id]
+
+    def _plan_switch(self, camera_id: str, level: int) -> Tuple[str, Camera, int, int]:
+        """Record a channel switch to run once the lock is released.
+
+        Must be called with the lock held.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            level: Index into ``Camera.streams_by_quality``
+
+        Returns:
+            (camera ID, camera, level, revision) for ``_switch_levels``
+        """
+        return camera_id, self.cameras[camera_id], level, self._touch(camera_id)
+
+    def _switch_levels(self, switches: List[Tuple[str, Camera, int, int]]):
+        """Move streams to other quality levels.
+
+        The URLs are resolved without the lock; a switch is dropped if its
+        stream changed in the meantime.
+
+        Args:
+            switches: Switches recorded by ``_plan_switch``
+        """
+        for camera_id, camera, level, revision in switches:
+            url = self._resolve_url(camera, level)
+            if not url:
+                continue
+            with self._lock:
+                if self._revisions.get(camera_id) != revision:
+                    logger.debug(f"Dropping outdated channel switch of camera {camera_id}")
+                    continue
+                state = self.quality_states[camera_id]
+                state.level = level
+                state.decoded_frames = state.lost_frames = 0
+                state.drop_ratio = 0.0
+                if url == self.stream_urls.get(camera_id):
+                    continue
+                self.stream_urls[camera_id] = url
+                if camera_id in self.active_streams:
+                    self.start_stream(camera_id)
+
+    def _forget(self, camera_id: str):
+        """Drop quality bookkeeping for a camera.
+
+        Args:
+            camera_id: Unique identifier for the camera
+        """
+        self.cameras.pop(camera_id, None)
+        self.quality_states.pop(camera_id, None)
@@ -0,0 +1,472 @@
+"""
+Preview thumbnails for timeline scrubbing.
+
+This module keeps a per-camera index of small JPEG thumbnails sampled
+across the visible timeline range, so dragging the playback slider can
+show previews instead of seeking every player. Thumbnails are grabbed in
+the background from cached recordings and stored per camera-hour as one
+memory-mapped JPEG strip plus a table of (second, offset, length)
+records.
+"""
+
+import io
+import mmap
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from .player import VideoPlayer
+from .recording_cache import RecordingCache
+from ..models.timeline import Timeline
+from ..utils.logger import get_logger
+
+logger = get_logger("video.thumbnail_index")
+
+# Offset table record; seconds are counted from the start of the hour
+_RECORD = np.dtype([('second', '<u2'), ('offset', '<u4'), ('length', '<u4')])
+_STRIP_SUFFIX = ".strip"
+_TABLE_SUFFIX = ".idx"
+_HOUR_FORMAT = "%Y%m%d%H"
+
+# Sampling intervals in seconds; each divides an hour, so the samples of a
+# coarse zoom level are a subset of those of every finer level
+_INTERVALS = (2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600)
+
+
+class _HourStrip:
+    """Thumbnails of one camera-hour: a JPEG strip and its offset table."""
+
+    def __init__(self, base: Path):
+        """Open or create the files of a camera-hour.
+
+        Args:
+            base: File path without suffix
+        """
+        self.strip_path = base.with_suffix(_STRIP_SUFFIX)
+        self.table_path = base.with_suffix(_TABLE_SUFFIX)
+        records = np.zeros(0, dtype=_RECORD)
+        if self.table_path.exists():
+            records = np.fromfile(self.table_path, dtype=_RECORD)
+        strip_size = self.strip_path.stat().st_size if self.strip_path.exists() else 0
+        # Drop records a crash left pointing past the end of the strip
+        records = records[records['offset'].astype(np.int64) + records['length'] <= strip_size]
+        records = records[np.argsort(records['second'], kind='stable')]
+        self.seconds = records['second'].astype(np.int32)
+        self.offsets = records['offset'].astype(np.int64)
+        self.lengths = records['length'].astype(np.int64)
+        self._map: Optional[mmap.mmap] = None
+        self._file = None
+
+    def __len__(self) -> int:
+        return len(self.seconds)
+
+    def has(self, second: int) -> bool:
+        """Check if a thumbnail exists for a second of the hour.
+
+        Args:
+            second: Seconds since the start of the hour
+
+        Returns:
+            True if stored
+        """
+        index = np.searchsorted(self.seconds, second)
+        return bool(index < len(self.seconds) and self.seconds[index] == second)
+
+    def nearest(self, second: int, tolerance: int) -> Optional[Tuple[int, bytes]]:
+        """Get the thumbnail closest to a second of the hour.
+
+        Args:
+            second: Seconds since the start of the hour
+            tolerance: Maximum distance in seconds
+
+        Returns:
+            (distance, JPEG data) or None if nothing is close enough
+        """
+        if not len(self.seconds):
+            return None
+        index = int(np.searchsorted(self.seconds, second))
+        candidates = [i for i in (index - 1, index) if 0 <= i < len(self.seconds)]
+        best = min(candidates, key=lambda i: abs(int(self.seconds[i]) - second))
+        distance = abs(int(self.seconds[best]) - second)
+        if distance > tolerance:
+            return None
+        return distance, self._read(int(self.offsets[best]), int(self.lengths[best]))
+
+    def append(self, second: int, jpeg: bytes):
+        """Store a thumbnail.
+
+        Args:
+            second: Seconds since the start of the hour
+            jpeg: JPEG image data
+        """
+        self.strip_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.strip_path, 'ab') as strip:
+            offset = strip.tell()
+            strip.write(jpeg)
+        record = np.array([(second, offset, len(jpeg))], dtype=_RECORD)
+        # The table is written after the data, so a crash never leaves a
+        # record without its image
+        with open(self.table_path, 'ab') as table:
+            record.tofile(table)
+        index = int(np.searchsorted(self.seconds, second))
+        self.seconds = np.insert(self.seconds, index, second)
+        self.offsets = np.insert(self.offsets, index, offset)
+        self.lengths = np.insert(self.lengths, index, len(jpeg))
+
+    def close(self):
+        """Unmap the strip."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Read a thumbnail from the mapped strip, remapping it if it grew.
+
+        Args:
+            offset: Byte offset in the strip
+            length: Byte length
+
+        Returns:
+            JPEG image data
+        """
+        if self._map is None or self._map.size() < offset + length:
+            self.close()
+            self._file = open(self.strip_path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length]
+
+
+class RecordingFrameGrabber:
+    """Grabs thumbnails from cached recordings with a windowless player."""
+
+    def __init__(self, cache: RecordingCache, size: Tuple[int, int] = (160, 90),
+                 timeout: float = 5.0, quality: int = 75,
+                 player_factory: Optional[Callable[[], VideoPlayer]] = None):
+        """Initialize the grabber.
+
+        Args:
+            cache: Recording cache holding the files to grab from
+            size: Thumbnail (width, height) in pixels
+            timeout: Seconds to wait for the first decoded frame
+            quality: JPEG quality
+            player_factory: Function creating a player, defaults to ``VideoPlayer``
+        """
+        self.cache = cache
+        self.size = size
+        self.timeout = timeout
+        self.quality = quality
+        self.player_factory = player_factory or VideoPlayer
+
+    def __call__(self, camera_id: str, recording_id: str, offset_ms: int) -> Optional[bytes]:
+        """Grab the frame at an offset of a recording.
+
+        A recording that is not cached yet is queued for download and
+        None is returned; the next fill picks it up.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            recording_id: Unique identifier for the recording
+            offset_ms: Offset into the recording in milliseconds
+
+        Returns:
+            JPEG image data or None
+        """
+        path = self.cache.resolve(camera_id, recording_id)
+        if path is None:
+            return None
+
+        width, height = self.size
+        decoded = threading.Event()
+        player = self.player_factory()
+        try:
+            ring = player.enable_frame_access(width, height, buffers=2,
+                                              on_frame=lambda ring: decoded.set())
+            player.play_stream(path, options=[f":start-time={offset_ms / 1000:.3f}",
+                                              ":no-audio"])
+            if not decoded.wait(self.timeout):
+                logger.debug(f"No frame from recording {recording_id} at {offset_ms} ms")
+                return None
+            with ring.read() as frame:
+                image = Image.frombuffer('RGBA', (width, height), frame.data,
+                                         'raw', 'RGBA', 0, 1).convert('RGB')
+        finally:
+            player.cleanup()
+        output = io.BytesIO()
+        image.save(output, format='JPEG', quality=self.quality)
+        return output.getvalue()
+
+
+class ThumbnailIndex:
+    """Per-camera preview thumbnails, filled in the background."""
+
+    def __init__(self, grab: Callable[[str, str, int], Optional[bytes]],
+                 directory: Union[str, Path] = "thumbnails",
+                 samples_per_view: int = 120, max_workers: int = 2, max_open_hours: int = 64):
+        """Initialize the thumbnail index.
+
+        Args:
+            grab: Function returning a JPEG thumbnail for (camera_id,
+                recording_id, offset_ms), e.g. a ``RecordingFrameGrabber``
+            directory: Directory holding the camera-hour files
+            samples_per_view: Thumbnails to aim for across the visible range
+            max_workers: Fills running at the same time
+            max_open_hours: Camera-hours kept open and mapped
+        """
+        self.grab = grab
+        self.directory = Path(directory)
+        self.samples_per_view = samples_per_view
+        self.max_open_hours = max_open_hours
+
+        self._hours: "OrderedDict[Tuple[str, str], _HourStrip]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="thumbnails")
+
+    @classmethod
+    def from_config(cls, config, cache: RecordingCache) -> 'ThumbnailIndex':
+        """Create a thumbnail index grabbing from the recording cache.
+
+        Args:
+            config: Loaded ConfigManager instance
+            cache: Recording cache
+
+        Returns:
+            Configured thumbnail index
+        """
+        settings = config.get_recording_settings()
+        return cls(RecordingFrameGrabber(cache), directory=settings['thumbnail_directory'])
+
+    def sample_interval(self, timeline: Timeline) -> int:
+        """Choose the thumbnail spacing for a timeline's current zoom.
+
+        Args:
+            timeline: Camera timeline
+
+        Returns:
+            Interval in seconds
+        """
+        start, end = self._view_range(timeline)
+        if start is None:
+            return _INTERVALS[-1]
+        span = (end - start).total_seconds()
+        wanted = span / max(1, self.samples_per_view)
+        return next((interval for interval in _INTERVALS if interval >= wanted), _INTERVALS[-1])
+
+    def plan(self, timeline: Timeline) -> List[datetime]:
+        """Get the sample times in a timeline's view range that have footage.
+
+        Args:
+            timeline: Camera timeline
+
+        Returns:
+            Sample times, aligned to the interval
+        """
+        start, end = self._view_range(timeline)
+        if start is None:
+            return []
+        interval = self.sample_interval(timeline)
+        samples = []
+        for segment in timeline.get_segments_in_range(start, end):
+            first = max(segment.start_time, start)
+            aligned = int(first.timestamp() // interval * interval)
+            timestamp = datetime.fromtimestamp(aligned)
+            if timestamp < first:
+                timestamp += timedelta(seconds=interval)
+            last = min(segment.end_time, end)
+            while timestamp <= last:
+                samples.append(timestamp)
+                timestamp += timedelta(seconds=interval)
+        return samples
+
+    def fill(self, timeline: Timeline) -> Future:
+        """Grab the missing thumbnails of a timeline's view range in the background.
+
+        Supersedes a fill of the same camera that is still running, e.g.
+        after the user zoomed again.
+
+        Args:
+            timeline: Camera timeline
+
+        Returns:
+            Future resolving to the number of thumbnails added
+        """
+        camera_id = timeline.camera_id
+        with self._lock:
+            generation = self._generations.get(camera_id, 0) + 1
+            self._generations[camera_id] = generation
+        samples = [timestamp for timestamp in self.plan(timeline)
+                   if not self.has(camera_id, timestamp)]
+        return self._executor.submit(self._fill, timeline, _coarse_first(samples), generation)
+
+    def has(self, camera_id: str, timestamp: datetime) -> bool:
+        """Check if a thumbnail exists for an exact second.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            timestamp: Sample time
+
+        Returns:
+            True if stored
+        """
+        hour, second = _split(timestamp)
+        with self._lock:
+            return self._hour(camera_id, hour).has(second)
+
+    def get(self, camera_id: str, timestamp: datetime,
+            tolerance: Optional[float] = None) -> Optional[bytes]:
+        """Get the thumbnail closest to a time.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            timestamp: Time under the slider
+            tolerance: Maximum distance in seconds, defaults to the coarsest interval
+
+        Returns:
+            JPEG image data or None if no thumbnail is close enough
+        """
+        tolerance = int(tolerance if tolerance is not None else _INTERVALS[-1])
+        hour, second = _split(timestamp)
+        best = None
+        with self._lock:
+            # The nearest thumbnail may be stored in a neighbouring hour
+            for shift in (0, -3600, 3600):
+                if (shift < 0 and second > tolerance) or (shift > 0 and 3600 - second > tolerance):
+                    continue
+                strip = self._hour(camera_id, hour + timedelta(seconds=shift))
+                found = strip.nearest(second - shift, tolerance)
+                if found is not None and (best is None or found[0] < best[0]):
+                    best = found
+        return best[1] if best is not None else None
+
+    def close(self):
+        """Stop filling and unmap all strips."""
+        with self._lock:
+            for camera_id in self._generations:
+                self._generations[camera_id] += 1
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            for strip in self._hours.values():
+                strip.close()
+            self._hours.clear()
+
+    def _view_range(self, timeline: Timeline) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Get the visible range of a timeline, defaulting to all of its footage.
+
+        Args:
+            timeline: Camera timeline
+
+        Returns:
+            (start, end) or (None, None) if the timeline is empty
+        """
+        if timeline.view_start is not None and timeline.view_end is not None:
+            return timeline.view_start, timeline.view_end
+        if not timeline.segments:
+            return None, None
+        return timeline.segments[0].start_time, timeline.segments[-1].end_time
+
+    def _fill(self, timeline: Timeline, samples: List[datetime], generation: int) -> int:
+        """Grab and store thumbnails until done or superseded.
+
+        Args:
+            timeline: Camera timeline
+            samples: Sample times to grab
+            generation: Fill generation of the camera
+
+        Returns:
+            Number of thumbnails added
+        """
+        camera_id = timeline.camera_id
+        added = 0
+        for timestamp in samples:
+            with self._lock:
+                current = self._generations.get(camera_id)
+            if current != generation:
+                break
+            segment = timeline.get_segment_at_time(timestamp)
+            if segment is None:
+                continue
+            recording_id, recording_start = segment.recording_at(timestamp)
+            offset_ms = int((timestamp - recording_start).total_seconds() * 1000)
+            try:
+                jpeg = self.grab(camera_id, recording_id, offset_ms)
+            except Exception as e:
+                logger.warning(f"Thumbnail grab failed for camera {camera_id} at {timestamp}: {e}")
+                continue
+            if not jpeg:
+                continue
+            hour, second = _split(timestamp)
+            with self._lock:
+                strip = self._hour(camera_id, hour)
+                if not strip.has(second):
+                    strip.append(second, jpeg)
+                    added += 1
+        logger.debug(f"Added {added} thumbnails for camera {camera_id}")
+        return added
+
+    def _hour(self, camera_id: str, hour: datetime) -> _HourStrip:
+        """Get an open camera-hour, opening it if needed.
+
+        Must be called with the lock held.
+
+        Args:
+            camera_id: Unique identifier for the camera
+            hour: Start of the hour
+
+        Returns:
+            Camera-hour strip
+        """
+        key = (camera_id, hour.strftime(_HOUR_FORMAT))
+        strip = self._hours.get(key)
+        if strip is None:
+            strip = self._hours[key] = _HourStrip(self.directory / camera_id / key[1])
+            while len(self._hours) > self.max_open_hours:
+                _, evicted = self._hours.popitem(last=False)
+                evicted.close()
+        else:
+            self._hours.move_to_end(key)
+        return strip
+
+
+def _split(timestamp: datetime) -> Tuple[datetime, int]:
+    """Split a time into the start of its hour and the seconds into it.
+
+    Args:
+        timestamp: Time to split
+
+    Returns:
+        (hour, second)
+    """
+    hour = timestamp.replace(minute=0, second=0, microsecond=0)
+    return hour, int((timestamp - hour).total_seconds())
+
+
+def _coarse_first(samples: List[datetime]) -> List[datetime]:
+    """Order samples so a partial fill already covers the whole range evenly.
+
+    Args:
+        samples: Sample times in chronological order
+
+    Returns:
+        Every 2^k-th sample first, then progressively finer ones
+    """
+    ordered, seen = [], set()
+    step = 1
+    while step * 2 < len(samples):
+        step *= 2
+    while step >= 1:
+        for index in range(0, len(samples), step):
+            if index not in seen:
+                seen.add(index)
+                ordered.append(samples[index])
+        step //= 2
+    return ordered
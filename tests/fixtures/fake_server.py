@@ -0,0 +1,241 @@
+"""
+Local fake UniFi Video server for offline API tests.
+
+This module serves the mock responses from ``mock_responses`` over real
+HTTP so API clients can be exercised end to end without an NVR.
+"""
+
+import json
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .mock_responses import MockAPIResponses, HTTP_STATUS
+
+# Minimal JPEG payload (SOI + EOI markers) returned by the snapshot endpoint
+FAKE_JPEG = b"\xff\xd8\xff\xe0fake-jpeg\xff\xd9"
+
+# Size of the generated MP4 payload returned by the recording download endpoint
+FAKE_RECORDING_SIZE = 64 * 1024
+
+
+def fake_recording(recording_id: str) -> bytes:
+    """Build the deterministic payload served for a recording download."""
+    pattern = f"mp4:{recording_id};".encode()
+    return (pattern * (FAKE_RECORDING_SIZE // len(pattern) + 1))[:FAKE_RECORDING_SIZE]
+
+
+class _FakeRequestHandler(BaseHTTPRequestHandler):
+    """Request handler answering UniFi Video API endpoints."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        """Count every new TCP connection accepted by the server."""
+        super().setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+
+    def do_POST(self):
+        """Handle login requests."""
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self._log_request()
+
+        if urlparse(self.path).path != "/api/2.0/login":
+            self._send_json(MockAPIResponses.login_failure(), HTTP_STATUS["NOT_FOUND"])
+            return
+
+        if (body.get("email"), body.get("password")) != self.server.credentials:
+            self._send_json(MockAPIResponses.login_failure(), HTTP_STATUS["UNAUTHORIZED"])
+            return
+
+        session_id = uuid.uuid4().hex
+        self.server.sessions.add(session_id)
+        self._send_json(MockAPIResponses.login_success(),
+                        headers={"Set-Cookie": f"JSESSIONID_AV={session_id}; Path=/; HttpOnly"})
+
+    def do_GET(self):
+        """Handle authenticated GET endpoints."""
+        self._log_request()
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part][2:]
+
+        if self._session_id() not in self.server.sessions:
+            self._send_json(MockAPIResponses.login_failure(), HTTP_STATUS["UNAUTHORIZED"])
+            return
+
+        if self.server.latency:
+            self.server.wait(self.server.latency)
+
+        if parts == ["logout"]:
+            self.server.sessions.discard(self._session_id())
+            self._send_json(MockAPIResponses.login_success())
+        elif parts[:1] == ["server"]:
+            self._send_json(MockAPIResponses.server_info())
+        elif parts[:1] == ["camera"]:
+            payload = MockAPIResponses.camera_list()
+            if len(parts) > 1:
+                payload["data"] = [c for c in payload["data"] if c["_id"] == parts[1]]
+            self._send_json(payload)
+        elif parts[:1] == ["stream"] and len(parts) == 4:
+            self._send_json(MockAPIResponses.stream_url(parts[1], int(parts[2])))
+        elif parts[:1] == ["recording"] and parts[2:] == ["download"]:
+            self._send_recording(parts[1])
+        elif parts[:1] == ["recording"]:
+            self._send_json(self._recordings(parse_qs(url.query)))
+        elif parts[:2] == ["snapshot", "camera"]:
+            self._send(FAKE_JPEG, "image/jpeg")
+        else:
+            self._send_json({"rc": "error", "message": "not found"}, HTTP_STATUS["NOT_FOUND"])
+
+    def _recordings(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Build a recording listing filtered like the real endpoint."""
+        start = int(query.get("startTime", [0])[0])
+        end = int(query.get("endTime", [2 ** 62])[0])
+        data = []
+        for camera_id in query.get("cameras[]", []):
+            for item in MockAPIResponses.recordings_list(camera_id)["data"]:
+                if item["endTime"] >= start and item["startTime"] <= end:
+                    item["_id"] = f"{camera_id}-{item['_id']}"
+                    data.append(item)
+        data.sort(key=lambda item: item["startTime"])
+        return {"meta": {"rc": "ok"}, "data": data}
+
+    def _send_recording(self, recording_id: str):
+        """Send a recording, honouring ``Range: bytes=N-`` and injected interruptions."""
+        body = fake_recording(recording_id)
+        start = 0
+        match = re.fullmatch(r"bytes=(\d+)-", self.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            if start >= len(body):
+                self._send(b"", "video/mp4", 416,
+                           headers={"Content-Range": f"bytes */{len(body)}"})
+                return
+        with self.server.lock:
+            cut_after, self.server.interrupt_after = self.server.interrupt_after, None
+
+        self.send_response(206 if match else 200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(len(body) - start))
+        if match:
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.end_headers()
+        if cut_after is not None:
+            # Drop the connection mid-body like a flaky network would
+            self.wfile.write(body[start:start + cut_after])
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+    def _session_id(self) -> Optional[str]:
+        """Extract the session cookie from the request."""
+        for cookie in self.headers.get("Cookie", "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == "JSESSIONID_AV":
+                return value
+        return None
+
+    def _log_request(self):
+        """Record the request for later assertions."""
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path))
+
+    def _send_json(self, payload: Dict[str, Any], status: int = 200,
+                   headers: Optional[Dict[str, str]] = None):
+        """Send a JSON response."""
+        self._send(json.dumps(payload).encode(), "application/json", status, headers)
+
+    def _send(self, body: bytes, content_type: str, status: int = 200,
+              headers: Optional[Dict[str, str]] = None):
+        """Send a response with an explicit length so the connection stays open."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeUniFiVideoServer:
+    """Threaded HTTP server impersonating a UniFi Video NVR."""
+
+    def __init__(self, username: str = "admin", password: str = "password",
+                 latency: float = 0.0):
+        """Initialize the fake server.
+
+        Args:
+            username: Accepted login email
+            password: Accepted login password
+            latency: Artificial delay in seconds added to every GET request
+        """
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakeRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.credentials = (username, password)
+        self._httpd.latency = latency
+        self._httpd.sessions = set()
+        self._httpd.requests: List[Tuple[str, str]] = []
+        self._httpd.connection_count = 0
+        self._httpd.interrupt_after: Optional[int] = None
+        self._httpd.lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._httpd.wait = self._stopped.wait
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> List[Tuple[str, str]]:
+        """Requests received so far as (method, path) tuples."""
+        return list(self._httpd.requests)
+
+    @property
+    def connection_count(self) -> int:
+        """Number of TCP connections accepted so far."""
+        return self._httpd.connection_count
+
+    def interrupt_next_download(self, after_bytes: int):
+        """Cut the next recording download off after a number of body bytes."""
+        self._httpd.interrupt_after = after_bytes
+
+    def expire_sessions(self):
+        """Invalidate every issued session cookie."""
+        self._httpd.sessions.clear()
+
+    def start(self) -> str:
+        """Start serving in a background thread.
+
+        Returns:
+            Base URL of the server
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        """Stop the server and close its socket."""
+        self._stopped.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        """Start the server for the duration of a context."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the server."""
+        self.stop()
@@ -0,0 +1,101 @@
+"""
+Unit tests for the asynchronous UniFi Video API client.
+
+This module exercises the async client end to end against the local
+fake server, including login, discovery, and concurrent fan-out.
+"""
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+from src.api.async_client import AsyncUniFiVideoClient
+from src.api.client import UniFiVideoAPIError
+from src.models.camera import Camera
+from src.models.recording import Recording, RecordingType
+from tests.fixtures.fake_server import FakeUniFiVideoServer, FAKE_JPEG
+
+
+class TestAsyncUniFiVideoClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async API client."""
+
+    def setUp(self):
+        """Start the fake server before each test method."""
+        self.server = FakeUniFiVideoServer(latency=0.05)
+        self.server.start()
+        self.client = AsyncUniFiVideoClient(self.server.url, max_connections=4, timeout=5)
+
+    async def asyncTearDown(self):
+        """Close the client after each test method."""
+        await self.client.close()
+
+    def tearDown(self):
+        """Stop the fake server after each test method."""
+        self.server.stop()
+
+    async def test_login_success(self):
+        """Test login stores the session cookie."""
+        self.assertTrue(await self.client.login("admin", "password"))
+        self.assertIsNotNone(self.client.session_id)
+
+    async def test_login_failure(self):
+        """Test login with invalid credentials."""
+        self.assertFalse(await self.client.login("admin", "wrong"))
+        self.assertIsNone(self.client.session_id)
+        with self.assertRaises(UniFiVideoAPIError) as context:
+            await self.client.get_cameras()
+        self.assertEqual(context.exception.status_code, 401)
+
+    async def test_server_info_and_cameras(self):
+        """Test server info and camera listing are parsed into models."""
+        await self.client.login("admin", "password")
+        server_info, cameras = await asyncio.gather(self.client.get_server_info(),
+                                                    self.client.get_cameras())
+
+        self.assertEqual(server_info["_id"], "server001")
+        self.assertTrue(all(isinstance(camera, Camera) for camera in cameras))
+        self.assertEqual([camera.camera_id for camera in cameras], ["camera001", "camera002"])
+
+        camera = await self.client.get_camera("camera002")
+        self.assertEqual(camera.name, "Backyard Camera")
+
+    async def test_stream_url_fan_out(self):
+        """Test concurrent stream URL resolution is bounded by the connector."""
+        await self.client.login("admin", "password")
+        camera_ids = [f"camera{i:03d}" for i in range(12)]
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        urls = await self.client.get_stream_urls(camera_ids, channel=1)
+        elapsed = loop.time() - started
+
+        self.assertEqual(list(urls), camera_ids)
+        self.assertIn("camera011_1", urls["camera011"])
+        # 12 requests at 50 ms each over 4 connections take about 3 rounds
+        self.assertLess(elapsed, 12 * 0.05)
+        self.assertLessEqual(self.server.connection_count, 1 + 4)
+
+    async def test_recordings_and_snapshot(self):
+        """Test recording query and snapshot retrieval."""
+        await self.client.login("admin", "password")
+        now = datetime.now()
+        recordings = await self.client.get_recordings(["camera001", "camera002"],
+                                                      now - timedelta(hours=3), now)
+
+        self.assertTrue(all(isinstance(rec, Recording) for rec in recordings))
+        self.assertEqual({rec.camera_id for rec in recordings}, {"camera001", "camera002"})
+        self.assertEqual(recordings, sorted(recordings, key=lambda rec: rec.start_time))
+        self.assertIn(RecordingType.CONTINUOUS, {rec.recording_type for rec in recordings})
+        self.assertEqual(recordings[0].duration_seconds, 30 * 60)
+
+        self.assertEqual(await self.client.get_snapshot("camera001"), FAKE_JPEG)
+
+    async def test_logout(self):
+        """Test logout clears the session."""
+        await self.client.login("admin", "password")
+        self.assertTrue(await self.client.logout())
+        self.assertIsNone(self.client.session_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,10 +5,19 @@ This module contains unit tests for the authentication manager,
 including login, logout, and session management functionality.
 """
 
+import os
+import stat
+import tempfile
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch
-# TODO: Import authentication classes when implemented
-# from src.api.auth import AuthManager
+
+import requests
+
+from src.api.auth import AuthManager, SESSION_COOKIE
+from src.api.client import UniFiVideoClient
+from tests.fixtures.fake_server import FakeUniFiVideoServer
 
 
 class TestAuthManager(unittest.TestCase):
@@ -16,64 +25,130 @@ class TestAuthManager(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures before each test method."""
-        # TODO: Initialize test auth manager
-        # TODO: Setup mock HTTP responses
-        pass
+        self.server = FakeUniFiVideoServer()
+        self.server.start()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.session_file = Path(self.temp_dir.name) / "cache" / "session.json"
+        self.auth = AuthManager(session_file=str(self.session_file))
+
+    def _login_count(self):
+        """Count login requests received by the fake server."""
+        return sum(1 for method, path in self.server.requests if method == "POST")
 
     def test_auth_manager_initialization(self):
         """Test authentication manager initialization."""
-        # TODO: Test initial state
-        # TODO: Verify no session exists initially
-        pass
+        self.assertIsNone(self.auth.session_id)
+        self.assertEqual(self.auth.cookies, {})
+        self.assertFalse(self.auth.is_authenticated())
 
     def test_login_success(self):
         """Test successful login process."""
-        # TODO: Mock successful login API response
-        # TODO: Test login with valid credentials
-        # TODO: Verify session cookie is stored
-        pass
+        self.assertTrue(self.auth.login("admin", "password", self.server.url))
+        self.assertTrue(self.auth.is_authenticated())
+        self.assertEqual(self.auth.session.cookies.get(SESSION_COOKIE), self.auth.session_id)
 
     def test_login_invalid_credentials(self):
         """Test login with invalid credentials."""
-        # TODO: Mock failed login API response
-        # TODO: Test login with invalid credentials
-        # TODO: Verify appropriate error handling
-        pass
+        self.assertFalse(self.auth.login("admin", "wrong", self.server.url))
+        self.assertFalse(self.auth.is_authenticated())
+        self.assertFalse(self.session_file.exists())
 
     def test_login_network_error(self):
         """Test login with network connectivity issues."""
-        # TODO: Mock network error
-        # TODO: Test error handling for network issues
-        # TODO: Verify appropriate exceptions are raised
-        pass
+        with patch.object(self.auth.session, "post",
+                          side_effect=requests.ConnectionError("unreachable")):
+            self.assertFalse(self.auth.login("admin", "password", self.server.url))
+        self.assertFalse(self.auth.is_authenticated())
 
     def test_logout_success(self):
         """Test successful logout process."""
-        # TODO: Setup authenticated state
-        # TODO: Mock logout API response
-        # TODO: Test logout functionality
-        # TODO: Verify session is cleared
-        pass
+        self.auth.login("admin", "password", self.server.url)
+        self.assertTrue(self.auth.logout())
+        self.assertFalse(self.auth.is_authenticated())
+        self.assertFalse(self.session_file.exists())
 
     def test_is_authenticated_check(self):
         """Test authentication status checking."""
-        # TODO: Test unauthenticated state
-        # TODO: Test authenticated state
-        # TODO: Verify authentication status is correct
-        pass
+        self.assertFalse(self.auth.is_authenticated())
+        self.auth.login("admin", "password", self.server.url)
+        self.assertTrue(self.auth.is_authenticated())
+        self.auth.expires_at = time.time() - 1
+        self.assertFalse(self.auth.is_authenticated())
 
     def test_session_cookie_handling(self):
         """Test session cookie management."""
-        # TODO: Test cookie storage
-        # TODO: Test cookie retrieval
-        # TODO: Test cookie clearing
-        pass
+        self.auth.login("admin", "password", self.server.url)
+        self.assertEqual(self.auth.cookies, {SESSION_COOKIE: self.auth.session_id})
+        self.assertEqual(len(self.auth.session.cookies), 1)
+        self.auth.logout()
+        self.assertEqual(self.auth.cookies, {})
+        self.assertEqual(len(self.auth.session.cookies), 0)
+
+    def test_cached_session_is_reused(self):
+        """Test a restart reuses the cached session without logging in."""
+        self.auth.login("admin", "password", self.server.url)
+        self.assertEqual(stat.S_IMODE(os.stat(self.session_file).st_mode), 0o600)
+        self.assertNotIn("password", self.session_file.read_text())
+
+        restarted = AuthManager(session_file=str(self.session_file))
+        self.assertTrue(restarted.login("admin", "password", self.server.url))
+        self.assertEqual(restarted.session_id, self.auth.session_id)
+        self.assertEqual(self._login_count(), 1)
+
+    def test_expired_cached_session_is_ignored(self):
+        """Test an expired cached session triggers a fresh login."""
+        short_lived = AuthManager(session_file=str(self.session_file), session_lifetime=0)
+        short_lived.login("admin", "password", self.server.url)
+
+        restarted = AuthManager(session_file=str(self.session_file))
+        self.assertTrue(restarted.login("admin", "password", self.server.url))
+        self.assertEqual(self._login_count(), 2)
+
+    def test_background_refresh_renews_session(self):
+        """Test the background refresh logs in again before expiry."""
+        auth = AuthManager(session_lifetime=2, refresh_margin=1)
+        auth.login("admin", "password", self.server.url)
+        first_session = auth.session_id
+
+        auth.start_auto_refresh()
+        try:
+            deadline = time.time() + 3
+            while auth.session_id == first_session and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            auth.stop_auto_refresh()
+
+        self.assertNotEqual(auth.session_id, first_session)
+        self.assertTrue(auth.is_authenticated())
+
+    def test_request_replayed_after_401(self):
+        """Test a request rejected with 401 is replayed after re-login."""
+        with UniFiVideoClient(self.server.url) as client:
+            client.login("admin", "password")
+            stale_session = client.session_id
+            self.server.expire_sessions()
+
+            cameras = client.get_cameras()
+
+        self.assertEqual(len(cameras), 2)
+        self.assertNotEqual(client.session_id, stale_session)
+        self.assertEqual(self._login_count(), 2)
+
+    def test_stale_401_does_not_login_twice(self):
+        """Test concurrent 401s for the same session trigger a single re-login."""
+        self.auth.login("admin", "password", self.server.url)
+        stale_session = self.auth.session_id
+
+        self.assertTrue(self.auth.reauthenticate(stale_session))
+        self.assertTrue(self.auth.reauthenticate(stale_session))
+        self.assertEqual(self._login_count(), 2)
 
     def tearDown(self):
         """Clean up after each test method."""
-        # TODO: Cleanup test resources
-        pass
+        self.auth.stop_auto_refresh()
+        self.server.stop()
+        self.temp_dir.cleanup()
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
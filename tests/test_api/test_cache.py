@@ -0,0 +1,117 @@
+"""
+Unit tests for the response cache.
+"""
+
+import threading
+import time
+import unittest
+
+from src.api.cache import CachedResponse, ResponseCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache."""
+
+    def setUp(self):
+        """Set up a cache with a fake clock."""
+        self.clock = FakeClock()
+        self.cache = ResponseCache(ttls={'camera': 10.0}, max_entries=3, max_bytes=100,
+                                   clock=self.clock)
+        self.loads = []
+
+    def load(self, body: bytes, etag=None):
+        def load(stale):
+            self.loads.append(stale)
+            return CachedResponse(body, etag=etag)
+        return load
+
+    def test_fresh_entries_are_reused(self):
+        """Test that entries are served until their TTL runs out."""
+        self.assertEqual(self.cache.get("/camera/a", 'camera', self.load(b"one")).body, b"one")
+        self.clock.now = 9.0
+        self.assertEqual(self.cache.get("/camera/a", 'camera', self.load(b"two")).body, b"one")
+        self.clock.now = 11.0
+        self.assertEqual(self.cache.get("/camera/a", 'camera', self.load(b"two")).body, b"two")
+        self.assertEqual(self.cache.stats.hits, 1)
+        self.assertEqual(self.cache.stats.misses, 2)
+
+    def test_expired_entry_is_revalidated(self):
+        """Test that the stale entry is handed to the loader and can be renewed."""
+        first = self.cache.get("/camera/a", 'camera', self.load(b"one", etag='"v1"'))
+        self.clock.now = 11.0
+
+        renewed = self.cache.get("/camera/a", 'camera', lambda stale: stale)
+        self.assertIs(renewed, first)
+        self.assertEqual(first.validators(), {'If-None-Match': '"v1"'})
+        self.assertEqual(renewed.expires, 21.0)
+        self.assertEqual(self.cache.stats.revalidated, 1)
+
+    def test_lru_eviction_by_count_and_bytes(self):
+        """Test that the least recently used entries go first."""
+        for key in "abc":
+            self.cache.get(key, 'camera', self.load(b"x" * 10))
+        self.cache.get("a", 'camera', self.load(b""))
+        self.cache.get("d", 'camera', self.load(b"x" * 10))
+        self.assertEqual(list(self.cache._entries), ["c", "a", "d"])
+
+        self.cache.get("e", 'camera', self.load(b"x" * 85))
+        self.assertEqual(list(self.cache._entries), ["d", "e"])
+        self.assertEqual(self.cache.total_bytes, 95)
+
+        self.cache.get("f", 'camera', self.load(b"x" * 101))
+        self.assertNotIn("f", self.cache._entries)
+
+    def test_concurrent_callers_share_one_load(self):
+        """Test single-flight loading."""
+        release = threading.Event()
+        calls = []
+
+        def slow_load(stale):
+            calls.append(stale)
+            release.wait(1.0)
+            return CachedResponse(b"shared")
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            self.cache.get("/camera/a", 'camera', slow_load))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([r.body for r in results], [b"shared"] * 5)
+        self.assertEqual(self.cache.stats.shared, 4)
+
+    def test_failed_load_is_not_cached(self):
+        """Test that errors reach the caller and the next call retries."""
+        def failing(stale):
+            raise OSError("down")
+
+        with self.assertRaises(OSError):
+            self.cache.get("/camera/a", 'camera', failing)
+        self.assertEqual(self.cache.get("/camera/a", 'camera', self.load(b"ok")).body, b"ok")
+
+    def test_invalidate(self):
+        """Test dropping entries by prefix."""
+        self.cache.get("/camera/a", 'camera', self.load(b"1"))
+        self.cache.get("/stream/a/0/url", 'camera', self.load(b"2"))
+        self.cache.invalidate("/camera/")
+        self.assertEqual(list(self.cache._entries), ["/stream/a/0/url"])
+        self.assertEqual(self.cache.total_bytes, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
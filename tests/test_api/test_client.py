@@ -5,10 +5,34 @@ This module contains unit tests for the API client functionality,
 including authentication, camera discovery, and API communication.
 """
 
+import json
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import Mock, patch
-# TODO: Import API client classes when implemented
-# from src.api.client import UniFiVideoClient
+from pathlib import Path
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from src.api.cache import ResponseCache
+from src.api.client import UniFiVideoClient, UniFiVideoAPIError, recording_slices
+from tests.fixtures.fake_server import FakeUniFiVideoServer, fake_recording
+from tests.fixtures.mock_responses import MockAPIResponses, TEST_URLS
+
+
+def _response(payload=None, status_code=200, cookies=None, content=b""):
+    """Build a mock HTTP response."""
+    body = json.dumps(payload).encode() if payload is not None else content
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.cookies = cookies or {}
+    response.content = body
+    response.headers = {"Content-Length": str(len(body))}
+    response.iter_content.side_effect = lambda size: (body[i:i + size]
+                                                      for i in range(0, len(body), size))
+    return response
 
 
 class TestUniFiVideoClient(unittest.TestCase):
@@ -16,49 +40,250 @@ class TestUniFiVideoClient(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures before each test method."""
-        # TODO: Initialize test client instance
-        # TODO: Setup mock responses
-        pass
+        self.client = UniFiVideoClient(TEST_URLS["SERVER_BASE"] + "/",
+                                       max_connections=3, timeout=5)
 
     def test_client_initialization(self):
         """Test client initialization with server URL."""
-        # TODO: Test client creation
-        # TODO: Verify server URL is stored correctly
-        pass
+        self.assertEqual(self.client.server_url, TEST_URLS["SERVER_BASE"])
+        self.assertIsNone(self.client.session_id)
+        adapter = self.client.session.get_adapter(TEST_URLS["SERVER_BASE"])
+        self.assertEqual(adapter._pool_maxsize, 3)
+        self.assertTrue(adapter._pool_block)
+        self.assertIs(self.client.auth.session, self.client.session)
 
     def test_authentication_success(self):
         """Test successful authentication."""
-        # TODO: Mock successful login response
-        # TODO: Test authentication process
-        # TODO: Verify session handling
-        pass
+        login = _response(MockAPIResponses.login_success(),
+                          cookies={"JSESSIONID_AV": "abc123"})
+        with patch.object(self.client.session, "post", return_value=login) as post:
+            self.assertTrue(self.client.login("admin", "secret"))
+
+        post.assert_called_once()
+        self.assertEqual(post.call_args[0][0], TEST_URLS["LOGIN"])
+        self.assertEqual(self.client.session_id, "abc123")
+        self.assertEqual(self.client.session.cookies.get("JSESSIONID_AV"), "abc123")
 
     def test_authentication_failure(self):
         """Test authentication failure handling."""
-        # TODO: Mock failed login response
-        # TODO: Test error handling
-        # TODO: Verify appropriate exceptions are raised
-        pass
+        login = _response(MockAPIResponses.login_failure(), status_code=401)
+        with patch.object(self.client.session, "post", return_value=login):
+            self.assertFalse(self.client.login("admin", "wrong"))
+        self.assertIsNone(self.client.session_id)
+
+        error = _response(MockAPIResponses.login_failure())
+        with patch.object(self.client.session, "request", return_value=error):
+            with self.assertRaises(UniFiVideoAPIError):
+                self.client.get_cameras()
 
     def test_camera_discovery(self):
         """Test camera discovery functionality."""
-        # TODO: Mock camera list API response
-        # TODO: Test camera discovery
-        # TODO: Verify camera data parsing
-        pass
+        listing = _response(MockAPIResponses.camera_list())
+        with patch.object(self.client.session, "request", return_value=listing) as request:
+            cameras = self.client.get_cameras()
+
+        self.assertEqual(request.call_args[0], ("GET", TEST_URLS["CAMERAS"]))
+        self.assertEqual(request.call_args[1]["timeout"], 5)
+        self.assertEqual([c.camera_id for c in cameras], ["camera001", "camera002"])
+        self.assertTrue(cameras[0].is_online)
+        self.assertEqual(len(cameras[0].streams), 2)
+        self.assertEqual(cameras[0].streams[1].width, 1280)
+
+    def test_large_listings_are_streamed(self):
+        """Test that listings above the threshold are parsed item by item."""
+        listing = _response(MockAPIResponses.camera_list())
+        listing.headers = {}
+        with patch.object(self.client.session, "request", return_value=listing), \
+                patch("src.api.client.STREAM_CHUNK_SIZE", 7):
+            cameras = self.client.get_cameras()
+
+        listing.json.assert_not_called()
+        self.assertEqual([c.camera_id for c in cameras], ["camera001", "camera002"])
+
+        error = _response({"meta": {"rc": "error", "msg": "denied"}, "data": []})
+        error.headers = {}
+        with patch.object(self.client.session, "request", return_value=error):
+            with self.assertRaisesRegex(UniFiVideoAPIError, "denied"):
+                self.client.get_cameras()
+
+    def test_cached_endpoints_revalidate(self):
+        """Test that cached camera details are revalidated with their ETag."""
+        client = UniFiVideoClient(TEST_URLS["SERVER_BASE"], cache=ResponseCache(ttls={'camera': 0}))
+        listing = _response(MockAPIResponses.camera_list())
+        listing.headers["ETag"] = '"v1"'
+        not_modified = _response(status_code=304)
+        try:
+            with patch.object(client.session, "request",
+                              side_effect=[listing, not_modified]) as request:
+                first = client.get_camera("camera001")
+                second = client.get_camera("camera001")
+        finally:
+            client.close()
+
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(request.call_args[1]["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(first.camera_id, second.camera_id)
+        self.assertEqual(client.cache.stats.revalidated, 1)
 
     def test_stream_url_retrieval(self):
         """Test stream URL retrieval for cameras."""
-        # TODO: Mock stream URL API response
-        # TODO: Test stream URL generation
-        # TODO: Verify URL format and parameters
-        pass
+        def fake_request(method, url, **kwargs):
+            camera_id = url.split("/stream/")[1].split("/")[0]
+            return _response(MockAPIResponses.stream_url(camera_id))
+
+        with patch.object(self.client.session, "request", side_effect=fake_request):
+            url = self.client.get_stream_url("camera001")
+        self.assertTrue(url.startswith("rtsp://"))
+        self.assertIn("camera001_0", url)
+
+    def test_batch_stream_urls_run_concurrently(self):
+        """Test batch stream URL resolution stays within the connection cap."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_request(method, url, **kwargs):
+            camera_id = url.split("/stream/")[1].split("/")[0]
+            with lock:
+                active.append(camera_id)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(camera_id)
+            if camera_id == "broken":
+                return _response(status_code=500)
+            return _response(MockAPIResponses.stream_url(camera_id))
+
+        camera_ids = [f"camera{i:03d}" for i in range(8)] + ["broken"]
+        with patch.object(self.client.session, "request", side_effect=fake_request):
+            urls = self.client.get_stream_urls(camera_ids)
+
+        self.assertEqual(set(urls), set(camera_ids))
+        self.assertIsNone(urls["broken"])
+        self.assertIn("camera007_0", urls["camera007"])
+        self.assertGreater(max(peak), 1)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_connections_are_reused(self):
+        """Test requests against a live server reuse pooled connections."""
+        with FakeUniFiVideoServer() as server:
+            with UniFiVideoClient(server.url, max_connections=2) as client:
+                self.assertTrue(client.login("admin", "password"))
+                client.get_server_info()
+                client.get_cameras()
+                urls = client.get_stream_urls([f"camera{i:03d}" for i in range(6)])
+                recordings = client.get_recordings(["camera001"], datetime.now() - timedelta(hours=2),
+                                                   datetime.now())
+
+            self.assertTrue(all(urls.values()))
+            self.assertEqual(len(recordings), 2)
+            self.assertEqual(len(server.requests), 10)
+            self.assertLessEqual(server.connection_count, 2)
+
+    def test_download_recording(self):
+        """Test that recordings are streamed to disk."""
+        with FakeUniFiVideoServer() as server, tempfile.TemporaryDirectory() as directory:
+            destination = Path(directory) / "rec.mp4"
+            with UniFiVideoClient(server.url) as client:
+                client.login("admin", "password")
+                written = client.download_recording("rec001", destination, chunk_size=4096)
+
+            self.assertEqual(destination.read_bytes(), fake_recording("rec001"))
+            self.assertEqual(written, len(fake_recording("rec001")))
+
+    def test_recording_pages_stream_in_parallel(self):
+        """Test that a long range is fetched in concurrent, paged slices."""
+        start = datetime(2024, 1, 1)
+        items = [{"_id": f"{camera_id}-{minute}", "cameraId": camera_id,
+                  "startTime": int((start + timedelta(minutes=minute)).timestamp() * 1000),
+                  "endTime": int((start + timedelta(minutes=minute + 5)).timestamp() * 1000)}
+                 for camera_id in ("camera001", "camera002")
+                 for minute in range(0, 2 * 24 * 60, 10)]
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def fake_request(method, url, **kwargs):
+            params = dict(kwargs["params"])
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.005)
+            with lock:
+                active[0] -= 1
+            page = [item for item in items
+                    if item["cameraId"] == params["cameras[]"]
+                    and params["startTime"] <= item["startTime"] <= params["endTime"]]
+            return _response({"meta": {"rc": "ok"}, "data": page[:params["limit"]]})
+
+        priority = start + timedelta(hours=30)
+        with patch.object(self.client.session, "request", side_effect=fake_request):
+            pages = list(self.client.iter_recording_pages(
+                ["camera001", "camera002"], start, start + timedelta(days=2),
+                priority=priority, page_size=20))
+
+        received = [item["_id"] for page in pages for item in page]
+        self.assertEqual(sorted(received), sorted(item["_id"] for item in items))
+        # Pages arrive in completion order; the priority slices are among the
+        # first batch of slices submitted, so their pages come early
+        priority_ms = (int(priority.timestamp() * 1000),
+                       int((priority + timedelta(hours=1)).timestamp() * 1000))
+        urgent = {item["_id"] for item in items
+                  if priority_ms[0] <= item["startTime"] < priority_ms[1]}
+        early = {item["_id"] for page in pages[:4] for item in page}
+        self.assertLessEqual(urgent, early)
+        self.assertGreater(peak[0], 1)
+        self.assertLessEqual(peak[0], 3)
+
+    def test_recording_pages_keep_shared_start_times(self):
+        """Test that recordings sharing a start time across pages are all returned."""
+        start = datetime(2024, 1, 1)
+        start_ms = int(start.timestamp() * 1000)
+        # 25 recordings (e.g. several streams) start at the same millisecond,
+        # more than a page holds, followed by a few later ones
+        items = [{"_id": f"same-{index}", "cameraId": "camera001",
+                  "startTime": start_ms + 60000, "endTime": start_ms + 120000}
+                 for index in range(25)]
+        items += [{"_id": f"later-{minute}", "cameraId": "camera001",
+                   "startTime": start_ms + minute * 60000,
+                   "endTime": start_ms + (minute + 1) * 60000}
+                  for minute in range(2, 8)]
+
+        def fake_request(method, url, **kwargs):
+            params = dict(kwargs["params"])
+            page = [item for item in items
+                    if params["startTime"] <= item["startTime"] <= params["endTime"]]
+            return _response({"meta": {"rc": "ok"}, "data": page[:params["limit"]]})
+
+        with patch.object(self.client.session, "request", side_effect=fake_request):
+            pages = list(self.client.iter_recording_pages(
+                ["camera001"], start, start + timedelta(hours=1), page_size=10))
+
+        received = [item["_id"] for page in pages for item in page]
+        self.assertEqual(len(received), len(set(received)))
+        self.assertEqual(set(received), {item["_id"] for item in items})
 
     def tearDown(self):
         """Clean up after each test method."""
-        # TODO: Cleanup test resources
-        pass
+        self.client.close()
+
+
+class TestRecordingSlices(unittest.TestCase):
+    """Test cases for recording_slices."""
+
+    def test_slices_start_at_priority(self):
+        """Test that slices cover the range, nearest to the priority first."""
+        start = datetime(2024, 1, 1)
+        slices = recording_slices(["a", "b"], start, start + timedelta(hours=30),
+                                  priority=start + timedelta(hours=20))
+
+        self.assertEqual(slices[:2], [("a", start + timedelta(hours=20), start + timedelta(hours=21)),
+                                      ("b", start + timedelta(hours=20), start + timedelta(hours=21))])
+        self.assertEqual(slices[2][1:], (start + timedelta(hours=21), start + timedelta(hours=30)))
+        self.assertEqual(slices[4][1:], (start + timedelta(hours=8), start + timedelta(hours=20)))
+        spans = sorted({(s, e) for _, s, e in slices})
+        self.assertEqual(spans[0][0], start)
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(spans, spans[1:])))
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
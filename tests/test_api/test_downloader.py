@@ -0,0 +1,146 @@
+"""
+Unit tests for resumable recording downloads.
+"""
+
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from src.api.client import UniFiVideoClient
+from src.api.downloader import DownloadManager, DownloadState
+from src.models.recording import Recording
+from tests.fixtures.fake_server import (
+    FAKE_RECORDING_SIZE, FakeUniFiVideoServer, fake_recording,
+)
+
+
+def _recording(recording_id: str, size=FAKE_RECORDING_SIZE) -> Recording:
+    return Recording(recording_id=recording_id, camera_id="camera001", camera_name="Front",
+                     start_time=datetime(2024, 1, 1, 12), end_time=datetime(2024, 1, 1, 13),
+                     file_size_bytes=size)
+
+
+class TestDownloadManager(unittest.TestCase):
+    """Test cases for the download manager against the fake server."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.server = FakeUniFiVideoServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.client = UniFiVideoClient(self.server.url, max_connections=4)
+        self.client.login("admin", "password")
+        self.addCleanup(self.client.close)
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.directory = Path(self.tempdir.name)
+        self.updates = []
+
+    def _manager(self, **kwargs):
+        manager = DownloadManager(self.client, chunk_size=4096, retry_delay=0.01,
+                                  on_progress=lambda p, a: self.updates.append((p, a)),
+                                  **kwargs)
+        self.addCleanup(manager.close)
+        return manager
+
+    def test_parallel_downloads_with_progress(self):
+        """Test that several recordings download and report aggregate progress."""
+        manager = self._manager(max_parallel=3)
+        futures = manager.submit_many([_recording(f"rec{i}") for i in range(3)], self.directory)
+
+        results = [future.result(timeout=5) for future in futures.values()]
+        self.assertTrue(all(r.state == DownloadState.COMPLETED for r in results))
+        for result in results:
+            self.assertEqual(result.destination.read_bytes(), fake_recording(result.recording_id))
+        self.assertEqual(results[0].destination.name, "camera001_20240101-120000_rec0.mp4")
+
+        aggregate = manager.get_aggregate_progress()
+        self.assertEqual((aggregate.files_total, aggregate.files_completed), (3, 3))
+        self.assertEqual(aggregate.fraction, 1.0)
+        fractions = [p.fraction for p, _ in self.updates if p.recording_id == "rec0"]
+        self.assertEqual(fractions, sorted(fractions))
+        self.assertFalse(list(self.directory.glob("*.part")))
+
+    def test_resume_after_interruption(self):
+        """Test that a dropped transfer resumes with a Range request."""
+        self.server.interrupt_next_download(10000)
+        manager = self._manager()
+        result = manager.submit(_recording("rec1"), self.directory / "rec1.mp4").result(timeout=5)
+
+        self.assertEqual(result.state, DownloadState.COMPLETED)
+        self.assertEqual(result.resumed, 1)
+        self.assertEqual((self.directory / "rec1.mp4").read_bytes(), fake_recording("rec1"))
+
+    def test_existing_partial_file_is_resumed(self):
+        """Test that a partial file left by an earlier run is continued."""
+        (self.directory / "rec1.mp4.part").write_bytes(fake_recording("rec1")[:5000])
+        manager = self._manager()
+        result = manager.submit(_recording("rec1"), self.directory / "rec1.mp4").result(timeout=5)
+
+        self.assertEqual(result.state, DownloadState.COMPLETED)
+        self.assertEqual((self.directory / "rec1.mp4").read_bytes(), fake_recording("rec1"))
+        self.assertIn(5000, [p.bytes_done for p, _ in self.updates])
+
+    def test_size_mismatch_fails(self):
+        """Test that a file not matching file_size_bytes is rejected."""
+        manager = self._manager(max_retries=1)
+        result = manager.submit(_recording("rec1", size=1234),
+                                self.directory / "rec1.mp4").result(timeout=5)
+
+        self.assertEqual(result.state, DownloadState.FAILED)
+        self.assertIn("expected 1234", result.error)
+        self.assertFalse((self.directory / "rec1.mp4").exists())
+
+    def test_cancel_then_resume(self):
+        """Test that downloads submitted after cancel_all run and resume the partial file."""
+        manager = self._manager(bandwidth_limit=16 * 1024)
+        future = manager.submit(_recording("rec1"), self.directory / "rec1.mp4")
+        deadline = time.monotonic() + 5
+        while manager.get_progress("rec1").bytes_done == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        manager.cancel_all()
+
+        cancelled = future.result(timeout=5)
+        self.assertEqual(cancelled.state, DownloadState.CANCELLED)
+        self.assertTrue((self.directory / "rec1.mp4.part").exists())
+
+        manager.set_bandwidth_limit(0)
+        result = manager.submit(_recording("rec1"), self.directory / "rec1.mp4").result(timeout=5)
+        self.assertEqual(result.state, DownloadState.COMPLETED)
+        self.assertEqual(result.resumed, 1)
+        self.assertEqual((self.directory / "rec1.mp4").read_bytes(), fake_recording("rec1"))
+
+    def test_cancel_without_bandwidth_cap(self):
+        """Test that cancel_all stops a running download when bandwidth is unlimited."""
+        manager = None
+
+        def cancel_after_first_chunk(progress, aggregate):
+            if progress.bytes_done:
+                manager.cancel_all()
+
+        manager = DownloadManager(self.client, chunk_size=4096, retry_delay=0.01,
+                                  on_progress=cancel_after_first_chunk)
+        self.addCleanup(manager.close)
+        result = manager.submit(_recording("rec1"), self.directory / "rec1.mp4").result(timeout=5)
+
+        self.assertEqual(result.state, DownloadState.CANCELLED)
+        self.assertEqual(result.bytes_done, 4096)
+        self.assertFalse((self.directory / "rec1.mp4").exists())
+        self.assertEqual((self.directory / "rec1.mp4.part").stat().st_size, 4096)
+
+    def test_bandwidth_cap(self):
+        """Test that the combined transfer rate stays under the cap."""
+        manager = self._manager(max_parallel=2, bandwidth_limit=48 * 1024)
+        started = time.monotonic()
+        futures = manager.submit_many([_recording("rec1"), _recording("rec2")], self.directory)
+        for future in futures.values():
+            future.result(timeout=10)
+
+        # 128 KiB at 48 KiB/s after a one-second burst takes about 1.7 s
+        self.assertGreater(time.monotonic() - started, 1.4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Unit tests for incremental envelope parsing.
+"""
+
+import json
+import unittest
+
+from src.api.json_stream import ITEM, iter_envelope
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterEnvelope(unittest.TestCase):
+    """Test cases for iter_envelope."""
+
+    def test_matches_full_parse_for_any_chunk_size(self):
+        """Test that chunk boundaries inside tokens do not change the result."""
+        document = {
+            "meta": {"rc": "ok", "totalCount": 3},
+            "data": [{"_id": "a", "name": "Vorgarten ö [1]", "size": 1234567},
+                     {"_id": "b", "tags": [], "nested": {"x": [1, 2.5, None]}},
+                     {"_id": "c", "text": "quote \" and \\\\ }"}],
+            "count": 12345,
+        }
+        body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+        for size in (1, 2, 3, 7, 64, len(body)):
+            with self.subTest(size=size):
+                fields = list(iter_envelope(chunked(body, size)))
+                self.assertEqual([value for name, value in fields if name == ITEM],
+                                 document["data"])
+                self.assertEqual(dict((name, value) for name, value in fields if name != ITEM),
+                                 {"meta": document["meta"], "count": 12345})
+
+    def test_empty_documents(self):
+        """Test empty objects and arrays."""
+        self.assertEqual(list(iter_envelope([b"{}"])), [])
+        self.assertEqual(list(iter_envelope([b'{"data": [ ]}'])), [])
+        self.assertEqual(list(iter_envelope([b'{"data": null}'])), [("data", None)])
+
+    def test_malformed_documents(self):
+        """Test that broken bodies raise ValueError."""
+        for body in (b"", b"[1, 2]", b'{"data": [{"a": 1}', b'{"data": [1 2]}', b'{"a": 1} x'):
+            with self.subTest(body=body):
+                with self.assertRaises(ValueError):
+                    list(iter_envelope(chunked(body, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
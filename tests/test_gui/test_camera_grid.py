@@ -0,0 +1,127 @@
+"""
+Unit tests for the camera grid.
+"""
+
+import copy
+import unittest
+from unittest.mock import MagicMock, Mock
+
+from src.gui.camera_grid import CAMERA_EVENT, CameraGrid
+from src.models.camera_registry import CameraRegistry
+from src.video.stream_manager import SuspendMode
+from tests.fixtures.mock_responses import MockAPIResponses
+
+
+class TestCameraGridSync(unittest.TestCase):
+    """Test cases for applying camera registry events to the grid."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.items = MockAPIResponses.camera_list()["data"]
+        self.registry = CameraRegistry()
+        self.registry.sync(self.items)
+
+        self.stream_manager = Mock()
+        self.grid = CameraGrid(parent=MagicMock(), stream_manager=self.stream_manager)
+        self.grid.setup_grid(2, 2)
+        for camera_id, camera in self.registry.cameras.items():
+            self.grid.add_camera_stream(camera_id, f"rtsp://{camera_id}", camera=camera)
+        self.stream_manager.reset_mock()
+
+    def _sync(self, items):
+        """Sync a listing and feed the events through the window event handler."""
+        for event in self.registry.sync(items):
+            self.assertTrue(self.grid.handle_event(CAMERA_EVENT, {CAMERA_EVENT: event}))
+
+    def test_offline_camera_stops_only_its_tile(self):
+        """Test that a disconnect touches only the affected tile."""
+        items = copy.deepcopy(self.items)
+        items[0]["state"] = "DISCONNECTED"
+
+        self._sync(items)
+
+        self.stream_manager.remove_stream.assert_called_once_with("camera001")
+        self.stream_manager.add_stream.assert_not_called()
+
+    def test_camera_back_online_restarts_tile(self):
+        """Test that a reconnected camera resumes streaming."""
+        items = copy.deepcopy(self.items)
+        items[0]["state"] = "DISCONNECTED"
+        self._sync(items)
+        self.stream_manager.reset_mock()
+
+        self._sync(self.items)
+
+        self.stream_manager.add_stream.assert_called_once()
+        self.assertEqual(self.stream_manager.add_stream.call_args[0][0], "camera001")
+
+    def test_rename_leaves_streams_alone(self):
+        """Test that cosmetic changes do not restart streams."""
+        items = copy.deepcopy(self.items)
+        items[1]["name"] = "Garden"
+
+        self._sync(items)
+
+        self.stream_manager.remove_stream.assert_not_called()
+        self.stream_manager.add_stream.assert_not_called()
+        self.assertEqual(self.grid.get_tile("camera002").camera.name, "Garden")
+
+    def test_removed_camera_leaves_grid(self):
+        """Test that a camera removed from the NVR is removed from the grid."""
+        self._sync(self.items[1:])
+
+        self.assertIsNone(self.grid.get_tile("camera001"))
+        self.assertEqual(self.grid.get_tile("camera002").key, CameraGrid._tile_key(0))
+        self.stream_manager.remove_stream.assert_called_once_with("camera001")
+
+    def test_post_camera_event_uses_window_queue(self):
+        """Test that worker-thread events are marshalled through the window."""
+        event = self.registry.sync(self.items[1:])[0]
+
+        self.grid.post_camera_event(event)
+
+        self.grid.parent.write_event_value.assert_called_once_with(CAMERA_EVENT, event)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+class TestCameraGridSuspension(unittest.TestCase):
+    """Test cases for suspending tiles nobody can see."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.stream_manager = Mock()
+        self.grid = CameraGrid(parent=MagicMock(), stream_manager=self.stream_manager,
+                               suspend_mode=SuspendMode.RELEASE)
+        self.grid.setup_grid(2, 2)
+        for camera_id in ("camera001", "camera002", "camera003"):
+            self.grid.add_camera_stream(camera_id, f"rtsp://{camera_id}")
+
+    def _suspended(self):
+        """Get the cameras suspended in the stream manager."""
+        return {call[0][0] for call in self.stream_manager.suspend_stream.call_args_list}
+
+    def test_zoom_suspends_covered_tiles(self):
+        """Test that the zoom view suspends every other tile and leaving it resumes them."""
+        self.grid.set_zoomed_camera("camera002")
+
+        self.assertEqual(self._suspended(), {"camera001", "camera003"})
+        self.stream_manager.suspend_stream.assert_called_with("camera003", SuspendMode.RELEASE)
+
+        self.grid.set_zoomed_camera(None)
+        resumed = {call[0][0] for call in self.stream_manager.resume_stream.call_args_list}
+        self.assertEqual(resumed, {"camera001", "camera003"})
+
+    def test_minimize_suspends_all_tiles_once(self):
+        """Test that minimizing suspends each tile once, even if it was hidden already."""
+        self.grid.set_tile_visible("camera001", False)
+        self.grid.set_minimized(True)
+        self.grid.set_tile_visible("camera002", False)
+
+        self.assertEqual(self.stream_manager.suspend_stream.call_count, 3)
+
+        self.grid.set_minimized(False)
+        resumed = {call[0][0] for call in self.stream_manager.resume_stream.call_args_list}
+        self.assertEqual(resumed, {"camera003"})
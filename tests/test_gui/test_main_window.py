@@ -0,0 +1,94 @@
+"""
+Unit tests for the main window read loop.
+"""
+
+import copy
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import FreeSimpleGUI as sg
+
+from src.gui.main_window import MainWindow
+from src.gui.worker import BackgroundWorker
+from tests.fixtures.mock_responses import MockAPIResponses
+
+
+class TestMainWindowTick(unittest.TestCase):
+    """Test cases for the periodic work of the read loop."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.stream_manager = Mock()
+        self.stream_manager.quality.change_cooldown = 5.0
+        self.worker = BackgroundWorker(Mock(), max_workers=2)
+        self.main_window = MainWindow(stream_manager=self.stream_manager, worker=self.worker)
+
+    def _tick(self, now: float):
+        """Feed one read timeout to the window at a monotonic time."""
+        with patch("src.gui.camera_grid.time") as clock:
+            clock.monotonic.return_value = now
+            self.main_window.handle_event(sg.TIMEOUT_EVENT, {})
+
+    def test_quality_updates_follow_the_cooldown(self):
+        """Test that read timeouts adapt stream quality on the worker, throttled."""
+        threads = []
+        self.stream_manager.update_quality.side_effect = (
+            lambda: threads.append(threading.current_thread().name))
+        for now in (100.0, 100.1, 102.0, 104.9, 105.0, 107.0, 110.0):
+            self._tick(now)
+        # Closing drains the queued updates
+        self.main_window.close()
+
+        self.assertEqual(self.stream_manager.update_quality.call_count, 3)
+        self.assertTrue(all(name.startswith("gui-worker") for name in threads))
+
+    def test_no_quality_updates_without_streams(self):
+        """Test that grids without a stream manager skip quality updates."""
+        self.main_window.camera_grid.stream_manager = None
+        self._tick(100.0)
+        self.main_window.close()
+
+        self.stream_manager.update_quality.assert_not_called()
+
+
+
+class TestMainWindowCameraList(unittest.TestCase):
+    """Test cases for the camera list refresh."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.items = MockAPIResponses.camera_list()["data"]
+        self.client = Mock()
+        self.client.get_camera_data.return_value = self.items
+        self.worker = BackgroundWorker(Mock(), max_workers=2)
+        self.main_window = MainWindow(client=self.client, worker=self.worker)
+        self.addCleanup(self.main_window.close)
+
+    def _refresh(self):
+        """Refresh the camera list and deliver the result as the read loop would."""
+        self.main_window.refresh_cameras()
+        deadline = time.monotonic() + 5
+        while not self.worker.process_results() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_refresh_hands_the_gui_a_snapshot(self):
+        """Test that the GUI reads the cameras from the refresh result."""
+        self._refresh()
+        self.assertEqual(self.main_window._camera_order, ["camera002", "camera001"])
+        self.assertEqual(self.main_window._label("camera001"), "Front Door Camera (camera001)")
+
+        # A sync on another thread does not show up before its refresh result
+        items = copy.deepcopy(self.items)
+        items[0]["name"] = "Garden"
+        self.main_window.registry.sync(items)
+        self.assertEqual(self.main_window._label("camera001"), "Front Door Camera (camera001)")
+
+        self.client.get_camera_data.return_value = items
+        self._refresh()
+        self.assertEqual(self.main_window._label("camera001"), "Garden (camera001)")
+
+
+if __name__ == '__main__':
+    unittest.main()
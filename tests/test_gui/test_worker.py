@@ -0,0 +1,117 @@
+"""
+Unit tests for the GUI background worker.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from src.gui.worker import WORKER_EVENT, BackgroundWorker
+
+
+class TestBackgroundWorker(unittest.TestCase):
+    """Test cases for BackgroundWorker."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.window = Mock()
+        self.worker = BackgroundWorker(self.window, max_workers=4)
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.worker.shutdown()
+
+    def test_result_delivered_on_calling_thread(self):
+        """Test that callbacks run from process_results, not the pool."""
+        threads = []
+        on_result = Mock(side_effect=lambda result: threads.append(threading.get_ident()))
+
+        future = self.worker.submit(lambda x: x * 2, 21, on_result=on_result)
+        self.assertEqual(future.result(timeout=2), 42)
+        on_result.assert_not_called()
+        self.window.write_event_value.assert_called_with(WORKER_EVENT, None)
+
+        self.assertTrue(self.worker.handle_event(WORKER_EVENT, {WORKER_EVENT: None}))
+        on_result.assert_called_once_with(42)
+        self.assertEqual(threads, [threading.get_ident()])
+
+    def test_errors_go_to_on_error(self):
+        """Test that exceptions are handed to the error callback."""
+        on_error = Mock()
+
+        future = self.worker.submit(Mock(side_effect=ValueError("bad")), on_error=on_error)
+        with self.assertRaises(ValueError):
+            future.result(timeout=2)
+        self.worker.process_results()
+
+        self.assertIsInstance(on_error.call_args[0][0], ValueError)
+
+    def test_cancel_drops_queued_and_running_work(self):
+        """Test that cancelling a group skips queued tasks and drops results."""
+        started, release = threading.Event(), threading.Event()
+        on_result = Mock()
+        running = self.worker.submit(lambda: (started.set(), release.wait(2)),
+                                     group="selection", serial=True, on_result=on_result)
+        queued_func = Mock()
+        queued = self.worker.submit(queued_func, group="selection", serial=True)
+
+        started.wait(2)
+        self.worker.cancel("selection")
+        release.set()
+        running.result(timeout=2)
+        time.sleep(0.05)
+        self.worker.process_results()
+
+        self.assertTrue(queued.cancelled())
+        queued_func.assert_not_called()
+        on_result.assert_not_called()
+
+    def test_serial_group_keeps_order(self):
+        """Test that serial tasks of one group run in submission order."""
+        order = []
+        futures = [self.worker.submit(lambda i=i: (time.sleep(0.01 * (3 - i)), order.append(i)),
+                                      group="tile:camera001", serial=True)
+                   for i in range(3)]
+        for future in futures:
+            future.result(timeout=2)
+
+        self.assertEqual(order, [0, 1, 2])
+
+    def test_cancel_event_passed_to_long_tasks(self):
+        """Test that long tasks can observe cancellation."""
+        started = threading.Event()
+
+        def long_task(cancel_event):
+            started.set()
+            return cancel_event.wait(2)
+
+        future = self.worker.submit(long_task, group="camera-list", pass_cancel_event=True)
+        started.wait(2)
+        self.worker.cancel("camera-list")
+
+        self.assertTrue(future.result(timeout=2))
+
+    def test_shutdown_drains_queued_serial_tasks(self):
+        """Test that draining runs serial tasks queued behind busy workers."""
+        worker = BackgroundWorker(self.window, max_workers=2)
+        stopped = []
+        for index in range(6):
+            worker.submit(lambda index=index: (time.sleep(0.02), stopped.append(index)),
+                          group=f"tile:camera{index}", serial=True)
+        worker.shutdown(drain=True, timeout=5)
+
+        self.assertEqual(sorted(stopped), list(range(6)))
+        with self.assertRaises(RuntimeError):
+            worker.submit(Mock())
+
+    def test_submit_after_shutdown(self):
+        """Test that a shut down worker refuses new work."""
+        self.worker.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            self.worker.submit(Mock())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+"""Model test package for camera live view application."""
@@ -0,0 +1,39 @@
+"""
+Unit tests for the camera model.
+"""
+
+import unittest
+
+from src.models.camera import Camera, CameraState
+from tests.fixtures.mock_responses import MockAPIResponses
+
+
+class TestCamera(unittest.TestCase):
+    """Test cases for the Camera model."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.camera = Camera.from_api_response(MockAPIResponses.camera_list()["data"][0])
+
+    def test_slotted_instances(self):
+        """Test that cameras carry no __dict__ and get fresh containers."""
+        other = Camera("c2", "Back", "", "", "", "", 0, CameraState.OFFLINE, False,
+                       streams=None)
+
+        self.assertFalse(hasattr(self.camera, '__dict__'))
+        self.assertFalse(hasattr(self.camera.streams[0], '__dict__'))
+        self.assertEqual((other.streams, other.properties), ([], {}))
+
+    def test_to_dict(self):
+        """Test dictionary conversion."""
+        data = self.camera.to_dict()
+
+        self.assertEqual(data['camera_id'], self.camera.camera_id)
+        self.assertEqual(data['state'], self.camera.state.value)
+        self.assertEqual(data['recording_mode'], self.camera.recording_mode.value)
+        self.assertEqual(data['streams'][0]['width'], self.camera.streams[0].width)
+        self.assertEqual(len(data['streams']), len(self.camera.streams))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Unit tests for the incrementally synchronized camera registry.
+"""
+
+import copy
+import unittest
+from unittest.mock import Mock
+
+from src.models.camera import CameraState
+from src.models.camera_registry import CameraEventKind, CameraRegistry
+from tests.fixtures.mock_responses import MockAPIResponses
+
+
+class TestCameraRegistry(unittest.TestCase):
+    """Test cases for CameraRegistry."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.items = MockAPIResponses.camera_list()["data"]
+        self.registry = CameraRegistry()
+        self.listener = Mock()
+        self.registry.add_listener(self.listener)
+
+    def test_initial_sync_adds_cameras(self):
+        """Test that the first listing reports every camera as added."""
+        events = self.registry.sync(self.items)
+
+        self.assertEqual([(e.kind, e.camera_id) for e in events],
+                         [(CameraEventKind.ADDED, "camera001"),
+                          (CameraEventKind.ADDED, "camera002")])
+        self.assertEqual(self.listener.call_count, 2)
+        self.assertEqual(self.registry.get("camera001").name, "Front Door Camera")
+
+    def test_unchanged_listing_emits_nothing(self):
+        """Test that an identical listing produces no events."""
+        self.registry.sync(self.items)
+        self.listener.reset_mock()
+
+        self.assertEqual(self.registry.sync(copy.deepcopy(self.items)), [])
+        self.listener.assert_not_called()
+
+    def test_state_change_updates_camera_in_place(self):
+        """Test that a disconnect is applied to the existing camera object."""
+        self.registry.sync(self.items)
+        camera = self.registry.get("camera001")
+        items = copy.deepcopy(self.items)
+        items[0]["state"] = "DISCONNECTED"
+
+        events = self.registry.sync(items)
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].kind, CameraEventKind.CHANGED)
+        self.assertIs(events[0].camera, camera)
+        self.assertEqual(events[0].changed_fields, {"state", "is_connected"})
+        self.assertEqual(camera.state, CameraState.OFFLINE)
+        self.assertFalse(camera.is_connected)
+
+    def test_last_seen_alone_is_quiet(self):
+        """Test that heartbeat fields are updated without an event."""
+        self.registry.sync(self.items)
+        items = copy.deepcopy(self.items)
+        items[1]["lastSeen"] += 60
+
+        self.assertEqual(self.registry.sync(items), [])
+        self.assertEqual(self.registry.get("camera002").last_seen, str(items[1]["lastSeen"]))
+
+    def test_removed_camera(self):
+        """Test that a camera missing from the listing is removed."""
+        self.registry.sync(self.items)
+
+        events = self.registry.sync(self.items[1:])
+
+        self.assertEqual([(e.kind, e.camera_id) for e in events],
+                         [(CameraEventKind.REMOVED, "camera001")])
+        self.assertIsNone(self.registry.get("camera001"))
+
+    def test_snapshot_is_unaffected_by_later_syncs(self):
+        """Test that a snapshot keeps the values it was taken with."""
+        self.registry.sync(self.items)
+        snapshot = self.registry.snapshot()
+        state = snapshot["camera001"].state
+        items = copy.deepcopy(self.items)
+        items[0]["name"] = "Garden"
+        items[0]["state"] = "DISCONNECTED"
+
+        self.registry.sync(items)
+
+        self.assertEqual(set(snapshot), {"camera001", "camera002"})
+        self.assertIsNot(snapshot["camera001"], self.registry.get("camera001"))
+        self.assertEqual(snapshot["camera001"].name, "Front Door Camera")
+        self.assertEqual(snapshot["camera001"].state, state)
+        self.assertEqual(self.registry.get("camera001").state, CameraState.OFFLINE)
+        self.assertNotEqual(state, CameraState.OFFLINE)
+        self.assertEqual(self.registry.get("camera001").name, "Garden")
+
+    def test_failing_listener_does_not_stop_sync(self):
+        """Test that a listener error is contained."""
+        self.registry.add_listener(Mock(side_effect=RuntimeError("boom")))
+
+        events = self.registry.sync(self.items)
+
+        self.assertEqual(len(events), 2)
+        self.assertEqual(self.listener.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Unit tests for the local metadata index.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.models.metadata_store import MetadataStore
+from src.models.timeline import TimelineEvent, TimelineEventType
+from tests.fixtures.mock_responses import MockAPIResponses
+
+BASE = datetime(2024, 1, 10, 12, 0, 0)
+
+
+def at(minutes: float) -> datetime:
+    return BASE + timedelta(minutes=minutes)
+
+
+def recording(recording_id: str, camera_id: str, start: float, end: float = None,
+              recording_type: str = "motion"):
+    item = {"_id": recording_id, "cameraId": camera_id, "type": recording_type,
+            "startTime": int(at(start).timestamp() * 1000), "motionScore": 50}
+    if end is None:
+        item["inProgress"] = True
+    else:
+        item["endTime"] = int(at(end).timestamp() * 1000)
+    return item
+
+
+class FakeClient:
+    """API client double serving a fixed recording listing."""
+
+    def __init__(self, items):
+        self.items = items
+        self.queries = []
+
+    def get_recording_data(self, camera_ids, start_time, end_time):
+        self.queries.append((sorted(camera_ids), start_time))
+        start_ms = int(start_time.timestamp() * 1000)
+        return [item for item in self.items
+                if item["cameraId"] in camera_ids and item["startTime"] >= start_ms]
+
+
+class TestMetadataStore(unittest.TestCase):
+    """Test cases for MetadataStore."""
+
+    def setUp(self):
+        """Set up a store with two cameras."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "metadata.db"
+        self.store = MetadataStore(self.path)
+        self.store.put_recordings([
+            recording("a1", "cam1", 0, 10),
+            recording("a2", "cam1", 20, 30, "continuous"),
+            recording("a3", "cam1", 40),
+            recording("b1", "cam2", 5, 15),
+        ])
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_range_query(self):
+        """Test that recordings overlapping the range are returned in order."""
+        recordings = self.store.get_recordings(["cam1", "cam2"], at(8), at(25))
+        self.assertEqual([r.recording_id for r in recordings], ["a1", "b1", "a2"])
+        self.assertEqual(self.store.get_recording_set(["cam2"], at(20), at(50)).get_ids(), [])
+
+    def test_motion_events_are_derived(self):
+        """Test that motion recordings become timeline events."""
+        events = self.store.get_events("cam1", at(0), at(60))
+        self.assertEqual([e.timestamp for e in events], [at(0), at(40)])
+        self.assertEqual(events[0].duration_seconds, 600)
+        self.assertEqual(events[0].metadata["motion_score"], 50)
+
+        self.store.put_events("cam1", [TimelineEvent(at(25), TimelineEventType.BOOKMARK)])
+        self.assertEqual(len(self.store.get_events("cam1", at(0), at(60))), 3)
+
+    def test_store_persists(self):
+        """Test that a reopened store keeps its data."""
+        self.store.put_cameras(MockAPIResponses.camera_list()["data"])
+        self.store.close()
+
+        self.store = MetadataStore(self.path)
+        self.assertEqual(len(self.store.get_cameras()), 2)
+        self.assertEqual(len(self.store.get_recording_data(["cam1"], at(0), at(60))), 3)
+
+    def test_incremental_sync(self):
+        """Test that sync resumes at the recording still in progress."""
+        self.assertEqual(self.store.sync_point("cam1"), at(40))
+        self.assertEqual(self.store.sync_point("cam2"), at(5))
+        self.assertIsNone(self.store.sync_point("cam3"))
+
+        finished = recording("a3", "cam1", 40, 50)
+        client = FakeClient([finished, recording("a4", "cam1", 55, 58),
+                             recording("c1", "cam3", -60, -50)])
+        fetched = self.store.sync_recordings(client, ["cam1", "cam2", "cam3"],
+                                             retention_start=at(-120), end_time=at(60))
+
+        self.assertEqual(client.queries, [(["cam3"], at(-120)), (["cam1", "cam2"], at(5))])
+        self.assertEqual(fetched, 3)
+        self.assertEqual(self.store.sync_point("cam1"), at(55))
+
+    def test_purge(self):
+        """Test that recordings past retention are removed."""
+        self.store.purge(at(12))
+        ids = [r.recording_id for r in self.store.get_recordings(["cam1", "cam2"], at(-60),
+                                                                  at(60))]
+        self.assertEqual(ids, ["b1", "a2", "a3"])
+
+
+if __name__ == '__main__':
+    unittest.main()
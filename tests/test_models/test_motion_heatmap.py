@@ -0,0 +1,62 @@
+"""
+Unit tests for the motion heatmap.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from src.models.motion_heatmap import MotionHeatmap, MotionResolution
+
+BASE = datetime(2024, 1, 1, 0, 0, 0)
+
+
+def at(minutes: float) -> datetime:
+    return BASE + timedelta(minutes=minutes)
+
+
+class TestMotionHeatmap(unittest.TestCase):
+    """Test cases for MotionHeatmap."""
+
+    def setUp(self):
+        """Set up events on two days."""
+        self.heatmap = MotionHeatmap()
+        for minute, score in [(0.5, 10), (0.9, 40), (61, 20), (24 * 60 + 5, 90), (30, None)]:
+            self.heatmap.add(at(minute), score)
+
+    def test_buckets_at_every_resolution(self):
+        """Test counts and peaks per minute, hour and day."""
+        minutes = self.heatmap.density(at(0), at(2), MotionResolution.MINUTE)
+        self.assertEqual(minutes.counts.tolist(), [2, 0, 0])
+        self.assertEqual(minutes.max_scores[0], 40)
+
+        hours = self.heatmap.density(at(0), at(119), MotionResolution.HOUR)
+        self.assertEqual(hours.counts.tolist(), [3, 1])
+
+        days = self.heatmap.density(at(0), at(2 * 24 * 60 - 1), MotionResolution.DAY)
+        self.assertEqual(days.counts.tolist(), [4, 1])
+        self.assertEqual(days.max_scores.tolist(), [40, 90])
+        self.assertEqual(days.end_time, at(2 * 24 * 60))
+
+    def test_resolution_follows_range(self):
+        """Test that long ranges use coarse buckets."""
+        self.assertEqual(self.heatmap.resolution_for(at(0), at(60)), MotionResolution.MINUTE)
+        self.assertEqual(self.heatmap.resolution_for(at(0), at(30 * 24 * 60)),
+                         MotionResolution.HOUR)
+        self.assertEqual(self.heatmap.resolution_for(at(0), at(30 * 24 * 60), max_buckets=100),
+                         MotionResolution.DAY)
+
+    def test_summary(self):
+        """Test range totals assembled from mixed resolutions."""
+        self.assertEqual(self.heatmap.summary(), (5, 90))
+        self.assertEqual(self.heatmap.summary(at(0), at(3 * 24 * 60)), (5, 90))
+        self.assertEqual(self.heatmap.summary(at(1), at(24 * 60)), (2, 20))
+
+    def test_clear(self):
+        """Test that clear empties every resolution."""
+        self.heatmap.clear()
+        self.assertEqual(self.heatmap.summary(), (0, 0.0))
+        self.assertEqual(self.heatmap.density(at(0), at(1)).counts.sum(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for the multi-camera timeline.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from src.models.multi_timeline import MultiTimeline
+from src.models.timeline import Timeline, TimelineSegment
+
+BASE = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def at(minutes: float) -> datetime:
+    return BASE + timedelta(minutes=minutes)
+
+
+def timeline(camera_id, *spans):
+    result = Timeline(camera_id)
+    result.add_segments(TimelineSegment(at(start), at(end), f"{camera_id}-{start}", camera_id)
+                        for start, end in spans)
+    return result
+
+
+class TestMultiTimeline(unittest.TestCase):
+    """Test cases for merged coverage across cameras."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.front = timeline("front", (0, 10), (40, 50))
+        self.back = timeline("back", (5, 20), (20, 25), (60, 70))
+        self.multi = MultiTimeline([self.front, self.back])
+
+    def test_coverage_merges_cameras(self):
+        """Test that overlapping and touching spans merge across cameras."""
+        self.assertEqual(self.multi.coverage,
+                         [(at(0), at(25)), (at(40), at(50)), (at(60), at(70))])
+        self.assertEqual((self.multi.start_time, self.multi.end_time), (at(0), at(70)))
+
+    def test_next_covered_time_skips_gaps(self):
+        """Test that gaps with no footage anywhere are skipped in one step."""
+        self.assertEqual(self.multi.next_covered_time(at(12)), at(12))
+        self.assertEqual(self.multi.next_covered_time(at(30)), at(40))
+        self.assertEqual(self.multi.next_covered_time(at(-5)), at(0))
+        self.assertIsNone(self.multi.next_covered_time(at(71)))
+        self.assertFalse(self.multi.has_footage_at(at(55)))
+
+    def test_segments_at(self):
+        """Test per-camera segment lookup."""
+        self.assertEqual(set(self.multi.get_segments_at(at(7))), {"front", "back"})
+        self.assertEqual(set(self.multi.get_segments_at(at(45))), {"front"})
+
+    def test_coverage_follows_timeline_changes(self):
+        """Test that coverage is rebuilt after timelines change."""
+        self.assertFalse(self.multi.has_footage_at(at(30)))
+        self.front.add_segment(TimelineSegment(at(28), at(35), "late", "front"))
+        self.assertTrue(self.multi.has_footage_at(at(30)))
+
+        self.multi.remove_timeline("back")
+        self.assertEqual(self.multi.end_time, at(50))
+
+
+    def test_add_recording_data(self):
+        """Test that recording pages extend existing timelines and create new ones."""
+        def item(recording_id, camera_id, start, end=None):
+            data = {"_id": recording_id, "cameraId": camera_id, "type": "motion",
+                    "startTime": int(at(start).timestamp() * 1000)}
+            if end is not None:
+                data["endTime"] = int(at(end).timestamp() * 1000)
+            return data
+
+        added = self.multi.add_recording_data([item("f3", "front", 80, 90),
+                                               item("s1", "side", 0, 5),
+                                               item("s2", "side", 100)])
+
+        self.assertEqual(added, 3)
+        self.assertEqual(self.front.get_segment_at_time(at(85)).recording_id, "f3")
+        side = self.multi.timelines["side"]
+        self.assertTrue(side.segments[0].has_motion)
+        self.assertGreater(side.segments[-1].end_time, at(100))
+        self.assertEqual(self.multi.end_time, side.segments[-1].end_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Unit tests for the columnar recording store.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.models.recording import Recording, RecordingStatus, RecordingType
+from src.models.recording_set import RecordingSet
+from tests.fixtures.mock_responses import MockAPIResponses
+
+
+class TestRecordingSet(unittest.TestCase):
+    """Test cases for RecordingSet."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.items = (MockAPIResponses.recordings_list("camera001")["data"]
+                      + MockAPIResponses.recordings_list("camera002")["data"])
+        for index, item in enumerate(self.items):
+            item["_id"] = f"{item['cameraId']}-{item['_id']}"
+            item["motionScore"] = index * 10
+        self.items[0]["inProgress"] = True
+        self.items[0].pop("endTime")
+        self.recordings = RecordingSet.from_api_response(self.items)
+
+    def test_rows_match_recording_parsing(self):
+        """Test that materialized rows equal Recording.from_api_response."""
+        self.assertEqual(len(self.recordings), 10)
+        for index, item in enumerate(self.items):
+            expected = Recording.from_api_response(item)
+            expected.metadata.pop('filename')
+            expected.motion_score = float(expected.motion_score)
+            self.assertEqual(self.recordings[index], expected)
+        self.assertEqual(self.recordings[-1].recording_id, "camera002-recording004")
+
+    def test_columns_are_compact(self):
+        """Test the column dtypes and the lookup tables."""
+        self.assertEqual(self.recordings.cameras, ["camera001", "camera002"])
+        self.assertEqual(self.recordings.camera_index.dtype, np.int16)
+        self.assertEqual(self.recordings.start_ms.dtype, np.int64)
+        self.assertLess(self.recordings.nbytes, 100 * len(self.recordings))
+
+    def test_vectorized_filters(self):
+        """Test filters by camera, type, status and time range."""
+        camera2 = self.recordings.for_cameras(["camera002"])
+        self.assertEqual({r.camera_id for r in camera2}, {"camera002"})
+        self.assertEqual(len(camera2), 5)
+
+        motion = self.recordings.of_type(RecordingType.MOTION)
+        self.assertEqual(len(motion), 6)
+        self.assertEqual(len(self.recordings.with_status(RecordingStatus.RECORDING)), 1)
+
+        now = datetime.now()
+        recent = self.recordings.in_range(now - timedelta(minutes=100), now)
+        self.assertEqual(sorted(r.recording_id for r in recent),
+                         ["camera001-recording000", "camera001-recording001",
+                          "camera002-recording000", "camera002-recording001"])
+
+    def test_ordering_and_lookup(self):
+        """Test sorting, id lookup and size totals."""
+        ordered = self.recordings.sorted_by_start()
+        self.assertTrue(np.all(np.diff(ordered.start_ms) >= 0))
+        self.assertEqual(self.recordings.index_of("camera002-recording003"), 8)
+        self.assertIsNone(self.recordings.index_of("missing"))
+        self.assertEqual(self.recordings.total_size(), 2 * sum(50000000 + i * 10000000
+                                                               for i in range(5)))
+
+    def test_round_trip_and_concat(self):
+        """Test building from Recording objects and concatenating sets."""
+        first = RecordingSet.from_recordings(self.recordings[:5])
+        second = RecordingSet.from_api_response(self.items[5:])
+        combined = RecordingSet.concat([first, RecordingSet.empty(), second])
+
+        self.assertEqual(list(combined), list(self.recordings))
+        self.assertEqual(combined.get_ids(), self.recordings.get_ids())
+        self.assertEqual(len(RecordingSet.empty()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
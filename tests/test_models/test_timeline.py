@@ -0,0 +1,195 @@
+"""
+Unit tests for the playback timeline model.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from src.models.timeline import (
+    Timeline, TimelineEvent, TimelineEventType, TimelineSegment,
+)
+
+BASE = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def at(minutes: float) -> datetime:
+    return BASE + timedelta(minutes=minutes)
+
+
+def segment(start: float, end: float, recording_id: str) -> TimelineSegment:
+    return TimelineSegment(at(start), at(end), recording_id, "cam1")
+
+
+class TestTimelineSegments(unittest.TestCase):
+    """Test cases for the segment index."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.timeline = Timeline("cam1")
+
+    def test_segments_kept_sorted(self):
+        """Test out-of-order inserts end up in chronological order."""
+        for start, rec in [(20, "c"), (0, "a"), (10, "b")]:
+            self.timeline.add_segment(segment(start, start + 5, rec))
+
+        self.assertEqual([s.recording_id for s in self.timeline.segments], ["a", "b", "c"])
+
+    def test_overlapping_segments_coalesce(self):
+        """Test that a segment bridging two others merges all three."""
+        self.timeline.add_segment(segment(0, 5, "a"))
+        self.timeline.add_segment(segment(10, 15, "c"))
+        self.timeline.add_segment(segment(4, 11, "b"))
+
+        self.assertEqual(len(self.timeline.segments), 1)
+        merged = self.timeline.segments[0]
+        self.assertEqual((merged.start_time, merged.end_time), (at(0), at(15)))
+        self.assertEqual(merged.recording_id, "a")
+        self.assertEqual(merged.recording_ids, ["a", "b", "c"])
+
+    def test_merged_segment_resolves_covering_recording(self):
+        """Test that a merged segment maps a time to the recording covering it."""
+        self.timeline.add_segment(segment(0, 30, "a"))
+        self.timeline.add_segment(segment(20, 60, "b"))
+        merged = self.timeline.segments[0]
+
+        self.assertEqual(merged.recording_at(at(10)), ("a", at(0)))
+        self.assertEqual(merged.recording_at(at(25)), ("a", at(0)))
+        self.assertEqual(merged.recording_at(at(25), preferred="b"), ("b", at(20)))
+        self.assertEqual(merged.recording_at(at(45), preferred="a"), ("b", at(20)))
+
+    def test_touching_segments_stay_separate(self):
+        """Test that segments sharing only a boundary are not merged."""
+        self.timeline.add_segment(segment(0, 5, "a"))
+        self.timeline.add_segment(segment(5, 10, "b"))
+
+        self.assertEqual(len(self.timeline.segments), 2)
+        self.assertEqual(self.timeline.get_segment_at_time(at(5)).recording_id, "b")
+
+    def test_segment_lookup(self):
+        """Test point and range lookups."""
+        self.timeline.add_segments([segment(0, 5, "a"), segment(10, 15, "b"),
+                                    segment(20, 25, "c")])
+
+        self.assertEqual(self.timeline.get_segment_at_time(at(12)).recording_id, "b")
+        self.assertEqual(self.timeline.get_segment_at_time(at(15)).recording_id, "b")
+        self.assertIsNone(self.timeline.get_segment_at_time(at(7)))
+        self.assertIsNone(self.timeline.get_segment_at_time(at(-1)))
+        self.assertEqual(self.timeline.get_next_segment(at(7)).recording_id, "b")
+        self.assertIsNone(self.timeline.get_next_segment(at(21)))
+        self.assertEqual([s.recording_id for s in
+                          self.timeline.get_segments_in_range(at(3), at(12))], ["a", "b"])
+        self.assertEqual(self.timeline.get_segments_in_range(at(6), at(9)), [])
+
+    def test_bulk_add_matches_incremental(self):
+        """Test that add_segments coalesces like repeated add_segment."""
+        spans = [(30, 40), (0, 10), (5, 12), (50, 55), (38, 51), (60, 61)]
+        incremental = Timeline("cam1")
+        for index, (start, end) in enumerate(spans):
+            incremental.add_segment(segment(start, end, str(index)))
+        self.timeline.add_segments(segment(start, end, str(index))
+                                   for index, (start, end) in enumerate(spans))
+
+        def spans_of(timeline):
+            return [(s.start_time, s.end_time) for s in timeline.segments]
+
+        self.assertEqual(spans_of(self.timeline), spans_of(incremental))
+        self.assertEqual(spans_of(self.timeline),
+                         [(at(0), at(12)), (at(30), at(55)), (at(60), at(61))])
+
+
+class TestTimelineModels(unittest.TestCase):
+    """Test cases for the slotted event and segment classes."""
+
+    def test_slotted_defaults(self):
+        """Test that instances have no __dict__ and do not share defaults."""
+        first = TimelineEvent(at(0), TimelineEventType.MOTION)
+        second = TimelineEvent(at(1), TimelineEventType.MOTION, metadata=None)
+        first.metadata['score'] = 80
+
+        self.assertFalse(hasattr(first, '__dict__'))
+        self.assertEqual(second.metadata, {})
+        self.assertEqual(segment(0, 1, "a").recording_ids, ["a"])
+
+    def test_to_dict(self):
+        """Test dictionary conversion of events and segments."""
+        event = TimelineEvent(at(1), TimelineEventType.BOOKMARK, 30, {'note': 'door'})
+        item = TimelineSegment(at(0), at(5), "a", "cam1", True, [event])
+
+        self.assertEqual(item.to_dict(), {
+            'start_time': '2024-01-01T12:00:00', 'end_time': '2024-01-01T12:05:00',
+            'recording_id': 'a', 'camera_id': 'cam1', 'has_motion': True,
+            'motion_events': [{'timestamp': '2024-01-01T12:01:00', 'event_type': 'bookmark',
+                               'duration_seconds': 30, 'metadata': {'note': 'door'}}],
+            'recording_ids': ['a'],
+            'recording_spans': [('a', '2024-01-01T12:00:00', '2024-01-01T12:05:00')],
+        })
+
+
+class TestTimelineEvents(unittest.TestCase):
+    """Test cases for the event index and event seeking."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.timeline = Timeline("cam1")
+        self.timeline.add_segments([segment(0, 10, "a"), segment(20, 30, "b")])
+        for minute, event_type in [(25, TimelineEventType.MOTION),
+                                   (2, TimelineEventType.MOTION),
+                                   (15, TimelineEventType.MOTION),
+                                   (8, TimelineEventType.BOOKMARK)]:
+            self.timeline.add_event(TimelineEvent(at(minute), event_type))
+
+    def test_events_sorted_and_ranged(self):
+        """Test chronological order and inclusive range queries."""
+        self.assertEqual([e.timestamp for e in self.timeline.events],
+                         [at(2), at(8), at(15), at(25)])
+        self.assertEqual([e.timestamp for e in self.timeline.get_events_in_range(at(8), at(15))],
+                         [at(8), at(15)])
+
+    def test_seek_to_next_event(self):
+        """Test forward seeking with and without a type filter."""
+        self.assertTrue(self.timeline.seek_to_time(at(3)))
+        self.assertTrue(self.timeline.seek_to_next_event())
+        self.assertEqual(self.timeline.current_position, at(8))
+        # The motion event at minute 15 has no footage and is skipped
+        self.assertTrue(self.timeline.seek_to_next_event(TimelineEventType.MOTION))
+        self.assertEqual(self.timeline.current_position, at(25))
+        self.assertFalse(self.timeline.seek_to_next_event())
+        self.assertFalse(self.timeline.seek_to_next_event(TimelineEventType.ALERT))
+
+    def test_seek_to_previous_event(self):
+        """Test backward seeking with a type filter."""
+        self.timeline.seek_to_time(at(25))
+        self.assertTrue(self.timeline.seek_to_previous_event(TimelineEventType.MOTION))
+        self.assertEqual(self.timeline.current_position, at(2))
+        self.assertFalse(self.timeline.seek_to_previous_event())
+
+    def test_motion_density_follows_zoom(self):
+        """Test that zooming picks the heatmap resolution of the density bar."""
+        self.timeline.add_event(TimelineEvent(at(15.5), TimelineEventType.MOTION,
+                                              metadata={'motion_score': 70}))
+        self.timeline.zoom_to_range(at(0), at(30))
+        density = self.timeline.get_motion_density()
+
+        self.assertEqual(density.resolution.name, "MINUTE")
+        self.assertEqual(density.counts[15], 2)
+        self.assertEqual(density.max_scores[15], 70)
+
+    def test_timeline_summary(self):
+        """Test the summary counts."""
+        summary = self.timeline.get_timeline_summary()
+
+        self.assertEqual(summary['event_count'], 4)
+        self.assertEqual(summary['motion_event_count'], 3)
+        self.assertEqual(summary['events_by_type'], {'motion': 3, 'bookmark': 1})
+
+    def test_clear(self):
+        """Test that clear empties both indexes."""
+        self.timeline.clear()
+
+        self.assertEqual(self.timeline.events, [])
+        self.assertIsNone(self.timeline.get_segment_at_time(at(5)))
+        self.assertFalse(self.timeline.seek_to_next_event())
+
+
+if __name__ == '__main__':
+    unittest.main()
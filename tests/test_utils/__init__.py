@@ -0,0 +1 @@
+"""Utility test package for camera live view application."""
@@ -0,0 +1,105 @@
+"""
+Unit tests for helper utilities.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from src.utils.helpers import debounce, retry_operation, throttle
+
+
+class TestRetryOperation(unittest.TestCase):
+    """Test cases for retry_operation."""
+
+    @patch("src.utils.helpers.time.sleep")
+    def test_retries_until_success(self, sleep):
+        """Test that failures are retried with growing delays."""
+        func = Mock(side_effect=[OSError("down"), OSError("down"), "ok"])
+
+        self.assertEqual(retry_operation(func, max_retries=3, delay=1.0, jitter=0), "ok")
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1.0, 2.0])
+
+    @patch("src.utils.helpers.time.sleep")
+    def test_reraises_last_exception(self, sleep):
+        """Test that the last exception is raised once retries are exhausted."""
+        func = Mock(side_effect=[OSError("first"), OSError("second")])
+
+        with self.assertRaisesRegex(OSError, "second"):
+            retry_operation(func, max_retries=1, delay=0.5)
+        self.assertEqual(func.call_count, 2)
+
+    @patch("src.utils.helpers.time.sleep")
+    def test_delay_is_capped_and_jittered(self, sleep):
+        """Test max_delay and jitter bounds."""
+        func = Mock(side_effect=[OSError()] * 5 + ["ok"])
+
+        retry_operation(func, max_retries=5, delay=1.0, max_delay=3.0, jitter=0.2)
+        delays = [c.args[0] for c in sleep.call_args_list]
+        self.assertEqual(len(delays), 5)
+        self.assertTrue(all(0.8 <= d <= 3.6 for d in delays))
+        self.assertGreaterEqual(min(delays[2:]), 2.4)
+
+    def test_stop_event_aborts(self):
+        """Test that a set stop event ends retrying."""
+        stop_event = threading.Event()
+        stop_event.set()
+        func = Mock(side_effect=OSError("down"))
+
+        with self.assertRaises(OSError):
+            retry_operation(func, max_retries=5, delay=10.0, stop_event=stop_event)
+        func.assert_called_once()
+
+
+class TestRateLimiting(unittest.TestCase):
+    """Test cases for debounce and throttle."""
+
+    def test_debounce_runs_last_call_once(self):
+        """Test that a burst of calls runs once with the last arguments."""
+        calls = []
+        done = threading.Event()
+
+        @debounce(0.05)
+        def record(value):
+            calls.append(value)
+            done.set()
+
+        for value in range(5):
+            record(value)
+        self.assertTrue(done.wait(1.0))
+        time.sleep(0.1)
+        self.assertEqual(calls, [4])
+
+    def test_debounce_cancel_and_flush(self):
+        """Test dropping and forcing the pending call."""
+        calls = []
+        record = debounce(10.0)(calls.append)
+
+        record(1)
+        record.cancel()
+        record(2)
+        record.flush()
+        self.assertEqual(calls, [2])
+
+    def test_throttle_coalesces_calls(self):
+        """Test that the first call runs at once and the rest collapse into one."""
+        calls = []
+        done = threading.Event()
+
+        @throttle(20)
+        def record(value):
+            calls.append(value)
+            if value == 9:
+                done.set()
+
+        for value in range(10):
+            record(value)
+        self.assertEqual(calls, [0])
+        self.assertTrue(done.wait(1.0))
+        self.assertEqual(calls, [0, 9])
+
+
+if __name__ == '__main__':
+    unittest.main()
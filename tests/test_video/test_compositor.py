@@ -0,0 +1,106 @@
+"""
+Unit tests for the mosaic compositor.
+"""
+
+import ctypes
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from src.video.compositor import MosaicCompositor
+from src.video.player import VideoPlayer
+
+
+class _FakePlayer(VideoPlayer):
+    """VideoPlayer on a mock libVLC player that can simulate decoded frames."""
+
+    def initialize(self):
+        if self.media_player is None:
+            self.vlc_instance = Mock()
+            self.media_player = Mock()
+
+    def cleanup(self):
+        self.stop()
+        self.disable_frame_access()
+        self.cleaned_up = True
+
+    def decode(self, value):
+        """Deliver one frame filled with a value through the VLC callbacks."""
+        lock, unlock, display, _ = self.media_player.video_set_callbacks.call_args[0]
+        _, width, height, pitch = self.media_player.video_set_format.call_args[0]
+        planes = (ctypes.c_void_p * 1)()
+        picture = lock(None, planes)
+        ctypes.memset(planes[0], value, pitch * height)
+        unlock(None, picture, planes)
+        display(None, picture)
+
+
+class TestMosaicCompositor(unittest.TestCase):
+    """Test cases for MosaicCompositor."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.players = []
+
+        def factory():
+            player = _FakePlayer()
+            self.players.append(player)
+            return player
+
+        self.compositor = MosaicCompositor(2, 2, tile_size=(32, 18), max_fps=10,
+                                           player_factory=factory)
+
+    def _canvas(self, data):
+        """Parse the PPM image returned by render()."""
+        header, pixels = data.split(b"\n", 1)
+        self.assertEqual(header, b"P6 64 36 255")
+        return np.frombuffer(pixels, dtype=np.uint8).reshape(36, 64, 3)
+
+    def test_frames_land_in_their_cell(self):
+        """Test that decoded frames are copied into the camera's cell."""
+        self.compositor.add_camera("camera001", "rtsp://nvr/camera001")
+        self.compositor.add_camera("camera002", "rtsp://nvr/camera002")
+        self.players[1].decode(200)
+
+        canvas = self._canvas(self.compositor.render(now=1.0))
+
+        self.assertTrue(np.all(canvas[:18, 32:] == 200))
+        self.assertTrue(np.all(canvas[:18, :32] == 0))
+        self.assertEqual(self.compositor.get_stats(), {"camera001": 0, "camera002": 1})
+        self.players[0].media_player.video_set_format.assert_called_with("RGBA", 32, 18, 128)
+
+    def test_render_is_rate_capped_and_skips_unchanged_frames(self):
+        """Test the frame budget and change detection."""
+        self.compositor.add_camera("camera001", "rtsp://nvr/camera001")
+        self.assertIsNotNone(self.compositor.render(now=1.0))
+
+        self.players[0].decode(50)
+        self.assertIsNone(self.compositor.render(now=1.05))
+        self.assertIsNotNone(self.compositor.render(now=1.1))
+        self.assertIsNone(self.compositor.render(now=1.3))
+
+    def test_remove_frees_cell_and_resets_player(self):
+        """Test that removing a camera blanks its cell and detaches the callbacks."""
+        self.compositor.add_camera("camera001", "rtsp://nvr/camera001")
+        self.players[0].decode(90)
+        self.compositor.remove_camera("camera001")
+
+        canvas = self._canvas(self.compositor.render(now=1.0))
+        self.assertTrue(np.all(canvas == 0))
+        self.assertTrue(self.players[0].cleaned_up)
+        self.assertIsNone(self.players[0].frame_ring)
+
+        self.compositor.add_camera("camera003", "rtsp://nvr/camera003")
+        self.assertEqual(self.compositor.get_camera_at(5, 5), "camera003")
+        self.assertIsNone(self.compositor.get_camera_at(40, 5))
+
+    def test_full_mosaic_rejects_cameras(self):
+        """Test that cameras beyond the cell count are refused."""
+        for index in range(4):
+            self.assertTrue(self.compositor.add_camera(f"camera{index}", f"rtsp://{index}"))
+        self.assertFalse(self.compositor.add_camera("camera9", "rtsp://9"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the reusable frame buffer ring.
+"""
+
+import unittest
+
+import numpy as np
+
+from src.video.frame_buffer import FrameRing
+
+
+class TestFrameRing(unittest.TestCase):
+    """Test cases for FrameRing."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.ring = FrameRing(8, 4, count=3)
+
+    def _decode(self, value):
+        """Write and publish one frame filled with a value."""
+        slot = self.ring.begin_write()
+        self.ring._buffers[slot][:] = value
+        self.ring.end_write(slot)
+        self.ring.commit(slot)
+        return slot
+
+    def test_no_frame_yet(self):
+        """Test reading before anything was decoded."""
+        with self.ring.read() as frame:
+            self.assertIsNone(frame)
+        self.assertIsNone(self.ring.copy_latest(np.empty((4, 8, 4), dtype=np.uint8)))
+
+    def test_buffers_are_reused(self):
+        """Test that the decoder cycles through the preallocated buffers."""
+        addresses = set()
+        for value in range(10):
+            addresses.add(self.ring.address(self._decode(value)))
+
+        self.assertEqual(len(addresses), 3)
+        self.assertEqual(self.ring.sequence, 10)
+        with self.ring.read() as frame:
+            self.assertTrue(np.all(frame.data == 9))
+            self.assertFalse(frame.data.flags.writeable)
+            self.assertEqual(frame.sequence, 10)
+
+    def test_pinned_frame_is_not_overwritten(self):
+        """Test that a frame being read survives newer frames."""
+        self._decode(1)
+        with self.ring.read() as frame:
+            for value in range(2, 8):
+                self._decode(value)
+            self.assertTrue(np.all(frame.data == 1))
+        self.assertEqual(self.ring.copy_latest(np.empty((4, 8, 4), dtype=np.uint8)), 7)
+
+    def test_frames_dropped_when_every_buffer_is_busy(self):
+        """Test that a full ring sends frames to the spare buffer and counts them."""
+        self._decode(1)
+        with self.ring.read():
+            first, second = self.ring.begin_write(), self.ring.begin_write()
+            spare = self.ring.begin_write()
+            self.assertEqual(spare, self.ring.count)
+            self.ring.commit(spare)
+            self.ring.commit(first)
+            self.ring.commit(second)
+
+        self.assertEqual(self.ring.dropped, 1)
+        self.assertEqual(self.ring.sequence, 3)
+
+    def test_undisplayed_frames_are_reclaimed(self):
+        """Test that buffers written but never displayed are reused last."""
+        self._decode(1)
+        skipped = self.ring.begin_write()
+        self.ring.end_write(skipped)
+
+        free = self.ring.begin_write()
+        self.assertNotEqual(free, skipped)
+        self.ring.end_write(free)
+        self.assertIn(self.ring.begin_write(), (skipped, free))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Unit tests for stream health monitoring and reconnection.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from src.video.health_monitor import StreamHealth, StreamHealthMonitor
+
+
+class FakePlayer:
+    """Player double exposing frame counters and VLC event hooks."""
+
+    def __init__(self):
+        self.decoded_frames = 0
+        self.flowing = False
+        self.callbacks = {}
+        self.detached = False
+
+    def get_stats(self):
+        if self.flowing:
+            self.decoded_frames += 1
+        return {'decoded_frames': self.decoded_frames, 'lost_frames': 2,
+                'input_bitrate': 0.25}
+
+    def attach_event(self, event_type, callback):
+        self.callbacks[event_type] = callback
+
+    def detach_events(self):
+        self.detached = True
+        self.callbacks = {}
+
+
+class TestStreamHealthMonitor(unittest.TestCase):
+    """Test cases for the stream health monitor."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        patcher = patch("src.video.health_monitor.vlc")
+        self.vlc = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.player = FakePlayer()
+        self.restart = Mock(side_effect=self._restart)
+        self.monitor = StreamHealthMonitor(self.restart, stall_timeout=0.3, max_retries=2,
+                                           retry_delay=0.01, reconnect_interval=0.05,
+                                           check_interval=60)
+        self.addCleanup(self.monitor.stop)
+
+    def _restart(self, camera_id, player):
+        self.player.decoded_frames = 0
+        self.player.flowing = True
+        return True
+
+    def _wait_for(self, state, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            status = self.monitor.get_status("cam1")
+            if status.state == state:
+                return status
+            time.sleep(0.01)
+        self.fail(f"stream never reached {state}")
+
+    def test_status_snapshot(self):
+        """Test that frame counters and bitrate are reported."""
+        self.monitor.watch("cam1", self.player)
+        self.player.decoded_frames = 25
+        self.monitor.check(now=time.monotonic())
+
+        status = self.monitor.snapshot()["cam1"]
+        self.assertEqual(status.decoded_frames, 25)
+        self.assertEqual(status.dropped_frames, 2)
+        self.assertEqual(status.bitrate_kbps, 2000.0)
+        self.assertAlmostEqual(status.last_frame_age, 0.0)
+        self.assertEqual(status.to_dict()['state'], "starting")
+
+    def test_vlc_events_update_state(self):
+        """Test buffering and playing events."""
+        self.monitor.watch("cam1", self.player)
+        events = self.vlc.EventType
+
+        self.player.callbacks[events.MediaPlayerBuffering](Mock(u=Mock(new_cache=40.0)))
+        self.assertEqual(self.monitor.get_status("cam1").state, StreamHealth.BUFFERING)
+        self.player.callbacks[events.MediaPlayerPlaying](Mock())
+        self.assertEqual(self.monitor.get_status("cam1").state, StreamHealth.PLAYING)
+
+    def test_stall_triggers_reconnect(self):
+        """Test that a stream without new frames is restarted."""
+        self.monitor.watch("cam1", self.player)
+        self.player.decoded_frames = 10
+        now = time.monotonic()
+        self.monitor.check(now=now)
+        self.monitor.check(now=now + 1.0)
+
+        status = self._wait_for(StreamHealth.PLAYING)
+        self.restart.assert_called_once_with("cam1", self.player)
+        self.assertEqual(status.reconnect_count, 1)
+        self.assertIsNone(status.last_error)
+
+    def test_error_event_triggers_reconnect(self):
+        """Test that a VLC error reconnects the stream on the next check."""
+        self.monitor.watch("cam1", self.player)
+        self.player.callbacks[self.vlc.EventType.MediaPlayerEncounteredError](Mock())
+        self.monitor.check()
+
+        self.assertEqual(self._wait_for(StreamHealth.PLAYING).reconnect_count, 1)
+
+    def test_gives_up_after_retries(self):
+        """Test that a stream that cannot be restarted is marked failed."""
+        self.restart.side_effect = None
+        self.restart.return_value = False
+        self.monitor.watch("cam1", self.player)
+        self.player.callbacks[self.vlc.EventType.MediaPlayerEndReached](Mock())
+        self.monitor.check()
+
+        status = self._wait_for(StreamHealth.FAILED)
+        self.assertEqual(self.restart.call_count, 3)
+        self.assertEqual(status.last_error, "restart failed")
+
+    def test_unwatch_cancels_reconnect_in_flight(self):
+        """Test that a stream unwatched mid-reconnect gets no further attempts."""
+        restarted = threading.Event()
+        self.restart.side_effect = lambda camera_id, player: restarted.set() or True
+        self.monitor.watch("cam1", self.player)
+        self.player.callbacks[self.vlc.EventType.MediaPlayerEncounteredError](Mock())
+        self.monitor.check()
+
+        self.assertTrue(restarted.wait(2))
+        self.monitor.unwatch("cam1")
+        time.sleep(0.5)
+
+        self.restart.assert_called_once_with("cam1", self.player)
+        self.assertIsNone(self.monitor.get_status("cam1"))
+
+    def test_no_reconnect_when_disabled(self):
+        """Test that auto_reconnect=False only reports the stall."""
+        self.monitor.auto_reconnect = False
+        self.monitor.watch("cam1", self.player)
+        self.monitor.check(now=time.monotonic() + 1.0)
+
+        self.assertEqual(self.monitor.get_status("cam1").state, StreamHealth.STALLED)
+        self.restart.assert_not_called()
+
+    def test_unwatch(self):
+        """Test that unwatched streams are forgotten and their events detached."""
+        self.monitor.watch("cam1", self.player)
+        self.monitor.unwatch("cam1")
+
+        self.assertTrue(self.player.detached)
+        self.assertIsNone(self.monitor.get_status("cam1"))
+        self.assertEqual(self.monitor.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+Unit tests for synchronized multi-camera playback.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from src.models.multi_timeline import MultiTimeline
+from src.models.timeline import PlaybackState, Timeline, TimelineSegment
+from src.video.playback import PlaybackCoordinator
+
+BASE = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def at(seconds: float) -> datetime:
+    return BASE + timedelta(seconds=seconds)
+
+
+class FakePlayer:
+    """Player double tracking media, position and pause state."""
+
+    def __init__(self, widget=None):
+        self.widget = widget
+        self.url = None
+        self.options = []
+        self.time_ms = None
+        self.playing = False
+        self.rate = 1.0
+
+    def play_stream(self, url, options=None):
+        self.url, self.options, self.time_ms, self.playing = url, options or [], 0, True
+        for option in self.options:
+            if option.startswith(":start-time="):
+                self.time_ms = round(float(option.split("=", 1)[1]) * 1000)
+
+    def set_time(self, position_ms):
+        self.time_ms = position_ms
+
+    def get_time(self):
+        return self.time_ms
+
+    def set_rate(self, rate):
+        self.rate = rate
+
+    def pause(self):
+        self.playing = False
+
+    def resume(self):
+        self.playing = True
+
+    def is_playing(self):
+        return self.playing
+
+    def stop(self):
+        self.url = None
+        self.playing = False
+
+    def set_widget(self, widget):
+        self.widget = widget
+
+    def cleanup(self):
+        self.stop()
+
+
+class TestPlaybackCoordinator(unittest.TestCase):
+    """Test cases for the playback coordinator."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        front, back = Timeline("front"), Timeline("back")
+        front.add_segment(TimelineSegment(at(0), at(60), "f1", "front"))
+        front.add_segment(TimelineSegment(at(300), at(360), "f2", "front"))
+        back.add_segment(TimelineSegment(at(30), at(90), "b1", "back"))
+        self.coordinator = PlaybackCoordinator(
+            MultiTimeline([front, back]), lambda camera_id, recording_id: f"file://{recording_id}",
+            drift_threshold=1.0, player_factory=FakePlayer,
+        )
+        self.coordinator.add_camera("front")
+        self.coordinator.add_camera("back")
+        self.front = self.coordinator.players["front"]
+        self.back = self.coordinator.players["back"]
+
+    def test_play_loads_cameras_with_footage(self):
+        """Test that only cameras with a recording at the clock start playing."""
+        self.coordinator.play()
+
+        self.assertEqual(self.coordinator.position, at(0))
+        self.assertEqual(self.front.url, "file://f1")
+        self.assertTrue(self.front.playing)
+        self.assertIsNone(self.back.url)
+
+    def test_seek_sets_offsets(self):
+        """Test that seeking positions every player within its recording."""
+        self.coordinator.play()
+        self.coordinator.seek(at(45))
+
+        self.assertEqual(self.front.time_ms, 45000)
+        self.assertEqual(self.back.url, "file://b1")
+        self.assertEqual(self.back.time_ms, 15000)
+
+    def test_players_without_footage_pause(self):
+        """Test that a camera whose recording ended is paused."""
+        self.coordinator.play()
+        self.coordinator.seek(at(70))
+
+        self.assertFalse(self.front.playing)
+        self.assertTrue(self.back.playing)
+
+    def test_tick_skips_gaps_across_cameras(self):
+        """Test that a gap with no footage anywhere is skipped in one tick."""
+        self.coordinator.play()
+        self.coordinator.seek(at(89))
+        self.coordinator.tick(now=self.coordinator._last_tick + 2.0)
+
+        self.assertEqual(self.coordinator.position, at(300))
+        self.assertEqual(self.front.url, "file://f2")
+        self.assertEqual(self.front.time_ms, 0)
+
+    def test_overlapping_recordings_play_the_covering_one(self):
+        """Test that a merged segment plays the recording covering the clock."""
+        side = Timeline("side")
+        side.add_segment(TimelineSegment(at(0), at(1800), "a", "side"))
+        side.add_segment(TimelineSegment(at(1200), at(3600), "b", "side"))
+        coordinator = PlaybackCoordinator(
+            MultiTimeline([side]), lambda camera_id, recording_id: f"file://{recording_id}",
+            player_factory=FakePlayer,
+        )
+        coordinator.add_camera("side")
+        player = coordinator.players["side"]
+
+        coordinator.play()
+        coordinator.seek(at(600))
+        self.assertEqual((player.url, player.time_ms), ("file://a", 600000))
+
+        coordinator.seek(at(2700))
+        self.assertEqual((player.url, player.time_ms), ("file://b", 1500000))
+
+    def test_loaded_recordings_open_at_the_offset(self):
+        """Test that a recording loaded while paused opens at the clock offset."""
+        self.coordinator.play()
+        self.coordinator.pause()
+        self.coordinator.seek(at(45.5))
+
+        self.assertEqual(self.back.url, "file://b1")
+        self.assertEqual(self.back.options, [":start-time=15.500"])
+        self.assertFalse(self.back.playing)
+
+    def test_drift_correction(self):
+        """Test that players drifting beyond the threshold are reseeked."""
+        self.coordinator.play()
+        start = self.coordinator._last_tick
+        self.front.time_ms = 5200
+        self.coordinator.tick(now=start + 5.0)
+        self.assertEqual(self.front.time_ms, 5200)
+        self.assertEqual(self.coordinator.drift_corrections, 0)
+
+        self.front.time_ms = 12000
+        self.coordinator.tick(now=start + 10.0)
+        self.assertEqual(self.front.time_ms, 10000)
+        self.assertEqual(self.coordinator.drift_corrections, 1)
+
+    def test_pause_and_speed(self):
+        """Test pause holding the clock and speed scaling it."""
+        self.coordinator.play()
+        start = self.coordinator._last_tick
+        self.coordinator.set_speed(2.0)
+        self.coordinator.tick(now=start + 5.0)
+        self.assertEqual(self.coordinator.position, at(10))
+        self.assertEqual(self.front.rate, 2.0)
+
+        self.coordinator.pause()
+        self.coordinator.tick(now=start + 50.0)
+        self.assertEqual(self.coordinator.position, at(10))
+        self.assertFalse(self.front.playing)
+
+    def test_end_of_recordings(self):
+        """Test that playback pauses at the end of the last recording."""
+        self.coordinator.play()
+        self.coordinator.seek(at(359))
+        self.coordinator.tick(now=self.coordinator._last_tick + 5.0)
+
+        self.assertEqual(self.coordinator.state, PlaybackState.PAUSED)
+        self.assertEqual(self.coordinator.position, at(360))
+
+
+if __name__ == '__main__':
+    unittest.main()
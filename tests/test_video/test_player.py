@@ -5,10 +5,11 @@ This module contains unit tests for the VLC media player wrapper,
 including stream playback, controls, and resource management.
 """
 
+import ctypes
 import unittest
 from unittest.mock import Mock, patch
-# TODO: Import video player classes when implemented
-# from src.video.player import VideoPlayer
+
+from src.video.player import VideoPlayer, PlayerPool, VLCInstanceManager
 
 
 class TestVideoPlayer(unittest.TestCase):
@@ -16,72 +17,156 @@ class TestVideoPlayer(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures before each test method."""
-        # TODO: Initialize test video player
-        # TODO: Setup mock VLC components
-        pass
+        patcher = patch("src.video.player.vlc")
+        self.vlc = patcher.start()
+        self.addCleanup(patcher.stop)
+        VLCInstanceManager._instance = None
+        self.instance = self.vlc.Instance.return_value
+        self.instance.media_player_new.side_effect = lambda: Mock(name="MediaPlayer")
+        self.pool = PlayerPool("--no-audio", max_idle=2)
+        self.widget = Mock()
+        self.widget.winfo_id.return_value = 42
+        self.player = VideoPlayer(self.widget, self.pool)
 
     def test_video_player_initialization(self):
         """Test video player initialization."""
-        # TODO: Test initialization with widget
-        # TODO: Test initialization without widget
-        # TODO: Verify initial state
-        pass
+        self.assertIs(self.player.widget, self.widget)
+        self.assertIsNone(self.player.media_player)
+        self.assertIsNone(VideoPlayer().pool)
+        self.vlc.Instance.assert_not_called()
 
     def test_vlc_initialization(self):
         """Test VLC instance and media player initialization."""
-        # TODO: Mock VLC components
-        # TODO: Test VLC initialization
-        # TODO: Verify VLC instance creation
-        pass
+        self.player.initialize()
+        other = VideoPlayer(pool=self.pool)
+        other.initialize()
+
+        self.vlc.Instance.assert_called_once_with("--no-audio")
+        self.assertIs(self.player.vlc_instance, other.vlc_instance)
+        self.assertIsNot(self.player.media_player, other.media_player)
+        self.player.media_player.audio_set_mute.assert_called_with(True)
 
     def test_stream_playback(self):
         """Test video stream playback."""
-        # TODO: Mock stream URL and VLC media
-        # TODO: Test stream playback start
-        # TODO: Verify media is set and playback starts
-        pass
+        self.player.play_stream("rtsp://nvr/camera001")
+
+        self.instance.media_new.assert_called_once_with("rtsp://nvr/camera001")
+        self.player.media_player.set_media.assert_called_with(self.instance.media_new.return_value)
+        self.player.media_player.play.assert_called_once()
+        self.assertEqual(self.player.current_url, "rtsp://nvr/camera001")
 
     def test_playback_controls(self):
         """Test playback control functions."""
-        # TODO: Test play/pause functionality
-        # TODO: Test stop functionality
-        # TODO: Test resume functionality
-        pass
+        self.player.play_stream("rtsp://nvr/camera001")
+        media_player = self.player.media_player
+
+        self.player.pause()
+        media_player.set_pause.assert_called_with(1)
+        self.player.resume()
+        media_player.set_pause.assert_called_with(0)
+        self.player.stop()
+        media_player.stop.assert_called()
+        self.assertIsNone(self.player.current_media)
 
     def test_volume_control(self):
         """Test volume control functionality."""
-        # TODO: Test volume setting
-        # TODO: Test volume range validation
-        # TODO: Verify VLC volume is updated
-        pass
+        self.player.initialize()
+        self.player.set_volume(150)
+        self.player.media_player.audio_set_volume.assert_called_with(100)
+        self.player.set_volume(-5)
+        self.player.media_player.audio_set_volume.assert_called_with(0)
 
     def test_playback_state(self):
         """Test playback state checking."""
-        # TODO: Test is_playing method
-        # TODO: Mock different VLC player states
-        # TODO: Verify correct state reporting
-        pass
+        self.assertFalse(self.player.is_playing())
+        self.player.initialize()
+        self.player.media_player.is_playing.return_value = 1
+        self.assertTrue(self.player.is_playing())
+
+    def test_time_control(self):
+        """Test seeking and position reporting within the media."""
+        self.assertIsNone(self.player.get_time())
+        self.player.play_stream("file:///recordings/rec001.mp4")
+        media_player = self.player.media_player
+
+        media_player.get_time.return_value = -1
+        self.assertIsNone(self.player.get_time())
+        media_player.get_time.return_value = 1500
+        self.assertEqual(self.player.get_time(), 1500)
+        self.player.set_time(-20)
+        media_player.set_time.assert_called_with(0)
+        self.player.set_rate(2.0)
+        media_player.set_rate.assert_called_with(2.0)
 
     def test_resource_cleanup(self):
         """Test proper resource cleanup."""
-        # TODO: Test cleanup method
-        # TODO: Verify VLC resources are released
-        # TODO: Test cleanup during destruction
-        pass
+        self.player.play_stream("rtsp://nvr/camera001")
+        media_player = self.player.media_player
+        self.player.cleanup()
+
+        self.assertIsNone(self.player.media_player)
+        media_player.release.assert_not_called()
+        media_player.set_media.assert_called_with(None)
+        self.instance.release.assert_not_called()
+        self.assertEqual(self.pool.idle_count, 1)
+
+    def test_frame_access(self):
+        """Test decoding into the reusable frame ring and detaching on cleanup."""
+        frames = []
+        ring = self.player.enable_frame_access(16, 8, buffers=2, on_frame=frames.append)
+        media_player = self.player.media_player
+        media_player.video_set_format.assert_called_once_with("RGBA", 16, 8, 64)
+        lock, unlock, display, _ = media_player.video_set_callbacks.call_args[0]
+
+        planes = (ctypes.c_void_p * 1)()
+        picture = lock(None, planes)
+        ctypes.memset(planes[0], 7, ring.pitch * ring.height)
+        unlock(None, picture, planes)
+        display(None, picture)
+
+        self.assertEqual(frames, [ring])
+        with ring.read() as frame:
+            self.assertTrue((frame.data == 7).all())
+
+        self.player.cleanup()
+        media_player.video_set_callbacks.assert_called_with(None, None, None, None)
+        self.assertIsNone(self.player.frame_ring)
+
+    def test_players_are_reused_from_pool(self):
+        """Test checked-in players are handed out again instead of recreated."""
+        self.player.initialize()
+        first = self.player.media_player
+        self.player.cleanup()
+
+        reused = VideoPlayer(pool=self.pool)
+        reused.initialize()
+        self.assertIs(reused.media_player, first)
+        self.assertEqual(self.instance.media_player_new.call_count, 1)
+
+    def test_pool_releases_players_beyond_idle_limit(self):
+        """Test the pool only keeps max_idle players around."""
+        players = [VideoPlayer(pool=self.pool) for _ in range(3)]
+        for player in players:
+            player.initialize()
+        media_players = [player.media_player for player in players]
+        for player in players:
+            player.cleanup()
+
+        self.assertEqual(self.pool.idle_count, 2)
+        media_players[2].release.assert_called_once()
+        self.pool.clear()
+        self.assertEqual(self.pool.idle_count, 0)
 
     def test_error_handling(self):
         """Test error handling for various scenarios."""
-        # TODO: Test handling of invalid stream URLs
-        # TODO: Test handling of VLC initialization failures
-        # TODO: Test handling of playback errors
-        pass
+        self.vlc.Instance.return_value = None
+        with self.assertRaises(RuntimeError):
+            self.player.initialize()
 
     def tearDown(self):
         """Clean up after each test method."""
-        # TODO: Cleanup test resources
-        # TODO: Ensure VLC resources are freed
-        pass
+        VLCInstanceManager._instance = None
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
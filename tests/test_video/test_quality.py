@@ -0,0 +1,129 @@
+"""
+Unit tests for adaptive stream quality selection.
+
+This module contains unit tests for channel selection by tile size,
+load-based downgrades and upgrades, and their use by the stream manager.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.models.camera import Camera
+from src.video.quality import QualityController, StreamQualityState
+from src.video.stream_manager import StreamManager
+from tests.fixtures.mock_responses import MockAPIResponses
+
+
+def _camera(index=0):
+    """Parse a camera with high (1080p) and medium (720p) channels."""
+    data = MockAPIResponses.camera_list()["data"][index]
+    for channel in data["channels"]:
+        channel["url"] = f"rtsp://nvr/{data['_id']}_{channel['id']}"
+    return Camera.from_api_response(data)
+
+
+class TestQualityController(unittest.TestCase):
+    """Test cases for the quality controller."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.camera = _camera()
+        self.controller = QualityController(change_cooldown=5, upgrade_delay=30)
+
+    def test_primary_and_secondary_streams(self):
+        """Test streams are ordered by resolution rather than channel number."""
+        self.camera.streams.reverse()
+        self.assertEqual(self.camera.primary_stream.width, 1920)
+        self.assertEqual(self.camera.secondary_stream.width, 1280)
+        self.assertIsNone(_camera(1).secondary_stream)
+
+    def test_preferred_level_follows_tile_size(self):
+        """Test small tiles get the low channel and the zoom view the high one."""
+        self.assertEqual(self.controller.preferred_level(self.camera, (320, 180)), 0)
+        self.assertEqual(self.controller.preferred_level(self.camera, (1600, 900)), 1)
+        self.assertEqual(self.controller.preferred_level(self.camera, None), 1)
+
+    def test_fixed_quality_when_auto_quality_disabled(self):
+        """Test the default quality is used when auto quality is off."""
+        high = QualityController(auto_quality=False, default_quality="high")
+        low = QualityController(auto_quality=False, default_quality="low")
+        self.assertEqual(high.preferred_level(self.camera, (320, 180)), 1)
+        self.assertEqual(low.preferred_level(self.camera, None), 0)
+
+    def test_downgrade_under_load(self):
+        """Test one stream is downgraded per cooldown period under high load."""
+        states = {cid: StreamQualityState(cid, 1, 1) for cid in ("a", "b")}
+        first = self.controller.evaluate(states, cpu_load=0.95, now=100)
+        self.assertEqual(len(first), 1)
+        for camera_id, level in first.items():
+            states[camera_id].level = level
+
+        self.assertEqual(self.controller.evaluate(states, cpu_load=0.95, now=102), {})
+        second = self.controller.evaluate(states, cpu_load=0.95, now=106)
+        self.assertEqual(set(second) | set(first), {"a", "b"})
+
+    def test_dropped_frames_trigger_downgrade(self):
+        """Test a stream dropping frames is downgraded first."""
+        states = {cid: StreamQualityState(cid, 1, 1) for cid in ("a", "b")}
+        self.controller.update_frame_stats(states["b"], {"decoded_frames": 100, "lost_frames": 0})
+        self.controller.update_frame_stats(states["b"], {"decoded_frames": 200, "lost_frames": 20})
+        self.assertAlmostEqual(states["b"].drop_ratio, 0.2)
+        self.assertEqual(self.controller.evaluate(states, cpu_load=0.1, now=100), {"b": 0})
+
+    def test_upgrade_after_sustained_headroom(self):
+        """Test downgraded streams are restored only after sustained headroom."""
+        states = {"a": StreamQualityState("a", 0, 1)}
+        self.assertEqual(self.controller.evaluate(states, cpu_load=0.2, now=100), {})
+        self.assertEqual(self.controller.evaluate(states, cpu_load=0.6, now=120), {})
+        self.assertEqual(self.controller.evaluate(states, cpu_load=0.2, now=125), {})
+        self.assertEqual(self.controller.evaluate(states, cpu_load=0.2, now=156), {"a": 1})
+
+        # Never above the level the tile size asks for
+        states["a"].level = 1
+        self.assertEqual(self.controller.evaluate(states, cpu_load=0.1, now=300), {})
+
+
+class TestStreamManagerQuality(unittest.TestCase):
+    """Test cases for channel switching in the stream manager."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        patcher = patch("src.video.stream_manager.VideoPlayer")
+        self.player_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = StreamManager()
+        self.addCleanup(self.manager.cleanup)
+        self.camera = _camera()
+
+    def test_grid_tile_uses_low_channel_and_zoom_switches_up(self):
+        """Test the channel follows the tile size."""
+        self.assertTrue(self.manager.add_stream("camera001", camera=self.camera,
+                                                tile_size=(320, 180)))
+        player = self.player_class.return_value
+        player.play_stream.assert_called_with("rtsp://nvr/camera001_1")
+
+        self.manager.set_tile_size("camera001", None)
+        player.play_stream.assert_called_with("rtsp://nvr/camera001_0")
+        self.assertEqual(self.manager.get_stream_status("camera001")["quality_level"], 1)
+
+    def test_update_quality_downgrades_dropping_stream(self):
+        """Test update_quality applies load-based decisions."""
+        self.manager.add_stream("camera001", camera=self.camera)
+        player = self.player_class.return_value
+        player.get_stats.side_effect = [{"decoded_frames": 100, "lost_frames": 50}]
+
+        self.manager.update_quality()
+        player.play_stream.assert_called_with("rtsp://nvr/camera001_1")
+
+    def test_url_resolver_used_for_channels_without_url(self):
+        """Test channels without a URL are resolved through the API."""
+        for stream in self.camera.streams:
+            stream.url = ""
+        manager = StreamManager(url_resolver=lambda cid, channel: f"rtsp://api/{cid}/{channel}")
+        self.addCleanup(manager.cleanup)
+        manager.add_stream("camera001", camera=self.camera, tile_size=(320, 180))
+        self.player_class.return_value.play_stream.assert_called_with("rtsp://api/camera001/1")
+
+
+if __name__ == '__main__':
+    unittest.main()
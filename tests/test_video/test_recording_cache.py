@@ -0,0 +1,125 @@
+"""
+Unit tests for the recording playback cache.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.models.multi_timeline import MultiTimeline
+from src.models.timeline import Timeline, TimelineSegment
+from src.video.recording_cache import RecordingCache
+
+BASE = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def at(minutes: float) -> datetime:
+    return BASE + timedelta(minutes=minutes)
+
+
+class FakeDownloader:
+    """Download double writing fixed-size files and counting calls."""
+
+    def __init__(self, size=1000):
+        self.size = size
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, recording_id, path):
+        with self.lock:
+            self.calls.append(recording_id)
+        Path(path).write_bytes(b"x" * self.size)
+
+
+class TestRecordingCache(unittest.TestCase):
+    """Test cases for the recording cache."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.directory = Path(self.tempdir.name)
+        self.download = FakeDownloader()
+        self.cache = self._cache()
+
+    def _cache(self, **kwargs):
+        kwargs.setdefault('max_bytes', 3500)
+        cache = RecordingCache(self.download, self.directory, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def _wait_cached(self, *recording_ids):
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            if all(self.cache.contains(r) for r in recording_ids):
+                return
+            time.sleep(0.01)
+        self.fail(f"recordings {recording_ids} were never cached")
+
+    def test_resolve_downloads_once(self):
+        """Test that a recording is fetched on first use and served locally after."""
+        self.assertIsNone(self.cache.resolve("cam1", "rec1"))
+        self._wait_cached("rec1")
+
+        path = self.cache.resolve("cam1", "rec1")
+        self.assertEqual(Path(path), self.directory / "rec1.mp4")
+        self.cache.resolve("cam1", "rec1")
+        self.assertEqual(self.download.calls, ["rec1"])
+        self.assertFalse(list(self.directory.glob("*.part")))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used recording is evicted first."""
+        for recording_id in ["a", "b", "c"]:
+            self.cache.fetch(recording_id)
+            self._wait_cached(recording_id)
+        self.cache.get_path("a")
+        self.cache.fetch("d")
+        self._wait_cached("d")
+
+        self.assertFalse(self.cache.contains("b"))
+        self.assertTrue(all(self.cache.contains(r) for r in ["a", "c", "d"]))
+        self.assertFalse((self.directory / "b.mp4").exists())
+        self.assertEqual(self.cache.total_bytes, 3000)
+
+    def test_prefetch_ahead_of_playhead(self):
+        """Test that each camera's current and next segments are fetched."""
+        front, back = Timeline("front"), Timeline("back")
+        front.add_segments([TimelineSegment(at(m), at(m + 5), f"f{m}", "front")
+                            for m in (0, 10, 20, 30)])
+        back.add_segment(TimelineSegment(at(2), at(4), "b2", "back"))
+        self.cache.max_bytes = 10 ** 6
+        self.cache.prefetch_segments = 1
+
+        self.cache.prefetch_all(MultiTimeline([front, back]), at(3))
+        self._wait_cached("f0", "f10", "b2")
+        self.assertEqual(sorted(self.download.calls), ["b2", "f0", "f10"])
+
+    def test_index_survives_restart(self):
+        """Test that cached files are picked up by a new cache instance."""
+        self.cache.fetch("rec1")
+        self._wait_cached("rec1")
+        (self.directory / "stale.mp4.part").write_bytes(b"partial")
+
+        reopened = self._cache()
+        self.assertTrue(reopened.contains("rec1"))
+        self.assertEqual(reopened.total_bytes, 1000)
+        self.assertFalse((self.directory / "stale.mp4.part").exists())
+
+    def test_expired_recordings_purged(self):
+        """Test that files older than max_age_days are deleted."""
+        self.cache.fetch("old")
+        self._wait_cached("old")
+        old = time.time() - 3 * 86400
+        os.utime(self.directory / "old.mp4", (old, old))
+
+        reopened = self._cache(max_age_days=2)
+        self.assertFalse(reopened.contains("old"))
+        self.assertFalse((self.directory / "old.mp4").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Unit tests for the slider seek pipeline.
+"""
+
+import unittest
+
+from src.models.multi_timeline import MultiTimeline
+from src.models.timeline import Timeline, TimelineSegment
+from src.video.playback import PlaybackCoordinator
+from src.video.seek_pipeline import SeekPipeline
+
+from .test_playback import FakePlayer, at
+
+
+class CountingPlayer(FakePlayer):
+    """Player double counting seeks and displayed frames."""
+
+    def __init__(self, widget=None):
+        super().__init__(widget)
+        self.seeks = 0
+        self.displayed = 0
+
+    def set_time(self, position_ms):
+        super().set_time(position_ms)
+        self.seeks += 1
+
+    def get_stats(self):
+        return {'displayed_frames': self.displayed} if self.url else {}
+
+
+class TestSeekPipeline(unittest.TestCase):
+    """Test cases for SeekPipeline."""
+
+    def setUp(self):
+        """Set up eight cameras recording the same hour."""
+        timelines = []
+        for index in range(8):
+            timeline = Timeline(f"cam{index}")
+            timeline.add_segment(TimelineSegment(at(0), at(3600), f"rec{index}", f"cam{index}"))
+            timelines.append(timeline)
+        self.coordinator = PlaybackCoordinator(
+            MultiTimeline(timelines), lambda camera_id, recording_id: f"file://{recording_id}",
+            player_factory=CountingPlayer,
+        )
+        for timeline in timelines:
+            self.coordinator.add_camera(timeline.camera_id)
+        self.coordinator.play()
+        self.coordinator.pause()
+        self.players = list(self.coordinator.players.values())
+        for player in self.players:
+            player.seeks = 0
+        self.latencies = []
+        self.pipeline = SeekPipeline(self.coordinator, max_seeks_per_second=1000,
+                                     settle_time=60.0, seek_timeout=60.0,
+                                     on_first_frame=lambda target, latency:
+                                     self.latencies.append((target, latency)))
+
+    def tearDown(self):
+        self.pipeline.cancel()
+
+    def _show_frames(self):
+        for player in self.players:
+            player.displayed += 1
+
+    def test_drag_is_coalesced(self):
+        """Test that a drag seeks once per landed seek, not once per event."""
+        for second in range(1, 201):
+            self.pipeline.request(at(second))
+
+        self.assertEqual(self.pipeline.seeks, 1)
+        self.assertEqual(sum(player.seeks for player in self.players), 8)
+
+        self._show_frames()
+        self.pipeline.tick()
+        self.assertEqual(self.pipeline.seeks, 2)
+        self.assertEqual(self.players[0].time_ms, 200000)
+        self.assertEqual(self.latencies[0][0], at(1))
+
+    def test_commit_supersedes_in_flight_seek(self):
+        """Test that releasing the slider seeks to the final position at once."""
+        self.pipeline.request(at(10))
+        self.pipeline.request(at(20))
+        self.pipeline.commit(at(30))
+
+        self.assertEqual(self.pipeline.seeks, 2)
+        self.assertEqual(self.pipeline.superseded, 1)
+        self.assertEqual(self.coordinator.position, at(30))
+        self.assertEqual(self.coordinator.multi_timeline.timelines["cam0"].current_position,
+                         at(30))
+
+    def test_first_frame_is_timed(self):
+        """Test that the latency is recorded once every player shows a frame."""
+        self.pipeline.request(at(10))
+        self.players[0].displayed += 1
+        self.pipeline.tick()
+        self.assertEqual(self.latencies, [])
+
+        self._show_frames()
+        self.pipeline.tick()
+        self.assertEqual(len(self.latencies), 1)
+        self.assertEqual(self.pipeline.get_stats()['seeks'], 1)
+
+    def test_stalled_seek_times_out(self):
+        """Test that a seek that never shows a frame does not block the next."""
+        pipeline = SeekPipeline(self.coordinator, max_seeks_per_second=1000,
+                                settle_time=60.0, seek_timeout=0.0)
+        pipeline.request(at(10))
+        pipeline.request(at(20))
+        pipeline.tick()
+        pipeline.cancel()
+        self.assertEqual(self.coordinator.position, at(20))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the shared snapshot poller.
+
+This module contains unit tests for snapshot decoding, the shared
+request budget, and visibility handling of the snapshot poller.
+"""
+
+import io
+import threading
+import time
+import unittest
+
+from PIL import Image
+
+from src.video.snapshot_poller import SnapshotPoller, decode_snapshot
+
+
+def _jpeg(width=640, height=360):
+    """Encode a solid-colour JPEG."""
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 40, 40)).save(output, format="JPEG")
+    return output.getvalue()
+
+
+class TestSnapshotPoller(unittest.TestCase):
+    """Test cases for the snapshot poller."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.jpeg = _jpeg()
+        self.fetches = []
+        self.frames = []
+        self.lock = threading.Lock()
+
+    def _fetch(self, camera_id):
+        with self.lock:
+            self.fetches.append((camera_id, time.monotonic()))
+        return self.jpeg
+
+    def _on_frame(self, camera_id, image_data):
+        with self.lock:
+            self.frames.append((camera_id, image_data))
+
+    def test_decode_snapshot_scales_to_tile(self):
+        """Test snapshots are scaled to fit the tile and encoded as PPM."""
+        image = Image.open(io.BytesIO(decode_snapshot(self.jpeg, (160, 160))))
+        self.assertEqual(image.format, "PPM")
+        self.assertEqual(image.size, (160, 90))
+
+    def test_rate_budget_is_shared(self):
+        """Test the total request rate stays within the budget."""
+        poller = SnapshotPoller(self._fetch, self._on_frame, rate_limit=10, interval=0.01)
+        for index in range(8):
+            poller.add_camera(f"camera{index}", (64, 36))
+        poller.start()
+        time.sleep(1.0)
+        poller.stop()
+
+        # One second of budget plus the initial burst of the bucket
+        self.assertLessEqual(len(self.fetches), 10 + 10 + 1)
+        self.assertEqual({camera_id for camera_id, _ in self.fetches},
+                         {f"camera{index}" for index in range(8)})
+        self.assertTrue(self.frames)
+
+    def test_hidden_and_paused_tiles_are_skipped(self):
+        """Test hidden tiles and a paused poller issue no requests."""
+        poller = SnapshotPoller(self._fetch, self._on_frame, rate_limit=50, interval=0.05)
+        poller.add_camera("visible", (64, 36))
+        poller.add_camera("hidden", (64, 36), visible=False)
+        poller.start()
+        time.sleep(0.3)
+        poller.set_paused(True)
+        time.sleep(0.1)
+        with self.lock:
+            paused_count = len(self.fetches)
+        time.sleep(0.3)
+        poller.stop()
+
+        self.assertNotIn("hidden", {camera_id for camera_id, _ in self.fetches})
+        self.assertEqual(len(self.fetches), paused_count)
+
+    def test_failed_fetch_does_not_stop_polling(self):
+        """Test a failing camera does not block the others."""
+        def fetch(camera_id):
+            if camera_id == "broken":
+                raise IOError("snapshot unavailable")
+            return self._fetch(camera_id)
+
+        poller = SnapshotPoller(fetch, self._on_frame, rate_limit=50, interval=0.05)
+        poller.add_camera("broken", (64, 36))
+        poller.add_camera("working", (64, 36))
+        poller.start()
+        time.sleep(0.3)
+        poller.stop()
+
+        self.assertGreater(len([f for f in self.frames if f[0] == "working"]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
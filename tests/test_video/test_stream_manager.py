@@ -0,0 +1,193 @@
+"""
+Unit tests for suspending and resuming streams in the stream manager.
+"""
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.video.stream_manager import StreamManager, SuspendMode
+from tests.test_video.test_quality import _camera
+
+
+class TestStreamSuspension(unittest.TestCase):
+    """Test cases for StreamManager.suspend_stream and resume_stream."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        patcher = patch("src.video.stream_manager.VideoPlayer")
+        self.player_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.player = self.player_class.return_value
+        self.manager = StreamManager()
+        self.addCleanup(self.manager.cleanup)
+        self.manager.add_stream("camera001", camera=_camera(), tile_size=None)
+
+    def test_pause_keeps_connection(self):
+        """Test that pausing stops decoding without closing the stream."""
+        self.manager.suspend_stream("camera001", SuspendMode.PAUSE)
+
+        self.player.pause.assert_called_once()
+        self.player.stop.assert_not_called()
+        self.assertIsNone(self.manager.health_monitor.get_status("camera001"))
+        self.assertEqual(self.manager.get_stream_status("camera001")["suspended"], "pause")
+
+        self.assertTrue(self.manager.resume_stream("camera001"))
+        self.player.resume.assert_called_once()
+        self.assertIsNotNone(self.manager.health_monitor.get_status("camera001"))
+
+    def test_release_stops_and_restarts(self):
+        """Test that releasing stops the stream and resuming reopens it."""
+        self.manager.suspend_stream("camera001", SuspendMode.RELEASE)
+
+        self.player.stop.assert_called_once()
+        self.assertNotIn("camera001", self.manager.active_streams)
+
+        self.player.play_stream.reset_mock()
+        self.manager.resume_stream("camera001")
+        self.player.play_stream.assert_called_once_with("rtsp://nvr/camera001_0")
+        self.assertIn("camera001", self.manager.active_streams)
+
+    def test_warm_keeps_lowest_channel_playing(self):
+        """Test that a warm stream drops to the lowest channel and comes back."""
+        self.manager.suspend_stream("camera001", SuspendMode.WARM)
+        self.player.play_stream.assert_called_with("rtsp://nvr/camera001_1")
+        self.player.pause.assert_not_called()
+
+        # Zoom changes while hidden are applied on resume, not immediately
+        self.manager.set_tile_size("camera001", (320, 180))
+        self.manager.set_tile_size("camera001", None)
+        self.player.play_stream.assert_called_with("rtsp://nvr/camera001_1")
+
+        self.manager.resume_stream("camera001")
+        self.player.play_stream.assert_called_with("rtsp://nvr/camera001_0")
+
+    def test_update_quality_skips_suspended_streams(self):
+        """Test that suspended streams are not upgraded by the quality controller."""
+        self.manager.suspend_stream("camera001", SuspendMode.WARM)
+        self.player.play_stream.reset_mock()
+
+        self.manager.update_quality()
+
+        self.player.play_stream.assert_not_called()
+        self.player.get_stats.assert_not_called()
+
+
+
+class TestStreamConcurrency(unittest.TestCase):
+    """Test cases for calls and reconnects arriving from several threads."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        patcher = patch("src.video.stream_manager.VideoPlayer")
+        self.player_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.player = self.player_class.return_value
+        self.manager = StreamManager()
+        self.addCleanup(self.manager.cleanup)
+        self.manager.add_stream("camera001", camera=_camera(), tile_size=None)
+        self.player.play_stream.reset_mock()
+
+    def test_restart_needs_the_watched_player(self):
+        """Test that a reconnect only restarts the player it was watching."""
+        self.assertTrue(self.manager._restart_stream("camera001", self.player))
+        self.assertFalse(self.manager._restart_stream("camera001", object()))
+        self.player.play_stream.assert_called_once_with("rtsp://nvr/camera001_0")
+
+    def test_restart_waits_for_removal(self):
+        """Test that a reconnect racing a removal does not reopen the player."""
+        cleaning, release = threading.Event(), threading.Event()
+        self.player.cleanup.side_effect = lambda: (cleaning.set(), release.wait(2))
+        remover = threading.Thread(target=self.manager.remove_stream, args=("camera001",))
+        remover.start()
+        self.assertTrue(cleaning.wait(2))
+
+        results = []
+        restarter = threading.Thread(
+            target=lambda: results.append(self.manager._restart_stream("camera001", self.player)))
+        restarter.start()
+        restarter.join(0.1)
+        self.assertTrue(restarter.is_alive())
+
+        release.set()
+        remover.join(2)
+        restarter.join(2)
+        self.assertEqual(results, [False])
+        self.player.play_stream.assert_not_called()
+
+    def _add_with_slow_resolver(self):
+        """Start adding camera002 with a resolver that blocks until released."""
+        resolving, release = threading.Event(), threading.Event()
+
+        def resolve(camera_id, channel):
+            resolving.set()
+            release.wait(2)
+            return f"rtsp://api/{camera_id}/{channel}"
+
+        camera = _camera(1)
+        for stream in camera.streams:
+            stream.url = ""
+        self.manager.url_resolver = resolve
+        results = []
+        adder = threading.Thread(target=lambda: results.append(
+            self.manager.add_stream("camera002", camera=camera, tile_size=None)))
+        adder.start()
+        self.assertTrue(resolving.wait(2))
+        return adder, release, results
+
+    def test_slow_resolver_does_not_block_other_calls(self):
+        """Test that resolving a stream URL does not hold up other streams."""
+        adder, release, results = self._add_with_slow_resolver()
+        caller = threading.Thread(target=lambda: (
+            self.manager.update_quality(), self.manager.get_stream_status("camera001")))
+        caller.start()
+        caller.join(1)
+        self.assertFalse(caller.is_alive())
+
+        release.set()
+        adder.join(2)
+        self.assertEqual(results, [True])
+        self.assertTrue(self.manager.stream_urls["camera002"].startswith("rtsp://api/camera002/"))
+
+    def test_removal_while_resolving_drops_the_add(self):
+        """Test that a stream removed while its URL resolves is not started."""
+        adder, release, results = self._add_with_slow_resolver()
+        self.manager.remove_stream("camera002")
+
+        release.set()
+        adder.join(2)
+        self.assertEqual(results, [False])
+        self.assertNotIn("camera002", self.manager.streams)
+        self.assertNotIn("camera002", self.manager.quality_states)
+
+    def test_concurrent_calls_keep_state_consistent(self):
+        """Test that calls from several threads leave the bookkeeping consistent."""
+        errors = []
+
+        def churn(camera_id):
+            try:
+                for _ in range(100):
+                    self.manager.add_stream(camera_id, f"rtsp://nvr/{camera_id}")
+                    self.manager.suspend_stream(camera_id, SuspendMode.PAUSE)
+                    self.manager.update_quality()
+                    self.manager.resume_stream(camera_id)
+                    self.manager.get_stream_status(camera_id)
+                    self.manager.remove_stream(camera_id)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=churn, args=(f"camera00{index}",))
+                   for index in range(2, 6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(set(self.manager.streams), {"camera001"})
+        self.assertEqual(self.manager.active_streams, ["camera001"])
+        self.assertEqual(set(self.manager.quality_states), {"camera001"})
+
+
+if __name__ == '__main__':
+    unittest.main()
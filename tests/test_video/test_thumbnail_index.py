@@ -0,0 +1,113 @@
+"""
+Unit tests for the timeline thumbnail index.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.models.timeline import Timeline, TimelineSegment
+from src.video.thumbnail_index import ThumbnailIndex
+
+BASE = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def at(seconds: float) -> datetime:
+    return BASE + timedelta(seconds=seconds)
+
+
+def _timeline(hours: float = 2) -> Timeline:
+    timeline = Timeline("cam1")
+    timeline.add_segment(TimelineSegment(at(0), at(hours * 3600), "rec1", "cam1"))
+    return timeline
+
+
+class TestThumbnailIndex(unittest.TestCase):
+    """Test cases for ThumbnailIndex."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.grabs = []
+        self.recordings = []
+
+        def grab(camera_id, recording_id, offset_ms):
+            self.grabs.append(offset_ms)
+            self.recordings.append((recording_id, offset_ms))
+            return f"jpeg {camera_id} {offset_ms}".encode()
+
+        self.index = ThumbnailIndex(grab, self.directory.name, samples_per_view=10)
+
+    def tearDown(self):
+        self.index.close()
+        self.directory.cleanup()
+
+    def test_sample_interval_follows_zoom(self):
+        timeline = _timeline()
+        self.assertEqual(self.index.sample_interval(timeline), 900)
+
+        timeline.zoom_to_range(at(0), at(600))
+        self.assertEqual(timeline.zoom_level, 12)
+        self.assertEqual(self.index.sample_interval(timeline), 60)
+
+    def test_plan_stays_inside_footage(self):
+        timeline = _timeline()
+        timeline.add_segment(TimelineSegment(at(3 * 3600), at(3 * 3600 + 60), "rec2", "cam1"))
+        timeline.zoom_to_range(at(3600 + 1800), at(3 * 3600 + 1800))
+
+        samples = self.index.plan(timeline)
+        self.assertEqual(samples[0], at(3600 + 1800))
+        self.assertEqual(samples[-1], at(3 * 3600))
+        self.assertTrue(all(timeline.get_segment_at_time(sample) for sample in samples))
+
+    def test_fill_and_lookup(self):
+        timeline = _timeline()
+        added = self.index.fill(timeline).result(timeout=5)
+        self.assertEqual(added, 9)
+
+        self.assertEqual(self.index.get("cam1", at(910)), b"jpeg cam1 900000")
+        self.assertEqual(self.index.get("cam1", at(3600 - 10)), b"jpeg cam1 3600000")
+        self.assertIsNone(self.index.get("cam1", at(1200), tolerance=60))
+        self.assertIsNone(self.index.get("cam2", at(900)))
+
+    def test_fill_grabs_from_covering_recording(self):
+        timeline = Timeline("cam1")
+        timeline.add_segment(TimelineSegment(at(0), at(1800), "rec1", "cam1"))
+        timeline.add_segment(TimelineSegment(at(1200), at(7200), "rec2", "cam1"))
+        self.index.fill(timeline).result(timeout=5)
+
+        self.assertIn(("rec1", 900000), self.recordings)
+        self.assertIn(("rec2", 2700000 - 1200000), self.recordings)
+        self.assertTrue(all(recording_id == "rec2" for recording_id, offset_ms
+                            in self.recordings if offset_ms > 1800000))
+
+    def test_fill_skips_stored_samples(self):
+        timeline = _timeline()
+        self.index.fill(timeline).result(timeout=5)
+        self.grabs.clear()
+
+        timeline.zoom_to_range(at(0), at(3600))
+        added = self.index.fill(timeline).result(timeout=5)
+        self.assertEqual(added, len(self.grabs))
+        self.assertNotIn(900000, self.grabs)
+        self.assertEqual(sorted(self.grabs), [600000, 1200000, 2400000, 3000000])
+
+    def test_thumbnails_persist(self):
+        self.index.fill(_timeline()).result(timeout=5)
+        self.index.close()
+
+        reopened = ThumbnailIndex(lambda *args: None, self.directory.name)
+        try:
+            self.assertEqual(reopened.get("cam1", at(1800), tolerance=0), b"jpeg cam1 1800000")
+        finally:
+            reopened.close()
+
+    def test_failed_grabs_are_skipped(self):
+        index = ThumbnailIndex(lambda *args: None, self.directory.name)
+        try:
+            self.assertEqual(index.fill(_timeline()).result(timeout=5), 0)
+        finally:
+            index.close()
+
+
+if __name__ == '__main__':
+    unittest.main()